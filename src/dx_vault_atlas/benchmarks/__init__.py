@@ -0,0 +1 @@
+"""Synthetic vaults and performance benchmarks."""
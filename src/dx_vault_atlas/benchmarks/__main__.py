@@ -0,0 +1,324 @@
+"""Benchmark runner: ``python -m dx_vault_atlas.benchmarks``.
+
+Examples:
+    python -m dx_vault_atlas.benchmarks run -o before.json
+    python -m dx_vault_atlas.benchmarks run --sizes 1000,10000 -o after.json
+    python -m dx_vault_atlas.benchmarks compare before.json after.json
+    python -m dx_vault_atlas.benchmarks generate ~/synthetic --notes 5000
+    python -m dx_vault_atlas.benchmarks memory --notes 10000
+    python -m dx_vault_atlas.benchmarks imports --slack 2
+"""
+
+from pathlib import Path
+
+import typer
+from platformdirs import user_cache_dir
+from rich.console import Console
+from rich.table import Table
+
+from dx_vault_atlas.benchmarks import importtime
+from dx_vault_atlas.benchmarks.memory import COMMANDS, profile_memory
+from dx_vault_atlas.benchmarks.suite import (
+    DEFAULT_SIZES,
+    STAGES,
+    BenchReport,
+    StageResult,
+    comparable,
+    compare,
+    run_suite,
+)
+from dx_vault_atlas.benchmarks.synthetic import VaultSpec, ensure_vault, generate_vault
+from dx_vault_atlas.shared.paths import APP_NAME
+
+console = Console()
+
+app = typer.Typer(
+    name="dxva-bench",
+    help="Synthetic vaults and end-to-end benchmarks.",
+    add_completion=False,
+    no_args_is_help=True,
+)
+
+_WORK_DIR = Path(user_cache_dir(APP_NAME)) / "bench"
+
+_KIB = 1024
+_MIB = 1024 * 1024
+
+
+def _csv(value: str, name: str) -> list[str]:
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    if not items:
+        raise typer.BadParameter("must not be empty", param_hint=name)
+    return items
+
+
+def _spec(
+    notes: int,
+    seed: int,
+    invalid_ratio: float,
+    body_min: int,
+    body_max: int,
+    max_depth: int,
+) -> VaultSpec:
+    try:
+        return VaultSpec(
+            notes=notes,
+            seed=seed,
+            invalid_ratio=invalid_ratio,
+            body_size=(body_min, body_max),
+            max_depth=max_depth,
+        )
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from e
+
+
+def _rss(value: int | None) -> str:
+    return "-" if value is None else f"{value / _MIB:.1f}"
+
+
+def _result_row(result: StageResult) -> list[str]:
+    return [
+        f"{result.size:,}",
+        result.stage,
+        f"{result.seconds:.3f}",
+        f"{result.notes_per_sec:,.0f}",
+        _rss(result.peak_rss),
+    ]
+
+
+# Shared options
+_SEED = typer.Option(0, "--seed", help="Random seed of the generated vaults.")
+_INVALID = typer.Option(
+    0.1,
+    "--invalid-ratio",
+    min=0.0,
+    max=1.0,
+    help="Share of notes with broken frontmatter.",
+)
+_BODY_MIN = typer.Option(
+    200, "--body-min", min=0, help="Shortest body, in characters."
+)
+_BODY_MAX = typer.Option(
+    2000, "--body-max", min=0, help="Longest body, in characters."
+)
+_DEPTH = typer.Option(3, "--max-depth", min=0, help="Deepest directory level.")
+_WORK = typer.Option(
+    _WORK_DIR, "--work-dir", help="Where synthetic vaults are generated and kept."
+)
+
+# Options of ``run``
+_RUN_OUTPUT = typer.Option(
+    None, "--output", "-o", help="Write the JSON report to this file."
+)
+
+
+@app.command("run")
+def run(
+    sizes: str = typer.Option(
+        ",".join(str(s) for s in DEFAULT_SIZES),
+        "--sizes",
+        help="Vault sizes, comma-separated.",
+    ),
+    stages: str = typer.Option(
+        ",".join(STAGES), "--stages", help="Stages to time, comma-separated."
+    ),
+    repeat: int = typer.Option(
+        1, "--repeat", min=1, help="Runs per stage; the fastest is kept."
+    ),
+    output: Path | None = _RUN_OUTPUT,
+    work_dir: Path = _WORK,
+    seed: int = _SEED,
+    invalid_ratio: float = _INVALID,
+    body_min: int = _BODY_MIN,
+    body_max: int = _BODY_MAX,
+    max_depth: int = _DEPTH,
+) -> None:
+    """Time every stage over synthetic vaults of each size."""
+    try:
+        size_list = [int(s) for s in _csv(sizes, "--sizes")]
+    except ValueError as e:
+        raise typer.BadParameter("sizes must be integers", param_hint="--sizes") from e
+    spec = _spec(0, seed, invalid_ratio, body_min, body_max, max_depth)
+
+    table = Table(title="Benchmark")
+    for column in ("Notes", "Stage", "Seconds", "Notes/s", "Peak RSS (MiB)"):
+        table.add_column(column, justify="left" if column == "Stage" else "right")
+
+    def show(result: StageResult) -> None:
+        console.print(
+            f"[dim]{result.stage} x{result.size:,}: {result.seconds:.3f}s[/dim]"
+        )
+        table.add_row(*_result_row(result))
+
+    try:
+        report = run_suite(
+            work_dir,
+            spec,
+            sizes=size_list,
+            stages=_csv(stages, "--stages"),
+            repeat=repeat,
+            on_result=show,
+        )
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from e
+
+    console.print(table)
+    console.print(f"[dim]commit {report.meta['commit'] or 'unknown'}[/dim]")
+    if output is not None:
+        report.save(output)
+        console.print(f"Report written to [cyan]{output}[/cyan]")
+
+
+_BASE = typer.Argument(..., exists=True, help="Report of the baseline.")
+_HEAD = typer.Argument(..., exists=True, help="Report to compare with it.")
+
+
+@app.command("compare")
+def compare_reports(base: Path = _BASE, head: Path = _HEAD) -> None:
+    """Compare the throughput of two benchmark reports."""
+    try:
+        before, after = BenchReport.load(base), BenchReport.load(head)
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from e
+    if not comparable(before, after):
+        console.print(
+            "[yellow]Warning:[/yellow] "
+            "the reports measured vaults from different specs."
+        )
+
+    base_name = before.meta["commit"] or base.name
+    head_name = after.meta["commit"] or head.name
+    table = Table(title=f"{base_name} -> {head_name}")
+    columns = ("Notes", "Stage", "Base notes/s", "Head notes/s", "Change", "RSS (MiB)")
+    for column in columns:
+        table.add_column(column, justify="left" if column == "Stage" else "right")
+    for row in compare(before, after):
+        change = row["change"]
+        color = "green" if change > 0.05 else "red" if change < -0.05 else "white"
+        table.add_row(
+            f"{row['size']:,}",
+            row["stage"],
+            f"{row['base']:,.0f}",
+            f"{row['head']:,.0f}",
+            f"[{color}]{change:+.1%}[/{color}]",
+            f"{_rss(row['base_rss'])} -> {_rss(row['head_rss'])}",
+        )
+    console.print(table)
+
+
+_DESTINATION = typer.Argument(..., help="Directory to write the vault to.")
+
+
+@app.command("generate")
+def generate(
+    destination: Path = _DESTINATION,
+    notes: int = typer.Option(1000, "--notes", "-n", min=0, help="Number of notes."),
+    seed: int = _SEED,
+    invalid_ratio: float = _INVALID,
+    body_min: int = _BODY_MIN,
+    body_max: int = _BODY_MAX,
+    max_depth: int = _DEPTH,
+) -> None:
+    """Write a synthetic vault, e.g. to try the doctor on."""
+    spec = _spec(notes, seed, invalid_ratio, body_min, body_max, max_depth)
+    try:
+        vault = generate_vault(destination, spec)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="DESTINATION") from e
+    console.print(
+        f"Wrote [bold]{notes}[/bold] notes ({vault.invalid_count} invalid) "
+        f"to [cyan]{destination}[/cyan]"
+    )
+
+
+@app.command("memory")
+def memory(
+    notes: int = typer.Option(1000, "--notes", "-n", min=1, help="Number of notes."),
+    commands: str = typer.Option(
+        ",".join(COMMANDS), "--commands", help="Commands to measure, comma-separated."
+    ),
+    top: int = typer.Option(8, "--top", min=1, help="Modules to list per command."),
+    work_dir: Path = _WORK,
+    seed: int = _SEED,
+    invalid_ratio: float = _INVALID,
+    body_min: int = _BODY_MIN,
+    body_max: int = _BODY_MAX,
+    max_depth: int = _DEPTH,
+) -> None:
+    """Trace the memory of doctor and migrate runs over a synthetic vault."""
+    spec = _spec(notes, seed, invalid_ratio, body_min, body_max, max_depth)
+    vault = ensure_vault(work_dir / f"vault-{notes}", spec)
+    for command in _csv(commands, "--commands"):
+        try:
+            report = profile_memory(command, vault.root, top=top)
+        except ValueError as e:
+            raise typer.BadParameter(str(e), param_hint="--commands") from e
+
+        console.print(
+            f"[bold]{command}[/bold] x{notes:,}: "
+            f"peak {report.peak / _MIB:.1f} MiB "
+            f"({report.peak_per_note / _KIB:.1f} KiB/note), "
+            f"retained {report.retained / _MIB:.1f} MiB "
+            f"({report.retained_per_note / _KIB:.1f} KiB/note)"
+        )
+        table = Table()
+        table.add_column("Module")
+        table.add_column("Retained (KiB)", justify="right")
+        table.add_column("Blocks", justify="right")
+        for item in report.modules:
+            table.add_row(item.module, f"{item.size / _KIB:,.1f}", f"{item.count:,}")
+        console.print(table)
+
+
+@app.command("imports")
+def imports(
+    commands: str = typer.Option(
+        ",".join(importtime.COMMANDS),
+        "--commands",
+        help="dxva commands to time, comma-separated.",
+    ),
+    slack: float = typer.Option(
+        1.0,
+        "--slack",
+        min=1.0,
+        help="Factor applied to every threshold (slow machines).",
+    ),
+    top: int = typer.Option(
+        5, "--top", min=0, help="Slowest modules to list per command."
+    ),
+) -> None:
+    """Time the imports of dxva commands against their startup thresholds."""
+    try:
+        reports = importtime.run_commands(_csv(commands, "--commands"))
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--commands") from e
+
+    table = Table(title=f"Import time (budget {importtime.IMPORT_BUDGET_MS:.0f} ms)")
+    for column in ("Command", "Imports (ms)", "Threshold (ms)", "Forbidden"):
+        table.add_column(column, justify="right" if "ms" in column else "left")
+    failed = False
+    for report in reports:
+        threshold = report.spec.threshold_ms * slack
+        over = report.total_ms > threshold
+        forbidden = report.forbidden_imports
+        failed = failed or over or bool(forbidden)
+        color = "red" if over else "green"
+        table.add_row(
+            report.name,
+            f"[{color}]{report.total_ms:.1f}[/{color}]",
+            f"{threshold:.0f}",
+            f"[red]{', '.join(forbidden)}[/red]" if forbidden else "-",
+        )
+    console.print(table)
+    for report in reports:
+        slowest = ", ".join(
+            f"{r.module} {r.cumulative_us / 1000:.1f}" for r in report.slowest(top)
+        )
+        if slowest:
+            console.print(f"[dim]{report.name}: {slowest}[/dim]")
+    if failed:
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    app()
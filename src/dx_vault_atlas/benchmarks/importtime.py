@@ -0,0 +1,237 @@
+"""Import-time benchmark of ``dxva`` commands, parsed from ``-X importtime``.
+
+Each command of ``COMMANDS`` runs in a fresh interpreter under
+``python -X importtime`` against a throwaway setup: a small synthetic
+vault and a config pointing at it, with ``HOME`` and the XDG directories
+redirected to a temporary directory so nothing of the user's is read or
+written. Startup cost is measured as the time spent importing modules a
+bare interpreter does not import (interpreter startup itself is left
+out), and compared with the command's threshold; every threshold is
+within ``IMPORT_BUDGET_MS``, the cold-start budget for scripted use.
+
+Timings depend on the machine, so each run also records which modules
+were imported: the guard tests assert on those (``--help`` never loads
+Textual, printing commands never load questionary, ...), which holds
+everywhere.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from dx_vault_atlas.shared.paths import APP_NAME
+
+# Cold-start budget for scripted use, in milliseconds
+IMPORT_BUDGET_MS = 150.0
+
+# Heavy stacks that only interactive commands may load
+TUI_MODULES = ("textual", "questionary", "prompt_toolkit")
+
+# What the ``dxva`` console script runs
+_ENTRY_POINT = (
+    "import sys; from dx_vault_atlas.cli import app; sys.exit(app(prog_name='dxva'))"
+)
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """A command to time and what it may import.
+
+    Attributes:
+        args: Arguments after ``dxva``.
+        threshold_ms: Import time allowed, in milliseconds.
+        forbidden: Top-level packages the command must not import.
+    """
+
+    args: tuple[str, ...]
+    threshold_ms: float
+    forbidden: tuple[str, ...] = TUI_MODULES
+
+
+COMMANDS: dict[str, CommandSpec] = {
+    "help": CommandSpec(("--help",), 80.0, (*TUI_MODULES, "pydantic")),
+    "config show": CommandSpec(("config", "show"), 120.0),
+    "stats": CommandSpec(("stats", "--format", "json"), IMPORT_BUDGET_MS),
+    "query": CommandSpec(
+        ("query", "type=task", "--format", "paths"), IMPORT_BUDGET_MS
+    ),
+    "graph orphans": CommandSpec(("graph", "orphans"), IMPORT_BUDGET_MS),
+    "doctor --batch": CommandSpec(("doctor", "--batch"), IMPORT_BUDGET_MS),
+}
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One line of ``-X importtime`` output.
+
+    Attributes:
+        module: Imported module.
+        self_us: Time spent in the module itself, in microseconds.
+        cumulative_us: Time including its own imports, in microseconds.
+        depth: Nesting level (0 for imports made by ``__main__``).
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportReport:
+    """Imports of one command run."""
+
+    name: str
+    spec: CommandSpec
+    records: list[ImportRecord]
+    baseline: frozenset[str] = field(default_factory=frozenset)
+
+    @property
+    def modules(self) -> set[str]:
+        """Every module imported."""
+        return {r.module for r in self.records}
+
+    @property
+    def total_ms(self) -> float:
+        """Time spent importing modules a bare interpreter does not import."""
+        spent = sum(r.self_us for r in self.records if r.module not in self.baseline)
+        return spent / 1000
+
+    @property
+    def over_budget(self) -> bool:
+        """True when the import time exceeds the command's threshold."""
+        return self.total_ms > self.spec.threshold_ms
+
+    @property
+    def forbidden_imports(self) -> list[str]:
+        """Forbidden packages the command imported."""
+        roots = {module.partition(".")[0] for module in self.modules}
+        return [name for name in self.spec.forbidden if name in roots]
+
+    def slowest(self, count: int = 10) -> list[ImportRecord]:
+        """Modules with the largest cumulative time, outside the baseline."""
+        records = [r for r in self.records if r.module not in self.baseline]
+        return sorted(records, key=lambda r: -r.cumulative_us)[:count]
+
+
+def parse_importtime(text: str) -> list[ImportRecord]:
+    """Parse ``-X importtime`` lines out of *text* (a process's stderr).
+
+    Lines that are not import timings (the header, program output) are
+    skipped.
+    """
+    records = []
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        records.append(
+            ImportRecord(
+                stripped,
+                int(fields[0]),
+                int(fields[1]),
+                (len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return records
+
+
+def run_commands(
+    names: list[str] | None = None, timeout: float = 120.0
+) -> list[ImportReport]:
+    """Time the imports of each named command (all of ``COMMANDS`` by default).
+
+    Raises:
+        ValueError: If a command name is unknown.
+        RuntimeError: If a command fails.
+    """
+    names = list(COMMANDS) if names is None else names
+    unknown = [name for name in names if name not in COMMANDS]
+    if unknown:
+        raise ValueError(f"Unknown commands: {', '.join(unknown)}")
+
+    with tempfile.TemporaryDirectory(prefix="dxva-importtime-") as tmp:
+        env = _sandbox(Path(tmp))
+        baseline = frozenset(
+            r.module for r in parse_importtime(_run(["-c", "pass"], env, timeout))
+        )
+        return [
+            ImportReport(
+                name,
+                COMMANDS[name],
+                parse_importtime(
+                    _run(["-c", _ENTRY_POINT, *COMMANDS[name].args], env, timeout)
+                ),
+                baseline,
+            )
+            for name in names
+        ]
+
+
+# -- private helpers ------------------------------------------------------------
+
+
+def _sandbox(root: Path) -> dict[str, str]:
+    """Environment with a fresh home, config and vault under *root*."""
+    from dx_vault_atlas.benchmarks.synthetic import VaultSpec, generate_vault
+
+    vault = generate_vault(root / "vault", VaultSpec(notes=50, seed=1))
+    env = {
+        **os.environ,
+        "HOME": str(root / "home"),
+        "XDG_CONFIG_HOME": str(root / "config"),
+        "XDG_CACHE_HOME": str(root / "cache"),
+        "XDG_DATA_HOME": str(root / "data"),
+        "XDG_STATE_HOME": str(root / "state"),
+        "COLUMNS": "120",
+    }
+    # Resolved by the child: not every platform honours XDG_CONFIG_HOME
+    config_dir = Path(
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, platformdirs; "
+                "print(platformdirs.user_config_dir(sys.argv[1]))",
+                APP_NAME,
+            ],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    )
+    config_dir.mkdir(parents=True, exist_ok=True)
+    config = {"vault_path": str(vault.root), "vault_inbox": str(vault.root)}
+    (config_dir / "config.json").write_text(json.dumps(config), encoding="utf-8")
+    return env
+
+
+def _run(args: list[str], env: dict[str, str], timeout: float) -> str:
+    """Run the interpreter with ``-X importtime``; return its stderr."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        env=env,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        check=False,
+    )
+    if proc.returncode != 0:
+        errors = "\n".join(
+            line
+            for line in proc.stderr.splitlines()
+            if not line.startswith("import time:")
+        )
+        command = " ".join(args[2:]) or "python"
+        raise RuntimeError(f"{command} exited with {proc.returncode}: {errors}")
+    return proc.stderr
@@ -0,0 +1,278 @@
+"""Memory profile of doctor and migrate runs, under ``tracemalloc``.
+
+Runs a command over a (synthetic) vault with every allocation traced and
+reports two figures, both relative to the state before the run:
+
+- ``peak``: the most memory the run ever held.
+- ``retained``: what it still holds at its high-water mark of kept
+  state. For the doctor that is the end of the full check, when every
+  note needing attention waits in the queue for the interactive phase;
+  for the migrator, the end of the run.
+
+The retained allocations are also broken down by the module that made
+them, so a growing structure points at its owner. Dividing either figure
+by the vault size gives a per-note cost that stays roughly constant as
+vaults grow, which is what the memory budget tests assert on.
+
+The doctor is run without its interactive phase and writes nothing; the
+migrator writes, so it runs on a copy of the vault.
+"""
+
+import shutil
+import sys
+import tempfile
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from dx_vault_atlas.shared.core.scanner import VaultScanner
+
+if TYPE_CHECKING:
+    from dx_vault_atlas.services.note_doctor.core.cli import DoctorCLI
+
+COMMANDS = ("doctor", "migrate")
+
+# Modules outside any sys.path entry (e.g. <frozen ...>, <unknown>)
+_UNKNOWN = "<unknown>"
+
+
+@dataclass(frozen=True)
+class ModuleAllocation:
+    """Memory retained by allocations made in one module.
+
+    Attributes:
+        module: Dotted module name (or the file name, if not importable).
+        size: Bytes retained.
+        count: Live blocks.
+    """
+
+    module: str
+    size: int
+    count: int
+
+
+@dataclass(frozen=True)
+class MemoryReport:
+    """Memory used by one command over one vault.
+
+    Attributes:
+        command: Command measured, one of ``COMMANDS``.
+        notes: Notes in the vault.
+        peak: Peak traced memory during the run, in bytes.
+        retained: Traced memory held at the point of most retained
+            state, in bytes.
+        modules: Largest retainers, biggest first.
+    """
+
+    command: str
+    notes: int
+    peak: int
+    retained: int
+    modules: list[ModuleAllocation]
+
+    @property
+    def peak_per_note(self) -> float:
+        """Peak memory divided by the vault size."""
+        return self.peak / self.notes if self.notes else 0.0
+
+    @property
+    def retained_per_note(self) -> float:
+        """Retained memory divided by the vault size."""
+        return self.retained / self.notes if self.notes else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-data form, with the per-note figures."""
+        return {
+            **asdict(self),
+            "peak_per_note": round(self.peak_per_note),
+            "retained_per_note": round(self.retained_per_note),
+        }
+
+
+def profile_memory(command: str, vault: Path, top: int = 10) -> MemoryReport:
+    """Run *command* over *vault* with ``tracemalloc`` and report its memory.
+
+    Args:
+        command: ``"doctor"`` (full check) or ``"migrate"``.
+        vault: Vault root; left untouched.
+        top: Modules to keep in the breakdown.
+
+    Raises:
+        ValueError: If the command is unknown.
+        RuntimeError: If ``tracemalloc`` is already tracing.
+    """
+    if command not in COMMANDS:
+        raise ValueError(f"Unknown command: {command}")
+    if tracemalloc.is_tracing():
+        raise RuntimeError("tracemalloc is already tracing")
+
+    with tempfile.TemporaryDirectory(prefix="dxva-memory-") as tmp:
+        work = Path(tmp)
+        if command == "migrate":
+            vault = Path(shutil.copytree(vault, work / "vault"))
+        run = _RUNNERS[command](vault, work)
+        # Scanning interns every path part up front, and keeping the paths
+        # alive keeps them interned: a resize of the interpreter-wide intern
+        # table would otherwise be charged to the run
+        paths = list(VaultScanner().scan(vault))
+
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.take_snapshot()
+            start, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            mark = run() or _mark()
+        finally:
+            tracemalloc.stop()
+
+    current, peak, snapshot = mark
+    return MemoryReport(
+        command,
+        len(paths),
+        max(0, peak - start),
+        max(0, current - start),
+        _by_module(snapshot, baseline, top),
+    )
+
+
+def _mark() -> "_Mark":
+    """Traced memory now, peak so far, and a snapshot of what is live.
+
+    Both figures are read before the snapshot, which is traced too.
+    """
+    current, peak = tracemalloc.get_traced_memory()
+    return current, peak, tracemalloc.take_snapshot()
+
+
+# -- attribution ----------------------------------------------------------------
+
+
+def _by_module(
+    snapshot: tracemalloc.Snapshot, baseline: tracemalloc.Snapshot, top: int
+) -> list[ModuleAllocation]:
+    """Aggregate the allocations made since *baseline* by module."""
+    ignore = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ]
+    diff = snapshot.filter_traces(ignore).compare_to(
+        baseline.filter_traces(ignore), "filename"
+    )
+    totals: dict[str, list[int]] = {}
+    for stat in diff:
+        if stat.size_diff <= 0:
+            continue
+        entry = totals.setdefault(_module_name(stat.traceback[0].filename), [0, 0])
+        entry[0] += stat.size_diff
+        entry[1] += max(0, stat.count_diff)
+    ranked = sorted(totals.items(), key=lambda item: -item[1][0])
+    return [ModuleAllocation(name, size, count) for name, (size, count) in ranked[:top]]
+
+
+def _module_name(filename: str) -> str:
+    """Dotted module name of a source file, by its longest ``sys.path`` root."""
+    path = Path(filename)
+    if not path.is_absolute():
+        return filename or _UNKNOWN
+    best: Path | None = None
+    for entry in sys.path:
+        root = Path(entry or ".").resolve()
+        if not path.is_relative_to(root):
+            continue
+        if best is None or len(root.parts) > len(best.parts):
+            best = root
+    if best is None:
+        return path.name
+    parts = list(path.relative_to(best).with_suffix("").parts)
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts) or path.name
+
+
+# -- commands -------------------------------------------------------------------
+
+# (traced memory, peak, snapshot) at a run's point of most retained state
+_Mark = tuple[int, int, tracemalloc.Snapshot]
+
+# Prepared outside tracing; returns its mark, or None to have it taken on return
+_Run = Callable[[], _Mark | None]
+
+
+def _quiet_doctor_cli() -> "DoctorCLI":
+    """Return a DoctorCLI that shows nothing a full check reports."""
+    from dx_vault_atlas.services.note_doctor.core.cli import DoctorCLI
+
+    class _QuietDoctorCLI(DoctorCLI):
+        def _silent(self, *_args: object, **_kwargs: object) -> None:
+            """Show nothing."""
+
+        show_header = show_scan_count = _silent
+        show_note_fixed = show_note_warnings = report_results = _silent
+
+    return _QuietDoctorCLI()
+
+
+class _QuietMigratorUI:
+    """Migrator UI that confirms the backup prompt and shows nothing."""
+
+    def show_header(self, title: str = "") -> None:
+        """Show nothing."""
+
+    def confirm(self, message: str) -> bool:  # noqa: ARG002 - IUserInterface signature
+        """Confirm without asking."""
+        return True
+
+    def print_summary(self, data: dict[str, Any]) -> None:
+        """Show nothing."""
+
+    def display_message(self, msg: str) -> None:
+        """Show nothing."""
+
+
+def _settings(vault: Path) -> Any:  # noqa: ANN401
+    from dx_vault_atlas.shared.config import GlobalConfig
+
+    return GlobalConfig(vault_path=vault, vault_inbox=vault)
+
+
+def _doctor(vault: Path, work: Path) -> _Run:
+    """Prepare a full doctor check that stops before the interactive phase."""
+    from dx_vault_atlas.services.note_doctor.app import create_app
+
+    marks: list[_Mark] = []
+
+    def hold(_queue: object) -> bool:
+        # Everything the check keeps for the wizards is alive here
+        marks.append(_mark())
+        return False
+
+    app = create_app(_settings(vault), queue_hook=hold, cli=_quiet_doctor_cli())
+    app.checkpoint_path = work / "checkpoint.json"
+    app.rename_journal_path = work / "rename_journal.json"
+
+    def run() -> _Mark | None:
+        app.run()
+        return marks[0] if marks else None
+
+    return run
+
+
+def _migrate(vault: Path, work: Path) -> _Run:  # noqa: ARG001 - runner signature
+    """Prepare a full migration that confirms its backup prompt."""
+    from dx_vault_atlas.services.note_migrator.app import create_app
+
+    app = create_app(_settings(vault), ui=_QuietMigratorUI())
+
+    def run() -> _Mark | None:
+        app.run()
+        return None
+
+    return run
+
+
+_RUNNERS: dict[str, Callable[[Path, Path], _Run]] = {
+    "doctor": _doctor,
+    "migrate": _migrate,
+}
@@ -0,0 +1,366 @@
+"""End-to-end benchmark suite over synthetic vaults.
+
+Times the pipeline stages the doctor and the migrator are built from,
+each over a whole vault, with the services wired exactly as the apps'
+``create_app`` factories wire them:
+
+- ``scan``: walk the vault for notes.
+- ``parse``: read every note and split its YAML frontmatter.
+- ``validate``: columnar validation, as the doctor's full check.
+- ``fix``: the doctor's rule chain on each validated note (in memory).
+- ``migrate``: the migrator's schema transformation (in memory).
+- ``serialize``: render each note's frontmatter back to YAML.
+
+Stages that need parsed notes parse them outside the timed region, so
+every stage measures only its own work, and nothing is written back,
+so vaults can be reused across runs. By default each stage runs in a
+fresh process: its peak RSS is its own and no stage warms another's
+caches. Reports record the commit and the vault spec, so two reports
+from the same spec can be compared (``compare``).
+"""
+
+import json
+import platform
+import subprocess
+import sys
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any
+
+from dx_vault_atlas.benchmarks.synthetic import (
+    GENERATOR_VERSION,
+    VaultSpec,
+    ensure_vault,
+)
+from dx_vault_atlas.shared.logger import logger
+
+STAGES = ("scan", "parse", "validate", "fix", "migrate", "serialize")
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+REPORT_FORMAT = 1
+
+_NS_PER_S = 1_000_000_000
+
+
+@dataclass(frozen=True)
+class StageResult:
+    """Timing of one stage over one vault.
+
+    Attributes:
+        size: Notes in the vault.
+        stage: Stage name, one of ``STAGES``.
+        notes: Notes the stage processed (unparseable ones are skipped
+            by the stages after ``parse``).
+        seconds: Time spent in the stage (best of the repeats).
+        peak_rss: Peak resident set size of the process, in bytes;
+            None where the platform does not report it.
+    """
+
+    size: int
+    stage: str
+    notes: int
+    seconds: float
+    peak_rss: int | None
+
+    @property
+    def notes_per_sec(self) -> float:
+        """Throughput of the stage."""
+        return self.notes / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-data form, with the derived throughput."""
+        return {**asdict(self), "notes_per_sec": round(self.notes_per_sec, 1)}
+
+
+@dataclass
+class BenchReport:
+    """A benchmark run: where it ran and what it measured."""
+
+    meta: dict[str, Any]
+    results: list[StageResult]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-data form, for JSON output."""
+        return {
+            "format": REPORT_FORMAT,
+            "meta": self.meta,
+            "results": [r.to_dict() for r in self.results],
+        }
+
+    def save(self, path: Path) -> None:
+        """Write the report as JSON."""
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> "BenchReport":
+        """Read a report written by ``save``.
+
+        Raises:
+            ValueError: If the file is not a report of this format.
+        """
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("format") != REPORT_FORMAT:
+            raise ValueError(f"Unsupported benchmark report format: {path}")
+        results = [
+            StageResult(
+                r["size"], r["stage"], r["notes"], r["seconds"], r["peak_rss"]
+            )
+            for r in data["results"]
+        ]
+        return cls(data["meta"], results)
+
+
+def environment(spec: VaultSpec) -> dict[str, Any]:
+    """Describe the code, machine and vault spec a run measures."""
+    try:
+        commit = subprocess.run(
+            ["git", "describe", "--always", "--dirty"],  # noqa: S607
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "generator": GENERATOR_VERSION,
+        "spec": {k: v for k, v in spec.to_dict().items() if k != "notes"},
+    }
+
+
+def comparable(base: BenchReport, head: BenchReport) -> bool:
+    """True when both reports measured vaults from the same spec."""
+    keys = ("generator", "spec")
+    return all(base.meta.get(k) == head.meta.get(k) for k in keys)
+
+
+def compare(base: BenchReport, head: BenchReport) -> list[dict[str, Any]]:
+    """Pair the results of two reports by size and stage.
+
+    Returns:
+        One row per measurement present in both, with both throughputs
+        and ``change``, the relative throughput change (+0.1 = 10% faster).
+    """
+    before = {(r.size, r.stage): r for r in base.results}
+    rows = []
+    for after in head.results:
+        old = before.get((after.size, after.stage))
+        if old is None:
+            continue
+        old_rate, new_rate = old.notes_per_sec, after.notes_per_sec
+        rows.append(
+            {
+                "size": after.size,
+                "stage": after.stage,
+                "base": old_rate,
+                "head": new_rate,
+                "change": new_rate / old_rate - 1 if old_rate else 0.0,
+                "base_rss": old.peak_rss,
+                "head_rss": after.peak_rss,
+            }
+        )
+    return rows
+
+
+# -- running --------------------------------------------------------------------
+
+
+def run_suite(
+    work_dir: Path,
+    spec: VaultSpec,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    stages: Sequence[str] = STAGES,
+    repeat: int = 1,
+    isolate: bool = True,
+    on_result: Callable[[StageResult], None] | None = None,
+) -> BenchReport:
+    """Benchmark *stages* over a synthetic vault of each size.
+
+    Args:
+        work_dir: Where vaults are generated; reused when their spec
+            matches, so only the first run pays for generation.
+        spec: Vault shape; its ``notes`` is replaced by each size.
+        sizes: Vault sizes to measure.
+        stages: Stages to time, in order.
+        repeat: Runs per stage; the fastest is kept.
+        isolate: Run each stage in a fresh process.
+        on_result: Called with each result as soon as it is measured.
+
+    Raises:
+        ValueError: If a stage is unknown.
+    """
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise ValueError(f"Unknown stages: {', '.join(sorted(unknown))}")
+
+    results = []
+    for size in sizes:
+        vault = ensure_vault(work_dir / f"vault-{size}", replace(spec, notes=size))
+        for stage in stages:
+            runs = [
+                _run(stage, size, vault.root, isolate) for _ in range(max(1, repeat))
+            ]
+            result = min(runs, key=lambda r: r.seconds)
+            rss = [r.peak_rss for r in runs if r.peak_rss is not None]
+            result = replace(result, peak_rss=max(rss) if rss else None)
+            logger.debug(f"Bench: {stage} x{size}: {result.seconds:.3f}s")
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    return BenchReport(environment(spec), results)
+
+
+def _run(stage: str, size: int, vault: Path, isolate: bool) -> StageResult:
+    """Measure one stage, in a fresh process if *isolate*."""
+    if not isolate:
+        return measure(stage, size, vault)
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(measure, stage, size, vault).result()
+
+
+def measure(stage: str, size: int, vault: Path) -> StageResult:
+    """Time one stage over *vault* in this process."""
+    notes, elapsed_ns = _STAGES[stage](vault)
+    return StageResult(size, stage, notes, elapsed_ns / _NS_PER_S, _peak_rss())
+
+
+def _peak_rss() -> int | None:
+    """Peak resident set size of this process in bytes, if known."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# -- stages ---------------------------------------------------------------------
+
+
+def _paths(vault: Path) -> list[Path]:
+    from dx_vault_atlas.shared.core.scanner import VaultScanner
+
+    return list(VaultScanner().scan(vault, ordered=True))
+
+
+def _parsed(vault: Path) -> Iterator[tuple[Path, Any]]:
+    """Yield ``(path, ParsedNote)`` for every note with frontmatter."""
+    from dx_vault_atlas.shared.yaml_parser import YamlParseError, YamlParserService
+
+    parser = YamlParserService()
+    for path in _paths(vault):
+        try:
+            parsed = parser.parse(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, YamlParseError):
+            continue
+        if parsed.has_yaml:
+            yield path, parsed
+
+
+def _settings(vault: Path) -> Any:  # noqa: ANN401
+    from dx_vault_atlas.shared.config import GlobalConfig
+
+    return GlobalConfig(vault_path=vault, vault_inbox=vault)
+
+
+def _stage_scan(vault: Path) -> tuple[int, int]:
+    from dx_vault_atlas.shared.core.scanner import VaultScanner
+
+    start = perf_counter_ns()
+    notes = sum(1 for _ in VaultScanner().scan(vault))
+    return notes, perf_counter_ns() - start
+
+
+def _stage_parse(vault: Path) -> tuple[int, int]:
+    from dx_vault_atlas.shared.yaml_parser import YamlParseError, YamlParserService
+
+    paths = _paths(vault)
+    parser = YamlParserService()
+    start = perf_counter_ns()
+    for path in paths:
+        try:
+            parser.parse(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, YamlParseError):
+            continue
+    return len(paths), perf_counter_ns() - start
+
+
+def _stage_validate(vault: Path) -> tuple[int, int]:
+    from dx_vault_atlas.services.note_doctor.app import create_app
+    from dx_vault_atlas.services.note_doctor.columnar import DEFAULT_CHUNK_SIZE
+    from dx_vault_atlas.shared.core.io import iter_chunks
+
+    doctor = create_app(_settings(vault))
+    paths = _paths(vault)
+    start = perf_counter_ns()
+    for chunk in iter_chunks(paths, DEFAULT_CHUNK_SIZE):
+        doctor.columnar.validate_batch(chunk)
+    return len(paths), perf_counter_ns() - start
+
+
+def _stage_fix(vault: Path) -> tuple[int, int]:
+    from dx_vault_atlas.services.note_doctor.app import create_app
+    from dx_vault_atlas.services.note_doctor.columnar import DEFAULT_CHUNK_SIZE
+    from dx_vault_atlas.shared.core.io import iter_chunks
+
+    doctor = create_app(_settings(vault))
+    notes = elapsed = 0
+    for chunk in iter_chunks(_paths(vault), DEFAULT_CHUNK_SIZE):
+        results = doctor.columnar.validate_batch(chunk)
+        for path, result in zip(chunk, results, strict=True):
+            if result.error:
+                continue
+            frontmatter = result.frontmatter.copy()
+            start = perf_counter_ns()
+            doctor.fixer.fix(path, frontmatter, result.body, result=result)
+            elapsed += perf_counter_ns() - start
+            notes += 1
+    return notes, elapsed
+
+
+def _stage_migrate(vault: Path) -> tuple[int, int]:
+    from dx_vault_atlas.services.note_migrator.app import create_app
+
+    transformer = create_app(_settings(vault)).transformer
+    notes = elapsed = 0
+    for path, parsed in _parsed(vault):
+        start = perf_counter_ns()
+        transformer.transform(parsed.frontmatter, path)
+        elapsed += perf_counter_ns() - start
+        notes += 1
+    return notes, elapsed
+
+
+def _stage_serialize(vault: Path) -> tuple[int, int]:
+    from dx_vault_atlas.shared.yaml_parser import YamlParserService
+
+    parser = YamlParserService()
+    notes = elapsed = 0
+    for _, parsed in _parsed(vault):
+        start = perf_counter_ns()
+        parser.serialize_frontmatter(parsed.frontmatter) + parsed.body
+        elapsed += perf_counter_ns() - start
+        notes += 1
+    return notes, elapsed
+
+
+_STAGES: dict[str, Callable[[Path], tuple[int, int]]] = {
+    "scan": _stage_scan,
+    "parse": _stage_parse,
+    "validate": _stage_validate,
+    "fix": _stage_fix,
+    "migrate": _stage_migrate,
+    "serialize": _stage_serialize,
+}
@@ -0,0 +1,535 @@
+"""Seeded generator of synthetic vaults.
+
+Writes N notes spread over every registered note type, in a directory
+tree of configurable depth, with bodies of configurable size and a
+configurable share of notes whose frontmatter is broken in one of the
+ways real vaults are (see ``INVALID_KINDS``).
+
+Valid notes are valid for the doctor too: the filename carries the
+``created`` timestamp and the sanitized title, and the title is among
+the aliases. Frontmatter is written by a small emitter of its own rather
+than by ``YamlParserService``, so a given spec produces byte-identical
+vaults on every commit and benchmark results stay comparable.
+"""
+
+import json
+import random
+import shutil
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from dx_vault_atlas.core.registry import NoteModelRegistry
+from dx_vault_atlas.shared.logger import logger
+from dx_vault_atlas.shared.models.defaults import SCHEMA_VERSION
+from dx_vault_atlas.shared.utils.title_normalizer import TitleNormalizer
+
+# Bumped whenever the generator output changes for a given spec
+GENERATOR_VERSION = 1
+
+# Written at the vault root; not a note, so scanners skip it
+MANIFEST_NAME = "synthetic.json"
+
+# Ways a note can be broken, picked uniformly among invalid notes
+INVALID_KINDS = (
+    "missing",  # a required field is absent
+    "enum",  # status/priority/area/type spelled wrong
+    "date",  # bad or inconsistent created/updated
+    "extra",  # a field no model declares
+    "version",  # outdated or missing schema version
+    "aliases",  # title missing from the aliases
+    "filename",  # filename disagrees with title or created
+    "yaml",  # unparseable frontmatter
+    "plain",  # no frontmatter at all
+)
+
+_WORDS = (  # noqa: SIM905 - easier to extend as prose
+    "atlas vault note graph index query link alias tag schema model field "
+    "value status area priority version title body draft review project "
+    "task reference map content source idea summary outline chapter topic "
+    "design system cache memory stream batch chunk worker thread process "
+    "signal event queue buffer token parser writer reader report metric "
+    "trace span budget profile sample random seed garden forest river "
+    "mountain ocean desert island valley harbor bridge tower castle market"
+).split()
+
+_EPOCH = datetime(2020, 1, 1)
+_SPAN_SECONDS = 6 * 365 * 24 * 3600
+
+# Scalars YAML would read as something other than a string
+_YAML_KEYWORDS = frozenset(
+    {"yes", "no", "y", "n", "true", "false", "null", "on", "off"}
+)
+
+# Fields every note gets, computed rather than drawn from the annotation
+_FIXED = frozenset(
+    {"version", "title", "aliases", "tags", "created", "updated", "type", "up"}
+)
+
+# Links kept around for bodies and ``up`` to point at
+_RECENT_STEMS = 256
+
+
+@dataclass(frozen=True)
+class VaultSpec:
+    """Shape of a synthetic vault; the same spec yields the same vault.
+
+    Attributes:
+        notes: Number of notes.
+        seed: Random seed.
+        invalid_ratio: Share of notes with broken frontmatter, 0 to 1.
+        body_size: Inclusive (min, max) body length in characters.
+        max_depth: Deepest directory level; 0 puts every note at the root.
+        fanout: Directories per level.
+        types: Note types to draw from; every registered one by default.
+    """
+
+    notes: int
+    seed: int = 0
+    invalid_ratio: float = 0.1
+    body_size: tuple[int, int] = (200, 2000)
+    max_depth: int = 3
+    fanout: int = 8
+    types: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        """Reject specs that cannot be generated."""
+        if self.notes < 0:
+            raise ValueError("notes must be >= 0")
+        if not 0.0 <= self.invalid_ratio <= 1.0:
+            raise ValueError("invalid_ratio must be between 0 and 1")
+        low, high = self.body_size
+        if not 0 <= low <= high:
+            raise ValueError("body_size must be (min, max) with 0 <= min <= max")
+        if self.max_depth < 0 or self.fanout < 1:
+            raise ValueError("max_depth must be >= 0 and fanout >= 1")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-data form, for manifests and benchmark reports."""
+        data = asdict(self)
+        data["body_size"] = list(self.body_size)
+        data["types"] = list(self.types)
+        return data
+
+
+@dataclass
+class SyntheticVault:
+    """What a generator run wrote.
+
+    Attributes:
+        root: Vault root.
+        spec: Spec the vault was generated from.
+        types: Notes per note type.
+        invalid: Invalid notes per kind of breakage.
+    """
+
+    root: Path
+    spec: VaultSpec
+    types: dict[str, int] = field(default_factory=dict)
+    invalid: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def invalid_count(self) -> int:
+        """Notes with broken frontmatter."""
+        return sum(self.invalid.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Manifest form."""
+        return {
+            "generator": GENERATOR_VERSION,
+            "spec": self.spec.to_dict(),
+            "types": self.types,
+            "invalid": self.invalid,
+        }
+
+    @classmethod
+    def load(cls, root: Path) -> "SyntheticVault | None":
+        """Read the manifest of *root*; None when absent or outdated."""
+        try:
+            data = json.loads((root / MANIFEST_NAME).read_text(encoding="utf-8"))
+            if data.get("generator") != GENERATOR_VERSION:
+                return None
+            spec = data["spec"]
+            spec["body_size"] = tuple(spec["body_size"])
+            spec["types"] = tuple(spec["types"])
+            return cls(root, VaultSpec(**spec), data["types"], data["invalid"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+def generate_vault(root: Path, spec: VaultSpec) -> SyntheticVault:
+    """Write the vault described by *spec* under *root*.
+
+    *root* must not exist, be empty, or hold an earlier synthetic vault
+    (recognized by its manifest), which is replaced.
+
+    Raises:
+        ValueError: If *root* holds anything but a synthetic vault.
+    """
+    if root.exists() and any(root.iterdir()):
+        if not (root / MANIFEST_NAME).exists():
+            raise ValueError(f"Refusing to overwrite non-synthetic directory: {root}")
+        shutil.rmtree(root)
+    root.mkdir(parents=True, exist_ok=True)
+
+    vault = SyntheticVault(root, spec)
+    writer = _NoteWriter(spec)
+    for rel, text, note_type, kind in writer.notes():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        vault.types[note_type] = vault.types.get(note_type, 0) + 1
+        if kind is not None:
+            vault.invalid[kind] = vault.invalid.get(kind, 0) + 1
+
+    (root / MANIFEST_NAME).write_text(
+        json.dumps(vault.to_dict(), indent=2), encoding="utf-8"
+    )
+    logger.debug(
+        f"Synthetic vault: {spec.notes} notes, {vault.invalid_count} invalid at {root}"
+    )
+    return vault
+
+
+def ensure_vault(root: Path, spec: VaultSpec) -> SyntheticVault:
+    """Return the vault at *root*, generating it unless it matches *spec*."""
+    existing = SyntheticVault.load(root)
+    if existing is not None and existing.spec == spec:
+        return existing
+    return generate_vault(root, spec)
+
+
+# -- generation -------------------------------------------------------------------
+
+
+class _NoteWriter:
+    """Draws notes from a single seeded random stream."""
+
+    def __init__(self, spec: VaultSpec) -> None:
+        import dx_vault_atlas.shared.models.note  # noqa: F401  (registers models)
+
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.models = NoteModelRegistry.get_all()
+        self.types = spec.types or tuple(sorted(self.models))
+        unknown = set(self.types) - set(self.models)
+        if unknown:
+            raise ValueError(f"Unknown note types: {', '.join(sorted(unknown))}")
+        self.recent: list[str] = []
+        self.used: set[str] = set()
+
+    def notes(self) -> Iterator[tuple[str, str, str, str | None]]:
+        """Yield ``(relative path, text, type, invalid kind or None)``."""
+        rng = self.rng
+        for i in range(self.spec.notes):
+            note_type = rng.choice(self.types)
+            kind = (
+                rng.choice(INVALID_KINDS)
+                if rng.random() < self.spec.invalid_ratio
+                else None
+            )
+            title = " ".join(rng.choices(_WORDS, k=rng.randint(1, 4))).capitalize()
+            created = _EPOCH + timedelta(seconds=rng.randrange(_SPAN_SECONDS))
+            stem = f"{created:%Y%m%d%H%M%S}_{TitleNormalizer.sanitize(title)}"
+            folder = self._folder()
+            if f"{folder}{stem}" in self.used:
+                title = f"{title} {i}"
+                stem = f"{stem}_{i}"
+            self.used.add(f"{folder}{stem}")
+
+            frontmatter = self._frontmatter(note_type, title, created)
+            body = self._body(title)
+            text = None
+            if kind is not None:
+                stem, text = self._corrupt(kind, stem, frontmatter, body)
+            if text is None:
+                text = _emit(frontmatter) + body
+
+            self.recent.append(stem)
+            if len(self.recent) > _RECENT_STEMS:
+                del self.recent[: _RECENT_STEMS // 2]
+            yield f"{folder}{stem}.md", text, note_type, kind
+
+    def _folder(self) -> str:
+        """A directory path, ``""`` or ``"d0_3/d1_0/"`` style."""
+        depth = self.rng.randint(0, self.spec.max_depth)
+        return "".join(
+            f"d{level}_{self.rng.randrange(self.spec.fanout)}/"
+            for level in range(depth)
+        )
+
+    def _frontmatter(
+        self, note_type: str, title: str, created: datetime
+    ) -> dict[str, Any]:
+        """Frontmatter valid against the model of *note_type*."""
+        rng = self.rng
+        fixed = {
+            "version": SCHEMA_VERSION,
+            "title": title,
+            "aliases": [title],
+            "tags": sorted(set(rng.choices(_WORDS, k=rng.randint(0, 3)))),
+            "created": created,
+            "updated": created + timedelta(seconds=rng.randrange(30 * 24 * 3600)),
+            "type": note_type,
+            "up": f"[[{rng.choice(self.recent)}]]" if self.recent else "[[ ]]",
+        }
+        frontmatter: dict[str, Any] = {}
+        for name, info in self.models[note_type].model_fields.items():
+            key = info.alias or name
+            if key in _FIXED:
+                frontmatter[key] = fixed[key]
+            # The doctor wants defaulted fields spelled out; nullable ones
+            # are optional
+            elif info.default is not None or rng.random() < 0.5:
+                value = _random_value(rng, info.annotation, created)
+                if value is not None:
+                    frontmatter[key] = value
+        return frontmatter
+
+    def _body(self, title: str) -> str:
+        """Markdown paragraphs of the configured size, with wikilinks."""
+        rng = self.rng
+        size = rng.randint(*self.spec.body_size)
+        parts = [f"# {title}\n\n"]
+        length = len(parts[0])
+        while length < size:
+            words = rng.choices(_WORDS, k=rng.randint(8, 40))
+            if self.recent and rng.random() < 0.3:
+                words[rng.randrange(len(words))] = f"[[{rng.choice(self.recent)}]]"
+            paragraph = " ".join(words).capitalize() + ".\n\n"
+            parts.append(paragraph)
+            length += len(paragraph)
+        return "".join(parts)[: max(size, len(parts[0]))]
+
+    def _corrupt(
+        self, kind: str, stem: str, frontmatter: dict[str, Any], body: str
+    ) -> tuple[str, str | None]:
+        """Break a note; return its stem and, if not emitted, its text."""
+        model = self.models[frontmatter["type"]]
+        return _CORRUPTORS[kind](self.rng, model, stem, frontmatter, body)
+
+
+# -- corruptors -------------------------------------------------------------------
+
+# Each takes (rng, model, stem, frontmatter, body), may edit frontmatter in
+# place, and returns the stem plus the full text when it renders the note itself
+
+_Corruptor = Callable[
+    [random.Random, type[BaseModel], str, dict[str, Any], str],
+    tuple[str, str | None],
+]
+
+
+def _drop_required(
+    rng: random.Random,
+    model: type[BaseModel],
+    stem: str,
+    frontmatter: dict[str, Any],
+    body: str,  # noqa: ARG001 - corruptor signature
+) -> tuple[str, str | None]:
+    """Remove a required field."""
+    required = [
+        info.alias or name
+        for name, info in model.model_fields.items()
+        if info.is_required()
+    ]
+    frontmatter.pop(rng.choice(required), None)
+    return stem, None
+
+
+def _misspell_enum(
+    rng: random.Random,
+    model: type[BaseModel],
+    stem: str,
+    frontmatter: dict[str, Any],
+    body: str,  # noqa: ARG001 - corruptor signature
+) -> tuple[str, str | None]:
+    """Spell type, status, priority or area wrong."""
+    choices = {"type": frontmatter["type"].upper()}
+    if "status" in model.model_fields:
+        choices["status"] = rng.choice(["Done", "doing", "In Progress"])
+    if "priority" in model.model_fields:
+        choices["priority"] = rng.choice(["High", "urgent", 9])
+    if "area" in model.model_fields:
+        choices["area"] = rng.choice(["Work", "home"])
+    key = rng.choice(sorted(choices))
+    frontmatter[key] = choices[key]
+    return stem, None
+
+
+def _break_dates(
+    rng: random.Random,
+    model: type[BaseModel],  # noqa: ARG001 - corruptor signature
+    stem: str,
+    frontmatter: dict[str, Any],
+    body: str,  # noqa: ARG001 - corruptor signature
+) -> tuple[str, str | None]:
+    """Reformat, truncate, reorder or drop the dates."""
+    created = frontmatter["created"]
+    variant = rng.randrange(4)
+    if variant == 0:
+        frontmatter["created"] = f"{created:%d/%m/%Y}"
+    elif variant == 1:
+        frontmatter["created"] = created.date()
+    elif variant == 2:
+        frontmatter["updated"] = created - timedelta(days=1)
+    else:
+        del frontmatter["created"]
+    return stem, None
+
+
+def _add_extra(
+    rng: random.Random,
+    model: type[BaseModel],  # noqa: ARG001 - corruptor signature
+    stem: str,
+    frontmatter: dict[str, Any],
+    body: str,  # noqa: ARG001 - corruptor signature
+) -> tuple[str, str | None]:
+    """Add a field no model declares."""
+    frontmatter[rng.choice(["owner", "due", "rating"])] = rng.choice(_WORDS)
+    return stem, None
+
+
+def _outdate_version(
+    rng: random.Random,
+    model: type[BaseModel],  # noqa: ARG001 - corruptor signature
+    stem: str,
+    frontmatter: dict[str, Any],
+    body: str,  # noqa: ARG001 - corruptor signature
+) -> tuple[str, str | None]:
+    """Set an old schema version or drop it."""
+    if rng.random() < 0.5:
+        frontmatter["version"] = "0.9"
+    else:
+        del frontmatter["version"]
+    return stem, None
+
+
+def _clear_aliases(
+    rng: random.Random,  # noqa: ARG001 - corruptor signature
+    model: type[BaseModel],  # noqa: ARG001 - corruptor signature
+    stem: str,
+    frontmatter: dict[str, Any],
+    body: str,  # noqa: ARG001 - corruptor signature
+) -> tuple[str, str | None]:
+    """Leave the title out of the aliases."""
+    frontmatter["aliases"] = []
+    return stem, None
+
+
+def _rename_file(
+    rng: random.Random,
+    model: type[BaseModel],  # noqa: ARG001 - corruptor signature
+    stem: str,
+    frontmatter: dict[str, Any],  # noqa: ARG001 - corruptor signature
+    body: str,  # noqa: ARG001 - corruptor signature
+) -> tuple[str, str | None]:
+    """Put a word in the filename that the title does not have."""
+    return f"{stem[:14]}_{rng.choice(_WORDS)}_{stem[15:]}", None
+
+
+def _unclose_yaml(
+    rng: random.Random,  # noqa: ARG001 - corruptor signature
+    model: type[BaseModel],  # noqa: ARG001 - corruptor signature
+    stem: str,
+    frontmatter: dict[str, Any],
+    body: str,
+) -> tuple[str, str | None]:
+    """Open a flow sequence in the title that never closes."""
+    text = _emit(frontmatter).replace("\ntitle: ", "\ntitle: [", 1)
+    return stem, text + body
+
+
+def _drop_frontmatter(
+    rng: random.Random,  # noqa: ARG001 - corruptor signature
+    model: type[BaseModel],  # noqa: ARG001 - corruptor signature
+    stem: str,
+    frontmatter: dict[str, Any],  # noqa: ARG001 - corruptor signature
+    body: str,
+) -> tuple[str, str | None]:
+    """Write the body alone."""
+    return stem, body
+
+
+_CORRUPTORS: dict[str, _Corruptor] = {
+    "missing": _drop_required,
+    "enum": _misspell_enum,
+    "date": _break_dates,
+    "extra": _add_extra,
+    "version": _outdate_version,
+    "aliases": _clear_aliases,
+    "filename": _rename_file,
+    "yaml": _unclose_yaml,
+    "plain": _drop_frontmatter,
+}
+
+
+def _random_value(
+    rng: random.Random,
+    annotation: Any,  # noqa: ANN401
+    created: datetime,
+) -> Any:  # noqa: ANN401
+    """A value of *annotation*'s type; None for types it cannot draw."""
+    if get_origin(annotation) in (Union, UnionType):
+        options = [a for a in get_args(annotation) if a is not NoneType]
+        annotation = options[0] if options else NoneType
+    origin = get_origin(annotation) or annotation
+    if isinstance(origin, type) and issubclass(origin, Enum):
+        return rng.choice(list(origin)).value
+    if origin is bool:
+        return rng.random() < 0.5
+    if origin is int:
+        return rng.randint(1, 5)
+    if origin is datetime:
+        return created + timedelta(days=rng.randrange(365))
+    if origin is str:
+        return rng.choice(_WORDS)
+    if origin is list:
+        return rng.choices(_WORDS, k=rng.randint(1, 3))
+    return None
+
+
+# -- emitter ----------------------------------------------------------------------
+
+
+def _scalar(value: Any) -> str:  # noqa: ANN401
+    """Render a scalar as YAML, quoting strings YAML would misread."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int | float):
+        return str(value)
+    if isinstance(value, datetime):
+        return f"{value:%Y-%m-%d %H:%M:%S}"
+    if isinstance(value, date):
+        return value.isoformat()
+    text = str(value)
+    if (
+        text
+        and text[0].isalpha()
+        and text.replace(" ", "").replace("_", "").isalnum()
+        and text.isascii()
+        and text.lower() not in _YAML_KEYWORDS
+    ):
+        return text
+    return json.dumps(text, ensure_ascii=False)
+
+
+def _emit(frontmatter: dict[str, Any]) -> str:
+    """Render frontmatter between ``---`` fences, lists in flow style."""
+    lines = ["---"]
+    for key, value in frontmatter.items():
+        if isinstance(value, list):
+            rendered = "[" + ", ".join(_scalar(item) for item in value) + "]"
+        else:
+            rendered = _scalar(value)
+        lines.append(f"{key}: {rendered}")
+    lines.append("---\n")
+    return "\n".join(lines)
@@ -5,28 +5,51 @@ Refactored to comply with:
 - Skill 01: Project Structure (Imports)
 """
 
-import json
 import sys
+from functools import cache
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.traceback import install as install_rich_traceback
 
 # Adjust imports based on new src/ structure if necessary,
 # assuming installed in editable mode or PYTHONPATH set.
-from dx_vault_atlas.shared.config import (
-    ConfigNotFoundError,
-    get_config_manager,
-)
-from dx_vault_atlas.shared.logger import logger  # Skill 07
-from dx_vault_atlas.shared.tui.config_wizard import run_setup_wizard
+# Keep module-level imports light: Rich, Pydantic and Textual are
+# imported by the commands that use them, so `--help` and scripted
+# commands start fast (see benchmarks.importtime).
+from dx_vault_atlas.shared.logger import LOG_DIR, logger  # Skill 07
+from dx_vault_atlas.shared.tracing import DEFAULT_CAPACITY
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from dx_vault_atlas.shared.profiling import StageTime
+
+
+def _rich_excepthook(
+    exc_type: type[BaseException],
+    exc: BaseException,
+    tb: TracebackType | None,
+) -> None:
+    """Install Rich tracebacks on the first unhandled exception, then show it."""
+    from rich.traceback import install as install_rich_traceback
+
+    install_rich_traceback(show_locals=False)
+    sys.excepthook(exc_type, exc, tb)
+
 
 # Setup Rich for unhandled exceptions in TUI mode
-install_rich_traceback(show_locals=False)
+sys.excepthook = _rich_excepthook
+
+
+@cache
+def _console() -> "Console":
+    """Stdout console, created on first use."""
+    from rich.console import Console
+
+    return Console()
 
-console = Console()
 
 app = typer.Typer(
     name="dx-vault-atlas",
@@ -39,10 +62,54 @@ app = typer.Typer(
 config_app = typer.Typer(help="Manage application configuration.")
 app.add_typer(config_app, name="config")
 
+# Tag and alias subcommand group
+tags_app = typer.Typer(help="Query notes by tags and aliases.")
+app.add_typer(tags_app, name="tags")
+
+# Link graph subcommand group
+graph_app = typer.Typer(help="Query the vault's wikilink graph.")
+app.add_typer(graph_app, name="graph")
+
+# Where ``--profile`` writes its cProfile stats by default
+PROFILE_PATH = LOG_DIR / "profile.pstats"
+
+_PROFILE_OUTPUT = typer.Option(
+    PROFILE_PATH, "--profile-output", help="Where --profile saves cProfile stats."
+)
+
+_TRACE = typer.Option(
+    None,
+    "--trace",
+    envvar="DX_TRACE",
+    help="Record per-note spans and save them as a Chrome trace "
+    "(open in ui.perfetto.dev).",
+)
+
 
 @app.callback(invoke_without_command=True)
-def init_config(ctx: typer.Context) -> None:
+def init_config(
+    ctx: typer.Context,
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Profile the command: save cProfile stats and print a per-stage "
+        "time breakdown at exit.",
+    ),
+    profile_output: Path = _PROFILE_OUTPUT,
+    trace: Path | None = _TRACE,
+    trace_buffer: int = typer.Option(
+        DEFAULT_CAPACITY,
+        "--trace-buffer",
+        min=1,
+        help="Spans --trace keeps; the oldest are dropped beyond it.",
+    ),
+) -> None:
     """Ensure configuration exists before running commands."""
+    if profile:
+        _start_profile(ctx, profile_output)
+    if trace is not None:
+        _start_trace(ctx, trace, trace_buffer)
+
     if ctx.invoked_subcommand == "config":
         return
 
@@ -54,21 +121,113 @@ def init_config(ctx: typer.Context) -> None:
     except Exception as e:
         # Log internal error, show user friendly error
         logger.critical(f"Bootstrap failed: {e}", exc_info=True)
-        console.print(
+        _console().print(
             f"[bold red]Critical Error:[/bold red] Could not initialize configuration. See logs at {logger.handlers[0].baseFilename}"
         )
         raise typer.Exit(1)
 
 
+def _start_profile(ctx: typer.Context, output: Path) -> None:
+    """Profile the rest of the run; report when the command exits."""
+    from dx_vault_atlas.shared.profiling import ProfileSession
+
+    session = ProfileSession(output)
+
+    def report() -> None:
+        try:
+            breakdown = session.finish()
+            saved: Path | None = output
+        except OSError as e:
+            logger.warning(f"Could not save profile to {output}: {e}")
+            breakdown, saved = session.timer.breakdown(), None
+        _show_profile(breakdown, session.timer.wall_ns, saved)
+
+    ctx.call_on_close(report)
+    session.start()
+
+
+def _start_trace(ctx: typer.Context, output: Path, capacity: int) -> None:
+    """Trace the rest of the run; export the spans when the command exits."""
+    from rich.console import Console
+
+    from dx_vault_atlas.shared.tracing import TRACER
+
+    def export() -> None:
+        TRACER.stop()
+        err = Console(stderr=True)
+        try:
+            spans = TRACER.export(output)
+        except OSError as e:
+            logger.warning(f"Could not save trace to {output}: {e}")
+            err.print(f"[yellow]Could not save trace to {output}: {e}[/yellow]")
+            return
+        dropped = (
+            f", {TRACER.dropped:,} oldest dropped (raise --trace-buffer)"
+            if TRACER.dropped
+            else ""
+        )
+        err.print(f"[dim]Trace of {spans:,} spans saved to {output}{dropped}[/dim]")
+
+    ctx.call_on_close(export)
+    TRACER.start(capacity)
+
+
+def _show_profile(
+    breakdown: list["StageTime"], wall_ns: int, saved: Path | None
+) -> None:
+    """Print the per-stage breakdown on stderr, clear of command output."""
+    from rich.console import Console
+    from rich.table import Table
+
+    err = Console(stderr=True)
+    wall = wall_ns / 1e9
+    table = Table(
+        title="Profile",
+        title_justify="left",
+        caption="Times include cProfile overhead.",
+        caption_justify="left",
+    )
+    table.add_column("Stage", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Share", justify="right")
+
+    def share(seconds: float) -> str:
+        return f"{seconds / wall:.1%}" if wall > 0 else "-"
+
+    for item in breakdown:
+        table.add_row(
+            item.name, f"{item.calls:,}", f"{item.seconds:.3f}", share(item.seconds)
+        )
+    other = wall - sum(item.seconds for item in breakdown)
+    if other > 0:
+        table.add_row("[dim]other[/dim]", "", f"{other:.3f}", share(other))
+    table.add_section()
+    table.add_row("[bold]total[/bold]", "", f"[bold]{wall:.3f}[/bold]", "")
+    err.print(table)
+    if saved is not None:
+        err.print(
+            f"[dim]cProfile stats saved to {saved} "
+            f"(inspect with: python -m pstats {saved})[/dim]"
+        )
+
+
 @config_app.command("show")
 def config_show() -> None:
     """Display current configuration."""
+    import json
+
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+
+    from dx_vault_atlas.shared.config import ConfigNotFoundError, get_config_manager
+
     manager = get_config_manager()
 
     try:
         config = manager.load()
     except ConfigNotFoundError:
-        console.print(
+        _console().print(
             "[yellow]No configuration found.[/yellow] "
             "Run any command to start the setup wizard."
         )
@@ -78,7 +237,7 @@ def config_show() -> None:
     data = config.model_dump(mode="json")
     json_str = json.dumps(data, indent=2, ensure_ascii=False)
 
-    console.print(
+    _console().print(
         Panel(
             Syntax(json_str, "json", theme="monokai"),
             title=f"[bold]Config[/bold] ({manager.config_path})",
@@ -100,6 +259,9 @@ def config_edit() -> None:
 @config_app.command("reset")
 def config_reset() -> None:
     """Delete configuration and run setup wizard."""
+    from dx_vault_atlas.shared.config import get_config_manager
+    from dx_vault_atlas.shared.tui.config_wizard import run_setup_wizard
+
     manager = get_config_manager()
 
     if manager.exists():
@@ -108,12 +270,12 @@ def config_reset() -> None:
         if not Confirm.ask(
             "[yellow]Delete current configuration and start fresh?[/yellow]"
         ):
-            console.print("Cancelled.")
+            _console().print("Cancelled.")
             raise typer.Exit(0)
 
         manager.delete()
         logger.info("Configuration reset by user.")
-        console.print("[dim]Configuration deleted.[/dim]\n")
+        _console().print("[dim]Configuration deleted.[/dim]\n")
 
     config = run_setup_wizard()
     if config:
@@ -159,6 +321,13 @@ def note_migrator(
     app_instance.run(rename_only=rename_only, debug_mode=debug_mode)
 
 
+_REPORT = typer.Option(
+    None,
+    "--report",
+    help="With --batch: stream one JSON line per note to this file.",
+)
+
+
 @app.command(name="doctor")
 def note_doctor(
     fix_date: bool = typer.Option(
@@ -171,6 +340,27 @@ def note_doctor(
         "--debug-mode",
         help="Enable debug logging and disable TUI for inputs.",
     ),
+    profile_rules: bool = typer.Option(
+        False,
+        "--profile-rules",
+        help="Time every validation/fix rule and print a profile at the end.",
+    ),
+    batch: bool = typer.Option(
+        False,
+        "--batch",
+        help="Apply safe auto-fixes without prompting (for CI/cron).",
+    ),
+    report: Path | None = _REPORT,
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Continue the last interrupted interactive session.",
+    ),
+    rename_all: bool = typer.Option(
+        False,
+        "--rename-all",
+        help="Fix every filename mismatch at once (planned, transactional).",
+    ),
 ) -> None:
     """Interactive doctor to fix invalid notes."""
     from dx_vault_atlas.services.note_doctor.app import create_app
@@ -183,9 +373,297 @@ def note_doctor(
         enable_debug_logging()
         logger.debug("Debug mode enabled")
 
+    if report is not None and not batch:
+        raise typer.BadParameter("--report requires --batch", param_hint="--report")
+    if resume and (batch or fix_date):
+        raise typer.BadParameter(
+            "--resume cannot be combined with --batch or --fix-date",
+            param_hint="--resume",
+        )
+    if rename_all and (batch or fix_date or resume):
+        raise typer.BadParameter(
+            "--rename-all cannot be combined with --batch, --fix-date or --resume",
+            param_hint="--rename-all",
+        )
+
     settings = get_settings()
-    app_instance = create_app(settings)
-    app_instance.run(fix_date=fix_date, debug_mode=debug_mode)
+    app_instance = create_app(settings, profile_rules=profile_rules)
+    app_instance.run(
+        fix_date=fix_date,
+        debug_mode=debug_mode,
+        batch=batch,
+        report_path=report,
+        resume=resume,
+        rename_all=rename_all,
+    )
+
+
+_INDEX_CACHED_HELP = "Answer from the stored index without re-checking the vault."
+
+
+def _check_format(output: str, formats: tuple[str, ...]) -> None:
+    """Reject an unknown ``--format`` value."""
+    if output not in formats:
+        raise typer.BadParameter(
+            f"expected one of {', '.join(formats)}", param_hint="--format"
+        )
+
+
+_CONDITIONS = typer.Argument(
+    None,
+    help='Filters that must all hold, e.g. "type=task" "priority>=3" "tags=work".',
+)
+
+
+@app.command(name="query")
+def vault_query(
+    conditions: list[str] | None = _CONDITIONS,
+    fields: str = typer.Option(
+        "path,type,title",
+        "--fields",
+        help="Comma-separated fields to show.",
+    ),
+    sort: str = typer.Option(
+        "path",
+        "--sort",
+        help="Comma-separated sort fields; prefix with - for descending.",
+    ),
+    limit: int | None = typer.Option(None, "--limit", min=1, help="Maximum rows."),
+    output: str = typer.Option(
+        "table",
+        "--format",
+        help="Output format: table, jsonl or paths.",
+    ),
+    cached: bool = typer.Option(False, "--cached", help=_INDEX_CACHED_HELP),
+) -> None:
+    """Query note metadata from the persistent vault index."""
+    from dx_vault_atlas.services.vault_index.app import create_app
+    from dx_vault_atlas.services.vault_index.query import OUTPUT_FORMATS, QueryError
+    from dx_vault_atlas.shared.config import get_settings
+
+    _check_format(output, OUTPUT_FORMATS)
+
+    app_instance = create_app(get_settings())
+    try:
+        query = app_instance.parse(conditions or [], fields, sort, limit)
+    except QueryError as e:
+        raise typer.BadParameter(str(e)) from e
+    app_instance.query(query, output=output, refresh=not cached)
+
+
+_SEARCH_TEXT = typer.Argument(..., help="Words to search for.")
+_SEARCH_WHERE = typer.Option(
+    None,
+    "--where",
+    "-w",
+    help='Frontmatter filter as in dxva query, e.g. "type=task" (repeatable).',
+)
+
+
+@app.command(name="search")
+def vault_search(
+    text: list[str] = _SEARCH_TEXT,
+    where: list[str] | None = _SEARCH_WHERE,
+    limit: int = typer.Option(20, "--limit", min=1, help="Maximum results."),
+    require_all: bool = typer.Option(
+        False,
+        "--all",
+        help="Only match notes containing every word.",
+    ),
+    output: str = typer.Option(
+        "table",
+        "--format",
+        help="Output format: table, jsonl or paths.",
+    ),
+    cached: bool = typer.Option(False, "--cached", help=_INDEX_CACHED_HELP),
+) -> None:
+    """Full-text search over note titles and bodies, ranked by BM25."""
+    from dx_vault_atlas.services.vault_index.app import create_app
+    from dx_vault_atlas.services.vault_index.query import OUTPUT_FORMATS, QueryError
+    from dx_vault_atlas.shared.config import get_settings
+
+    _check_format(output, OUTPUT_FORMATS)
+
+    app_instance = create_app(get_settings())
+    try:
+        filters = app_instance.parse(where or [], "path", "path", None)
+    except QueryError as e:
+        raise typer.BadParameter(str(e), param_hint="--where") from e
+    app_instance.search(
+        " ".join(text),
+        filters=filters,
+        limit=limit,
+        require_all=require_all,
+        output=output,
+        refresh=not cached,
+    )
+
+
+@tags_app.command("query")
+def tags_query(
+    expression: str = typer.Argument(
+        ..., help='Tags combined with & | ! and parentheses, e.g. "work & !archived".'
+    ),
+    output: str = typer.Option(
+        "table", "--format", help="Output format: table, jsonl or paths."
+    ),
+    cached: bool = typer.Option(False, "--cached", help=_INDEX_CACHED_HELP),
+) -> None:
+    """List the notes matching a tag expression."""
+    from dx_vault_atlas.services.vault_index.app import create_app
+    from dx_vault_atlas.services.vault_index.query import OUTPUT_FORMATS, QueryError
+    from dx_vault_atlas.shared.config import get_settings
+
+    _check_format(output, OUTPUT_FORMATS)
+    app_instance = create_app(get_settings())
+    try:
+        expr = app_instance.parse_tags(expression)
+    except QueryError as e:
+        raise typer.BadParameter(str(e), param_hint="EXPRESSION") from e
+    app_instance.tags_query(expr, output=output, refresh=not cached)
+
+
+@tags_app.command("stats")
+def tags_stats(
+    aliases: bool = typer.Option(
+        False, "--aliases", help="Count aliases instead of tags."
+    ),
+    limit: int | None = typer.Option(30, "--limit", min=1, help="Rows to show."),
+    output: str = typer.Option(
+        "table", "--format", help="Output format: table or jsonl."
+    ),
+    cached: bool = typer.Option(False, "--cached", help=_INDEX_CACHED_HELP),
+) -> None:
+    """Show how many notes carry each tag (or alias)."""
+    from dx_vault_atlas.services.vault_index.app import create_app
+    from dx_vault_atlas.shared.config import get_settings
+
+    _check_format(output, ("table", "jsonl"))
+    create_app(get_settings()).tag_stats(
+        "aliases" if aliases else "tags",
+        limit=limit,
+        output=output,
+        refresh=not cached,
+    )
+
+
+@tags_app.command("alias")
+def tags_alias(
+    name: str = typer.Argument(..., help="Alias to resolve."),
+    output: str = typer.Option(
+        "table", "--format", help="Output format: table, jsonl or paths."
+    ),
+    cached: bool = typer.Option(False, "--cached", help=_INDEX_CACHED_HELP),
+) -> None:
+    """List the notes that declare an alias."""
+    from dx_vault_atlas.services.vault_index.app import create_app
+    from dx_vault_atlas.services.vault_index.query import OUTPUT_FORMATS
+    from dx_vault_atlas.shared.config import get_settings
+
+    _check_format(output, OUTPUT_FORMATS)
+    create_app(get_settings()).alias(name, output=output, refresh=not cached)
+
+
+@app.command(name="stats")
+def vault_stats(
+    output: str = typer.Option(
+        "table", "--format", help="Output format: table or json."
+    ),
+    cached: bool = typer.Option(False, "--cached", help=_INDEX_CACHED_HELP),
+) -> None:
+    """Show note counts by type, status, area, priority, version and month."""
+    from dx_vault_atlas.services.vault_index.app import create_app
+    from dx_vault_atlas.shared.config import get_settings
+
+    _check_format(output, ("table", "json"))
+    create_app(get_settings()).stats(output=output, refresh=not cached)
+
+
+_EXPORT_DESTINATION = typer.Option(
+    None, "--output", "-o", help="File to write; standard output by default."
+)
+
+
+@app.command(name="export")
+def vault_export(
+    output: str = typer.Option(
+        "jsonl", "--format", help="Output format: jsonl or csv."
+    ),
+    destination: Path | None = _EXPORT_DESTINATION,
+    workers: int = typer.Option(
+        1, "--workers", min=0, help="Parsing processes (0 = one per CPU)."
+    ),
+) -> None:
+    """Stream every note's frontmatter as JSONL or CSV, in stable path order."""
+    from dx_vault_atlas.services.vault_index.app import create_app
+    from dx_vault_atlas.services.vault_index.export import EXPORT_FORMATS
+    from dx_vault_atlas.shared.config import get_settings
+
+    _check_format(output, EXPORT_FORMATS)
+    create_app(get_settings()).export(output, destination=destination, workers=workers)
+
+
+@app.command(name="dedupe")
+def vault_dedupe(
+    threshold: float = typer.Option(
+        0.8,
+        "--threshold",
+        min=0.0,
+        max=1.0,
+        help="Minimum Jaccard similarity of word shingles to report.",
+    ),
+    whole_vault: bool = typer.Option(
+        False, "--vault", help="Check the whole vault instead of the inbox."
+    ),
+    output: str = typer.Option(
+        "table", "--format", help="Output format: table or jsonl."
+    ),
+) -> None:
+    """Find near-duplicate notes (MinHash + LSH, verified with exact Jaccard)."""
+    from dx_vault_atlas.services.vault_index.app import create_app
+    from dx_vault_atlas.shared.config import get_settings
+
+    _check_format(output, ("table", "jsonl"))
+    create_app(get_settings()).dedupe(threshold, whole_vault=whole_vault, output=output)
+
+
+_CACHED_HELP = "Answer from the stored graph without re-checking the vault."
+
+
+@graph_app.command("backlinks")
+def graph_backlinks(
+    note: str = typer.Argument(..., help="Note path, filename or [[link]]."),
+    cached: bool = typer.Option(False, "--cached", help=_CACHED_HELP),
+) -> None:
+    """List the notes that link to a note."""
+    from dx_vault_atlas.services.link_graph.app import create_app
+    from dx_vault_atlas.shared.config import get_settings
+
+    app_instance = create_app(get_settings())
+    if not app_instance.backlinks(note, refresh=not cached):
+        raise typer.Exit(1)
+
+
+@graph_app.command("orphans")
+def graph_orphans(
+    cached: bool = typer.Option(False, "--cached", help=_CACHED_HELP),
+) -> None:
+    """List the notes no other note links to."""
+    from dx_vault_atlas.services.link_graph.app import create_app
+    from dx_vault_atlas.shared.config import get_settings
+
+    create_app(get_settings()).orphans(refresh=not cached)
+
+
+@graph_app.command("broken")
+def graph_broken(
+    cached: bool = typer.Option(False, "--cached", help=_CACHED_HELP),
+) -> None:
+    """List wikilinks that point to no existing note."""
+    from dx_vault_atlas.services.link_graph.app import create_app
+    from dx_vault_atlas.shared.config import get_settings
+
+    create_app(get_settings()).broken(refresh=not cached)
 
 
 def main():
@@ -198,11 +676,11 @@ def main():
     except Exception as e:
         # THE MAIN CATCH: Captura todo lo que no fue manejado
         logger.critical(f"Unhandled exception at top level: {e}", exc_info=True)
-        console.print("\n[bold red]FATAL ERROR[/bold red]")
-        console.print(
+        _console().print("\n[bold red]FATAL ERROR[/bold red]")
+        _console().print(
             f"An unexpected error occurred. Please check the logs at: [cyan]{logger.handlers[0].baseFilename}[/cyan]"
         )
-        console.print(f"Error details: {e}")
+        _console().print(f"Error details: {e}")
         sys.exit(1)
 
 
@@ -0,0 +1 @@
+"""Link Graph Service."""
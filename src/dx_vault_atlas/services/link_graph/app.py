@@ -0,0 +1,75 @@
+"""Link Graph application orchestrator."""
+
+from pathlib import Path
+from time import perf_counter_ns
+
+from dx_vault_atlas.services.link_graph.core.cli import GraphCLI
+from dx_vault_atlas.services.link_graph.graph import LinkGraph
+from dx_vault_atlas.shared.config import GlobalConfig
+from dx_vault_atlas.shared.core.scanner import VaultScanner
+from dx_vault_atlas.shared.logger import logger
+from dx_vault_atlas.shared.paths import vault_data_dir
+
+_NS_PER_MS = 1_000_000
+
+
+class LinkGraphApp:
+    """Answers backlink, orphan and broken-link queries over the vault.
+
+    The graph is stored per vault and refreshed incrementally before each
+    query, so only notes whose content changed are re-read for links.
+    """
+
+    def __init__(
+        self,
+        settings: GlobalConfig,
+        cli: GraphCLI,
+        store_path: Path | None = None,
+    ) -> None:
+        """Initialise LinkGraphApp with dependencies."""
+        self.settings = settings
+        self.cli = cli
+        self.scanner = VaultScanner()
+        self.store_path = store_path or (
+            vault_data_dir(settings.vault_path) / "link_graph.json"
+        )
+
+    def load(self, refresh: bool = True) -> LinkGraph:
+        """Load the stored graph, bringing it up to date unless told not to."""
+        vault = self.settings.vault_path
+        graph = LinkGraph.load(self.store_path, vault) or LinkGraph(vault)
+        if not refresh:
+            return graph
+
+        start = perf_counter_ns()
+        if graph.refresh(self.scanner.scan(vault)):
+            graph.save(self.store_path)
+            elapsed = (perf_counter_ns() - start) / _NS_PER_MS
+            logger.debug(f"Link graph refreshed in {elapsed:.1f} ms")
+            self.cli.show_graph_refreshed(len(graph), elapsed)
+        return graph
+
+    def backlinks(self, note: str, refresh: bool = True) -> bool:
+        """Show the notes linking to *note*. Returns False if it is unknown."""
+        graph = self.load(refresh)
+        note_id = graph.resolve(note)
+        if note_id is None:
+            self.cli.show_unknown_note(note)
+            return False
+        self.cli.show_paths(
+            f"Backlinks to {graph.paths[note_id]}", graph.backlinks(note_id)
+        )
+        return True
+
+    def orphans(self, refresh: bool = True) -> None:
+        """Show the notes nothing links to."""
+        self.cli.show_paths("Orphan notes", self.load(refresh).orphans())
+
+    def broken(self, refresh: bool = True) -> None:
+        """Show the links that match no note."""
+        self.cli.show_broken(self.load(refresh).broken_links())
+
+
+def create_app(settings: GlobalConfig) -> LinkGraphApp:
+    """Create LinkGraphApp instance."""
+    return LinkGraphApp(settings=settings, cli=GraphCLI())
@@ -0,0 +1 @@
+"""Core logic for Link Graph."""
@@ -0,0 +1,33 @@
+"""CLI service for Link Graph."""
+
+from dx_vault_atlas.shared import console as ui
+
+
+class GraphCLI:
+    """Service handling the display of graph queries."""
+
+    def show_graph_refreshed(self, notes: int, elapsed_ms: float) -> None:
+        """Show that the stored graph was brought up to date."""
+        ui.console.print(
+            f"[dim]Link graph updated: {notes} notes in {elapsed_ms:.0f} ms[/dim]"
+        )
+
+    def show_unknown_note(self, note: str) -> None:
+        """Show that *note* matches no note in the vault."""
+        ui.console.print(f"[red]No note matches {note!r}.[/red]")
+
+    def show_paths(self, title: str, paths: list[str]) -> None:
+        """Show a titled list of vault-relative note paths."""
+        ui.console.print(f"[bold]{title}[/bold] ({len(paths)})")
+        for path in paths:
+            ui.console.print(f"  {path}", markup=False, highlight=False)
+
+    def show_broken(self, links: list[tuple[str, str]]) -> None:
+        """Show links that match no note, grouped by source note."""
+        ui.console.print(f"[bold]Broken links[/bold] ({len(links)})")
+        current = None
+        for source, key in links:
+            if source != current:
+                ui.console.print(f"  {source}", markup=False, highlight=False)
+                current = source
+            ui.console.print(f"    [[{key}]]", markup=False, highlight=False)
@@ -0,0 +1,257 @@
+"""Compact, incrementally refreshed wikilink graph of a vault.
+
+Notes get integer ids (their position in the sorted list of vault-relative
+paths). Edges are kept in CSR form: for note ``i`` its resolved outgoing
+links are ``out_targets[out_offsets[i]:out_offsets[i + 1]]`` and its
+backlinks are the same slice of ``in_targets`` / ``in_offsets``. All four
+are ``array('I')``, so the whole graph costs a few bytes per edge and
+every query is a slice.
+
+``refresh`` walks the scan once: notes whose fingerprint is unchanged are
+reused as-is; otherwise the file is hashed, and links are re-extracted
+only if the content hash changed. Edges are rebuilt in one linear pass
+when any note's links (or the set of notes) changed.
+"""
+
+import base64
+import hashlib
+import json
+from array import array
+from collections.abc import Iterable
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+from dx_vault_atlas.services.link_graph.links import extract_links, link_key, note_key
+from dx_vault_atlas.shared.core.io import Fingerprint, file_fingerprint
+from dx_vault_atlas.shared.logger import logger
+
+# Bump when the on-disk layout changes; older files are rebuilt
+GRAPH_FORMAT = 1
+
+_ARRAYS = ("out_offsets", "out_targets", "in_offsets", "in_targets")
+
+
+class LinkGraph:
+    """Wikilink graph with integer note ids and array-backed adjacency."""
+
+    def __init__(self, vault: Path) -> None:
+        """Create an empty graph for *vault*."""
+        self.vault = vault
+        self.paths: list[str] = []
+        self.fingerprints: list[Fingerprint | None] = []
+        self.hashes: list[str] = []
+        self.links: list[tuple[str, ...]] = []
+        self.out_offsets = array("I", [0])
+        self.out_targets = array("I")
+        self.in_offsets = array("I", [0])
+        self.in_targets = array("I")
+        self.broken: list[tuple[int, str]] = []
+        self._ids: dict[str, int] = {}
+        self._by_key: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Number of notes in the graph."""
+        return len(self.paths)
+
+    # -- building -------------------------------------------------------------
+
+    def refresh(self, notes: Iterable[Path]) -> bool:
+        """Bring the graph in line with *notes* (a full vault scan).
+
+        Returns:
+            True if anything changed and the graph should be saved.
+        """
+        previous = dict(self._ids)
+        entries: list[tuple[str, Fingerprint | None, str, tuple[str, ...]]] = []
+        dirty = relinked = False
+
+        for path in notes:
+            rel = path.relative_to(self.vault).as_posix()
+            fingerprint = file_fingerprint(path)
+            old = previous.pop(rel, None)
+            if old is not None and fingerprint == self.fingerprints[old]:
+                entries.append((rel, fingerprint, self.hashes[old], self.links[old]))
+                continue
+
+            dirty = True
+            try:
+                data = path.read_bytes()
+            except OSError as e:
+                logger.warning(f"Link graph: cannot read {rel}: {e}")
+                relinked = True
+                continue
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            if old is not None and digest == self.hashes[old]:
+                entries.append((rel, fingerprint, digest, self.links[old]))
+                continue
+
+            links = extract_links(data.decode("utf-8", errors="replace"))
+            entries.append((rel, fingerprint, digest, links))
+            relinked = True
+
+        if previous:
+            dirty = relinked = True  # notes were deleted or moved
+
+        if not dirty:
+            return False
+        entries.sort(key=lambda entry: entry[0])
+        self.paths = [e[0] for e in entries]
+        self.fingerprints = [e[1] for e in entries]
+        self.hashes = [e[2] for e in entries]
+        self.links = [e[3] for e in entries]
+        self._reindex()
+        if relinked or len(self.in_offsets) != len(self.paths) + 1:
+            self._rebuild_edges()
+        return True
+
+    def _reindex(self) -> None:
+        """Rebuild the path and link-key lookups."""
+        self._ids = {rel: i for i, rel in enumerate(self.paths)}
+        self._by_key = {}
+        for i, rel in enumerate(self.paths):
+            # On duplicate names the first path in sorted order wins
+            self._by_key.setdefault(note_key(PurePosixPath(rel).stem), i)
+
+    def _rebuild_edges(self) -> None:
+        """Resolve every note's links and lay out both CSR adjacencies."""
+        out_offsets = array("I", [0])
+        out_targets = array("I")
+        broken: list[tuple[int, str]] = []
+        in_degree = [0] * len(self.paths)
+
+        for i, keys in enumerate(self.links):
+            targets = set()
+            for key in keys:
+                target = self._by_key.get(key)
+                if target is None:
+                    broken.append((i, key))
+                elif target != i:
+                    targets.add(target)
+            for target in sorted(targets):
+                out_targets.append(target)
+                in_degree[target] += 1
+            out_offsets.append(len(out_targets))
+
+        self.out_offsets, self.out_targets = out_offsets, out_targets
+        self.in_offsets, self.in_targets = _transpose(
+            out_offsets, out_targets, in_degree
+        )
+        self.broken = broken
+
+    # -- queries --------------------------------------------------------------
+
+    def resolve(self, note: str) -> int | None:
+        """Return the id of *note*: a path, a filename or a ``[[link]]``."""
+        text = note.strip()
+        if text.startswith("[[") and text.endswith("]]"):
+            text = text[2:-2]
+        candidate = Path(text).expanduser()
+        if candidate.is_absolute():
+            try:
+                text = candidate.resolve().relative_to(self.vault.resolve()).as_posix()
+            except ValueError:
+                return None
+        if text in self._ids:
+            return self._ids[text]
+        key = link_key(text)
+        return self._by_key.get(key) if key is not None else None
+
+    def backlinks(self, note_id: int) -> list[str]:
+        """Paths of the notes linking to *note_id*."""
+        start, end = self.in_offsets[note_id], self.in_offsets[note_id + 1]
+        return [self.paths[i] for i in self.in_targets[start:end]]
+
+    def outlinks(self, note_id: int) -> list[str]:
+        """Paths of the notes *note_id* links to."""
+        start, end = self.out_offsets[note_id], self.out_offsets[note_id + 1]
+        return [self.paths[i] for i in self.out_targets[start:end]]
+
+    def orphans(self) -> list[str]:
+        """Paths of the notes nothing links to."""
+        offsets = self.in_offsets
+        return [
+            rel
+            for i, rel in enumerate(self.paths)
+            if offsets[i] == offsets[i + 1]
+        ]
+
+    def broken_links(self) -> list[tuple[str, str]]:
+        """``(source path, link key)`` for links that match no note."""
+        return [(self.paths[i], key) for i, key in self.broken]
+
+    # -- persistence ----------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to the on-disk JSON layout."""
+        data: dict[str, Any] = {
+            "format": GRAPH_FORMAT,
+            "vault": str(self.vault),
+            "paths": self.paths,
+            "fingerprints": self.fingerprints,
+            "hashes": self.hashes,
+            "links": self.links,
+            "broken": self.broken,
+        }
+        for name in _ARRAYS:
+            data[name] = base64.b64encode(getattr(self, name).tobytes()).decode()
+        return data
+
+    def save(self, path: Path) -> None:
+        """Write the graph atomically to *path*."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path, vault: Path) -> "LinkGraph | None":
+        """Load the graph stored at *path*, or None if absent or stale."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable link graph {path}: {e}")
+            return None
+        if data.get("format") != GRAPH_FORMAT or data.get("vault") != str(vault):
+            return None
+
+        graph = cls(vault)
+        try:
+            graph.paths = data["paths"]
+            graph.fingerprints = [
+                tuple(fp) if fp is not None else None for fp in data["fingerprints"]
+            ]
+            graph.hashes = data["hashes"]
+            graph.links = [tuple(keys) for keys in data["links"]]
+            graph.broken = [(int(i), key) for i, key in data["broken"]]
+            for name in _ARRAYS:
+                stored = array("I")
+                stored.frombytes(base64.b64decode(data[name]))
+                setattr(graph, name, stored)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring malformed link graph {path}: {e}")
+            return None
+        graph._reindex()
+        return graph
+
+
+def _transpose(
+    out_offsets: array[int], out_targets: array[int], in_degree: list[int]
+) -> tuple[array[int], array[int]]:
+    """Lay out the incoming CSR adjacency of an outgoing one.
+
+    Sources are visited in id order, so each note's backlinks come out
+    sorted.
+    """
+    in_offsets = array("I", [0])
+    for degree in in_degree:
+        in_offsets.append(in_offsets[-1] + degree)
+    in_targets = array("I", bytes(len(out_targets) * out_targets.itemsize))
+    cursor = array("I", in_offsets[:-1])
+    for source in range(len(out_offsets) - 1):
+        for k in range(out_offsets[source], out_offsets[source + 1]):
+            target = out_targets[k]
+            in_targets[cursor[target]] = source
+            cursor[target] += 1
+    return in_offsets, in_targets
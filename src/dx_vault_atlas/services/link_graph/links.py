@@ -0,0 +1,62 @@
+"""Wikilink extraction and link-key normalization.
+
+Links are read from the whole note, so the ``up`` field (``"[[Parent]]"``)
+and any other frontmatter link are picked up together with the body's
+``[[wikilinks]]`` and ``![[embeds]]``. Fenced code blocks are skipped.
+
+A link and a note match when their *keys* are equal: the basename of the
+link target (or of the file), without ``.md``, case-folded. Heading and
+block references (``#...``, ``^...``) and aliases (``|...``) are dropped.
+"""
+
+import re
+
+_WIKILINK_RE = re.compile(r"\[\[([^\[\]\n]+?)\]\]")
+_FENCE_RE = re.compile(r"^(`{3,}|~{3,}).*?^\1", re.MULTILINE | re.DOTALL)
+
+# Link targets that are attachments, not notes
+_ATTACHMENT_SUFFIXES = frozenset(
+    {
+        ".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".bmp", ".pdf",
+        ".mp3", ".wav", ".ogg", ".m4a", ".mp4", ".webm", ".mov",
+        ".canvas", ".excalidraw",
+    }
+)
+
+
+def note_key(stem: str) -> str:
+    """Key under which a note with filename *stem* is linked."""
+    return stem.strip().casefold()
+
+
+def link_key(target: str) -> str | None:
+    """Return the key of a wikilink *target*, or None if it is not a note.
+
+    ``target`` is the text between ``[[`` and ``]]``.
+    """
+    name = target.split("|", 1)[0]
+    name = re.split(r"[#^]", name, maxsplit=1)[0]
+    name = name.rsplit("/", 1)[-1].strip()
+    if not name:
+        return None
+    lowered = name.casefold()
+    if lowered.endswith(".md"):
+        return note_key(name[:-3])
+    dot = lowered.rfind(".")
+    if dot > 0 and lowered[dot:] in _ATTACHMENT_SUFFIXES:
+        return None
+    return note_key(name)
+
+
+def extract_links(content: str) -> tuple[str, ...]:
+    """Return the distinct link keys in *content*, in first-seen order."""
+    if "[[" not in content:
+        return ()
+    if "```" in content or "~~~" in content:
+        content = _FENCE_RE.sub("", content)
+    seen: dict[str, None] = {}
+    for match in _WIKILINK_RE.finditer(content):
+        key = link_key(match.group(1))
+        if key is not None:
+            seen.setdefault(key)
+    return tuple(seen)
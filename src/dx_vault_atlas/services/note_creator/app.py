@@ -11,11 +11,15 @@ from dx_vault_atlas.services.note_creator.core.ports import (
 from dx_vault_atlas.services.note_creator.core.processor import NoteProcessor
 from dx_vault_atlas.services.note_creator.core.writer import NoteWriter
 from dx_vault_atlas.services.note_creator.services.editor import EditorService
+from dx_vault_atlas.services.note_creator.services.link_suggester import (
+    LinkSuggester,
+)
 from dx_vault_atlas.services.note_creator.services.templating import TemplatingService
 from dx_vault_atlas.services.note_creator.tui import run_tui
 from dx_vault_atlas.shared.utils.title_normalizer import TitleNormalizer
 from dx_vault_atlas.shared.config import GlobalConfig
 from dx_vault_atlas.shared.logger import logger
+from dx_vault_atlas.shared.profiling import stage
 from dx_vault_atlas.shared.tui.result_app import run_result_tui
 
 
@@ -38,6 +42,7 @@ class NoteCreatorApp:
         editor: EditorService,
         error_presenter: IOutputPresenter,
         show_header: bool = True,
+        link_suggester: LinkSuggester | None = None,
     ) -> None:
         """Initialize with dependencies.
 
@@ -48,6 +53,7 @@ class NoteCreatorApp:
             editor: Service to handle external editor interactions.
             error_presenter: Service to handle error UI presentation.
             show_header: Whether to show header panel.
+            link_suggester: Source of ``up`` link suggestions, if any.
         """
         self.settings = settings
         self.vault_inbox = vault_inbox
@@ -56,15 +62,22 @@ class NoteCreatorApp:
         self.editor = editor
         self.error_presenter = error_presenter
         self.show_header = show_header
+        self.link_suggester = link_suggester
 
     def run(self) -> None:
         """Execute the note creation workflow."""
         logger.info("Starting note creator")
 
+        # Titles load in the background while the first steps are filled in
+        suggest_links = None
+        if self.link_suggester is not None:
+            self.link_suggester.start()
+            suggest_links = self.link_suggester.suggest
+
         while True:
             # 1. Wizard TUI
             # Returns dict with collected data or None if cancelled
-            wizard_data = run_tui()
+            wizard_data = run_tui(suggest_links)
 
             if not wizard_data:
                 # User cancelled or quit
@@ -72,7 +85,8 @@ class NoteCreatorApp:
 
             # 2. Editor (External Process)
             # Opens default editor for body content
-            body_content = self.editor.get_editor_content()
+            with stage("editor"):
+                body_content = self.editor.get_editor_content()
 
             # 3. Create Note
             try:
@@ -80,15 +94,18 @@ class NoteCreatorApp:
                 safe_title = TitleNormalizer.normalize(title)
                 output_path = self.vault_inbox / f"{safe_title}.md"
 
-                note_instance = NoteFactory.create_note(wizard_data)
+                with stage("validate"):
+                    note_instance = NoteFactory.create_note(wizard_data)
 
                 logger.info(f"Creating note: {safe_title}")
-                rendered_content = self.processor.render_note(
-                    template_name=f"{note_instance.note_type}.md",
-                    note_data=note_instance,
-                    body_content=body_content,
-                )
-                self.writer.write(rendered_content, output_path)
+                with stage("serialize"):
+                    rendered_content = self.processor.render_note(
+                        template_name=f"{note_instance.note_type}.md",
+                        note_data=note_instance,
+                        body_content=body_content,
+                    )
+                with stage("write"):
+                    self.writer.write(rendered_content, output_path)
                 logger.info(f"Note created at {output_path}")
 
                 note_path = output_path
@@ -143,4 +160,5 @@ def create_app(settings: GlobalConfig, show_header: bool = True) -> NoteCreatorA
         editor=editor,
         error_presenter=DefaultErrorPresenter(),
         show_header=show_header,
+        link_suggester=LinkSuggester(settings.vault_path),
     )
@@ -72,6 +72,8 @@ class NoteFactory:
             note_data["area"] = area
         if status := data.get("status"):
             note_data["status"] = status
+        if up := str(data.get("up") or "").strip():
+            note_data["up"] = up if up.startswith("[[") else f"[[{up}]]"
 
         # Instantiate
         note_class = get_model(template_enum, default=BaseNote)
@@ -0,0 +1,90 @@
+"""Service suggesting parent notes for the wizard's ``up`` step."""
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from dx_vault_atlas.shared.logger import logger
+from dx_vault_atlas.shared.paths import vault_data_dir
+
+if TYPE_CHECKING:
+    from dx_vault_atlas.services.vault_index.titles import TitleTrie
+
+# Suggestions shown under the input
+SUGGESTION_LIMIT = 8
+
+
+class LinkSuggester:
+    """Serves ``up`` link suggestions from the vault's title trie.
+
+    The trie is loaded in a background thread started by ``start``, so the
+    wizard opens at once; until it is ready, ``suggest`` returns nothing.
+    Loading refreshes the metadata index (one ``stat`` per note) and
+    reuses the cached trie unless the index changed since it was built.
+    """
+
+    def __init__(
+        self,
+        vault: Path,
+        data_dir: Path | None = None,
+        limit: int = SUGGESTION_LIMIT,
+    ) -> None:
+        """Initialize the suggester.
+
+        Args:
+            vault: Vault root whose notes are suggested.
+            data_dir: Directory of the vault indexes; per-vault by default.
+            limit: Maximum suggestions per keystroke.
+        """
+        self.vault = vault
+        self.data_dir = data_dir or vault_data_dir(vault)
+        self.limit = limit
+        self._trie: TitleTrie | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def ready(self) -> bool:
+        """True once the trie is loaded."""
+        return self._trie is not None
+
+    def start(self) -> None:
+        """Start loading the trie in the background (once)."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._load_quietly, name="link-suggester", daemon=True
+            )
+            self._thread.start()
+
+    def load(self) -> None:
+        """Refresh the metadata index and load (or rebuild) the trie."""
+        from dx_vault_atlas.services.vault_index.store import MetadataIndex
+        from dx_vault_atlas.services.vault_index.titles import TitleTrie
+        from dx_vault_atlas.shared.core.scanner import VaultScanner
+
+        trie_path = self.data_dir / "titles.json"
+        # One process: forking from under a running TUI is not safe
+        with MetadataIndex(
+            self.data_dir / "metadata.sqlite3", self.vault, workers=1
+        ) as index:
+            index.refresh(VaultScanner().scan(self.vault))
+            generation = index.generation
+            trie = TitleTrie.load(trie_path, generation)
+            if trie is None:
+                trie = TitleTrie.from_index(index)
+                trie.save(trie_path, generation)
+        logger.debug(f"Link suggester: {len(trie)} notes")
+        self._trie = trie
+
+    def _load_quietly(self) -> None:
+        """Thread entry point: load, logging instead of raising."""
+        try:
+            self.load()
+        except Exception as e:
+            logger.warning(f"Link suggestions unavailable: {e}")
+
+    def suggest(self, text: str) -> list[str]:
+        """Link targets matching *text*, best first (empty until ready)."""
+        trie = self._trie
+        if trie is None:
+            return []
+        return trie.complete(text, self.limit)
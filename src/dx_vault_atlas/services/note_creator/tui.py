@@ -1,20 +1,31 @@
 """Note Creator TUI - minimal config only."""
 
+from collections.abc import Callable
+from dataclasses import replace
 from typing import Any
 
-from dx_vault_atlas.shared.tui.common_steps import NOTE_CREATOR_STEPS
 from dx_vault_atlas.shared.tui import WizardConfig, run_wizard
+from dx_vault_atlas.shared.tui.common_steps import NOTE_CREATOR_STEPS, UP_STEP
 
 
-def run_tui() -> dict[str, Any] | None:
+def run_tui(
+    suggest_links: Callable[[str], list[str]] | None = None,
+) -> dict[str, Any] | None:
     """Run the Note Creator TUI and return collected data.
 
+    Args:
+        suggest_links: Suggestions for the ``up`` step, if available.
+
     Returns:
         Collected wizard data or None if cancelled.
     """
+    steps = [
+        replace(step, suggest=suggest_links) if step is UP_STEP else step
+        for step in NOTE_CREATOR_STEPS
+    ]
     config = WizardConfig(
         title="DX Vault Atlas · Note Creator",
-        steps=NOTE_CREATOR_STEPS,
+        steps=steps,
         on_complete=None,  # No callback, return data directly
         success_message="Note ready to create!",
         auto_exit_delay=0.1,  # Exit immediately after completion
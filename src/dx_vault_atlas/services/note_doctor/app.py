@@ -1,25 +1,54 @@
 """Note Doctor application orchestrator."""
 
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import nullcontext
 from pathlib import Path
+from time import perf_counter_ns
 from typing import Any
 
 from dx_vault_atlas.shared.utils.title_normalizer import (
     TitleNormalizer,
 )
+from dx_vault_atlas.services.note_doctor.checkpoint import (
+    CHECKPOINT_PATH,
+    DoctorCheckpoint,
+    QueuedNote,
+)
+from dx_vault_atlas.services.note_doctor.columnar import (
+    DEFAULT_CHUNK_SIZE,
+    ColumnarValidator,
+)
 from dx_vault_atlas.services.note_doctor.core.cli import DoctorCLI
+from dx_vault_atlas.services.note_doctor.date_fix import DateFixEngine
 from dx_vault_atlas.shared.utils.date_resolver import DateResolver
+from dx_vault_atlas.shared.utils.enum_index import NormalizationIndex
+from dx_vault_atlas.shared.utils.filename_index import (
+    DirectoryProbe,
+    FilenameIndex,
+)
 from dx_vault_atlas.services.note_doctor.core.fixer import (
     DateFixRule,
     DefaultsFixRule,
     EnumFixRule,
     ExtraneousFieldsFixRule,
+    FixRuleProtocol,
     NoteFixer,
     VersionFixRule,
 )
-from dx_vault_atlas.shared.core.io import NoteIOService
+from dx_vault_atlas.shared.core.bulk_rename import RenameError, RenameTransaction
+from dx_vault_atlas.shared.core.io import NoteIOService, file_fingerprint, iter_chunks
 from dx_vault_atlas.services.note_doctor.core.patcher import (
     FrontmatterPatcher,
 )
+from dx_vault_atlas.services.note_doctor.core.profiler import RuleProfiler
+from dx_vault_atlas.services.note_doctor.prefetch import PrefetchedNote, Prefetcher
+from dx_vault_atlas.services.note_doctor.core.report import (
+    STATUSES,
+    NdjsonReport,
+    NoteOutcome,
+    changed_keys,
+)
+from dx_vault_atlas.services.note_doctor.session import DoctorSession
 from dx_vault_atlas.services.note_doctor.tui import DoctorTUI
 from dx_vault_atlas.services.note_doctor.validator import (
     NoteDoctorValidator,
@@ -30,11 +59,25 @@ from dx_vault_atlas.shared.yaml_parser import (
 )
 from dx_vault_atlas.shared.config import GlobalConfig
 from dx_vault_atlas.shared.core.scanner import VaultScanner
-from dx_vault_atlas.shared.logger import logger
+from dx_vault_atlas.shared.logger import LOG_DIR, logger
+from dx_vault_atlas.shared.paths import DATA_DIR
+from dx_vault_atlas.shared.tracing import TRACER, note_span
 
 # Maximum fix attempts before skipping a note
 _MAX_FIX_ATTEMPTS = 2
 
+# Where ``--profile-rules`` exports its JSON report
+RULE_PROFILE_PATH = LOG_DIR / "rule_profile.json"
+
+# Rollback journal of ``--rename-all`` transactions
+RENAME_JOURNAL_PATH = DATA_DIR / "rename_journal.json"
+
+_NS_PER_MS = 1_000_000
+
+# Called with the invalid notes once a full check has queued them; returning
+# False stops before the interactive phase, leaving the queue checkpointed
+QueueHook = Callable[[list[ValidationResult]], bool]
+
 
 class DoctorApp:
     """Orchestrates the note doctor workflow.
@@ -53,21 +96,34 @@ class DoctorApp:
         cli: DoctorCLI,
         io_service: NoteIOService,
         model_map: dict[str, Any],
+        profiler: RuleProfiler | None = None,
+        queue_hook: QueueHook | None = None,
     ) -> None:
         """Initialise DoctorApp with dependencies."""
         self.settings = settings
         self.cli = cli
+        self.queue_hook = queue_hook
         self.io = io_service
         self.scanner = VaultScanner()
+        self.checkpoint_path = CHECKPOINT_PATH
+        self.rename_journal_path = RENAME_JOURNAL_PATH
+        # Filled while scanning; until then renames also check the disk
+        self.filenames = FilenameIndex(complete=False)
         self.yaml_parser = YamlParserService()
         self.date_resolver = DateResolver()
-        self.validator = NoteDoctorValidator(yaml_parser=self.yaml_parser)
+        self.enum_index = NormalizationIndex.build(settings.value_mappings)
+        self.validator = NoteDoctorValidator(
+            yaml_parser=self.yaml_parser,
+            date_resolver=self.date_resolver,
+        )
+        self.columnar = ColumnarValidator(self.validator)
 
         # Instantiate fix rules
-        self.date_rule = DateFixRule(self.date_resolver)
-        self.enum_rule = EnumFixRule()
+        # Typed as the protocol: ``--profile-rules`` swaps in wrapped rules
+        self.date_rule: FixRuleProtocol = DateFixRule(self.date_resolver)
+        self.enum_rule = EnumFixRule(self.enum_index)
         self.defaults_rule = DefaultsFixRule()
-        self.extraneous_rule = ExtraneousFieldsFixRule()
+        self.extraneous_rule: FixRuleProtocol = ExtraneousFieldsFixRule()
         self.version_rule = VersionFixRule()
 
         from dx_vault_atlas.services.note_doctor.core.fixer import (
@@ -89,63 +145,144 @@ class DoctorApp:
         self.patcher = FrontmatterPatcher()
         self.tui = DoctorTUI(model_map=model_map)
 
+        self.profiler = profiler
+        if profiler is not None:
+            self._install_profiler(profiler)
+
     # -- public API ---------------------------------------------------------
 
     def run(
         self,
         fix_date: bool = False,
         debug_mode: bool = False,
+        batch: bool = False,
+        report_path: Path | None = None,
+        resume: bool = False,
+        rename_all: bool = False,
     ) -> None:
-        """Execute the doctor workflow."""
-        mode_str = "(date fix only)" if fix_date else "(full check)"
+        """Execute the doctor workflow.
+
+        Args:
+            fix_date: Only fix created/updated dates.
+            debug_mode: Emit debug traces and use the plain CLI for input.
+            batch: Never prompt; apply safe auto-fixes and summarise.
+            report_path: NDJSON report destination for batch mode.
+            resume: Continue the last interrupted interactive session
+                from its checkpoint instead of scanning the vault.
+            rename_all: Only fix filename mismatches, all at once, with a
+                transactional bulk rename.
+        """
+        mode_str = self._mode_label(fix_date, rename_all, batch)
         if debug_mode:
             logger.debug(f"Doctor start | mode={mode_str}")
 
         self.cli.show_header(mode_str, str(self.settings.vault_path))
 
-        notes = list(self.scanner.scan(self.settings.vault_path))
+        # Put back files left under temporary names by a crashed bulk rename
+        recovered = RenameTransaction.recover(self.rename_journal_path)
+        if recovered:
+            self.cli.show_rename_recovered(recovered)
+
+        try:
+            self._run_mode(
+                fix_date=fix_date,
+                debug_mode=debug_mode,
+                batch=batch,
+                report_path=report_path,
+                resume=resume,
+                rename_all=rename_all,
+            )
+        finally:
+            if self.profiler is not None:
+                self._report_rule_profile(self.profiler)
+
+    @staticmethod
+    def _mode_label(fix_date: bool, rename_all: bool, batch: bool) -> str:
+        """Return the header label of the selected mode."""
+        if fix_date:
+            return "(date fix only)"
+        if rename_all:
+            return "(rename all)"
+        if batch:
+            return "(batch)"
+        return "(full check)"
+
+    def _run_mode(
+        self,
+        *,
+        fix_date: bool,
+        debug_mode: bool,
+        batch: bool,
+        report_path: Path | None,
+        resume: bool,
+        rename_all: bool,
+    ) -> None:
+        """Dispatch ``run`` to the selected mode (same arguments)."""
+        if resume and not fix_date and not batch and self._try_resume(debug_mode):
+            return
+
+        if batch and not fix_date:
+            # Stream paths straight from the scanner and probe the disk
+            # for rename collisions: nothing is kept per note
+            self.filenames = DirectoryProbe()
+            stream = self.scanner.scan(self.settings.vault_path)
+            self._run_batch_mode(stream, report_path, debug_mode)
+            return
+
+        notes = list(self.filenames.track(self.scanner.scan(self.settings.vault_path)))
         self.cli.show_scan_count(len(notes))
         if debug_mode:
             logger.debug(f"Found {len(notes)} notes in scan")
 
         if fix_date:
             self._run_date_fix_mode(notes)
+        elif rename_all:
+            self._run_rename_all_mode(notes)
         else:
             self._run_full_check_mode(notes, debug_mode)
 
-    # -- date-only mode -----------------------------------------------------
+    # -- rule profiling -----------------------------------------------------
 
-    def _run_date_fix_mode(self, notes: list[Path]) -> None:
-        """Run only date fixing logic."""
-        fixed = sum(1 for n in notes if self._fix_date_for_note(n, save=True))
-        self.cli.show_date_fix_result(fixed)
+    def _install_profiler(self, profiler: RuleProfiler) -> None:
+        """Wrap validator and fixer rule chains with timing wrappers.
 
-    def _fix_date_for_note(
-        self,
-        note_path: Path,
-        *,
-        save: bool = False,
-    ) -> bool:
-        """Check and optionally fix dates for a single note."""
-        parsed = self.io.read_note(note_path)
-        if not parsed:
-            return False
+        Rules invoked directly by the app (date-only mode, the extraneous
+        strip after config mappings) are swapped for their wrapped
+        counterparts so those calls are measured too.
+        """
+        self.validator.rules = profiler.wrap_validation_rules(self.validator.rules)
+        self.fixer.rules = profiler.wrap_fix_rules(self.fixer.rules)
+        self.date_rule = profiler.wrap_fix_rule(self.date_rule)
+        self.extraneous_rule = profiler.wrap_fix_rule(self.extraneous_rule)
+
+    def _report_rule_profile(self, profiler: RuleProfiler) -> None:
+        """Print the rule profile table and export it as JSON."""
+        try:
+            profiler.export_json(RULE_PROFILE_PATH)
+            export_path: Path | None = RULE_PROFILE_PATH
+        except OSError as e:
+            logger.error(f"Could not export rule profile: {e}")
+            export_path = None
+        self.cli.show_rule_profile(profiler.sorted_stats(), export_path)
 
-        new_fm = parsed.frontmatter.copy()
-        has_changes = self.date_rule.apply(
-            note_path,
-            parsed.frontmatter,
-            new_fm,
-        )
-        date_ok = not has_changes
+    # -- date-only mode -----------------------------------------------------
 
-        if not date_ok and save:
-            if self.io.write_note(note_path, new_fm, parsed.body):
-                self.cli.show_note_date_fixed(note_path.name)
-                return True
-            return False
+    def _run_date_fix_mode(self, notes: list[Path]) -> None:
+        """Run only date fixing logic (head-only reads, parallel workers).
 
-        return not date_ok
+        When rules are profiled or the run is traced, ``self.date_rule``
+        runs in-process instead, so its timings and spans are recorded.
+        """
+        instrumented = self.profiler is not None or TRACER.enabled
+        engine = DateFixEngine(
+            now=self.date_resolver.now,
+            rule=self.date_rule if instrumented else None,
+        )
+        fixed = 0
+        for note_path in engine.run(notes):
+            self.cli.show_note_date_fixed(note_path.name)
+            fixed += 1
+        self.cli.show_date_fix_result(fixed)
 
     # -- full-check mode ----------------------------------------------------
 
@@ -156,51 +293,267 @@ class DoctorApp:
     ) -> None:
         """Run full validation and repair logic."""
         invalid_results: list[ValidationResult] = []
-        valid_count = 0
-        warn_count = 0
-        version_count = 0
-        fixed_count = 0
+        counts = dict.fromkeys(STATUSES, 0)
 
-        for note_path in notes:
+        for note_path, result, _ns in self._validate_in_chunks(notes):
             outcome = self._classify_note(
                 note_path,
                 debug_mode,
+                result=result,
             )
-            if outcome == "valid":
-                valid_count += 1
-            elif outcome == "warning":
-                warn_count += 1
-            elif outcome == "version":
-                version_count += 1
-            elif outcome == "fixed":
-                fixed_count += 1
-            else:
-                # outcome is a ValidationResult
-                invalid_results.append(outcome)
+            counts[outcome.status] += 1
+            if outcome.needs_attention:
+                invalid_results.append(outcome.result)
 
         self.cli.report_results(
-            valid_count,
-            warn_count,
-            version_count,
+            counts["valid"],
+            counts["warning"],
+            counts["version"],
             len(invalid_results),
-            fixed_count,
+            counts["fixed"],
+        )
+        if not invalid_results:
+            DoctorCheckpoint.discard(self.checkpoint_path)
+            return
+        checkpoint = DoctorCheckpoint.start(
+            self.settings.vault_path, invalid_results, path=self.checkpoint_path
+        )
+        if self.queue_hook is not None and not self.queue_hook(invalid_results):
+            return
+        self._process_invalid_results(
+            invalid_results, debug_mode, checkpoint=checkpoint
+        )
+
+    # -- bulk rename ----------------------------------------------------------
+
+    def _run_rename_all_mode(self, notes: list[Path]) -> None:
+        """Plan every filename fix up front and apply it in one transaction."""
+        moves: list[tuple[Path, Path]] = []
+        for note_path, result, _ns in self._validate_in_chunks(notes):
+            if "integrity_filename" not in result.invalid_fields:
+                continue
+            target = self._desired_path(result)
+            if target is not None:
+                moves.append((note_path, target))
+
+        try:
+            plan = self.filenames.plan(moves)
+        except FileExistsError as e:
+            logger.error(f"Rename planning failed: {e}")
+            self.cli.show_rename_failed(str(e))
+            return
+        desired = dict(moves)
+        suffixed = sum(1 for src, dst in plan if dst != desired[src])
+        self.cli.show_rename_plan(len(plan), suffixed)
+        if not plan:
+            return
+
+        try:
+            RenameTransaction(plan, self.rename_journal_path).apply()
+        except RenameError as e:
+            self.cli.show_rename_failed(str(e))
+            return
+        for src, dst in plan:
+            self.filenames.move(src, dst)
+        self.cli.show_rename_done(len(plan))
+
+    # -- resume ---------------------------------------------------------------
+
+    def _load_checkpoint(self) -> DoctorCheckpoint | None:
+        """Return the pending checkpoint for this vault, if there is one."""
+        checkpoint = DoctorCheckpoint.load(self.checkpoint_path)
+        if checkpoint is None or checkpoint.done:
+            return None
+        if Path(checkpoint.vault) != Path(self.settings.vault_path):
+            logger.info(f"Checkpoint belongs to another vault: {checkpoint.vault}")
+            return None
+        return checkpoint
+
+    def _try_resume(self, debug_mode: bool) -> bool:
+        """Resume the pending session; False when there is none to resume."""
+        checkpoint = self._load_checkpoint()
+        if checkpoint is None:
+            self.cli.show_no_checkpoint()
+            return False
+        self._resume(checkpoint, debug_mode)
+        return True
+
+    def _resume(self, checkpoint: DoctorCheckpoint, debug_mode: bool) -> None:
+        """Continue an interrupted session without scanning the vault."""
+        remaining = checkpoint.remaining
+        self.cli.show_resume(
+            len(remaining), checkpoint.position, len(checkpoint.queue)
+        )
+        self._process_invalid_results(
+            (self._restore_result(entry) for entry in remaining),
+            debug_mode,
+            names=[entry.file_path.name for entry in remaining],
+            checkpoint=checkpoint,
+        )
+
+    def _restore_result(self, entry: QueuedNote) -> ValidationResult:
+        """Rebuild a queued note's result, re-validating only if it changed."""
+        path = entry.file_path
+        if not entry.is_unchanged(file_fingerprint(path)):
+            logger.debug(f"Checkpoint entry changed, re-validating | {path.name}")
+            return self.validator.validate(path)
+
+        parsed = self.validator.read_note(path)
+        if isinstance(parsed, ValidationResult):
+            return parsed
+        frontmatter, body = parsed
+        return ValidationResult(
+            path,
+            False,
+            frontmatter,
+            body,
+            missing_fields=list(entry.missing),
+            invalid_fields=list(entry.invalid),
+            warnings=list(entry.warnings),
+            error=entry.error,
         )
-        self._process_invalid_results(invalid_results, debug_mode)
+
+    # -- batch mode ---------------------------------------------------------
+
+    def _run_batch_mode(
+        self,
+        notes: Iterable[Path],
+        report_path: Path | None,
+        debug_mode: bool,
+    ) -> None:
+        """Apply every safe auto-fix without prompting, streaming a report.
+
+        Notes are consumed lazily from *notes* and each outcome is written
+        to the NDJSON report as soon as it is known; nothing is retained
+        per note, so memory stays flat regardless of vault size.
+        """
+        counts = dict.fromkeys(STATUSES, 0)
+        report = NdjsonReport(report_path) if report_path is not None else None
+
+        with report if report is not None else nullcontext():
+            for note_path, result, validate_ns in self._validate_in_chunks(notes):
+                outcome = self._classify_note(
+                    note_path,
+                    debug_mode,
+                    result=result,
+                    write_partial=True,
+                )
+                outcome.timings_ms["validate"] = validate_ns / _NS_PER_MS
+                if "integrity_filename" in outcome.result.invalid_fields:
+                    self._batch_rename(outcome)
+                counts[outcome.status] += 1
+                if report is not None:
+                    report.write(outcome.to_record())
+
+        self.cli.report_results(
+            counts["valid"],
+            counts["warning"],
+            counts["version"],
+            counts["invalid"] + counts["error"],
+            counts["fixed"],
+        )
+        self.cli.show_batch_summary(sum(counts.values()), report_path)
+
+    def _batch_rename(self, outcome: NoteOutcome) -> None:
+        """Apply the automatic filename fix to a batch outcome in place."""
+        rename_out = self._handle_rename(outcome.result)
+        if rename_out is None:
+            return
+        outcome.path, outcome.result = rename_out
+        outcome.applied_fixes.append("rename")
+        if outcome.result.is_valid:
+            outcome.status = self._tag_valid(
+                outcome.result, outcome.path, was_fixed=True
+            )
+        elif self._is_only_version_issue(outcome.result):
+            outcome.status = "version"
+
+    def _validate_in_chunks(
+        self,
+        notes: Iterable[Path],
+    ) -> Iterator[tuple[Path, ValidationResult, int]]:
+        """Yield ``(path, result, validate_ns)`` validated in columnar chunks.
+
+        ``validate_ns`` is the chunk's validation time amortized per note.
+        """
+        for chunk in iter_chunks(notes, DEFAULT_CHUNK_SIZE):
+            start = perf_counter_ns()
+            results = self.columnar.validate_batch(chunk)
+            share = (perf_counter_ns() - start) // len(chunk)
+            for note_path, result in zip(chunk, results, strict=True):
+                yield note_path, result, share
 
     def _classify_note(
         self,
         note_path: Path,
         debug_mode: bool,
-    ) -> str | ValidationResult:
+        result: ValidationResult | None = None,
+        write_partial: bool = False,
+    ) -> NoteOutcome:
         """Validate, auto-fix, and classify a single note.
 
+        Args:
+            note_path: Note to classify.
+            debug_mode: Emit debug traces.
+            result: Pre-computed validation (e.g. from a columnar batch).
+                Validated from disk when omitted.
+            write_partial: Write auto-fixes even when the note is still
+                invalid afterwards (batch mode). Interactive mode keeps
+                them in memory for the fix wizard instead.
+
         Returns:
+            The note's outcome. ``status`` is one of:
             "valid"   – healthy with no warnings
             "warning" – healthy but has warnings
             "version" – only version is outdated
             "fixed"   – was auto-fixed and is now healthy
-            ValidationResult – still invalid after auto-fix
+            "invalid" – still invalid after auto-fix
+            "error"   – unreadable file or broken YAML
         """
+        with note_span("doctor.classify_note", note_path):
+            return self._classify(note_path, debug_mode, result, write_partial)
+
+    def _classify(
+        self,
+        note_path: Path,
+        debug_mode: bool,
+        result: ValidationResult | None,
+        write_partial: bool,
+    ) -> NoteOutcome:
+        """Body of ``_classify_note``."""
+        start = perf_counter_ns()
+        result = self._validate_for_classify(note_path, result, debug_mode)
+        outcome = NoteOutcome(note_path, "invalid", result)
+
+        if result.error:
+            # File unreadable or gross YAML error - can't auto-fix
+            outcome.status = "error"
+            return outcome
+
+        has_changes, fm_final, body = self._auto_fix(note_path, result, debug_mode)
+        if has_changes:
+            self._apply_auto_fix(
+                outcome, fm_final, body, start, debug_mode, write_partial
+            )
+        elif result.is_valid:
+            if debug_mode:
+                logger.debug(
+                    f"[Doctor Debug] Note valid and unchanged | {note_path.name}"
+                )
+            outcome.status = self._tag_valid(result, note_path)
+
+        outcome.timings_ms.setdefault("fix", (perf_counter_ns() - start) / _NS_PER_MS)
+        if outcome.status == "invalid" and self._is_only_version_issue(outcome.result):
+            outcome.status = "version"
+        return outcome
+
+    def _validate_for_classify(
+        self,
+        note_path: Path,
+        result: ValidationResult | None,
+        debug_mode: bool,
+    ) -> ValidationResult:
+        """Return *result*, validating *note_path* from disk when it is None."""
         if debug_mode:
             logger.debug(
                 "[Doctor Debug] --------------------------------------------------"
@@ -208,26 +561,35 @@ class DoctorApp:
             logger.debug(f"[Doctor Debug] Validating: {note_path.name}")
             logger.debug("[DEBUG TRACE] app._classify_note Start")
 
-        result = self.validator.validate(note_path)
+        if result is None:
+            result = self.validator.validate(note_path)
 
         if debug_mode and not result.error:
             logger.debug("[DEBUG TRACE] app._classify_note After Validator")
+            if not result.is_valid:
+                logger.debug(
+                    f"[Doctor Debug] Invalid | {note_path.name}"
+                    f" | missing={result.missing_fields}"
+                    f" | invalid={result.invalid_fields}"
+                )
+        return result
 
-        if result.error:
-            # File unreadable or gross YAML error - can't auto-fix
-            return result
-
-        if debug_mode and not result.is_valid:
-            logger.debug(
-                f"[Doctor Debug] Invalid | {note_path.name}"
-                f" | missing={result.missing_fields}"
-                f" | invalid={result.invalid_fields}"
-            )
+    def _auto_fix(
+        self,
+        note_path: Path,
+        result: ValidationResult,
+        debug_mode: bool,
+    ) -> tuple[bool, dict[str, Any], str]:
+        """Run the fix rules and config mappings on a copy of the frontmatter.
 
+        Returns:
+            ``(has_changes, frontmatter, body)`` after every fix.
+        """
         has_changes, fm_final, body = self.fixer.fix(
             note_path,
             result.frontmatter.copy(),
             result.body,
+            result=result,
         )
 
         # Apply config-driven mappings
@@ -238,57 +600,65 @@ class DoctorApp:
 
         # Strip extraneous fields that config mappings may have introduced
         original_fm_final = fm_final.copy()
-        rule_made_changes = self.extraneous_rule.apply(
-            note_path,
-            original_fm_final,
-            fm_final,
-        )
-        unchanged = not rule_made_changes
-        if not unchanged:
+        if self.extraneous_rule.apply(note_path, original_fm_final, fm_final):
             has_changes = True
 
         if debug_mode:
             logger.debug(
-                f"[DEBUG TRACE] app._classify_note After Mappings | has_changes={has_changes}"
+                "[DEBUG TRACE] app._classify_note After Mappings"
+                f" | has_changes={has_changes}"
             )
+        return has_changes, fm_final, body
 
-        if result.is_valid and not has_changes:
-            if debug_mode:
-                logger.debug(
-                    f"[Doctor Debug] Note valid and unchanged | {note_path.name}"
-                )
-            return self._tag_valid(result, note_path)
-
-        if has_changes:
-            if debug_mode:
-                logger.debug(
-                    f"[Doctor Debug] Auto-fixing | {note_path.name} | has_changes=True"
-                )
-                logger.debug(f"[Doctor Debug] Frontmatter AFTER fix: {fm_final}")
+    def _apply_auto_fix(
+        self,
+        outcome: NoteOutcome,
+        fm_final: dict[str, Any],
+        body: str,
+        start: int,
+        debug_mode: bool,
+        write_partial: bool,
+    ) -> None:
+        """Re-validate auto-fixed frontmatter and write it, updating *outcome*.
 
-            # Re-validate in memory before writing to disk
-            fixed_result = self.validator.validate_content(note_path, fm_final, body)
+        The fix is written when the note is now valid, or always with
+        *write_partial*. ``start`` is when classification began, for the
+        ``fix`` timing.
+        """
+        note_path = outcome.path
+        original = outcome.result.frontmatter
+        if debug_mode:
+            logger.debug(
+                f"[Doctor Debug] Auto-fixing | {note_path.name} | has_changes=True"
+            )
+            logger.debug(f"[Doctor Debug] Frontmatter AFTER fix: {fm_final}")
 
-            if fixed_result.is_valid:
-                if debug_mode:
-                    logger.debug(
-                        "[Doctor Debug] Re-validation passed. Writing auto-fixed note."
-                    )
-                self.io.write_note(note_path, fm_final, body)
-                self.cli.show_note_fixed(note_path.name)
-                return self._tag_valid(fixed_result, note_path, was_fixed=True)
+        # Re-validate in memory before writing to disk
+        fixed_result = self.validator.validate_content(note_path, fm_final, body)
+        outcome.timings_ms["fix"] = (perf_counter_ns() - start) / _NS_PER_MS
+        outcome.result = fixed_result
 
+        if fixed_result.is_valid or write_partial:
             if debug_mode:
                 logger.debug(
-                    f"[Doctor Debug] Re-validation failed. Still invalid | "
-                    f"missing={fixed_result.missing_fields} | invalid={fixed_result.invalid_fields}"
+                    "[Doctor Debug] Writing auto-fixed note"
+                    f" | valid={fixed_result.is_valid}"
                 )
-            result = fixed_result
-
-        if self._is_only_version_issue(result):
-            return "version"
-
-        return result
+            write_start = perf_counter_ns()
+            written = self.io.write_note(note_path, fm_final, body)
+            outcome.timings_ms["write"] = (perf_counter_ns() - write_start) / _NS_PER_MS
+            if written:
+                outcome.applied_fixes = changed_keys(original, fm_final)
+
+        if fixed_result.is_valid:
+            self.cli.show_note_fixed(note_path.name)
+            outcome.status = self._tag_valid(fixed_result, note_path, was_fixed=True)
+        elif debug_mode:
+            logger.debug(
+                "[Doctor Debug] Re-validation failed. Still invalid"
+                f" | missing={fixed_result.missing_fields}"
+                f" | invalid={fixed_result.invalid_fields}"
+            )
 
     # -- config-driven mappings ---------------------------------------------
 
@@ -350,24 +720,110 @@ class DoctorApp:
 
     def _process_invalid_results(
         self,
-        results: list[ValidationResult],
+        results: Iterable[ValidationResult],
         debug_mode: bool,
+        names: list[str] | None = None,
+        checkpoint: DoctorCheckpoint | None = None,
     ) -> None:
-        """Process invalid results interactively."""
-        if not results:
+        """Process invalid results interactively.
+
+        The next few notes are read ahead in the background while the
+        user works on the current one. Outside debug mode all wizards run
+        in one long-lived TUI session instead of one app per note.
+
+        Args:
+            results: Invalid notes; may be a lazy iterable when *names*
+                is given.
+            debug_mode: Use the plain CLI loop instead of the TUI.
+            names: File names of the queued notes; derived from *results*
+                when omitted.
+            checkpoint: Progress record, advanced after every note and
+                deleted once the queue is finished.
+        """
+        if names is None:
+            results = list(results)
+            names = [r.file_path.name for r in results]
+        if not names:
             return
 
-        for i, result in enumerate(results, 1):
+        prefetcher: Prefetcher[ValidationResult, PrefetchedNote] = Prefetcher(
+            self._prefetch_note
+        )
+        notes = prefetcher.iterate(results)
+        try:
+            if debug_mode:
+                finished = self._run_cli_loop(notes, len(names), checkpoint)
+            else:
+                finished = self._run_session(names, notes, checkpoint)
+        finally:
+            notes.close()
+
+        if not finished:
+            if checkpoint is not None:
+                self.cli.show_checkpoint_saved()
+            return
+        if checkpoint is not None:
+            checkpoint.clear()
+        self.cli.show_doctor_finished()
+
+    def _run_cli_loop(
+        self,
+        notes: Iterator[tuple[ValidationResult, PrefetchedNote | None]],
+        total: int,
+        checkpoint: DoctorCheckpoint | None,
+    ) -> bool:
+        """Fix notes one by one with CLI prompts; False if the user quit.
+
+        Like ``DoctorSession``, renames are recorded in the checkpoint as
+        they happen and each handled note is advanced with the keys fixed.
+        """
+        for i, (result, prefetched) in enumerate(notes, 1):
+            applied: set[str] = set()
             action = self._process_note(
                 result,
                 i,
-                len(results),
-                debug_mode,
+                total,
+                True,
+                prefetched=prefetched,
+                checkpoint=checkpoint,
+                applied=applied,
             )
             if action == "__quit__":
-                return
+                return False
+            if checkpoint is not None:
+                checkpoint.advance(sorted(applied))
+        return True
 
-        self.cli.show_doctor_finished()
+    def _run_session(
+        self,
+        names: list[str],
+        notes: Iterator[tuple[ValidationResult, PrefetchedNote | None]],
+        checkpoint: DoctorCheckpoint | None,
+    ) -> bool:
+        """Fix every note inside a single TUI session; False if the user quit."""
+        session = DoctorSession(
+            self, names, notes, _MAX_FIX_ATTEMPTS, checkpoint=checkpoint
+        )
+        outcome = self.tui.run_session(session)
+
+        self.cli.show_session_log(session.log)
+        if outcome and outcome.get("__quit__"):
+            self.cli.show_exiting()
+            return False
+        return True
+
+    def _prefetch_note(self, result: ValidationResult) -> PrefetchedNote:
+        """Read ahead for *result* (worker thread).
+
+        Only I/O: the file fingerprint and, for a note queued for a
+        rename, its parsed content. The rename target and validations
+        are worked out on the main thread.
+        """
+        path = result.file_path
+        prefetched = PrefetchedNote(path, file_fingerprint(path))
+        if "integrity_filename" in result.invalid_fields:
+            prefetched.parsed = self.validator.read_note(path)
+        return prefetched
 
     def _process_note(
         self,
@@ -375,19 +831,40 @@ class DoctorApp:
         index: int,
         total: int,
         debug_mode: bool,
+        prefetched: PrefetchedNote | None = None,
+        checkpoint: DoctorCheckpoint | None = None,
+        applied: set[str] | None = None,
     ) -> str | None:
-        """Process a single invalid note interactively."""
-        file_path = result.file_path
-        self.cli.show_note_header(index, total, file_path.name)
+        """Process a single invalid note interactively.
+
+        Args:
+            result: Validation result of the note.
+            index: Position of the note in the queue (1-based).
+            total: Length of the queue.
+            debug_mode: Use the plain CLI prompts instead of the TUI.
+            prefetched: Work done ahead of time for this note, if any.
+            checkpoint: Progress record; told about a rename.
+            applied: Collects the keys of every fix written.
+
+        Returns:
+            "__quit__" if the user quit, "__skip__" if they skipped the
+            note, None otherwise.
+        """
+        self.cli.show_note_header(index, total, result.file_path.name)
+
+        if result.is_valid:
+            self.cli.show_note_valid(result.file_path.name)
+            return None
+        if prefetched is not None and not prefetched.is_fresh():
+            logger.debug(f"Prefetch stale, discarding | {result.file_path.name}")
+            prefetched = None
 
         # Handle filename mismatch before the fix loop
-        if "integrity_filename" in result.invalid_fields:
-            rename_out = self._handle_rename(result)
-            if rename_out is not None:
-                file_path, result = rename_out
-                if result.is_valid:
-                    self.cli.show_note_valid(file_path.name)
-                    return None
+        result = self._rename_queued(result, prefetched, checkpoint)
+        file_path = result.file_path
+        if result.is_valid:
+            self.cli.show_note_valid(file_path.name)
+            return None
 
         frontmatter = dict(result.frontmatter)
         for _attempt in range(_MAX_FIX_ATTEMPTS):
@@ -395,76 +872,121 @@ class DoctorApp:
                 result.missing_fields,
                 result.invalid_fields,
             )
+            fixes = self._gather_fixes(result, debug_mode)
+            action = self._wizard_exit(fixes)
+            if action is not None:
+                return action
 
-            if debug_mode:
-                logger.debug(f"CLI prompt | {file_path.name}")
-                logger.debug("[DEBUG TRACE] app._process_note Before Fix Gather")
-                fixes = self.cli.gather_fixes(result)
-            else:
-                fixes = self.tui.gather_fixes(result)
-
-            if debug_mode:
-                logger.debug(
-                    f"[DEBUG TRACE] app._process_note Fixes Gathered = {fixes}"
-                )
-
-            if not fixes:
-                self.cli.show_skip_or_no_fixes()
-                return None
-            if fixes.get("__quit__"):
-                self.cli.show_exiting()
-                return "__quit__"
-            if fixes.get("__skip__"):
-                self.cli.show_skipping_note()
-                return None
-
-            frontmatter = self.patcher.apply_fixes(
-                frontmatter,
-                fixes,
-            )
-            if debug_mode:
-                logger.debug("[DEBUG TRACE] app._process_note After Patcher")
-
-            # Strip fields not allowed by the note's Pydantic model
-            original_for_rules = frontmatter.copy()
-            self.extraneous_rule.apply(
-                file_path,
-                original_for_rules,
-                frontmatter,
+            result = self._apply_gathered_fixes(
+                file_path, frontmatter, fixes, result.body, debug_mode, applied
             )
-            if debug_mode:
-                logger.debug(
-                    "[DEBUG TRACE] app._process_note After check_and_fix_extraneous"
-                )
-
-            self.io.write_note(file_path, frontmatter, result.body)
-            self.cli.show_note_fixed(file_path.name)
-
-            result = self.validator.validate(file_path)
             if result.is_valid:
-                if debug_mode:
-                    logger.debug("[Doctor Debug] TUI fix successful. Note is valid.")
                 self.cli.show_note_valid(file_path.name)
                 return None
 
             frontmatter = dict(result.frontmatter)
-            if debug_mode:
-                logger.debug(
-                    f"[Doctor Debug] TUI fix still failed! | "
-                    f"missing={result.missing_fields} | invalid={result.invalid_fields}"
-                )
             self.cli.show_fix_failed()
 
         self.cli.show_max_attempts_reached(file_path.name, _MAX_FIX_ATTEMPTS)
         return None
 
-    # -- helpers ------------------------------------------------------------
+    def _rename_queued(
+        self,
+        result: ValidationResult,
+        prefetched: PrefetchedNote | None,
+        checkpoint: DoctorCheckpoint | None,
+    ) -> ValidationResult:
+        """Fix a filename mismatch of a queued note; return its current result."""
+        if "integrity_filename" not in result.invalid_fields:
+            return result
+        rename_out = self._handle_rename(
+            result,
+            parsed=prefetched.parsed if prefetched is not None else None,
+        )
+        if rename_out is None:
+            return result
+        file_path, result = rename_out
+        if checkpoint is not None:
+            checkpoint.relocate(file_path)
+        return result
 
-    def _handle_rename(
+    def _gather_fixes(
         self,
         result: ValidationResult,
-    ) -> tuple[Path, ValidationResult] | None:
-        """Automatically rename file to match title/timestamp."""
+        debug_mode: bool,
+    ) -> dict[str, Any]:
+        """Ask the user for fixes, with CLI prompts in debug mode."""
+        if not debug_mode:
+            return self.tui.gather_fixes(result)
+
+        logger.debug(f"CLI prompt | {result.file_path.name}")
+        logger.debug("[DEBUG TRACE] app._process_note Before Fix Gather")
+        fixes = self.cli.gather_fixes(result)
+        logger.debug(f"[DEBUG TRACE] app._process_note Fixes Gathered = {fixes}")
+        return fixes
+
+    def _wizard_exit(self, fixes: dict[str, Any] | None) -> str | None:
+        """Report a skip or quit; return "__quit__"/"__skip__", else None."""
+        if not fixes:
+            self.cli.show_skip_or_no_fixes()
+            return "__skip__"
+        if fixes.get("__quit__"):
+            self.cli.show_exiting()
+            return "__quit__"
+        if fixes.get("__skip__"):
+            self.cli.show_skipping_note()
+            return "__skip__"
+        return None
+
+    def _apply_gathered_fixes(
+        self,
+        file_path: Path,
+        frontmatter: dict[str, Any],
+        fixes: dict[str, Any],
+        body: str,
+        debug_mode: bool,
+        applied: set[str] | None,
+    ) -> ValidationResult:
+        """Write the wizard's fixes and return the note's new validation."""
+        result = self._apply_wizard_fixes(file_path, frontmatter, fixes, body)
+        if applied is not None:
+            applied.update(k for k in fixes if not k.startswith("__"))
+        self.cli.show_note_fixed(file_path.name)
+
+        if not debug_mode:
+            return result
+        if result.is_valid:
+            logger.debug("[Doctor Debug] TUI fix successful. Note is valid.")
+        else:
+            logger.debug(
+                "[Doctor Debug] TUI fix still failed!"
+                f" | missing={result.missing_fields}"
+                f" | invalid={result.invalid_fields}"
+            )
+        return result
+
+    # -- helpers ------------------------------------------------------------
+
+    def _rename_target(self, result: ValidationResult) -> Path | None:
+        """Return the free path the note should be renamed to, or None."""
+        new_path = self._desired_path(result)
+        if new_path is None:
+            return None
+        # Never clobber another note (or a case/sanitize-equivalent name)
+        try:
+            new_path = self.filenames.resolve(new_path, owner=result.file_path)
+        except FileExistsError as e:
+            logger.error(f"Cannot rename {result.file_path.name}: {e}")
+            return None
+        if new_path == result.file_path:
+            return None
+        return new_path
+
+    def _desired_path(self, result: ValidationResult) -> Path | None:
+        """Return the path matching the note's title and timestamp, or None.
+
+        Collisions with other notes are not considered here.
+        """
         title = result.frontmatter.get("title", "")
         if not title:
             return None
@@ -476,7 +998,7 @@ class DoctorApp:
         if created and isinstance(created, datetime):
             prefix = created.strftime("%Y%m%d%H%M%S") + "_"
         else:
-            ts_match = DateResolver.extract_timestamp_from_stem(stem)
+            ts_match = self.date_resolver.stem_timestamp(stem)
 
             # Determine prefix and clean stem
             if ts_match:
@@ -494,16 +1016,72 @@ class DoctorApp:
 
         if new_path == result.file_path:
             return None
+        return new_path
+
+    def _handle_rename(
+        self,
+        result: ValidationResult,
+        parsed: ValidationResult | tuple[dict[str, Any], str] | None = None,
+    ) -> tuple[Path, ValidationResult] | None:
+        """Automatically rename file to match title/timestamp.
+
+        Args:
+            result: Validation result of the note to rename.
+            parsed: Prefetched ``read_note`` output of the note; validated
+                under the new name instead of re-reading the file.
+        """
+        rename_out = self._rename(result, parsed=parsed)
+        if rename_out is not None:
+            self.cli.show_renamed(rename_out[0].name)
+        return rename_out
+
+    def _rename(
+        self,
+        result: ValidationResult,
+        parsed: ValidationResult | tuple[dict[str, Any], str] | None = None,
+    ) -> tuple[Path, ValidationResult] | None:
+        """Rename the note on disk without reporting (see ``_handle_rename``)."""
+        new_path = self._rename_target(result)
+        if new_path is None:
+            return None
 
         success = self.io.rename_note(result.file_path, new_path)
         if success:
-            self.cli.show_renamed(new_name)
+            self.filenames.move(result.file_path, new_path)
+            if isinstance(parsed, ValidationResult):
+                parsed.file_path = new_path
+                return new_path, parsed
+            if parsed is not None:
+                return new_path, self.validator.validate_content(new_path, *parsed)
             new_result = self.validator.validate(new_path)
             return new_path, new_result
         return None
 
-
-def create_app(settings: GlobalConfig) -> DoctorApp:
+    def _apply_wizard_fixes(
+        self,
+        file_path: Path,
+        frontmatter: dict[str, Any],
+        fixes: dict[str, Any],
+        body: str,
+    ) -> ValidationResult:
+        """Patch, strip extraneous fields, write and re-validate a note."""
+        frontmatter = self.patcher.apply_fixes(frontmatter, fixes)
+        logger.debug("[DEBUG TRACE] app._apply_wizard_fixes After Patcher")
+
+        # Strip fields not allowed by the note's Pydantic model
+        original_for_rules = frontmatter.copy()
+        self.extraneous_rule.apply(file_path, original_for_rules, frontmatter)
+
+        self.io.write_note(file_path, frontmatter, body)
+        return self.validator.validate(file_path)
+
+
+def create_app(
+    settings: GlobalConfig,
+    profile_rules: bool = False,
+    queue_hook: QueueHook | None = None,
+    cli: DoctorCLI | None = None,
+) -> DoctorApp:
     """Create DoctorApp instance."""
     # Ensure models are registered
     import dx_vault_atlas.shared.models.note  # noqa: F401
@@ -511,11 +1089,14 @@ def create_app(settings: GlobalConfig) -> DoctorApp:
 
     yaml_parser = YamlParserService()
     io_service = NoteIOService(yaml_parser)
-    cli = DoctorCLI()
+    if cli is None:
+        cli = DoctorCLI()
 
     return DoctorApp(
         settings=settings,
         cli=cli,
         io_service=io_service,
         model_map=NoteModelRegistry.get_all(),
+        profiler=RuleProfiler() if profile_rules else None,
+        queue_hook=queue_hook,
     )
@@ -0,0 +1,238 @@
+"""Checkpoint of an interactive doctor session, for ``dxva doctor --resume``.
+
+The checkpoint records the queue of invalid notes found by the last full
+check (with their issues and file fingerprints), the fixes applied so far
+and the position in the queue. The queue is written once; progress
+(renames and handled notes) is appended to a journal next to it after
+every note, so quitting or crashing loses at most the note on screen
+and a long session never rewrites the whole queue.
+
+Resuming skips the scan and classification entirely: notes whose
+fingerprint is unchanged reuse their recorded issues and only need to be
+parsed; the others are re-validated.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from dx_vault_atlas.services.note_doctor.validator import ValidationResult
+from dx_vault_atlas.shared.core.io import Fingerprint, file_fingerprint
+from dx_vault_atlas.shared.logger import logger
+from dx_vault_atlas.shared.paths import DATA_DIR
+
+CHECKPOINT_PATH = DATA_DIR / "doctor_checkpoint.json"
+
+# Bump when the on-disk layout changes; older files are ignored
+_FORMAT_VERSION = 2
+
+
+@dataclass
+class QueuedNote:
+    """One invalid note in the checkpointed queue.
+
+    Attributes:
+        path: Note path (updated when the doctor renames it).
+        fingerprint: ``(mtime_ns, size)`` when the issues were recorded.
+        missing: Missing fields at that time.
+        invalid: Invalid fields at that time.
+        warnings: Warnings at that time.
+        error: Read/parse error at that time, if any.
+        applied: Frontmatter keys fixed by the user (set once done).
+    """
+
+    path: str
+    fingerprint: list[int] | None
+    missing: list[str] = field(default_factory=list)
+    invalid: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    error: str | None = None
+    applied: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_result(cls, result: ValidationResult) -> "QueuedNote":
+        """Record *result* and the current fingerprint of its file."""
+        fingerprint = file_fingerprint(result.file_path)
+        return cls(
+            path=str(result.file_path),
+            fingerprint=list(fingerprint) if fingerprint is not None else None,
+            missing=list(result.missing_fields),
+            invalid=list(result.invalid_fields),
+            warnings=list(result.warnings),
+            error=result.error,
+        )
+
+    @property
+    def file_path(self) -> Path:
+        """The note path as a ``Path``."""
+        return Path(self.path)
+
+    def is_unchanged(self, current: Fingerprint | None) -> bool:
+        """True if *current* matches the recorded fingerprint."""
+        return (
+            current is not None
+            and self.fingerprint is not None
+            and tuple(self.fingerprint) == current
+        )
+
+
+@dataclass
+class DoctorCheckpoint:
+    """Queue and position of an interactive doctor session.
+
+    Attributes:
+        vault: Vault root the queue belongs to.
+        queue: Invalid notes in processing order.
+        position: Index of the first note not yet handled.
+        created: When the queue was built (ISO 8601).
+        path: Where the queue is stored; progress goes to ``journal``.
+    """
+
+    vault: str
+    queue: list[QueuedNote]
+    position: int = 0
+    created: str = field(default_factory=lambda: datetime.now().isoformat())
+    path: Path = field(default=CHECKPOINT_PATH, repr=False, compare=False)
+
+    @classmethod
+    def start(
+        cls,
+        vault: Path,
+        results: list[ValidationResult],
+        path: Path = CHECKPOINT_PATH,
+    ) -> "DoctorCheckpoint":
+        """Create (and save) a checkpoint for a fresh queue of invalid notes."""
+        checkpoint = cls(
+            str(vault),
+            [QueuedNote.from_result(r) for r in results],
+            path=path,
+        )
+        checkpoint.save()
+        return checkpoint
+
+    @classmethod
+    def load(cls, path: Path = CHECKPOINT_PATH) -> "DoctorCheckpoint | None":
+        """Load the checkpoint at *path*, or None if absent or unreadable."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable doctor checkpoint {path}: {e}")
+            return None
+
+        if not isinstance(data, dict) or data.get("format") != _FORMAT_VERSION:
+            logger.warning(f"Ignoring doctor checkpoint with unknown format: {path}")
+            return None
+        try:
+            checkpoint = cls(
+                vault=data["vault"],
+                queue=[QueuedNote(**entry) for entry in data["queue"]],
+                position=int(data["position"]),
+                created=data["created"],
+                path=path,
+            )
+            checkpoint._replay_journal()
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring malformed doctor checkpoint {path}: {e}")
+            return None
+        return checkpoint
+
+    # -- progress -----------------------------------------------------------
+
+    @property
+    def remaining(self) -> list[QueuedNote]:
+        """Notes not yet handled, current one first."""
+        return self.queue[self.position :]
+
+    @property
+    def done(self) -> bool:
+        """True once every queued note has been handled."""
+        return self.position >= len(self.queue)
+
+    def relocate(self, new_path: Path) -> None:
+        """Record that the current note was renamed to *new_path*."""
+        self._record({"relocate": str(new_path)})
+
+    def advance(self, applied: list[str]) -> None:
+        """Mark the current note handled with the keys the user fixed."""
+        self._record({"advance": sorted(applied)})
+
+    def _record(self, change: dict[str, Any]) -> None:
+        """Apply *change* to the current note and append it to the journal."""
+        if self.done:
+            return
+        entry = {"at": self.position, **change}
+        self._apply(entry)
+        with self.journal.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def _apply(self, entry: dict[str, Any]) -> None:
+        """Apply one journal entry if it is for the current note."""
+        if self.done or entry.get("at") != self.position:
+            return
+        if "relocate" in entry:
+            self.queue[self.position].path = str(entry["relocate"])
+        elif "advance" in entry:
+            self.queue[self.position].applied = list(entry["advance"])
+            self.position += 1
+
+    def _replay_journal(self) -> None:
+        """Apply the journalled progress on top of the stored queue.
+
+        Stops at the first line that does not decode: a write torn by a
+        crash loses only that entry.
+        """
+        try:
+            lines = self.journal.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                return
+            if not isinstance(entry, dict):
+                return
+            self._apply(entry)
+
+    # -- persistence ----------------------------------------------------------
+
+    @property
+    def journal(self) -> Path:
+        """Append-only progress log stored next to the queue."""
+        return self.path.with_suffix(".journal")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to the on-disk JSON layout."""
+        return {
+            "format": _FORMAT_VERSION,
+            "vault": self.vault,
+            "created": self.created,
+            "position": self.position,
+            "queue": [asdict(entry) for entry in self.queue],
+        }
+
+    def save(self) -> None:
+        """Write the whole checkpoint atomically and start a fresh journal.
+
+        The old journal is dropped first, so it can never be replayed on
+        top of the new queue.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.journal.unlink(missing_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.to_dict(), ensure_ascii=False), encoding="utf-8")
+        tmp.replace(self.path)
+
+    def clear(self) -> None:
+        """Delete the checkpoint and its journal."""
+        self.discard(self.path)
+
+    @staticmethod
+    def discard(path: Path = CHECKPOINT_PATH) -> None:
+        """Delete the checkpoint stored at *path*, if any, and its journal."""
+        path.unlink(missing_ok=True)
+        path.with_suffix(".journal").unlink(missing_ok=True)
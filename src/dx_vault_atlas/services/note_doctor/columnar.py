@@ -0,0 +1,409 @@
+"""Columnar batch validation for Note Doctor.
+
+Loads the frontmatter of a chunk of notes into a column-oriented table
+(one list per field) and evaluates the cheap checks column-wise: enum
+membership, version comparison and date shape. Each check is evaluated
+once per *distinct* value in a column, so a vault where every task has
+``status: to_do`` pays for a single enum lookup.
+
+Only rows that fail a column check go through the full per-note
+validator (and therefore Pydantic). Rows that pass every column check are
+known to be valid and get a ``ValidationResult`` without instantiating
+the model.
+
+The fast path is conservative: any field annotation or constraint it does
+not understand sends the whole note type down the per-note path.
+"""
+
+from collections.abc import Callable, Iterable, Sequence
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin
+
+from annotated_types import MinLen
+from packaging.version import InvalidVersion
+from packaging.version import parse as parse_version
+from pydantic import BaseModel
+
+from dx_vault_atlas.core.registry import NoteModelRegistry
+from dx_vault_atlas.services.note_doctor.validator import (
+    _TARGET_VERSION,
+    AreaRule,
+    CreatedFormatRule,
+    NoteDoctorValidator,
+    PriorityRule,
+    ValidationResult,
+    ValidationRule,
+    VersionRule,
+)
+from dx_vault_atlas.shared.logger import logger
+from dx_vault_atlas.shared.models.enums import NoteArea, Priority
+from dx_vault_atlas.shared.profiling import stage
+from dx_vault_atlas.shared.tracing import note_span, rule_span
+
+# Notes validated per table; bounds memory held by one chunk
+DEFAULT_CHUNK_SIZE = 512
+
+# Rules whose semantics are fully reproduced by the column checks below
+_COLUMN_RULES: tuple[type, ...] = (
+    PriorityRule,
+    AreaRule,
+    VersionRule,
+    CreatedFormatRule,
+)
+
+_MISSING = object()
+"""Marker for a field absent from a note's frontmatter."""
+
+Predicate = Callable[[Any], bool]
+
+
+# ---------------------------------------------------------------------------
+# Table
+# ---------------------------------------------------------------------------
+
+
+class FrontmatterTable:
+    """Column-oriented view over the frontmatter of a chunk of notes."""
+
+    def __init__(
+        self,
+        paths: Sequence[Path],
+        frontmatters: Sequence[dict[str, Any]],
+        bodies: Sequence[str],
+    ) -> None:
+        """Initialise the table from row-oriented inputs."""
+        self.paths = list(paths)
+        self.frontmatters = list(frontmatters)
+        self.bodies = list(bodies)
+        self._columns: dict[str, list[Any]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.paths)
+
+    def column(self, name: str) -> list[Any]:
+        """Return the column for *name*, using ``_MISSING`` for absent keys."""
+        col = self._columns.get(name)
+        if col is None:
+            col = [fm.get(name, _MISSING) for fm in self.frontmatters]
+            self._columns[name] = col
+        return col
+
+
+# ---------------------------------------------------------------------------
+# Column helpers
+# ---------------------------------------------------------------------------
+
+
+def _map_distinct(column: Iterable[Any], predicate: Predicate) -> list[bool]:
+    """Evaluate *predicate* once per distinct value of *column*."""
+    cache: dict[tuple[type, Any], bool] = {}
+    out: list[bool] = []
+    for value in column:
+        key = (type(value), value)
+        try:
+            verdict = cache.get(key)
+        except TypeError:  # unhashable (lists, dicts)
+            out.append(predicate(value))
+            continue
+        if verdict is None:
+            verdict = cache[key] = predicate(value)
+        out.append(verdict)
+    return out
+
+
+def _rule_priority_ok(value: Any) -> bool:  # noqa: ANN401
+    """Mirror ``PriorityRule``: absent/None passes, else must be a Priority."""
+    if value is _MISSING or value is None:
+        return True
+    try:
+        Priority(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _rule_area_ok(value: Any) -> bool:  # noqa: ANN401
+    """Mirror ``AreaRule``: falsy passes, else must be a NoteArea."""
+    if value is _MISSING or not value:
+        return True
+    try:
+        NoteArea(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _rule_version_ok(value: Any) -> bool:  # noqa: ANN401
+    """Mirror ``VersionRule``: empty passes, else must be >= target."""
+    raw = "" if value is _MISSING else str(value)
+    if not raw:
+        return True
+    try:
+        return parse_version(raw) >= _TARGET_VERSION
+    except InvalidVersion:
+        # Let the per-note path surface the parse failure
+        return False
+
+
+def _rule_created_ok(value: Any) -> bool:  # noqa: ANN401
+    """Mirror ``CreatedFormatRule``: date-only values are invalid."""
+    if value is _MISSING or value is None:
+        return True
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return False
+    if isinstance(value, str):
+        return " " in value or "T" in value.upper()
+    return True
+
+
+_RULE_COLUMNS: tuple[tuple[str, Predicate], ...] = (
+    ("priority", _rule_priority_ok),
+    ("area", _rule_area_ok),
+    ("version", _rule_version_ok),
+    ("created", _rule_created_ok),
+)
+
+
+# ---------------------------------------------------------------------------
+# Model field checks
+# ---------------------------------------------------------------------------
+
+
+def _enum_checker(enum_cls: type[Enum]) -> Predicate:
+    """Accept plain values of the enum's own base type that are members."""
+    values = frozenset(m.value for m in enum_cls)
+    base = str if issubclass(enum_cls, str) else int
+    return lambda v: type(v) is base and v in values
+
+
+_SCALAR_CHECKERS: tuple[tuple[type, Predicate], ...] = (
+    (str, lambda v: type(v) is str),
+    (int, lambda v: type(v) is int),
+    (datetime, lambda v: isinstance(v, datetime)),
+)
+
+
+def _optional_checker(annotation: Any) -> Predicate | None:  # noqa: ANN401
+    """Check for ``X | None``; other unions are unsupported."""
+    args = get_args(annotation)
+    inner = [a for a in args if a is not NoneType]
+    if len(inner) != 1 or len(args) != 2:
+        return None
+    checker = _annotation_checker(inner[0])
+    if checker is None:
+        return None
+    return lambda v: v is None or checker(v)
+
+
+def _list_checker(annotation: Any) -> Predicate | None:  # noqa: ANN401
+    """Check for ``list[str]``; other item types are unsupported."""
+    (item,) = get_args(annotation) or (Any,)
+    if item is not str:
+        return None
+    return lambda v: type(v) is list and all(type(x) is str for x in v)
+
+
+def _annotation_checker(annotation: Any) -> Predicate | None:  # noqa: ANN401
+    """Build a strict value check for *annotation*, or None if unsupported."""
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        return _optional_checker(annotation)
+    if origin is list:
+        return _list_checker(annotation)
+    for scalar, checker in _SCALAR_CHECKERS:
+        if annotation is scalar:
+            return checker
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return _enum_checker(annotation)
+    return None
+
+
+def _field_checker(field_info: Any) -> Predicate | None:  # noqa: ANN401
+    """Combine the annotation check with supported metadata constraints."""
+    checker = _annotation_checker(field_info.annotation)
+    if checker is None:
+        return None
+    min_len = None
+    for meta in field_info.metadata:
+        if isinstance(meta, MinLen):
+            min_len = meta.min_length
+        else:
+            return None
+    if min_len is None:
+        return checker
+    return lambda v: checker(v) and len(v) >= min_len
+
+
+def _field_verdict(checker: Predicate, required: bool) -> Predicate:
+    """Apply *checker* to present values; absent ones pass unless required."""
+
+    def verdict(value: Any) -> bool:  # noqa: ANN401
+        return not required if value is _MISSING else checker(value)
+
+    return verdict
+
+
+def _compile_model(
+    model_cls: type[BaseModel],
+) -> list[tuple[str, bool, Predicate]] | None:
+    """Return ``(key, required, check)`` per model field, or None if unsupported.
+
+    ``before`` field validators in this codebase only coerce (e.g.
+    ``ensure_list``), so values already of the target type pass through
+    them unchanged. Any other validator kind disables the fast path.
+    """
+    decorators = model_cls.__pydantic_decorators__
+    if decorators.model_validators:
+        return None
+    for dec in decorators.field_validators.values():
+        if dec.info.mode != "before":
+            return None
+
+    compiled = []
+    for name, info in model_cls.model_fields.items():
+        checker = _field_checker(info)
+        if checker is None:
+            return None
+        compiled.append((info.alias or name, info.is_required(), checker))
+    return compiled
+
+
+# ---------------------------------------------------------------------------
+# Validator
+# ---------------------------------------------------------------------------
+
+
+class ColumnarValidator:
+    """Validates chunks of notes column-wise, deferring failures to per-note.
+
+    Wraps a ``NoteDoctorValidator``: rules it can express as column checks
+    are evaluated on the table, any other rule (e.g. ``IntegrityRule``) is
+    run row-wise for rows that survived the column checks, and every row
+    that fails anything is re-validated by the wrapped validator so the
+    reported issues are exactly those of the per-note path.
+    """
+
+    def __init__(self, validator: NoteDoctorValidator) -> None:
+        """Initialise with the per-note validator used as fallback."""
+        self.validator = validator
+        self._models: dict[str, list[tuple[str, bool, Predicate]] | None] = {
+            name: _compile_model(model_cls)
+            for name, model_cls in NoteModelRegistry.get_all().items()
+        }
+
+    # -- public API ---------------------------------------------------------
+
+    def validate_batch(self, paths: Sequence[Path]) -> list[ValidationResult]:
+        """Read, parse and validate *paths*, preserving input order."""
+        results: list[ValidationResult | None] = []
+        rows: list[int] = []
+        row_paths: list[Path] = []
+        frontmatters: list[dict[str, Any]] = []
+        bodies: list[str] = []
+
+        for path in paths:
+            with note_span("doctor.load_note", path):
+                parsed = self.validator.read_note(path)
+            if isinstance(parsed, ValidationResult):
+                results.append(parsed)
+                continue
+            rows.append(len(results))
+            results.append(None)
+            row_paths.append(path)
+            frontmatters.append(parsed[0])
+            bodies.append(parsed[1])
+
+        table = FrontmatterTable(row_paths, frontmatters, bodies)
+        with stage("validate"):
+            validated = self.validate_table(table)
+        for idx, result in zip(rows, validated, strict=True):
+            results[idx] = result
+        return results  # type: ignore[return-value]
+
+    def validate_table(self, table: FrontmatterTable) -> list[ValidationResult]:
+        """Validate every row of *table*, preserving row order."""
+        passed = self._column_pass(table)
+        self._row_rules_pass(table, passed)
+
+        results: list[ValidationResult] = []
+        slow = 0
+        for i, ok in enumerate(passed):
+            path, fm, body = table.paths[i], table.frontmatters[i], table.bodies[i]
+            if ok:
+                results.append(ValidationResult(path, True, fm, body, warnings=[]))
+            else:
+                slow += 1
+                results.append(self.validator.validate_content(path, fm, body))
+
+        logger.debug(
+            f"Columnar batch | rows={len(table)} | fast={len(table) - slow}"
+            f" | per-note={slow}"
+        )
+        return results
+
+    # -- column checks ------------------------------------------------------
+
+    def _column_pass(self, table: FrontmatterTable) -> bytearray:
+        """Return a mask with 1 for rows that pass every column check."""
+        passed = bytearray(b"\x01") * len(table)
+        if not passed:
+            return passed
+
+        for key, predicate in _RULE_COLUMNS:
+            column = table.column(key)
+            for i, ok in enumerate(_map_distinct(column, predicate)):
+                if not ok:
+                    passed[i] = 0
+
+        self._model_pass(table, passed)
+        return passed
+
+    def _model_pass(self, table: FrontmatterTable, passed: bytearray) -> None:
+        """Check model fields column-wise, grouped by note type."""
+        groups: dict[str, list[int]] = {}
+        for i, note_type in enumerate(table.column("type")):
+            compiled = (
+                self._models.get(note_type) if type(note_type) is str else None
+            )
+            if compiled is None:
+                passed[i] = 0
+            elif passed[i]:
+                groups.setdefault(note_type, []).append(i)
+
+        for note_type, indices in groups.items():
+            for key, required, checker in self._models[note_type] or []:
+                column = table.column(key)
+                values = [column[i] for i in indices]
+                verdicts = _map_distinct(values, _field_verdict(checker, required))
+                for i, ok in zip(indices, verdicts, strict=True):
+                    if not ok:
+                        passed[i] = 0
+
+    # -- row-wise rules -----------------------------------------------------
+
+    def _row_rules_pass(self, table: FrontmatterTable, passed: bytearray) -> None:
+        """Run rules without a column equivalent on surviving rows."""
+        # Profiler wrappers keep the wrapped rule in ``.rule``
+        row_rules: list[ValidationRule] = [
+            rule
+            for rule in self.validator.rules
+            if type(getattr(rule, "rule", rule)) not in _COLUMN_RULES
+        ]
+        if not row_rules:
+            return
+        for i, ok in enumerate(passed):
+            if not ok:
+                continue
+            invalid: list[str] = []
+            warnings: list[str] = []
+            for rule in row_rules:
+                with rule_span(rule):
+                    rule.check(
+                        table.paths[i], table.frontmatters[i], invalid, warnings
+                    )
+            if invalid or warnings:
+                passed[i] = 0
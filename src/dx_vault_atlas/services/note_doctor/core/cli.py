@@ -1,6 +1,9 @@
 """CLI service for Note Doctor."""
 
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from rich.table import Table
 
 from dx_vault_atlas.core.registry import NoteModelRegistry
 from dx_vault_atlas.shared.models.enums import (
@@ -12,6 +15,9 @@ from dx_vault_atlas.services.note_doctor.validator import (
 )
 from dx_vault_atlas.shared import console as ui
 
+if TYPE_CHECKING:
+    from dx_vault_atlas.services.note_doctor.core.profiler import RuleStats
+
 # Field → selectable options (used in CLI debug mode)
 _ENUM_OPTIONS: dict[str, list[Any]] = {
     "type": list(NoteModelRegistry.get_all().keys()),
@@ -84,10 +90,64 @@ class DoctorCLI:
         else:
             ui.console.print("\n[bold]Doctor finished.[/bold]")
 
+    def show_batch_summary(self, total: int, report_path: Path | None) -> None:
+        """Show the batch run total and where the report went."""
+        ui.console.print(f"\n[bold]Checked {total} notes (batch).[/bold]")
+        if report_path is not None:
+            ui.console.print(f"[dim]Report written to {report_path}[/dim]")
+
+    def show_rename_plan(self, count: int, suffixed: int) -> None:
+        """Summarise a bulk rename plan before applying it."""
+        ui.console.print(f"\n[bold]Rename plan:[/bold] {count} notes")
+        if suffixed:
+            ui.console.print(
+                f"[yellow]{suffixed} targets collided and got a numeric suffix[/yellow]"
+            )
+
+    def show_rename_done(self, count: int) -> None:
+        """Confirm a completed bulk rename."""
+        ui.console.print(f"[green]✓ Renamed {count} notes.[/green]")
+
+    def show_rename_failed(self, error: str) -> None:
+        """Report a bulk rename that was not applied."""
+        ui.console.print(f"[red]Bulk rename not applied:[/red] {error}")
+
+    def show_rename_recovered(self, count: int) -> None:
+        """Report files restored from an interrupted bulk rename."""
+        ui.console.print(
+            f"[yellow]Recovered {count} files from an interrupted bulk rename.[/yellow]"
+        )
+
     def show_doctor_finished(self) -> None:
         """Show completion message."""
         ui.console.print("\n[bold]Doctor finished.[/bold]")
 
+    def show_resume(self, remaining: int, done: int, total: int) -> None:
+        """Announce that a checkpointed session is being resumed."""
+        ui.console.print(
+            f"\n[bold]Resuming doctor session:[/bold] {remaining} notes left "
+            f"[dim]({done}/{total} already handled)[/dim]"
+        )
+
+    def show_no_checkpoint(self) -> None:
+        """Tell the user there is nothing to resume."""
+        ui.console.print(
+            "[yellow]No interrupted doctor session found. "
+            "Running a full check.[/yellow]"
+        )
+
+    def show_checkpoint_saved(self) -> None:
+        """Tell the user how to continue an interrupted session."""
+        ui.console.print(
+            "[dim]Progress saved. "
+            "Continue with [bold]dxva doctor --resume[/bold].[/dim]"
+        )
+
+    def show_session_log(self, lines: list[str]) -> None:
+        """Echo the status lines collected during a TUI session."""
+        for line in lines:
+            ui.console.print(f"[dim]•[/dim] {line}")
+
     def show_note_header(self, index: int, total: int, filename: str) -> None:
         """Show header for processing a specific note."""
         ui.console.print(f"\n[cyan]━━━ [{index}/{total}] {filename} ━━━[/cyan]")
@@ -132,6 +192,33 @@ class DoctorCLI:
             f"after {max_attempts} attempts. Skipping.[/red]"
         )
 
+    def show_rule_profile(
+        self, stats: list["RuleStats"], export_path: Path | None
+    ) -> None:
+        """Show the per-rule profile table, slowest rule first."""
+        table = Table(title="Rule Profile", title_style="bold cyan")
+        table.add_column("Rule", style="bold")
+        table.add_column("Kind", style="dim")
+        table.add_column("Calls", justify="right")
+        table.add_column("Hits", justify="right")
+        table.add_column("Total ms", justify="right")
+        table.add_column("p50 ms", justify="right")
+        table.add_column("p99 ms", justify="right")
+        for row in stats:
+            table.add_row(
+                row.name,
+                row.kind,
+                str(row.calls),
+                str(row.hits),
+                f"{row.total_ms:.2f}",
+                f"{row.percentile_ms(50):.3f}",
+                f"{row.percentile_ms(99):.3f}",
+            )
+        ui.console.print()
+        ui.console.print(table)
+        if export_path is not None:
+            ui.console.print(f"[dim]Rule profile exported to {export_path}[/dim]")
+
     # -- Interactive Gathering ----------------------------------------------
 
     def gather_fixes(self, result: ValidationResult) -> dict[str, Any]:
@@ -1,50 +1,47 @@
 """Note Fixing Domain Service."""
 
-from datetime import UTC, datetime
+import re
+from collections.abc import Iterable
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
+from pydantic import BaseModel
 from pydantic_core import PydanticUndefined
 
 from dx_vault_atlas.core.registry import NoteModelRegistry
-from dx_vault_atlas.shared.models.enums import (
-    NoteArea,
-    NoteStatus,
-)
+from dx_vault_atlas.shared.logger import logger
 from dx_vault_atlas.shared.models.defaults import SCHEMA_VERSION
+from dx_vault_atlas.shared.profiling import stage
+from dx_vault_atlas.shared.tracing import rule_span
 from dx_vault_atlas.shared.utils.date_resolver import (
     DateResolver,
+    strip_tz,
 )
-from dx_vault_atlas.shared.logger import logger
+from dx_vault_atlas.shared.utils.enum_index import NormalizationIndex
+
+if TYPE_CHECKING:
+    from dx_vault_atlas.services.note_doctor.validator import ValidationResult
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _strip_tz(dt: datetime) -> datetime:
-    """Return a naive (tz-unaware) copy of *dt*."""
-    if dt.tzinfo is not None:
-        return dt.replace(tzinfo=None)
-    return dt
-
-
-def _normalize_key(text: str) -> str:
-    """Lowercase, strip, and collapse whitespace/dashes."""
-    return text.strip().lower().replace(" ", "_").replace("-", "_")
-
+_LATIN_DATE = re.compile(r"^(\d{2})[-/](\d{2})[-/](\d{4})(.*)$")
+"""``DD-MM-YYYY`` or ``DD/MM/YYYY``, optionally followed by a time."""
 
 _SENTINEL = object()
 """Unique marker to distinguish 'no default' from ``None``."""
 
 
-def _match_status_enum(raw: str) -> str | None:
-    """Return the canonical NoteStatus value matching *raw*, or None."""
-    norm = _normalize_key(raw)
-    for member in NoteStatus:
-        if _normalize_key(member.value) == norm:
-            return member.value
-    return None
+
+def _model_for(frontmatter: dict[str, Any]) -> type[BaseModel] | None:
+    """Return the model registered for the note's type, if any."""
+    note_type = frontmatter.get("type")
+    if not note_type or not isinstance(note_type, str):
+        return None
+    return NoteModelRegistry.get_model(note_type)
 
 
 # ---------------------------------------------------------------------------
@@ -53,7 +50,27 @@ def _match_status_enum(raw: str) -> str | None:
 
 
 class FixRuleProtocol(Protocol):
-    """Protocol for note fixing rules."""
+    """Protocol for note fixing rules.
+
+    ``handles`` lists the issue codes (missing or invalid field names)
+    a rule acts on; ``NoteFixer`` uses it to skip rules unrelated to a
+    note's issues. A rule with ``handles = None`` always runs.
+
+    ``issues`` reports the codes of the changes ``apply`` would make to
+    a note that is otherwise valid (not in canonical form), so each
+    rule's trigger lives next to its fix. A rule whose trigger depends
+    on the note type may look at the raw type; it also handles ``type``,
+    so a non-canonical type dispatches it anyway.
+    """
+
+    @property
+    def handles(self) -> frozenset[str] | None:
+        """Issue codes the rule acts on; None to run on every note."""
+        ...
+
+    def issues(self, file_path: Path, frontmatter: dict[str, Any]) -> list[str]:
+        """Return the codes of the changes ``apply`` would make."""
+        ...
 
     def apply(
         self,
@@ -77,6 +94,22 @@ class FixRuleProtocol(Protocol):
 class IntegrityAliasesFixRule:
     """Auto-fixes integrity_aliases if the aliases list is empty."""
 
+    handles = frozenset({"aliases", "integrity_aliases"})
+
+    def issues(
+        self,
+        file_path: Path,  # noqa: ARG002 - FixRuleProtocol signature
+        frontmatter: dict[str, Any],
+    ) -> list[str]:
+        """Flag a titled note whose aliases are absent, empty or a string."""
+        title = frontmatter.get("title")
+        if not title or not isinstance(title, str):
+            return []
+        aliases = frontmatter.get("aliases", _SENTINEL)
+        if aliases is _SENTINEL or aliases in (None, []):
+            return ["aliases"]
+        return ["aliases"] if isinstance(aliases, str) else []
+
     def apply(
         self,
         file_path: Path,
@@ -114,9 +147,41 @@ class IntegrityAliasesFixRule:
 class DateFixRule:
     """Fixes created and updated dates."""
 
+    handles = frozenset({"created", "updated", "dates", "integrity_filename"})
+
     def __init__(self, date_resolver: DateResolver) -> None:
         self.date_resolver = date_resolver
 
+    def issues(self, file_path: Path, frontmatter: dict[str, Any]) -> list[str]:
+        """Flag created/updated values ``apply`` would rewrite."""
+        codes = []
+        if self._created_needs_fix(file_path, frontmatter):
+            codes.append("created")
+        updated = frontmatter.get("updated")
+        created = frontmatter.get("created")
+        if "updated" not in frontmatter or (
+            isinstance(created, datetime)
+            and isinstance(updated, datetime)
+            and strip_tz(updated) < strip_tz(created)
+        ):
+            codes.append("updated")
+        return codes
+
+    def _created_needs_fix(
+        self, file_path: Path, frontmatter: dict[str, Any]
+    ) -> bool:
+        created = frontmatter.get("created")
+        true_created = self.date_resolver.resolve_created(file_path, frontmatter)
+        if true_created:
+            return created != true_created
+        if "created" not in frontmatter:
+            return True
+        if isinstance(created, str):
+            return _LATIN_DATE.match(created.strip()) is not None
+        if isinstance(created, datetime):
+            return strip_tz(created) > self.date_resolver.now
+        return isinstance(created, date)
+
     def apply(
         self,
         file_path: Path,
@@ -156,15 +221,13 @@ class DateFixRule:
 
         # Auto-fix latin date formats (DD-MM-YYYY or DD/MM/YYYY)
         if isinstance(current_created, str):
-            import re
-            match = re.match(r"^(\d{2})[-/](\d{2})[-/](\d{4})(.*)$", current_created.strip())
+            match = _LATIN_DATE.match(current_created.strip())
             if match:
                 dd, mm, yyyy, rest = match.groups()
                 if 1 <= int(dd) <= 31 and 1 <= int(mm) <= 12:
                     try:
                         rest_str = rest.strip()
                         if not rest_str:
-                            from datetime import date
                             parsed_dt = datetime.strptime(f"{yyyy}-{mm}-{dd}", "%Y-%m-%d").date()
                             current_created = parsed_dt
                             updated["created"] = parsed_dt
@@ -179,14 +242,11 @@ class DateFixRule:
         # If true_created is None, the stem did not have a timestamp.
         # Check if the current_created needs to be coerced into a full datetime
         # with padded zeros if it is currently just a date without a time.
-        from datetime import date
         if current_created and isinstance(current_created, date) and not isinstance(current_created, datetime):
-            now_utc = datetime.now(UTC)
-            
             # Form full datetime with 0 time padded
             padded_dt = datetime.combine(current_created, datetime.min.time())
             
-            if _strip_tz(padded_dt) > _strip_tz(now_utc):
+            if padded_dt > self.date_resolver.now:
                 updated["created"] = None
                 return True
 
@@ -194,8 +254,7 @@ class DateFixRule:
             return True
 
         if current_created and isinstance(current_created, datetime):
-            now_utc = datetime.now(UTC)
-            if _strip_tz(current_created) > _strip_tz(now_utc):
+            if strip_tz(current_created) > self.date_resolver.now:
                 updated["created"] = None
                 return True
         elif current_created is None and "created" not in original:
@@ -217,7 +276,7 @@ class DateFixRule:
             and u_val
             and isinstance(c_val, datetime)
             and isinstance(u_val, datetime)
-            and _strip_tz(u_val) < _strip_tz(c_val)
+            and strip_tz(u_val) < strip_tz(c_val)
         ):
             updated["updated"] = c_val
             has_changes = True
@@ -228,6 +287,65 @@ class DateFixRule:
 class EnumFixRule:
     """Fixes enum values (type, status, area, aliases, tags, task/project)."""
 
+    handles = frozenset({"type", "status", "area", "aliases", "tags", "priority"})
+
+    def __init__(self, enum_index: NormalizationIndex | None = None) -> None:
+        """Initialise with a normalization index (built from enums if omitted)."""
+        self.enum_index = enum_index or NormalizationIndex.build()
+
+    def issues(
+        self,
+        file_path: Path,  # noqa: ARG002 - FixRuleProtocol signature
+        frontmatter: dict[str, Any],
+    ) -> list[str]:
+        """Flag non-canonical enums, scalar aliases/tags and task defaults."""
+        codes: list[str] = []
+        note_type = self._canonical_type(frontmatter, codes)
+        self._value_issues(frontmatter, codes)
+        if note_type in ("task", "project"):
+            if not frontmatter.get("status"):
+                codes.append("status")
+            if "priority" not in frontmatter:
+                codes.append("priority")
+        return codes
+
+    def _canonical_type(
+        self, frontmatter: dict[str, Any], codes: list[str]
+    ) -> str | None:
+        """Return the type ``_fix_type`` would settle on, flagging renames."""
+        raw = frontmatter.get("type")
+        if not raw or not isinstance(raw, str):
+            codes.append("type")
+            return None
+        val: str | None = self.enum_index.lookup("type", raw)
+        if val is not None and val != raw:
+            codes.append("type")
+            return val
+        return raw
+
+    def _value_issues(self, frontmatter: dict[str, Any], codes: list[str]) -> None:
+        """Flag what ``_fix_status``, ``_fix_area`` and ``_fix_aliases_tags`` fix."""
+        status = frontmatter.get("status")
+        if isinstance(status, list) or (
+            isinstance(status, str) and status not in self.enum_index["status"]
+        ):
+            codes.append("status")
+
+        area = frontmatter.get("area")
+        if (
+            isinstance(area, str)
+            and area not in self.enum_index["area"]
+            and self.enum_index.lookup("area", area) is not None
+        ):
+            codes.append("area")
+
+        if "aliases" in frontmatter and (
+            frontmatter["aliases"] is None or isinstance(frontmatter["aliases"], str)
+        ):
+            codes.append("aliases")
+        if frontmatter.get("tags") is None:
+            codes.append("tags")
+
     def apply(
         self,
         file_path: Path,
@@ -252,15 +370,10 @@ class EnumFixRule:
             )
         return has_changes
 
-    @staticmethod
-    def _fix_type(updated: dict[str, Any]) -> bool:
-        known = set(NoteModelRegistry.get_all().keys()) | {"note"}
-
+    def _fix_type(self, updated: dict[str, Any]) -> bool:
         if "type" in updated and isinstance(updated["type"], str):
-            val = updated["type"].strip().lower()
-            if val.endswith(".md"):
-                val = val[:-3]
-            if val in known and val != updated["type"]:
+            val = self.enum_index.lookup("type", updated["type"])
+            if val is not None and val != updated["type"]:
                 updated["type"] = val
                 return True
 
@@ -270,8 +383,7 @@ class EnumFixRule:
 
         return False
 
-    @staticmethod
-    def _fix_status(updated: dict[str, Any]) -> bool:
+    def _fix_status(self, updated: dict[str, Any]) -> bool:
         if "status" not in updated:
             return False
 
@@ -287,7 +399,7 @@ class EnumFixRule:
             changed = True
 
         if isinstance(current, str):
-            canonical = _match_status_enum(current)
+            canonical = self.enum_index.lookup("status", current)
             if canonical is None:
                 del updated["status"]
                 return True
@@ -297,21 +409,15 @@ class EnumFixRule:
 
         return changed
 
-    @staticmethod
-    def _fix_area(updated: dict[str, Any]) -> bool:
-        if "area" not in updated:
-            return False
-        if not isinstance(updated["area"], str):
+    def _fix_area(self, updated: dict[str, Any]) -> bool:
+        current = updated.get("area")
+        if not isinstance(current, str):
             return False
 
-        current = updated["area"]
-        norm = _normalize_key(current)
-        for member in NoteArea:
-            if _normalize_key(member.value) == norm:
-                if current != member.value:
-                    updated["area"] = member.value
-                    return True
-                break
+        canonical = self.enum_index.lookup("area", current)
+        if canonical is not None and current != canonical:
+            updated["area"] = canonical
+            return True
         return False
 
     @staticmethod
@@ -354,6 +460,26 @@ class EnumFixRule:
 class DefaultsFixRule:
     """Fills missing fields with safe Pydantic defaults."""
 
+    handles = frozenset({"type", "status", "version", "tags", "up"})
+
+    # Fields filled from the model's defaults when missing
+    SAFE_FIELDS = ("status", "version", "tags", "up")
+
+    def issues(
+        self,
+        file_path: Path,  # noqa: ARG002 - FixRuleProtocol signature
+        frontmatter: dict[str, Any],
+    ) -> list[str]:
+        """Flag safe fields the note's model defines but the note lacks."""
+        model_cls = _model_for(frontmatter)
+        if not model_cls:
+            return []
+        return [
+            name
+            for name in self.SAFE_FIELDS
+            if name not in frontmatter and name in model_cls.model_fields
+        ]
+
     def apply(
         self,
         file_path: Path,
@@ -361,21 +487,16 @@ class DefaultsFixRule:
         updated: dict[str, Any],
     ) -> bool:
         has_changes = False
-        safe_fields = {"status", "version", "tags", "up"}
 
         logger.debug(
-            f"[Doctor Debug] Fixer 'DefaultsFixRule' start | safe_fields={safe_fields}"
+            f"[Doctor Debug] Fixer 'DefaultsFixRule' start | safe_fields={self.SAFE_FIELDS}"
         )
 
-        note_type = updated.get("type")
-        if not note_type or not isinstance(note_type, str):
-            return False
-
-        model_cls = NoteModelRegistry.get_model(note_type)
+        model_cls = _model_for(updated)
         if not model_cls:
             return False
 
-        for name in safe_fields:
+        for name in self.SAFE_FIELDS:
             if name in updated:
                 continue
             val = self._resolve_field_default(model_cls, name)
@@ -406,6 +527,33 @@ class DefaultsFixRule:
 class ExtraneousFieldsFixRule:
     """Removes fields not supported by the note's Pydantic model if it forbids extras."""
 
+    handles = frozenset({"type", "extraneous"})
+
+    def __init__(self) -> None:
+        """Initialise the per-model cache of accepted keys."""
+        self._known_keys: dict[type, frozenset[str] | None] = {}
+
+    def issues(
+        self,
+        file_path: Path,  # noqa: ARG002 - FixRuleProtocol signature
+        frontmatter: dict[str, Any],
+    ) -> list[str]:
+        """Flag keys a model that forbids extras would not accept."""
+        model_cls = _model_for(frontmatter)
+        if not model_cls:
+            return []
+        if model_cls not in self._known_keys:
+            known: frozenset[str] | None = None
+            if getattr(model_cls, "model_config", {}).get("extra") == "forbid":
+                fields = model_cls.model_fields
+                aliases = {info.alias for info in fields.values() if info.alias}
+                known = frozenset(fields) | aliases
+            self._known_keys[model_cls] = known
+        known = self._known_keys[model_cls]
+        if known is not None and not known.issuperset(frontmatter):
+            return ["extraneous"]
+        return []
+
     def apply(
         self,
         file_path: Path,
@@ -414,11 +562,7 @@ class ExtraneousFieldsFixRule:
     ) -> bool:
         logger.debug("[Doctor Debug] Fixer 'ExtraneousFieldsFixRule' start")
 
-        note_type = updated.get("type")
-        if not note_type or not isinstance(note_type, str):
-            return False
-
-        model_cls = NoteModelRegistry.get_model(note_type)
+        model_cls = _model_for(updated)
         if not model_cls:
             return False
 
@@ -450,6 +594,19 @@ class ExtraneousFieldsFixRule:
 class VersionFixRule:
     """Normalizes the version field to the target SCHEMA_VERSION string."""
 
+    handles = frozenset({"version"})
+
+    def issues(
+        self,
+        file_path: Path,  # noqa: ARG002 - FixRuleProtocol signature
+        frontmatter: dict[str, Any],
+    ) -> list[str]:
+        """Flag a version that is not the target version string."""
+        version = frontmatter.get("version", _SENTINEL)
+        if version is not _SENTINEL and version != str(SCHEMA_VERSION):
+            return ["version"]
+        return []
+
     def apply(
         self,
         file_path: Path,
@@ -471,6 +628,21 @@ class VersionFixRule:
         return False
 
 
+def default_fix_rules(
+    enum_index: NormalizationIndex | None = None,
+    date_resolver: DateResolver | None = None,
+) -> list[FixRuleProtocol]:
+    """Return the standard rule chain, in application order."""
+    return [
+        DateFixRule(date_resolver or DateResolver()),
+        EnumFixRule(enum_index),
+        DefaultsFixRule(),
+        ExtraneousFieldsFixRule(),
+        VersionFixRule(),
+        IntegrityAliasesFixRule(),
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Fixer
 # ---------------------------------------------------------------------------
@@ -481,8 +653,21 @@ class NoteFixer:
 
     def __init__(self, rules: list[FixRuleProtocol]) -> None:
         """Initialise the fixer with a list of rules."""
+        self._rules: list[FixRuleProtocol] = []
+        self._dispatch: dict[str, tuple[int, ...]] = {}
+        self._always: tuple[int, ...] = ()
         self.rules = rules
 
+    @property
+    def rules(self) -> list[FixRuleProtocol]:
+        """The rule chain, in application order."""
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: list[FixRuleProtocol]) -> None:
+        self._rules = list(rules)
+        self._build_dispatch()
+
     # -- public API ---------------------------------------------------------
 
     def fix(
@@ -490,9 +675,18 @@ class NoteFixer:
         file_path: Path,
         current: dict[str, Any],
         body: str,
+        result: "ValidationResult | None" = None,
     ) -> tuple[bool, dict[str, Any], str]:
         """Orchestrate all fixes for a note file in memory.
 
+        Args:
+            file_path: Path to the note file.
+            current: Frontmatter to fix in place.
+            body: Note body, returned unchanged.
+            result: Validation of *current*. When given, only the rules
+                ``rules_for`` selects run, and a valid note in canonical
+                form is returned untouched. Without it every rule runs.
+
         Returns:
             (has_changes, fixed_frontmatter, body)
         """
@@ -500,9 +694,50 @@ class NoteFixer:
         total_changes = False
         original = current.copy()
 
-        for rule in self.rules:
-            if rule.apply(file_path, original, current):
-                total_changes = True
+        rules = self.rules if result is None else self.rules_for(result)
+        with stage("fix"):
+            for rule in rules:
+                with rule_span(rule):
+                    changed = rule.apply(file_path, original, current)
+                if changed:
+                    total_changes = True
 
         logger.debug(f"[DEBUG TRACE] fixer.fix End | total_changes={total_changes}")
         return total_changes, current, body
+
+    def rules_for(self, result: "ValidationResult") -> list[FixRuleProtocol]:
+        """Return the rules applicable to *result*, in chain order.
+
+        Rules handling a missing or invalid field are selected, as are
+        the rules handling any code a rule's ``issues`` reports for a
+        note not in canonical form; a valid, canonical note gets none.
+        """
+        selected = set(self._always)
+        self._select(result.missing_fields, selected)
+        self._select(result.invalid_fields, selected)
+        for idx, rule in enumerate(self._rules):
+            if idx not in self._always:
+                codes = rule.issues(result.file_path, result.frontmatter)
+                self._select(codes, selected)
+        return [self._rules[i] for i in sorted(selected)]
+
+    # -- private helpers ----------------------------------------------------
+
+    def _build_dispatch(self) -> None:
+        """Index rule positions by the issue codes they handle."""
+        dispatch: dict[str, list[int]] = {}
+        always: list[int] = []
+        for idx, rule in enumerate(self._rules):
+            handles = rule.handles
+            if handles is None:
+                always.append(idx)
+                continue
+            for code in handles:
+                dispatch.setdefault(code, []).append(idx)
+        self._dispatch = {code: tuple(ids) for code, ids in dispatch.items()}
+        self._always = tuple(always)
+
+    def _select(self, codes: Iterable[str], selected: set[int]) -> None:
+        """Add the positions of the rules handling *codes* to *selected*."""
+        for code in codes:
+            selected.update(self._dispatch.get(code, ()))
@@ -0,0 +1,202 @@
+"""Per-rule timing and hit-count profiling for doctor rule chains."""
+
+import json
+import random
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any
+
+from dx_vault_atlas.services.note_doctor.core.fixer import FixRuleProtocol
+from dx_vault_atlas.services.note_doctor.validator import ValidationRule
+
+_NS_PER_MS = 1_000_000
+
+# Latency samples kept per rule; percentiles come from this uniform sample
+RESERVOIR_SIZE = 4096
+
+
+@dataclass
+class RuleStats:
+    """Accumulated measurements for a single rule.
+
+    Attributes:
+        name: Rule class name.
+        kind: ``"validate"`` for validation rules, ``"fix"`` for fix rules.
+        calls: Number of invocations.
+        hits: Invocations that raised an issue or made a change.
+        total_ns: Cumulative wall time in nanoseconds.
+
+    Latencies for the percentiles are kept in a fixed-size reservoir
+    (uniform sample of every call), so memory does not grow with the
+    number of notes.
+    """
+
+    name: str
+    kind: str
+    calls: int = 0
+    hits: int = 0
+    total_ns: int = 0
+    _samples: array[int] = field(default_factory=lambda: array("q"), repr=False)
+    _rng: random.Random = field(default_factory=lambda: random.Random(0), repr=False)
+
+    def record(self, elapsed_ns: int, hit: bool) -> None:
+        """Record a single invocation."""
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        if hit:
+            self.hits += 1
+        if len(self._samples) < RESERVOIR_SIZE:
+            self._samples.append(elapsed_ns)
+            return
+        slot = self._rng.randrange(self.calls)
+        if slot < RESERVOIR_SIZE:
+            self._samples[slot] = elapsed_ns
+
+    @property
+    def total_ms(self) -> float:
+        """Cumulative time in milliseconds."""
+        return self.total_ns / _NS_PER_MS
+
+    def percentile_ms(self, q: float) -> float:
+        """Return the *q* percentile latency (0-100) in milliseconds."""
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        idx = min(len(ordered) - 1, round(q / 100 * (len(ordered) - 1)))
+        return ordered[idx] / _NS_PER_MS
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize stats to a JSON-friendly dictionary."""
+        return {
+            "rule": self.name,
+            "kind": self.kind,
+            "calls": self.calls,
+            "hits": self.hits,
+            "total_ms": round(self.total_ms, 3),
+            "p50_ms": round(self.percentile_ms(50), 4),
+            "p99_ms": round(self.percentile_ms(99), 4),
+        }
+
+
+class ProfiledValidationRule:
+    """ValidationRule wrapper that records timing and raised issues."""
+
+    def __init__(self, rule: ValidationRule, stats: RuleStats) -> None:
+        """Wrap *rule*, recording into *stats*."""
+        self.rule = rule
+        self.stats = stats
+
+    def check(
+        self,
+        file_path: Path,
+        frontmatter: dict[str, Any],
+        invalid: list[str],
+        warnings: list[str],
+    ) -> None:
+        """Delegate to the wrapped rule and record the measurement."""
+        before = len(invalid) + len(warnings)
+        start = perf_counter_ns()
+        self.rule.check(file_path, frontmatter, invalid, warnings)
+        elapsed = perf_counter_ns() - start
+        self.stats.record(elapsed, len(invalid) + len(warnings) > before)
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Expose attributes of the wrapped rule."""
+        return getattr(self.rule, name)
+
+
+class ProfiledFixRule:
+    """FixRule wrapper that records timing and applied changes."""
+
+    def __init__(self, rule: FixRuleProtocol, stats: RuleStats) -> None:
+        """Wrap *rule*, recording into *stats*."""
+        self.rule = rule
+        self.stats = stats
+
+    @property
+    def handles(self) -> frozenset[str] | None:
+        """Issue codes of the wrapped rule."""
+        return self.rule.handles
+
+    def issues(self, file_path: Path, frontmatter: dict[str, Any]) -> list[str]:
+        """Delegate detection to the wrapped rule (not recorded)."""
+        return self.rule.issues(file_path, frontmatter)
+
+    def apply(
+        self,
+        file_path: Path,
+        original: dict[str, Any],
+        updated: dict[str, Any],
+    ) -> bool:
+        """Delegate to the wrapped rule and record the measurement."""
+        start = perf_counter_ns()
+        changed = self.rule.apply(file_path, original, updated)
+        elapsed = perf_counter_ns() - start
+        self.stats.record(elapsed, changed)
+        return changed
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Expose attributes of the wrapped rule."""
+        return getattr(self.rule, name)
+
+
+class RuleProfiler:
+    """Collects per-rule statistics for validation and fix rule chains.
+
+    Rules are keyed by ``(kind, class name)`` so the same rule instance
+    wrapped in several places (e.g. the fixer chain and a direct call in
+    the app) accumulates into one row.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty profiler."""
+        self._stats: dict[tuple[str, str], RuleStats] = {}
+
+    def stats_for(self, kind: str, name: str) -> RuleStats:
+        """Return (creating if needed) the stats bucket for a rule."""
+        key = (kind, name)
+        if key not in self._stats:
+            self._stats[key] = RuleStats(name=name, kind=kind)
+        return self._stats[key]
+
+    def wrap_validation_rule(self, rule: ValidationRule) -> ProfiledValidationRule:
+        """Wrap a single validation rule."""
+        if isinstance(rule, ProfiledValidationRule):
+            return rule
+        stats = self.stats_for("validate", type(rule).__name__)
+        return ProfiledValidationRule(rule, stats)
+
+    def wrap_fix_rule(self, rule: FixRuleProtocol) -> ProfiledFixRule:
+        """Wrap a single fix rule."""
+        if isinstance(rule, ProfiledFixRule):
+            return rule
+        stats = self.stats_for("fix", type(rule).__name__)
+        return ProfiledFixRule(rule, stats)
+
+    def wrap_validation_rules(
+        self, rules: list[ValidationRule]
+    ) -> list[ValidationRule]:
+        """Wrap every rule of a validator chain."""
+        return [self.wrap_validation_rule(rule) for rule in rules]
+
+    def wrap_fix_rules(self, rules: list[FixRuleProtocol]) -> list[FixRuleProtocol]:
+        """Wrap every rule of a fixer chain."""
+        return [self.wrap_fix_rule(rule) for rule in rules]
+
+    def sorted_stats(self) -> list[RuleStats]:
+        """Return rule stats ordered by cumulative time, slowest first."""
+        return sorted(self._stats.values(), key=lambda s: s.total_ns, reverse=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize all stats to a JSON-friendly dictionary."""
+        return {"rules": [s.to_dict() for s in self.sorted_stats()]}
+
+    def export_json(self, path: Path) -> None:
+        """Write the profile to *path* as JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(self.to_dict(), indent=2, ensure_ascii=False),
+            encoding="utf-8",
+        )
@@ -0,0 +1,101 @@
+"""Per-note outcomes and the streaming NDJSON report for batch doctor runs."""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any
+
+from dx_vault_atlas.services.note_doctor.validator import ValidationResult
+
+# Outcome statuses, in the order they are summarised
+STATUSES = ("valid", "warning", "version", "fixed", "invalid", "error")
+
+
+@dataclass
+class NoteOutcome:
+    """Classification of a single note after validation and auto-fix.
+
+    Attributes:
+        path: Note path (after any rename).
+        status: One of ``STATUSES``.
+        result: Latest validation result for the note.
+        applied_fixes: Frontmatter keys (and ``"rename"``) changed on disk.
+        timings_ms: Wall time per stage in milliseconds.
+    """
+
+    path: Path
+    status: str
+    result: ValidationResult
+    applied_fixes: list[str] = field(default_factory=list)
+    timings_ms: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def needs_attention(self) -> bool:
+        """True if the note still requires manual fixes."""
+        return self.status in ("invalid", "error")
+
+    def to_record(self) -> dict[str, Any]:
+        """Serialize to a JSON-friendly report line."""
+        return {
+            "path": str(self.path),
+            "outcome": self.status,
+            "missing": self.result.missing_fields,
+            "invalid": self.result.invalid_fields,
+            "warnings": self.result.warnings,
+            "error": self.result.error,
+            "applied_fixes": self.applied_fixes,
+            "timings_ms": {k: round(v, 3) for k, v in self.timings_ms.items()},
+        }
+
+
+def changed_keys(before: dict[str, Any], after: dict[str, Any]) -> list[str]:
+    """Return the sorted keys added, removed or modified between two dicts."""
+    keys = before.keys() | after.keys()
+    return sorted(
+        k
+        for k in keys
+        if k not in before or k not in after or before[k] != after[k]
+    )
+
+
+class NdjsonReport:
+    """Writes one JSON object per line, flushing after every record.
+
+    Nothing is buffered beyond the current line, so memory use does not
+    grow with the number of notes, and an interrupted run still leaves a
+    valid report of every note processed so far.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialise the report targeting *path*."""
+        self.path = path
+        self.count = 0
+        self._stream: IO[str] | None = None
+
+    def __enter__(self) -> "NdjsonReport":
+        """Open (truncating) the report file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._stream = self.path.open("w", encoding="utf-8")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the report file."""
+        if self._stream is not None:
+            self._stream.close()
+        self._stream = None
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Append *record* as a single JSON line."""
+        if self._stream is None:
+            msg = "NdjsonReport must be used as a context manager"
+            raise RuntimeError(msg)
+        self._stream.write(json.dumps(record, ensure_ascii=False, default=str))
+        self._stream.write("\n")
+        self._stream.flush()
+        self.count += 1
@@ -0,0 +1,267 @@
+"""High-throughput engine behind ``dxva doctor --fix-date``.
+
+``DateFixRule`` only looks at the filename stem and the ``created`` /
+``updated`` values, so most notes can be cleared without parsing them:
+
+1. the frontmatter head is read line by line up to its closing ``---``
+   (the body is never read) and only the ``created:`` / ``updated:``
+   lines are decoded;
+2. the rule runs on those two values, using the memoized stem timestamp;
+3. only notes the rule would change are read and parsed in full, fixed
+   and written, in one batch per chunk.
+
+Heads that cannot be decoded this way (no frontmatter, block values,
+duplicate or quoted keys) take the full path, so results match the
+serial rule exactly. Chunks fan out across worker processes, unless the
+run is profiled or traced: then the app's own (wrapped) rule runs
+in-process so its measurements and spans are kept.
+"""
+
+import os
+import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from itertools import repeat
+from pathlib import Path
+from typing import Any, TextIO
+
+import yaml
+
+from dx_vault_atlas.services.note_doctor.core.fixer import (
+    DateFixRule,
+    FixRuleProtocol,
+)
+from dx_vault_atlas.shared.core.io import NoteIOService, iter_chunks
+from dx_vault_atlas.shared.logger import logger
+from dx_vault_atlas.shared.tracing import note_span, rule_span
+from dx_vault_atlas.shared.utils.date_resolver import DateResolver
+from dx_vault_atlas.shared.yaml_parser import YamlParserService
+
+# Notes handed to a worker at a time
+DATE_FIX_CHUNK_SIZE = 256
+
+# Below this many chunks, process start-up costs more than it saves
+_MIN_PARALLEL_CHUNKS = 4
+
+# Give up on the head fast path past this many frontmatter lines
+_MAX_HEAD_LINES = 200
+
+_DATE_KEYS = ("created", "updated")
+_DATE_LINE_RE = re.compile(r"^(created|updated):[ \t]*(.*?)[ \t]*$")
+_ANCHOR_RE = re.compile(r"^&(\S+)[ \t]+(.*)$")
+_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+_DATETIME_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})[ T](\d{2}):(\d{2}):(\d{2})$")
+_FULL = object()  # sentinel: head not decodable, use the full path
+
+
+def _decode_scalar(raw: str) -> Any:  # noqa: ANN401
+    """Decode a plain YAML scalar, skipping the YAML machinery for dates.
+
+    Raises:
+        ValueError: For out-of-range dates (as PyYAML does).
+        yaml.YAMLError: For values PyYAML cannot parse.
+    """
+    if match := _DATETIME_RE.match(raw):
+        year, month, day, hour, minute, second = map(int, match.groups())
+        return datetime(year, month, day, hour, minute, second)
+    if match := _DATE_RE.match(raw):
+        return date(*map(int, match.groups()))
+    if raw in ("null", "~"):
+        return None
+    return yaml.safe_load(raw)
+
+
+def read_date_head(path: Path) -> dict[str, Any] | object:
+    """Return ``created`` / ``updated`` from the note's frontmatter head.
+
+    Only the frontmatter lines are read. Keys that are absent are absent
+    from the result. Returns the ``_FULL`` sentinel when the head is not
+    simple enough to decode exactly without a full YAML parse.
+    """
+    try:
+        with path.open(encoding="utf-8") as f:
+            return _scan_head(f)
+    except (OSError, UnicodeDecodeError, ValueError, yaml.YAMLError):
+        return _FULL
+
+
+def _scan_head(f: TextIO) -> dict[str, Any] | object:
+    """Decode the date lines of the frontmatter open in *f*."""
+    if f.readline().strip() != "---":
+        return _FULL
+    found: dict[str, Any] = {}
+    anchors: dict[str, Any] = {}
+    for _ in range(_MAX_HEAD_LINES):
+        line = f.readline()
+        if not line:
+            return _FULL  # unterminated frontmatter
+        if line.startswith("---"):
+            return found
+        if any(key in line for key in _DATE_KEYS) and not _read_date_line(
+            line, found, anchors
+        ):
+            return _FULL
+    return _FULL
+
+
+def _read_date_line(line: str, found: dict[str, Any], anchors: dict[str, Any]) -> bool:
+    """Decode a line mentioning a date key into *found*.
+
+    Returns:
+        False if the head needs a full YAML parse instead.
+    """
+    match = _DATE_LINE_RE.match(line)
+    if match is None:
+        # Nested value, list item or comment; anything else is not simple
+        return line[:1] in (" ", "\t", "-", "#")
+    key, raw = match.groups()
+    if key in found or not raw or raw.startswith(("|", ">")):
+        return False
+    value = _decode_value(raw, anchors)
+    if value is _FULL:
+        return False
+    found[key] = value
+    return True
+
+
+def _decode_value(raw: str, anchors: dict[str, Any]) -> Any:  # noqa: ANN401
+    """Decode *raw*, resolving the anchors the serializer puts on equal dates.
+
+    ``created: &id001 ...`` defines an anchor, ``updated: *id001`` reuses
+    it. Returns ``_FULL`` for an unknown alias or an unusual anchor.
+    """
+    if raw.startswith("*"):
+        return anchors.get(raw[1:], _FULL)
+    anchor = _ANCHOR_RE.match(raw)
+    if anchor is not None:
+        name, raw = anchor.groups()
+        anchors[name] = _decode_scalar(raw)
+        return anchors[name]
+    if raw.startswith("&"):
+        return _FULL
+    return _decode_scalar(raw)
+
+
+class DateFixer:
+    """Applies ``DateFixRule`` to notes, reading as little as possible."""
+
+    def __init__(
+        self,
+        now: datetime | None = None,
+        rule: FixRuleProtocol | None = None,
+    ) -> None:
+        """Initialise the fixer.
+
+        Args:
+            now: Run-scoped "now" used for future-date checks.
+            rule: Date rule to apply instead of a fresh ``DateFixRule``
+                (e.g. the app's profiled one).
+        """
+        self.date_resolver = DateResolver(now)
+        self.rule = rule if rule is not None else DateFixRule(self.date_resolver)
+        self.io = NoteIOService(YamlParserService())
+
+    def needs_fix(self, path: Path) -> bool:
+        """True if the rule may change *path* (exact when the head decodes)."""
+        return self._fix_head(path) is not None
+
+    def _fix_head(self, path: Path) -> dict[str, Any] | object | None:
+        """Apply the rule to the decoded date head of *path*.
+
+        Returns:
+            The fixed date keys, None if nothing changes, or ``_FULL``
+            when the head does not decode and the full note is needed.
+        """
+        head = read_date_head(path)
+        if not isinstance(head, dict):
+            return _FULL
+        fixed = dict(head)
+        with rule_span(self.rule):
+            changed = self.rule.apply(path, head, fixed)
+        return fixed if changed else None
+
+    def fix_chunk(self, paths: Iterable[Path]) -> list[Path]:
+        """Fix every note in *paths* that needs it; return the fixed paths.
+
+        All candidates are read and fixed first, then written together.
+        """
+        pending: list[tuple[Path, dict[str, Any], str]] = []
+        for path in paths:
+            with note_span("doctor.fix_date", path):
+                fixed = self._fix(path)
+            if fixed is not None:
+                pending.append(fixed)
+
+        return [
+            path
+            for path, frontmatter, body in pending
+            if self.io.write_note(path, frontmatter, body)
+        ]
+
+    def _fix(self, path: Path) -> tuple[Path, dict[str, Any], str] | None:
+        """Return ``(path, fixed_frontmatter, body)`` if *path* changes.
+
+        The rule runs once per note: on the date head when it decodes
+        (the rule only reads and writes the date keys), on the full
+        frontmatter otherwise.
+        """
+        head_fix = self._fix_head(path)
+        if head_fix is None:
+            return None
+        parsed = self.io.read_note(path)
+        if not parsed:
+            return None
+        new_fm = parsed.frontmatter.copy()
+        if isinstance(head_fix, dict):
+            new_fm.update(head_fix)
+            return path, new_fm, parsed.body
+        with rule_span(self.rule):
+            changed = self.rule.apply(path, parsed.frontmatter, new_fm)
+        return (path, new_fm, parsed.body) if changed else None
+
+
+def _fix_chunk(paths: list[Path], now: datetime) -> list[Path]:
+    """Worker entry point: fix one chunk with a process-local fixer."""
+    return DateFixer(now).fix_chunk(paths)
+
+
+class DateFixEngine:
+    """Fans date fixing out across worker processes, chunk by chunk."""
+
+    def __init__(
+        self,
+        now: datetime | None = None,
+        workers: int | None = None,
+        chunk_size: int = DATE_FIX_CHUNK_SIZE,
+        rule: FixRuleProtocol | None = None,
+    ) -> None:
+        """Initialise the engine.
+
+        Args:
+            now: Run-scoped "now" shared by every worker.
+            workers: Worker processes; defaults to the CPU count. With 1,
+                or for small vaults, everything runs in-process.
+            chunk_size: Notes per worker task.
+            rule: Date rule to run in-process instead of per-worker copies,
+                e.g. a profiled wrapper whose timings must be kept.
+        """
+        self.now = now or DateResolver().now
+        self.workers = 1 if rule is not None else workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.rule = rule
+
+    def run(self, paths: Iterable[Path]) -> Iterator[Path]:
+        """Fix dates in *paths*, yielding each fixed note as chunks finish."""
+        chunks = list(iter_chunks(paths, self.chunk_size))
+        if self.workers <= 1 or len(chunks) < _MIN_PARALLEL_CHUNKS:
+            fixer = DateFixer(self.now, rule=self.rule)
+            for chunk in chunks:
+                yield from fixer.fix_chunk(chunk)
+            return
+
+        workers = min(self.workers, len(chunks))
+        logger.debug(f"Date fix: {len(chunks)} chunks on {workers} workers")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for fixed in pool.map(_fix_chunk, chunks, repeat(self.now)):
+                yield from fixed
@@ -0,0 +1,94 @@
+"""Background prefetch of upcoming notes during the interactive doctor phase.
+
+While the user is busy in the fix wizard for one note, a single worker
+thread reads ahead: it fingerprints the next few notes and reads and
+parses those queued for a rename, so the main thread can validate them
+under their new name without going back to disk. The worker only does
+I/O; renaming, validation and the wizard steps stay on the main thread,
+which owns the filename index, the date resolver and the rule caches.
+
+Prefetched data is only used if the note's file fingerprint is unchanged
+when it is consumed; otherwise the app falls back to the regular path.
+"""
+
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from dx_vault_atlas.services.note_doctor.validator import ValidationResult
+from dx_vault_atlas.shared.core.io import Fingerprint, file_fingerprint
+from dx_vault_atlas.shared.logger import logger
+
+# Notes prepared ahead of the one on screen
+DEFAULT_PREFETCH_DEPTH = 2
+
+
+@dataclass
+class PrefetchedNote:
+    """Raw data read ahead of time for one invalid note.
+
+    Attributes:
+        path: Note path at prefetch time.
+        fingerprint: File fingerprint at prefetch time.
+        parsed: ``NoteDoctorValidator.read_note`` output for a note
+            queued for a rename, None otherwise.
+    """
+
+    path: Path
+    fingerprint: Fingerprint | None
+    parsed: ValidationResult | tuple[dict[str, Any], str] | None = None
+
+    def is_fresh(self) -> bool:
+        """True if the file has not changed since it was prefetched."""
+        return (
+            self.fingerprint is not None
+            and file_fingerprint(self.path) == self.fingerprint
+        )
+
+
+class Prefetcher[T, R]:
+    """Runs *load* on upcoming items in a background thread.
+
+    ``iterate`` yields each item together with its loaded value while the
+    worker is already loading up to ``depth`` items ahead. A failing load
+    yields None for that item so the caller can take the cold path.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[T], R],
+        depth: int = DEFAULT_PREFETCH_DEPTH,
+    ) -> None:
+        """Initialise with the load function and look-ahead depth."""
+        self.load = load
+        self.depth = max(0, depth)
+
+    def iterate(
+        self, items: Iterable[T]
+    ) -> Generator[tuple[T, R | None], None, None]:
+        """Yield ``(item, loaded)`` pairs in input order."""
+        source = iter(items)
+        pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="doctor-prefetch"
+        )
+        pending: deque[tuple[T, Future[R]]] = deque()
+        try:
+            for item in islice(source, self.depth + 1):
+                pending.append((item, pool.submit(self.load, item)))
+
+            while pending:
+                item, future = pending.popleft()
+                for nxt in islice(source, 1):
+                    pending.append((nxt, pool.submit(self.load, nxt)))
+                try:
+                    value: R | None = future.result()
+                except Exception as e:  # noqa: BLE001
+                    logger.debug(f"Prefetch failed, using cold path: {e}")
+                    value = None
+                yield item, value
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,189 @@
+"""Interactive doctor session: every invalid note in one running TUI.
+
+``DoctorSession`` is the driver behind ``WizardSessionApp``. It walks the
+(prefetched) invalid notes, performs the automatic rename, builds each
+note's wizard, applies the answers and decides whether to retry, skip or
+move on, while the app stays open between notes.
+
+Nothing here prints: status lines are queued in ``messages`` for the app
+to show as notifications and kept in ``log`` so the caller can echo them
+to the console once the app has exited. With a checkpoint, progress is
+recorded after every note so the session can be resumed later.
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from dx_vault_atlas.services.note_doctor.checkpoint import DoctorCheckpoint
+from dx_vault_atlas.services.note_doctor.prefetch import PrefetchedNote
+from dx_vault_atlas.services.note_doctor.validator import ValidationResult
+from dx_vault_atlas.shared.logger import logger
+
+if TYPE_CHECKING:
+    from dx_vault_atlas.services.note_doctor.app import DoctorApp
+    from dx_vault_atlas.services.note_doctor.tui import PreparedFixes
+    from dx_vault_atlas.shared.tui.wizard import WizardConfig
+
+
+@dataclass
+class _ActiveNote:
+    """State of the note currently on screen."""
+
+    file_path: Path
+    result: ValidationResult
+    frontmatter: dict[str, Any]
+    prepared: "PreparedFixes | None" = None
+    attempts: int = 0
+
+
+class DoctorSession:
+    """Feeds invalid notes to a long-lived wizard app, one after another."""
+
+    def __init__(
+        self,
+        app: "DoctorApp",
+        names: list[str],
+        notes: Iterator[tuple[ValidationResult, PrefetchedNote | None]],
+        max_attempts: int,
+        checkpoint: DoctorCheckpoint | None = None,
+    ) -> None:
+        """Initialise the session.
+
+        Args:
+            app: Doctor app providing rename, fix and validation helpers.
+            names: File names of the queued notes (for the sidebar).
+            notes: ``(result, prefetched)`` pairs for the same notes.
+            max_attempts: Wizard rounds per note before giving up.
+            checkpoint: Progress record advanced after every note.
+        """
+        self.app = app
+        self.total = len(names)
+        self.max_attempts = max_attempts
+        self.checkpoint = checkpoint
+        self.index = 0
+        self.messages: list[str] = []
+        self.log: list[str] = []
+        self._names = list(names)
+        self._notes = notes
+        self._current: _ActiveNote | None = None
+        self._applied: set[str] = set()
+        self._handled = 0
+
+    # -- WizardSessionDriver --------------------------------------------------
+
+    def next_config(self) -> "WizardConfig | None":
+        """Advance to the next note that needs the wizard."""
+        self._finish()
+        for result, prefetched in self._notes:
+            self.index += 1
+            config = self._open(result, prefetched)
+            if config is not None:
+                return config
+            self._finish()
+        return None
+
+    def submit(self, data: dict[str, Any]) -> "WizardConfig | None":
+        """Apply the wizard answers; return a retry config or None."""
+        note = self._current
+        if note is None or note.prepared is None:
+            return None
+
+        fixes = self.app.tui.finalize(note.prepared, data)
+        if not fixes:
+            self._say(f"{note.file_path.name}: skipped or no fixes provided")
+            return None
+
+        result = self.app._apply_wizard_fixes(
+            note.file_path, note.frontmatter, fixes, note.result.body
+        )
+        self._applied.update(k for k in fixes if not k.startswith("__"))
+        if result.is_valid:
+            self._say(f"{note.file_path.name}: fixed, now valid")
+            return None
+
+        note.attempts += 1
+        if note.attempts >= self.max_attempts:
+            self._say(
+                f"{note.file_path.name}: still invalid after "
+                f"{self.max_attempts} attempts, skipping"
+            )
+            return None
+
+        self._say(f"{note.file_path.name}: still has issues, retrying")
+        note.result = result
+        note.frontmatter = dict(result.frontmatter)
+        return self._wizard_for(note)
+
+    def skip(self) -> None:
+        """Leave the current note as it is."""
+        if self._current is not None:
+            self._say(f"{self._current.file_path.name}: skipped")
+
+    def pending(self) -> list[str]:
+        """Names of the notes still queued, current note first."""
+        return self._names[max(self.index - 1, 0) :]
+
+    def drain_messages(self) -> list[str]:
+        """Return and clear the messages not yet shown."""
+        messages, self.messages = self.messages, []
+        return messages
+
+    # -- helpers --------------------------------------------------------------
+
+    def _open(
+        self, result: ValidationResult, prefetched: PrefetchedNote | None
+    ) -> "WizardConfig | None":
+        """Rename *result* if needed and build its first wizard."""
+        file_path = result.file_path
+        if result.is_valid:
+            self._say(f"{file_path.name}: already valid")
+            return None
+        if prefetched is not None and not prefetched.is_fresh():
+            logger.debug(f"Prefetch stale, discarding | {file_path.name}")
+            prefetched = None
+
+        if "integrity_filename" in result.invalid_fields:
+            rename_out = self.app._rename(
+                result,
+                parsed=prefetched.parsed if prefetched is not None else None,
+            )
+            if rename_out is not None:
+                file_path, result = rename_out
+                self._names[self.index - 1] = file_path.name
+                if self.checkpoint is not None:
+                    self.checkpoint.relocate(file_path)
+                self._say(f"Renamed → {file_path.name}")
+                if result.is_valid:
+                    self._say(f"{file_path.name}: now valid")
+                    return None
+
+        self._current = _ActiveNote(file_path, result, dict(result.frontmatter))
+        return self._wizard_for(self._current)
+
+    def _wizard_for(self, note: _ActiveNote) -> "WizardConfig | None":
+        """Build the wizard for the note's latest result, or apply directly."""
+        prepared = self.app.tui.prepare(note.result)
+        note.prepared = prepared
+
+        title = f"[{self.index}/{self.total}] Fixing Note: {note.file_path.name}"
+        config = self.app.tui.config_for(prepared, title=title)
+        if config is None:
+            # Nothing to ask, but there may still be automatic fills
+            return self.submit({})
+        return config
+
+    def _finish(self) -> None:
+        """Close the current note and record it in the checkpoint."""
+        self._current = None
+        if self._handled < self.index:
+            if self.checkpoint is not None:
+                self.checkpoint.advance(sorted(self._applied))
+            self._handled = self.index
+        self._applied = set()
+
+    def _say(self, message: str) -> None:
+        """Queue a status line for the app and the final log."""
+        self.messages.append(message)
+        self.log.append(message)
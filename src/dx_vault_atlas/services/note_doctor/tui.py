@@ -1,6 +1,7 @@
-from dataclasses import replace
-from typing import Any
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
 
+from dx_vault_atlas.services.note_doctor.validator import ValidationResult
 from dx_vault_atlas.shared.tui.common_steps import (
     AREA_STEP,
     PRIORITY_STEP,
@@ -8,11 +9,25 @@ from dx_vault_atlas.shared.tui.common_steps import (
     TEMPLATE_STEP,
     TITLE_STEP,
 )
-from dx_vault_atlas.services.note_doctor.validator import ValidationResult
-from dx_vault_atlas.shared.tui import (
-    WizardConfig,
-    run_wizard,
-)
+from dx_vault_atlas.shared.tui.wizard import WizardConfig
+
+if TYPE_CHECKING:
+    from dx_vault_atlas.shared.tui.session_app import WizardSessionDriver
+
+
+@dataclass
+class PreparedFixes:
+    """Wizard steps computed for one note, ready to be shown.
+
+    Attributes:
+        result: Validation result the steps were built for.
+        steps: Wizard steps to run.
+        auto_fill_status: Fill ``status`` for info notes without asking.
+    """
+
+    result: ValidationResult
+    steps: list[Any]
+    auto_fill_status: bool = False
 
 
 class DoctorTUI:
@@ -22,8 +37,24 @@ class DoctorTUI:
         """Initialize DoctorTUI with dependencies."""
         self.model_map = model_map
 
-    def gather_fixes(self, result: ValidationResult) -> dict[str, Any]:
-        """Run wizard to gather fixes for missing/invalid fields."""
+    def gather_fixes(
+        self,
+        result: ValidationResult,
+        prepared: "PreparedFixes | None" = None,
+    ) -> dict[str, Any]:
+        """Run wizard to gather fixes for missing/invalid fields.
+
+        Args:
+            result: Validation result of the note to fix.
+            prepared: Output of ``prepare(result)`` computed ahead of time;
+                built here when omitted.
+        """
+        if prepared is None:
+            prepared = self.prepare(result)
+        return self.run_prepared(prepared)
+
+    def prepare(self, result: ValidationResult) -> "PreparedFixes":
+        """Compute the wizard steps for *result* without touching the UI."""
         missing = set(result.missing_fields)
         invalid = set(result.invalid_fields)
         invalid.discard("dates")
@@ -43,18 +74,22 @@ class DoctorTUI:
             auto_fill_status = True
 
         steps = self._build_steps(missing, invalid, result)
+        return PreparedFixes(result, steps, auto_fill_status)
+
+    def run_prepared(self, prepared: "PreparedFixes") -> dict[str, Any]:
+        """Run the wizard for prepared steps and post-process the answers."""
+        steps = prepared.steps
+        auto_fill_status = prepared.auto_fill_status
 
         if not steps and not auto_fill_status:
             return {}
 
         fixes = {}
-        if steps:
-            config = WizardConfig(
-                title=f"Fixing Note: {result.file_path.name}",
-                steps=steps,
-                success_message="Fixes collected!",
-                auto_exit_delay=0.5,
-            )
+        config = self.config_for(prepared)
+        if config is not None:
+            # Textual loads only once a wizard is shown (not in batch mode)
+            from dx_vault_atlas.shared.tui.wizard_app import run_wizard
+
             fixes = run_wizard(config) or {}
 
             # If wizard was cancelled (fixes is empty dict usually implies success with no data,
@@ -77,6 +112,30 @@ class DoctorTUI:
             # The steps (choose_enum) raise `UserQuitError`. `run_wizard` catches it?
             # Let's assume standard behavior for now and just inject the fix.
 
+        return self.finalize(prepared, fixes)
+
+    def config_for(
+        self, prepared: "PreparedFixes", title: str | None = None
+    ) -> WizardConfig | None:
+        """Return the wizard config for prepared steps, or None if empty."""
+        if not prepared.steps:
+            return None
+        return WizardConfig(
+            title=title or f"Fixing Note: {prepared.result.file_path.name}",
+            steps=prepared.steps,
+            success_message="Fixes collected!",
+            auto_exit_delay=0.5,
+        )
+
+    def finalize(
+        self, prepared: "PreparedFixes", answers: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Post-process wizard answers into the fixes to apply."""
+        result = prepared.result
+        auto_fill_status = prepared.auto_fill_status
+        current_type = result.frontmatter.get("type")
+        fixes = dict(answers)
+
         # Check if we should auto-fill status post-wizard
         # (Conditions: Pre-flagged OR template selected is INFO)
         from dx_vault_atlas.shared.models.enums import NoteTemplate
@@ -101,6 +160,12 @@ class DoctorTUI:
 
         return fixes
 
+    def run_session(self, driver: "WizardSessionDriver") -> dict[str, Any] | None:
+        """Run every queued note's wizard inside one long-lived app."""
+        from dx_vault_atlas.shared.tui.session_app import run_wizard_session
+
+        return run_wizard_session(driver, title="Note Doctor")
+
     def _build_steps(
         self, missing: set[str], invalid: set[str], result: ValidationResult
     ) -> list[Any]:
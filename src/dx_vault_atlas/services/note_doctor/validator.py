@@ -1,8 +1,8 @@
 """Validator for Note Doctor Service."""
 
 import re
-from pathlib import Path
 from datetime import date, datetime
+from pathlib import Path
 from typing import Any, Protocol
 
 from packaging.version import parse as parse_version
@@ -12,6 +12,7 @@ from pydantic import ValidationError
 # Constants
 # ---------------------------------------------------------------------------
 from dx_vault_atlas.core.registry import NoteModelRegistry
+from dx_vault_atlas.shared.logger import logger
 from dx_vault_atlas.shared.models.defaults import SCHEMA_VERSION
 from dx_vault_atlas.shared.models.enums import (
     NoteArea,
@@ -20,18 +21,19 @@ from dx_vault_atlas.shared.models.enums import (
 from dx_vault_atlas.shared.models.note import (
     BaseNote,
 )
-from dx_vault_atlas.shared.utils.title_normalizer import (
-    TitleNormalizer,
-)
+from dx_vault_atlas.shared.profiling import stage
+from dx_vault_atlas.shared.pydantic_utils import strip_unknown_fields
+from dx_vault_atlas.shared.tracing import rule_span, span
 from dx_vault_atlas.shared.utils.date_resolver import (
     DateResolver,
 )
+from dx_vault_atlas.shared.utils.title_normalizer import (
+    TitleNormalizer,
+)
 from dx_vault_atlas.shared.yaml_parser import (
     YamlParseError,
     YamlParserService,
 )
-from dx_vault_atlas.shared.logger import logger
-from dx_vault_atlas.shared.pydantic_utils import strip_unknown_fields
 
 _TARGET_VERSION = parse_version(SCHEMA_VERSION)
 
@@ -78,6 +80,10 @@ class ValidationRule(Protocol):
 class IntegrityRule:
     """Check title-vs-filename and title-in-aliases consistency."""
 
+    def __init__(self, date_resolver: DateResolver | None = None) -> None:
+        """Initialise with the run's shared date resolver."""
+        self.date_resolver = date_resolver or DateResolver()
+
     def check(
         self,
         file_path: Path,
@@ -96,11 +102,12 @@ class IntegrityRule:
             is_valid = norm_title == norm_fname
             
             created = frontmatter.get("created")
-            if created and isinstance(created, datetime):
-                current_ts = DateResolver.extract_timestamp_from_stem(file_path.stem)
-                expected_ts = created.strftime("%Y%m%d%H%M%S")
-                if current_ts != expected_ts:
-                    is_valid = False
+            if (
+                created
+                and isinstance(created, datetime)
+                and not self.date_resolver.stem_matches(file_path.stem, created)
+            ):
+                is_valid = False
             
             if not is_valid:
                 invalid.append("integrity_filename")
@@ -246,14 +253,16 @@ class NoteDoctorValidator:
         self,
         yaml_parser: YamlParserService,
         rules: list[ValidationRule] | None = None,
+        date_resolver: DateResolver | None = None,
     ) -> None:
         """Initialise the validator with a YAML parser and optional validation rules."""
         self.yaml_parser = yaml_parser
-        self.rules = (
+        self.date_resolver = date_resolver or DateResolver()
+        self.rules: list[ValidationRule] = (
             rules
             if rules is not None
             else [
-                IntegrityRule(),
+                IntegrityRule(self.date_resolver),
                 CreatedFormatRule(),
                 PriorityRule(),
                 AreaRule(),
@@ -265,7 +274,7 @@ class NoteDoctorValidator:
 
     def validate(self, file_path: Path) -> ValidationResult:
         """Validate a note file against schema and business rules."""
-        result = self._read_and_parse(file_path)
+        result = self.read_note(file_path)
         if isinstance(result, ValidationResult):
             return result
         frontmatter, body = result
@@ -275,6 +284,46 @@ class NoteDoctorValidator:
         self, file_path: Path, frontmatter: dict[str, Any], body: str
     ) -> ValidationResult:
         """Validate a note in-memory against schema and business rules."""
+        with stage("validate"):
+            return self._validate_content(file_path, frontmatter, body)
+
+    def read_note(
+        self,
+        file_path: Path,
+    ) -> ValidationResult | tuple[dict[str, Any], str]:
+        """Read and parse a note without validating it.
+
+        Returns:
+            ``(frontmatter, body)``, or an error ``ValidationResult`` if
+            the file cannot be read or its YAML cannot be parsed.
+        """
+        try:
+            with stage("read"):
+                content = file_path.read_text(encoding="utf-8")
+        except OSError as e:
+            return ValidationResult(
+                file_path,
+                False,
+                error=f"Read error: {e}",
+            )
+
+        try:
+            parsed = self.yaml_parser.parse(content)
+        except YamlParseError as e:
+            return ValidationResult(
+                file_path,
+                False,
+                error=f"YAML error: {e}",
+            )
+
+        return parsed.frontmatter, parsed.body
+
+    # -- private helpers ----------------------------------------------------
+
+    def _validate_content(
+        self, file_path: Path, frontmatter: dict[str, Any], body: str
+    ) -> ValidationResult:
+        """Body of ``validate_content``."""
         logger.debug(
             f"[DEBUG TRACE] validator.validate_content Start | path={file_path.name}"
         )
@@ -293,7 +342,8 @@ class NoteDoctorValidator:
         warnings: list[str] = []
 
         for rule in self.rules:
-            rule.check(file_path, frontmatter, invalid, warnings)
+            with rule_span(rule):
+                rule.check(file_path, frontmatter, invalid, warnings)
 
         model_cls = NoteModelRegistry.get_model(note_type)
         if model_cls:
@@ -332,33 +382,6 @@ class NoteDoctorValidator:
             warnings=warnings,
         )
 
-    # -- private helpers (read / parse) -------------------------------------
-
-    def _read_and_parse(
-        self,
-        file_path: Path,
-    ) -> ValidationResult | tuple[dict[str, Any], str]:
-        """Read and parse a note, returning early on errors."""
-        try:
-            content = file_path.read_text(encoding="utf-8")
-        except OSError as e:
-            return ValidationResult(
-                file_path,
-                False,
-                error=f"Read error: {e}",
-            )
-
-        try:
-            parsed = self.yaml_parser.parse(content)
-        except YamlParseError as e:
-            return ValidationResult(
-                file_path,
-                False,
-                error=f"YAML error: {e}",
-            )
-
-        return parsed.frontmatter, parsed.body
-
     # -- private helpers (field checks) -------------------------------------
 
     def _check_required(
@@ -396,7 +419,8 @@ class NoteDoctorValidator:
             logger.debug(
                 f"[DEBUG TRACE] validator._run_pydantic | class={model_cls.__name__}"
             )
-            model_cls(**filtered)
+            with span(model_cls.__name__, "pydantic"):
+                model_cls(**filtered)
         except ValidationError as e:
             logger.debug(
                 f"Pydantic errors | {file_path.name}: {_format_pydantic_errors(e)}"
@@ -19,6 +19,8 @@ from dx_vault_atlas.shared.yaml_parser import (
 )
 from dx_vault_atlas.shared.config import GlobalConfig
 from dx_vault_atlas.shared.logger import logger
+from dx_vault_atlas.shared.profiling import stage
+from dx_vault_atlas.shared.tracing import note_span
 
 
 class MigratorApp:
@@ -111,14 +113,22 @@ class MigratorApp:
         Returns:
             True if migrated, False if skipped.
         """
+        with note_span("migrator.migrate_note", file_path):
+            return self._migrate_note(file_path, rename_only, debug_mode)
+
+    def _migrate_note(
+        self, file_path: Path, rename_only: bool, debug_mode: bool
+    ) -> bool:
+        """Body of ``_migrate_note_if_needed``."""
         parsed = self._read_and_parse_note(file_path, debug_mode)
         if not parsed:
             return False
 
         # Transform
-        new_frontmatter, has_changes = self.transformer.transform(
-            parsed.frontmatter, file_path, rename_only, debug_mode
-        )
+        with stage("migrate"):
+            new_frontmatter, has_changes = self.transformer.transform(
+                parsed.frontmatter, file_path, rename_only, debug_mode
+            )
 
         if has_changes:
             if debug_mode:
@@ -166,8 +176,15 @@ class MigratorApp:
         logger.info(f"Updated {file_path.name}")
 
 
-def create_app(settings: GlobalConfig) -> MigratorApp:
-    """Factory function to create MigratorApp and inject dependencies."""
+def create_app(
+    settings: GlobalConfig, ui: IUserInterface | None = None
+) -> MigratorApp:
+    """Factory function to create MigratorApp and inject dependencies.
+
+    Args:
+        settings: Global configuration.
+        ui: User interface to use instead of the console one.
+    """
     # Ensure models are registered in NoteModelRegistry
     import dx_vault_atlas.shared.models.note  # noqa: F401
     from dx_vault_atlas.services.note_migrator.core.transformation_service import (
@@ -184,7 +201,8 @@ def create_app(settings: GlobalConfig) -> MigratorApp:
     scanner = VaultScanner()
     yaml_parser = YamlParserService()
     transformer = TransformationService(settings)
-    ui = CliUserInterface()
+    if ui is None:
+        ui = CliUserInterface()
     file_repo = LocalFileRepository()
 
     return MigratorApp(
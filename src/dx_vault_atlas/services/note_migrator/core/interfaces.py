@@ -1,6 +1,6 @@
 """Protocols and interfaces for the note migrator service."""
 
-from collections.abc import Generator
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, Protocol
 
@@ -67,7 +67,7 @@ class ITransformer(Protocol):
 class IScanner(Protocol):
     """Protocol for scanning the vault for markdown files."""
 
-    def scan(self, vault_path: Path) -> Generator[Path, None, None]:
+    def scan(self, vault_path: Path) -> Iterator[Path]:
         """Yield all markdown files in the vault recursively."""
         ...
 
@@ -0,0 +1 @@
+"""Vault Index Service."""
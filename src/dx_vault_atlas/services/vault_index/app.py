@@ -0,0 +1,245 @@
+"""Vault Index application orchestrator."""
+
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, TextIO
+
+from dx_vault_atlas.services.vault_index.core.cli import QueryCLI
+from dx_vault_atlas.services.vault_index.dedupe import MinHashIndex
+from dx_vault_atlas.services.vault_index.export import (
+    VaultExporter,
+    write_csv,
+    write_jsonl,
+)
+from dx_vault_atlas.services.vault_index.query import (
+    PATH,
+    Query,
+    parse_query,
+)
+from dx_vault_atlas.services.vault_index.schema import IndexSchema
+from dx_vault_atlas.services.vault_index.search import SearchIndex
+from dx_vault_atlas.services.vault_index.store import MetadataIndex
+from dx_vault_atlas.services.vault_index.tags import (
+    TagExpr,
+    TagIndex,
+    parse_tag_expression,
+)
+from dx_vault_atlas.shared.config import GlobalConfig
+from dx_vault_atlas.shared.core.scanner import VaultScanner
+from dx_vault_atlas.shared.logger import logger
+from dx_vault_atlas.shared.paths import vault_data_dir
+
+_NS_PER_MS = 1_000_000
+
+
+class VaultIndexApp:
+    """Answers ``dxva query``, ``search`` and ``tags`` from the vault indexes.
+
+    The indexes are refreshed incrementally before each query (one
+    ``stat`` per note, re-parsing only changed notes) unless told not to.
+    """
+
+    def __init__(
+        self,
+        settings: GlobalConfig,
+        cli: QueryCLI,
+        db_path: Path | None = None,
+    ) -> None:
+        """Initialise VaultIndexApp with dependencies."""
+        self.settings = settings
+        self.cli = cli
+        self.scanner = VaultScanner()
+        self.schema = IndexSchema()
+        self.db_path = db_path or (
+            vault_data_dir(settings.vault_path) / "metadata.sqlite3"
+        )
+        self.search_path = self.db_path.with_name("search.sqlite3")
+
+    def parse(
+        self, conditions: list[str], fields: str, sort: str, limit: int | None
+    ) -> Query:
+        """Parse ``dxva query`` arguments against the index schema.
+
+        Raises:
+            QueryError: On syntax errors or unknown fields.
+        """
+        return parse_query(
+            conditions, self.schema, fields=fields, sort=sort, limit=limit
+        )
+
+    def open(self, refresh: bool = True, quiet: bool = False) -> MetadataIndex:
+        """Open the index, bringing it up to date unless told not to."""
+        vault = self.settings.vault_path
+        index = MetadataIndex(self.db_path, vault, schema=self.schema)
+        if not refresh:
+            return index
+
+        start = perf_counter_ns()
+        update = index.refresh(self.scanner.scan(vault))
+        elapsed = (perf_counter_ns() - start) / _NS_PER_MS
+        logger.debug(f"Metadata index refreshed in {elapsed:.1f} ms: {update}")
+        if update.changed and not quiet:
+            self.cli.show_index_refreshed(update, elapsed)
+        return index
+
+    def query(self, query: Query, output: str = "table", refresh: bool = True) -> None:
+        """Run *query* and show the results in the *output* format."""
+        if output == "paths" and PATH not in query.fields:
+            query.fields.append(PATH)
+        with self.open(refresh, quiet=output != "table") as index:
+            rows = index.query(query)
+
+        self._show_rows([column.name for column in query.fields], rows, output)
+
+    def _show_rows(
+        self, fields: list[str], rows: list[dict[str, Any]], output: str
+    ) -> None:
+        """Show result rows in the *output* format."""
+        if output == "jsonl":
+            self.cli.show_jsonl(rows)
+        elif output == "paths":
+            self.cli.show_paths(rows)
+        else:
+            self.cli.show_table(fields, rows)
+
+    # -- tags -----------------------------------------------------------------
+
+    def parse_tags(self, expression: str) -> TagExpr:
+        """Parse a ``dxva tags query`` expression.
+
+        Raises:
+            QueryError: On syntax errors.
+        """
+        return parse_tag_expression(expression)
+
+    def tags_query(
+        self, expr: TagExpr, output: str = "table", refresh: bool = True
+    ) -> None:
+        """Show the notes matching a tag expression."""
+        with self.open(refresh, quiet=output != "table") as index:
+            rows = TagIndex(index).query(expr)
+        self._show_rows(["path", "title"], rows, output)
+
+    def alias(self, name: str, output: str = "table", refresh: bool = True) -> None:
+        """Show the notes that declare alias *name*."""
+        with self.open(refresh, quiet=output != "table") as index:
+            rows = TagIndex(index).resolve_alias(name)
+        self._show_rows(["path", "title"], rows, output)
+
+    def tag_stats(
+        self,
+        field_name: str = "tags",
+        limit: int | None = None,
+        output: str = "table",
+        refresh: bool = True,
+    ) -> None:
+        """Show how many notes carry each tag (or alias)."""
+        with self.open(refresh, quiet=output != "table") as index:
+            tags = TagIndex(index)
+            rows = tags.frequencies(field_name, limit)
+            distinct, tagged = tags.summary(field_name)
+            total = len(index)
+
+        if output == "table":
+            self.cli.show_tag_stats(field_name, rows, distinct, tagged, total)
+        else:
+            self.cli.show_jsonl([{"value": value, "notes": df} for value, df in rows])
+
+    # -- stats ----------------------------------------------------------------
+
+    def stats(self, output: str = "table", refresh: bool = True) -> None:
+        """Show note counts per type, status, area, priority, version and month."""
+        start = perf_counter_ns()
+        with self.open(refresh, quiet=output != "table") as index:
+            stats = index.stats()
+        elapsed = (perf_counter_ns() - start) / _NS_PER_MS
+
+        if output == "json":
+            self.cli.show_jsonl([stats.to_dict()])
+        else:
+            self.cli.show_stats(stats, elapsed)
+
+    def search(
+        self,
+        text: str,
+        filters: Query | None = None,
+        limit: int | None = None,
+        require_all: bool = False,
+        output: str = "table",
+        refresh: bool = True,
+    ) -> None:
+        """Rank notes against *text*, optionally restricted by *filters*."""
+        quiet = output != "table"
+        allowed = None
+        if filters is not None and filters.conditions:
+            filters.fields = [PATH]
+            with self.open(refresh, quiet=quiet) as index:
+                allowed = {row["path"] for row in index.query(filters)}
+
+        vault = self.settings.vault_path
+        with SearchIndex(self.search_path, vault) as index:
+            if refresh:
+                start = perf_counter_ns()
+                update = index.refresh(self.scanner.scan(vault))
+                elapsed = (perf_counter_ns() - start) / _NS_PER_MS
+                logger.debug(f"Search index refreshed in {elapsed:.1f} ms: {update}")
+                if update.changed and not quiet:
+                    self.cli.show_search_refreshed(update, elapsed)
+            hits = index.search(text, limit, allowed, require_all)
+
+        if output == "jsonl":
+            self.cli.show_jsonl([asdict(hit) for hit in hits])
+        elif output == "paths":
+            self.cli.show_paths([asdict(hit) for hit in hits])
+        else:
+            self.cli.show_hits(hits)
+
+    # -- export ---------------------------------------------------------------
+
+    def export(
+        self, output: str = "jsonl", destination: Path | None = None, workers: int = 1
+    ) -> None:
+        """Stream every note's frontmatter to *destination* (stdout if None)."""
+        exporter = VaultExporter(
+            self.settings.vault_path, schema=self.schema, workers=workers
+        )
+        start = perf_counter_ns()
+        if destination is None:
+            self._write_export(exporter, output, sys.stdout)
+            return
+        with destination.open("w", encoding="utf-8", newline="") as out:
+            count = self._write_export(exporter, output, out)
+        elapsed = (perf_counter_ns() - start) / _NS_PER_MS
+        self.cli.show_exported(count, destination, elapsed)
+
+    def _write_export(self, exporter: VaultExporter, output: str, out: TextIO) -> int:
+        """Write the records of *exporter* to *out* in the *output* format."""
+        if output == "csv":
+            return write_csv(exporter.records(), out, exporter.columns)
+        return write_jsonl(exporter.records(), out)
+
+    # -- dedupe ---------------------------------------------------------------
+
+    def dedupe(
+        self, threshold: float, whole_vault: bool = False, output: str = "table"
+    ) -> None:
+        """Report clusters of near-duplicate notes in the inbox (or vault)."""
+        root = self.settings.vault_path if whole_vault else self.settings.vault_inbox
+        start = perf_counter_ns()
+        with MinHashIndex(vault_data_dir(root) / "minhash.sqlite3", root) as index:
+            update = index.refresh(self.scanner.scan(root))
+            clusters = index.clusters(threshold)
+        elapsed = (perf_counter_ns() - start) / _NS_PER_MS
+        logger.debug(f"Dedupe of {root} took {elapsed:.1f} ms: {update}")
+
+        if output == "jsonl":
+            self.cli.show_jsonl([asdict(c) for c in clusters])
+        else:
+            self.cli.show_clusters(clusters, len(index.signatures), elapsed)
+
+
+def create_app(settings: GlobalConfig) -> VaultIndexApp:
+    """Create VaultIndexApp instance."""
+    return VaultIndexApp(settings=settings, cli=QueryCLI())
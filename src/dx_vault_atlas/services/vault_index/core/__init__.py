@@ -0,0 +1 @@
+"""Core logic for Vault Index."""
@@ -0,0 +1,168 @@
+"""CLI service for Vault Index."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from rich.columns import Columns
+from rich.panel import Panel
+from rich.table import Table
+
+from dx_vault_atlas.services.vault_index.dedupe import DuplicateCluster
+from dx_vault_atlas.services.vault_index.search import SearchHit
+from dx_vault_atlas.services.vault_index.stats import UNSET, VaultStats
+from dx_vault_atlas.services.vault_index.store import IndexUpdate
+from dx_vault_atlas.shared import console as ui
+
+_STAT_TITLES = {
+    "type": "Type",
+    "status": "Status",
+    "area": "Area",
+    "priority": "Priority",
+    "version": "Schema version",
+    "month": "Created",
+}
+
+
+def _text(value: Any) -> str:  # noqa: ANN401
+    """Render a cell for the table view."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ", ".join(value)
+    return str(value)
+
+
+class QueryCLI:
+    """Service handling the display of index queries."""
+
+    def show_index_refreshed(self, update: IndexUpdate, elapsed_ms: float) -> None:
+        """Show what bringing the index up to date changed."""
+        ui.console.print(
+            f"[dim]Metadata index updated: +{update.added} ~{update.updated}"
+            f" -{update.removed} notes in {elapsed_ms:.0f} ms[/dim]"
+        )
+
+    def show_search_refreshed(self, update: IndexUpdate, elapsed_ms: float) -> None:
+        """Show what bringing the search index up to date changed."""
+        ui.console.print(
+            f"[dim]Search index updated: +{update.added} ~{update.updated}"
+            f" -{update.removed} notes in {elapsed_ms:.0f} ms[/dim]"
+        )
+
+    def show_hits(self, hits: list[SearchHit]) -> None:
+        """Show ranked search results as a table."""
+        table = Table(title=f"{len(hits)} matches", title_style="bold cyan")
+        table.add_column("Score", justify="right", style="dim")
+        table.add_column("Path", overflow="fold")
+        table.add_column("Title", overflow="fold")
+        for hit in hits:
+            table.add_row(f"{hit.score:.2f}", hit.path, hit.title)
+        ui.console.print(table)
+
+    def show_table(self, fields: list[str], rows: list[dict[str, Any]]) -> None:
+        """Show query results as a table."""
+        table = Table(title=f"{len(rows)} notes", title_style="bold cyan")
+        for name in fields:
+            table.add_column(name, overflow="fold")
+        for row in rows:
+            table.add_row(*(_text(row[name]) for name in fields))
+        ui.console.print(table)
+
+    def show_tag_stats(
+        self,
+        field_name: str,
+        rows: list[tuple[str, int]],
+        distinct: int,
+        tagged: int,
+        total: int,
+    ) -> None:
+        """Show value frequencies of a list field (tags or aliases)."""
+        table = Table(
+            title=f"{distinct} distinct {field_name} on {tagged}/{total} notes",
+            title_style="bold cyan",
+        )
+        table.add_column(field_name.capitalize(), overflow="fold")
+        table.add_column("Notes", justify="right")
+        table.add_column("%", justify="right", style="dim")
+        for value, count in rows:
+            share = 100 * count / total if total else 0.0
+            table.add_row(value, str(count), f"{share:.1f}")
+        ui.console.print(table)
+
+    def show_stats(self, stats: VaultStats, elapsed_ms: float) -> None:
+        """Show the aggregate counters as a dashboard of small tables."""
+        invalid = stats.schema_invalid
+        invalid_share = 100 * invalid / stats.total if stats.total else 0.0
+        ui.console.print(
+            Panel(
+                f"[bold]{stats.total}[/bold] notes · [bold red]{invalid}"
+                f"[/bold red] schema-invalid ({invalid_share:.1f}%)"
+                f" [dim]· {elapsed_ms:.0f} ms[/dim]",
+                title="Vault stats",
+                title_align="left",
+                border_style="cyan",
+                expand=False,
+            )
+        )
+        tables = []
+        for dimension, counts in stats.counts.items():
+            if not counts:
+                continue
+            table = Table(
+                title=_STAT_TITLES.get(dimension, dimension), title_style="bold cyan"
+            )
+            table.add_column("Value", overflow="fold")
+            table.add_column("Notes", justify="right")
+            table.add_column("%", justify="right", style="dim")
+            for value, notes in counts.items():
+                share = 100 * notes / stats.total if stats.total else 0.0
+                label = "[dim](unset)[/dim]" if value == UNSET else value
+                table.add_row(label, str(notes), f"{share:.1f}")
+            tables.append(table)
+        ui.console.print(Columns(tables))
+
+    def show_exported(self, count: int, destination: Path, elapsed_ms: float) -> None:
+        """Confirm an export written to a file."""
+        ui.console.print(
+            f"[green]✓ Exported {count} notes to {destination}[/green]"
+            f" [dim]({elapsed_ms:.0f} ms)[/dim]"
+        )
+
+    def show_clusters(
+        self, clusters: list[DuplicateCluster], compared: int, elapsed_ms: float
+    ) -> None:
+        """Show near-duplicate clusters."""
+        if not clusters:
+            ui.console.print(
+                f"[green]✓ No near-duplicates among {compared} notes[/green]"
+                f" [dim]({elapsed_ms:.0f} ms)[/dim]"
+            )
+            return
+        table = Table(
+            title=f"{len(clusters)} near-duplicate clusters among {compared} notes",
+            title_style="bold cyan",
+        )
+        table.add_column("#", justify="right", style="dim")
+        table.add_column("Similarity", justify="right")
+        table.add_column("Notes", overflow="fold")
+        for number, found in enumerate(clusters, start=1):
+            table.add_row(
+                str(number), f"≥ {found.similarity:.2f}", "\n".join(found.paths)
+            )
+        ui.console.print(table)
+
+    def show_jsonl(self, rows: list[dict[str, Any]]) -> None:
+        """Print one JSON object per result row."""
+        for row in rows:
+            ui.console.print(
+                json.dumps(row, ensure_ascii=False),
+                markup=False,
+                highlight=False,
+                soft_wrap=True,
+            )
+
+    def show_paths(self, rows: list[dict[str, Any]]) -> None:
+        """Print the path of each result row."""
+        for row in rows:
+            ui.console.print(row["path"], markup=False, highlight=False, soft_wrap=True)
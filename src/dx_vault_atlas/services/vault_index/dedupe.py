@@ -0,0 +1,332 @@
+"""Near-duplicate detection with MinHash and LSH, for ``dxva dedupe``.
+
+1. Each note's normalized title and body (``tokenize``) are cut into
+   word 3-shingles, hashed to 64 bits.
+2. The signature is a one-permutation MinHash: shingle hashes fall into
+   128 bins by their low bits and each bin keeps its minimum (empty bins
+   borrow from the next non-empty one). Signatures are cached per file
+   fingerprint, so unchanged notes are never re-read.
+3. LSH splits signatures into 16 bands of 8 bins; notes sharing any band
+   are candidates (about Jaccard 0.7 and up).
+4. Candidates are verified with the exact Jaccard similarity of their
+   shingle sets and clustered with union-find.
+
+Only candidate notes are read twice, so the pass is linear in the number
+of notes plus the number of candidate pairs.
+"""
+
+import hashlib
+import os
+import sqlite3
+from array import array
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from dx_vault_atlas.services.vault_index.search import tokenize
+from dx_vault_atlas.services.vault_index.store import IndexUpdate
+from dx_vault_atlas.shared.core.io import file_fingerprint, iter_chunks
+from dx_vault_atlas.shared.logger import logger
+from dx_vault_atlas.shared.yaml_parser import YamlParseError, YamlParserService
+
+# Bump when shingling or the signature layout changes
+DEDUPE_FORMAT = 1
+
+SHINGLE_SIZE = 3
+NUM_BINS = 128
+BANDS = 16
+ROWS = NUM_BINS // BANDS
+
+DEFAULT_THRESHOLD = 0.8
+
+# Notes signed per worker task
+DEDUPE_CHUNK_SIZE = 256
+
+# Below this many changed chunks, process start-up costs more than it saves
+_MIN_PARALLEL_CHUNKS = 4
+
+_BIN_BITS = NUM_BINS.bit_length() - 1
+_VALUE_BITS = 64 - _BIN_BITS
+_EMPTY = (1 << 64) - 1
+
+
+# -- signatures -----------------------------------------------------------------
+
+
+def shingles(title: str, body: str) -> set[int]:
+    """64-bit hashes of the word shingles of a note's title and body."""
+    tokens = tokenize(f"{title}\n{body}")
+    if not tokens:
+        return set()
+    if len(tokens) < SHINGLE_SIZE:
+        grams = [" ".join(tokens)]
+    else:
+        grams = [
+            " ".join(tokens[i : i + SHINGLE_SIZE])
+            for i in range(len(tokens) - SHINGLE_SIZE + 1)
+        ]
+    return {
+        int.from_bytes(hashlib.blake2b(gram.encode(), digest_size=8).digest(), "little")
+        for gram in grams
+    }
+
+
+def signature(hashes: set[int]) -> array[int]:
+    """One-permutation MinHash signature of a shingle set.
+
+    Empty bins are densified by rotation: they take the value of the next
+    non-empty bin, offset by the distance so distinct bins stay distinct.
+    """
+    bins = array("Q", [_EMPTY]) * NUM_BINS
+    for value in hashes:
+        index = value & (NUM_BINS - 1)
+        rest = value >> _BIN_BITS
+        if rest < bins[index]:
+            bins[index] = rest
+    if not hashes:
+        return bins
+
+    if _EMPTY in bins:
+        dense = array("Q", bins)
+        for i in range(NUM_BINS):
+            if bins[i] == _EMPTY:
+                distance = next(
+                    d for d in range(1, NUM_BINS) if bins[(i + d) % NUM_BINS] != _EMPTY
+                )
+                dense[i] = bins[(i + distance) % NUM_BINS] + (distance << _VALUE_BITS)
+        bins = dense
+    return bins
+
+
+def jaccard(a: set[int], b: set[int]) -> float:
+    """Exact Jaccard similarity of two shingle sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _read_note(path: Path, parser: YamlParserService) -> tuple[str, str]:
+    """``(title, body)`` of the note at *path* (filename if no title)."""
+    try:
+        content = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        logger.debug(f"Dedupe: cannot read {path.name}: {e}")
+        return path.stem, ""
+    try:
+        parsed = parser.parse(content)
+        title, body = parsed.frontmatter.get("title"), parsed.body
+    except YamlParseError:
+        title, body = None, content
+    return (title if isinstance(title, str) and title.strip() else path.stem), body
+
+
+def _signature_chunk(paths: list[Path]) -> list[bytes]:
+    """Worker entry point: sign one chunk of notes."""
+    parser = YamlParserService()
+    return [
+        signature(shingles(*_read_note(path, parser))).tobytes() for path in paths
+    ]
+
+
+# -- clustering -----------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class DuplicateCluster:
+    """Notes that are near-duplicates of one another.
+
+    Attributes:
+        paths: Notes in the cluster, sorted.
+        similarity: Lowest verified Jaccard similarity of a linking pair.
+    """
+
+    paths: tuple[str, ...]
+    similarity: float
+
+
+def lsh_candidates(signatures: dict[str, array[int]]) -> set[tuple[str, str]]:
+    """Pairs of notes that share at least one LSH band.
+
+    Each bucket links its members to its first member, so a bucket of
+    ``m`` identical notes yields ``m - 1`` pairs instead of ``m²``.
+    """
+    pairs: set[tuple[str, str]] = set()
+    for band in range(BANDS):
+        start = band * ROWS
+        buckets: dict[bytes, str] = {}
+        for path, sig in signatures.items():
+            key = sig[start : start + ROWS].tobytes()
+            first = buckets.setdefault(key, path)
+            if first != path:
+                pairs.add((first, path) if first < path else (path, first))
+    return pairs
+
+
+def cluster(
+    pairs: Iterable[tuple[str, str, float]],
+) -> list[DuplicateCluster]:
+    """Group verified ``(a, b, similarity)`` pairs into clusters."""
+    parent: dict[str, str] = {}
+
+    def find(node: str) -> str:
+        root = parent.setdefault(node, node)
+        while root != parent[root]:
+            root = parent[root]
+        while node != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    lowest: dict[str, float] = {}
+    edges = list(pairs)
+    for a, b, _ in edges:
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[max(ra, rb)] = min(ra, rb)
+    members: dict[str, list[str]] = {}
+    for node in parent:
+        members.setdefault(find(node), []).append(node)
+    for a, _, similarity in edges:
+        root = find(a)
+        lowest[root] = min(lowest.get(root, 1.0), similarity)
+
+    clusters = [
+        DuplicateCluster(tuple(sorted(nodes)), lowest[root])
+        for root, nodes in members.items()
+    ]
+    return sorted(clusters, key=lambda c: (-len(c.paths), c.paths))
+
+
+# -- cache ----------------------------------------------------------------------
+
+
+class MinHashIndex:
+    """Cached MinHash signatures of the notes under one directory."""
+
+    def __init__(self, db_path: Path, root: Path, workers: int | None = None) -> None:
+        """Open (creating if needed) the signature cache at *db_path*.
+
+        Args:
+            db_path: SQLite database file.
+            root: Directory whose notes are compared.
+            workers: Processes for signing many notes; defaults to the CPU count.
+        """
+        self.root = root
+        self.workers = workers or os.cpu_count() or 1
+        self._prefix = os.path.join(str(root), "")  # noqa: PTH118 - str prefix fast path
+        self.parser = YamlParserService()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            row = self.conn.execute(
+                "SELECT value FROM meta WHERE key = 'format'"
+            ).fetchone()
+            if row is None or row[0] != str(DEDUPE_FORMAT):
+                self.conn.execute("DROP TABLE IF EXISTS signatures")
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('format', ?)",
+                    (str(DEDUPE_FORMAT),),
+                )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS signatures (path TEXT PRIMARY KEY,"
+                " mtime_ns INTEGER, size INTEGER, sig BLOB) WITHOUT ROWID"
+            )
+        self.signatures: dict[str, array[int]] = {}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self) -> "MinHashIndex":
+        """Use the index as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the connection on exit."""
+        self.close()
+
+    def _relative(self, path: Path) -> str:
+        """Root-relative POSIX path of a scanned note."""
+        text = str(path)
+        if text.startswith(self._prefix):
+            return text[len(self._prefix) :].replace(os.sep, "/")
+        return path.relative_to(self.root).as_posix()
+
+    def refresh(self, notes: Iterable[Path]) -> IndexUpdate:
+        """Load signatures for *notes*, computing only the changed ones."""
+        known = {
+            path: ((mtime, size), sig)
+            for path, mtime, size, sig in self.conn.execute(
+                "SELECT path, mtime_ns, size, sig FROM signatures"
+            )
+        }
+        blobs: dict[str, bytes] = {}
+        changed: list[tuple[str, Path, tuple[int | None, int | None]]] = []
+        added = 0
+        for path in notes:
+            rel = self._relative(path)
+            fingerprint = file_fingerprint(path)
+            cached = known.pop(rel, None)
+            if cached is not None and cached[0] == fingerprint:
+                blobs[rel] = cached[1]
+                continue
+            added += cached is None
+            changed.append((rel, path, fingerprint or (None, None)))
+
+        rows = []
+        signed = self._sign([path for _, path, _ in changed])
+        for (rel, _, (mtime, size)), blob in zip(changed, signed, strict=True):
+            blobs[rel] = blob
+            rows.append((rel, mtime, size, blob))
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO signatures VALUES (?, ?, ?, ?)", rows
+            )
+            self.conn.executemany(
+                "DELETE FROM signatures WHERE path = ?", [(rel,) for rel in known]
+            )
+
+        self.signatures = {}
+        for rel, blob in blobs.items():
+            sig = array("Q")
+            sig.frombytes(blob)
+            if sig[0] != _EMPTY:  # notes without words cannot be compared
+                self.signatures[rel] = sig
+        return IndexUpdate(added, len(changed) - added, len(known))
+
+    def _sign(self, paths: list[Path]) -> Iterator[bytes]:
+        """Yield the signatures of *paths* in order, in parallel if many."""
+        chunks = list(iter_chunks(paths, DEDUPE_CHUNK_SIZE))
+        if self.workers <= 1 or len(chunks) < _MIN_PARALLEL_CHUNKS:
+            for chunk in chunks:
+                yield from _signature_chunk(chunk)
+            return
+
+        workers = min(self.workers, len(chunks))
+        logger.debug(f"Dedupe: signing {len(chunks)} chunks on {workers} workers")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for signed in pool.map(_signature_chunk, chunks):
+                yield from signed
+
+    def clusters(self, threshold: float = DEFAULT_THRESHOLD) -> list[DuplicateCluster]:
+        """Near-duplicate clusters among the loaded signatures."""
+        candidates = lsh_candidates(self.signatures)
+        logger.debug(f"Dedupe: {len(candidates)} LSH candidate pairs")
+
+        sets: dict[str, set[int]] = {}
+
+        def shingle_set(rel: str) -> set[int]:
+            if rel not in sets:
+                sets[rel] = shingles(*_read_note(self.root / rel, self.parser))
+            return sets[rel]
+
+        verified = []
+        for a, b in sorted(candidates):
+            similarity = jaccard(shingle_set(a), shingle_set(b))
+            if similarity >= threshold:
+                verified.append((a, b, similarity))
+        return cluster(verified)
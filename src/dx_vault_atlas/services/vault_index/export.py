@@ -0,0 +1,174 @@
+"""Streaming export of every note's frontmatter, for ``dxva export``.
+
+The pipeline is a chain of generators: ``VaultScanner`` yields paths in
+name order, they are grouped into chunks, each chunk is parsed with
+``YamlParserService`` (in worker processes when asked to) and the
+records are written out one line at a time. At most a few chunks are
+in flight, so memory stays flat whatever the vault size, and chunks are
+consumed in submission order, so the output order is stable.
+
+Each record holds the note's vault-relative ``path``, whether it is
+``valid`` against its model, and its fields: as the model dumps them
+(``model_dump(mode="json")``) for valid notes, or their raw values made
+JSON-safe the same way for the others. Unreadable notes carry an
+``error`` instead.
+"""
+
+import csv
+import json
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, TextIO
+
+from pydantic_core import to_jsonable_python
+
+from dx_vault_atlas.services.vault_index.schema import IndexSchema
+from dx_vault_atlas.shared.core.io import iter_chunks
+from dx_vault_atlas.shared.core.scanner import VaultScanner
+from dx_vault_atlas.shared.logger import logger
+from dx_vault_atlas.shared.yaml_parser import YamlParseError, YamlParserService
+
+EXPORT_FORMATS = ("jsonl", "csv")
+
+# Notes parsed per worker task
+EXPORT_CHUNK_SIZE = 256
+
+# Chunks in flight per worker when parsing in parallel
+_CHUNKS_AHEAD = 2
+
+PATH, VALID, ERROR = "path", "valid", "error"
+
+# CSV column holding the fields no note model declares, as JSON
+EXTRA = "extra"
+
+
+def export_record(
+    path: Path, vault: Path, parser: YamlParserService, schema: IndexSchema
+) -> dict[str, Any]:
+    """Build the export record of one note."""
+    rel = path.relative_to(vault).as_posix()
+    try:
+        frontmatter = parser.parse(path.read_text(encoding="utf-8")).frontmatter
+    except (OSError, UnicodeDecodeError, YamlParseError) as e:
+        logger.debug(f"Export: cannot parse {rel}: {e}")
+        return {PATH: rel, VALID: False, ERROR: str(e)}
+
+    values, valid = schema.values(frontmatter)
+    record = {PATH: rel, VALID: valid}
+    record.update(to_jsonable_python(values, fallback=str))
+    record[PATH], record[VALID] = rel, valid
+    return record
+
+
+def _export_chunk(
+    paths: list[Path], vault: Path, schema: IndexSchema
+) -> list[dict[str, Any]]:
+    """Worker entry point: build the records of one chunk of notes."""
+    parser = YamlParserService()
+    return [export_record(path, vault, parser, schema) for path in paths]
+
+
+class VaultExporter:
+    """Streams the export records of a vault, in stable path order."""
+
+    def __init__(
+        self,
+        vault: Path,
+        schema: IndexSchema | None = None,
+        scanner: VaultScanner | None = None,
+        workers: int = 1,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+    ) -> None:
+        """Initialise the exporter.
+
+        Args:
+            vault: Vault root; record paths are relative to it.
+            schema: Field layout; derived from the registry by default.
+            scanner: Vault scanner; the default one by default.
+            workers: Parsing processes; 1 parses in-process, 0 uses the
+                CPU count.
+            chunk_size: Notes per worker task.
+        """
+        self.vault = vault
+        self.schema = schema or IndexSchema()
+        self.scanner = scanner or VaultScanner()
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+
+    @property
+    def columns(self) -> list[str]:
+        """CSV columns: path, validity, every model field, extras, error."""
+        return [PATH, VALID, *(c.name for c in self.schema.columns), EXTRA, ERROR]
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        """Yield one record per note, in path order."""
+        paths = self.scanner.scan(self.vault, ordered=True)
+        chunks = iter_chunks(paths, self.chunk_size)
+        if self.workers <= 1:
+            parser = YamlParserService()
+            for chunk in chunks:
+                for path in chunk:
+                    yield export_record(path, self.vault, parser, self.schema)
+            return
+
+        logger.debug(f"Export: parsing on {self.workers} workers")
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            pending: deque[Future[list[dict[str, Any]]]] = deque()
+            for chunk in chunks:
+                pending.append(
+                    pool.submit(_export_chunk, chunk, self.vault, self.schema)
+                )
+                # Bounded look-ahead: constant memory, results in order
+                if len(pending) >= self.workers * _CHUNKS_AHEAD:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+
+# -- writers ----------------------------------------------------------------------
+
+
+def write_jsonl(records: Iterable[dict[str, Any]], out: TextIO) -> int:
+    """Write one JSON object per line; return the number of records."""
+    count = 0
+    for record in records:
+        out.write(json.dumps(record, ensure_ascii=False))
+        out.write("\n")
+        count += 1
+    return count
+
+
+def _csv_cell(value: Any) -> str:  # noqa: ANN401
+    """Render a JSON-safe value as a CSV cell (lists and objects as JSON)."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def write_csv(
+    records: Iterable[dict[str, Any]], out: TextIO, columns: list[str]
+) -> int:
+    """Write a header and one row per record; return the number of records.
+
+    Fields outside *columns* go to the ``extra`` column as a JSON object.
+    """
+    known = set(columns)
+    extra_at = columns.index(EXTRA)
+    writer = csv.writer(out)
+    writer.writerow(columns)
+    count = 0
+    for record in records:
+        extra = {key: value for key, value in record.items() if key not in known}
+        row = [_csv_cell(record.get(column)) for column in columns]
+        if extra:
+            row[extra_at] = _csv_cell(extra)
+        writer.writerow(row)
+        count += 1
+    return count
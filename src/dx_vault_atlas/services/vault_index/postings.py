@@ -0,0 +1,49 @@
+"""Varint codec shared by the vault index postings.
+
+Sorted integer ids are stored as the gaps between them, each as an
+unsigned LEB128 varint: dense lists of note ids cost about a byte per id.
+"""
+
+from collections.abc import Iterable
+
+
+def put_varint(out: bytearray, value: int) -> None:
+    """Append *value* as an unsigned LEB128 varint."""
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varints(data: bytes) -> list[int]:
+    """Decode a run of varints."""
+    values: list[int] = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    return values
+
+
+def encode_ids(ids: Iterable[int]) -> bytes:
+    """Encode strictly increasing ids as varint gaps."""
+    out = bytearray()
+    last = 0
+    for note_id in ids:
+        put_varint(out, note_id - last)
+        last = note_id
+    return bytes(out)
+
+
+def decode_ids(data: bytes) -> list[int]:
+    """Decode ids written by ``encode_ids``."""
+    ids = decode_varints(data)
+    total = 0
+    for i, gap in enumerate(ids):
+        total += gap
+        ids[i] = total
+    return ids
@@ -0,0 +1,228 @@
+"""Filter, sort and projection syntax of ``dxva query``.
+
+A query is a list of conditions, all of which must hold::
+
+    type=task status=in_progress,to_do priority>=3 tags=work created>=2024-06
+
+``field=a,b`` matches any of the values and ``field!=a,b`` none of them;
+an empty value tests for absence (``area=``) or presence (``area!=``).
+``~`` matches a substring. ``<``, ``<=``, ``>`` and ``>=`` compare numbers
+numerically and everything else as text, which orders ISO dates
+correctly. On list fields (``tags``, ``aliases``) conditions apply to
+the items, ignoring case. Besides the model fields, ``path`` and ``valid`` (1 if the
+frontmatter validates against its model) can be filtered, sorted and
+shown.
+"""
+
+import re
+from dataclasses import dataclass, field
+
+from dx_vault_atlas.services.vault_index.schema import Column, IndexSchema
+
+# Columns every note has, besides the model fields
+PATH = Column("path", "text")
+VALID = Column("valid", "integer")
+
+DEFAULT_FIELDS = ("path", "type", "title")
+
+# Output formats of ``dxva query``
+OUTPUT_FORMATS = ("table", "jsonl", "paths")
+
+_CONDITION_RE = re.compile(r"^\s*([A-Za-z_][\w-]*)\s*(!=|>=|<=|=|>|<|~)\s*(.*?)\s*$")
+_ORDER_OPS = frozenset({"<", "<=", ">", ">="})
+
+
+class QueryError(ValueError):
+    """Raised for a query that does not parse or names unknown fields."""
+
+
+@dataclass(frozen=True)
+class Condition:
+    """One ``field OP value[,value...]`` filter."""
+
+    column: Column
+    op: str
+    values: tuple[str, ...]
+
+
+@dataclass
+class Query:
+    """A parsed ``dxva query``.
+
+    Attributes:
+        conditions: Filters that must all hold.
+        fields: Columns to return, in order.
+        sort: ``(column, descending)`` pairs.
+        limit: Maximum number of rows, if any.
+    """
+
+    conditions: list[Condition] = field(default_factory=list)
+    fields: list[Column] = field(default_factory=list)
+    sort: list[tuple[Column, bool]] = field(default_factory=list)
+    limit: int | None = None
+
+
+def _column(schema: IndexSchema, name: str) -> Column:
+    """Resolve a field name to its column."""
+    if name == PATH.name:
+        return PATH
+    if name == VALID.name:
+        return VALID
+    column = schema.by_name.get(name)
+    if column is None:
+        known = ", ".join([PATH.name, VALID.name, *schema.by_name])
+        raise QueryError(f"Unknown field {name!r} (known: {known})")
+    return column
+
+
+def _names(text: str) -> list[str]:
+    """Split a comma-separated list, dropping blanks."""
+    return [part.strip() for part in text.split(",") if part.strip()]
+
+
+def parse_condition(text: str, schema: IndexSchema) -> Condition:
+    """Parse one ``field OP value`` condition."""
+    match = _CONDITION_RE.match(text)
+    if match is None:
+        raise QueryError(f"Cannot parse condition {text!r} (expected field OP value)")
+    name, op, raw = match.groups()
+    column = _column(schema, name)
+
+    if op in _ORDER_OPS or op == "~":
+        if not raw:
+            raise QueryError(f"Condition {text!r} needs a value")
+        if op in _ORDER_OPS and column.kind == "list":
+            raise QueryError(f"Cannot order-compare list field {name!r}")
+        values: tuple[str, ...] = (raw,)
+    else:
+        values = tuple(_names(raw))
+
+    if column.kind in ("integer", "real") and op != "~":
+        cast = int if column.kind == "integer" else float
+        for value in values:
+            try:
+                cast(value)
+            except ValueError:
+                raise QueryError(f"{name} expects a number, got {value!r}") from None
+    return Condition(column, op, values)
+
+
+def parse_query(
+    conditions: list[str],
+    schema: IndexSchema,
+    fields: str = ",".join(DEFAULT_FIELDS),
+    sort: str = "path",
+    limit: int | None = None,
+) -> Query:
+    """Parse the arguments of ``dxva query``.
+
+    Args:
+        conditions: Filter expressions.
+        schema: Index schema the fields are resolved against.
+        fields: Comma-separated columns to return.
+        sort: Comma-separated columns; ``-field`` sorts descending.
+        limit: Maximum number of rows.
+
+    Raises:
+        QueryError: On syntax errors or unknown fields.
+    """
+    query = Query(limit=limit)
+    query.conditions = [parse_condition(text, schema) for text in conditions]
+    query.fields = [_column(schema, name) for name in _names(fields)]
+    if not query.fields:
+        raise QueryError("No fields to show")
+    for name in _names(sort):
+        descending = name.startswith("-")
+        query.sort.append((_column(schema, name.lstrip("-")), descending))
+    return query
+
+
+# -- SQL ------------------------------------------------------------------------
+
+
+def _quote(name: str) -> str:
+    """Quote an identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _param(column: Column, value: str) -> str | int | float:
+    """Bind *value* with the type of *column*."""
+    if column.kind == "integer":
+        return int(value)
+    if column.kind == "real":
+        return float(value)
+    return value
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards in *value*."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _list_clause(condition: Condition) -> tuple[str, list[str | int | float]]:
+    """SQL for a condition on a list column (``note_values`` rows)."""
+    subquery = "SELECT note_id FROM note_values WHERE field = ?"
+    params: list[str | int | float] = [condition.column.name]
+    values = condition.values
+
+    if condition.op == "~":
+        subquery += " AND value LIKE ? ESCAPE '\\'"
+        params.append(f"%{_escape_like(values[0].casefold())}%")
+        return f"id IN ({subquery})", params
+    if values:
+        subquery += f" AND value IN ({', '.join('?' * len(values))})"
+        params.extend(value.casefold() for value in values)
+    # field=        → no items; field!= → some item
+    # field=a,b     → has a or b; field!=a,b → has neither
+    negate = (condition.op == "=") != bool(values)
+    return f"id {'NOT IN' if negate else 'IN'} ({subquery})", params
+
+
+def _clause(condition: Condition) -> tuple[str, list[str | int | float]]:
+    """SQL for one condition."""
+    column, op, values = condition.column, condition.op, condition.values
+    if column.kind == "list":
+        return _list_clause(condition)
+
+    name = _quote(column.name)
+    if op == "~":
+        return f"{name} LIKE ? ESCAPE '\\'", [f"%{_escape_like(values[0])}%"]
+    if op in _ORDER_OPS:
+        return f"{name} {op} ?", [_param(column, values[0])]
+    if not values:
+        return f"{name} IS {'NULL' if op == '=' else 'NOT NULL'}", []
+
+    params = [_param(column, value) for value in values]
+    if len(params) == 1:
+        sql = f"{name} {op} ?"
+    else:
+        placeholders = ", ".join("?" * len(params))
+        sql = f"{name} {'IN' if op == '=' else 'NOT IN'} ({placeholders})"
+    if op == "!=":
+        sql = f"({sql} OR {name} IS NULL)"
+    return sql, params
+
+
+def compile_query(query: Query) -> tuple[str, list[str | int | float]]:
+    """Translate *query* into SQL over the ``notes`` table."""
+    select = ", ".join(_quote(column.name) for column in query.fields)
+    sql = f"SELECT {select} FROM notes"
+    params: list[str | int | float] = []
+
+    clauses = []
+    for condition in query.conditions:
+        clause, clause_params = _clause(condition)
+        clauses.append(clause)
+        params.extend(clause_params)
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+
+    order = [
+        f"{_quote(column.name)} {'DESC' if descending else 'ASC'}"
+        for column, descending in query.sort
+    ]
+    sql += " ORDER BY " + ", ".join([*order, "path"])
+    if query.limit is not None:
+        sql += " LIMIT ?"
+        params.append(query.limit)
+    return sql, params
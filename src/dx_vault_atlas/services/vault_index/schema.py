@@ -0,0 +1,179 @@
+"""Index columns derived from the registered note models.
+
+Every field of every model in ``NoteModelRegistry`` becomes a column of
+the ``notes`` table, keyed by its frontmatter name (``type``, not
+``note_type``). The column kind follows the field annotation, so adding
+a field to a model adds it to the index on the next refresh.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import date
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel, ValidationError
+
+import dx_vault_atlas.shared.models.note  # noqa: F401  (registers the models)
+from dx_vault_atlas.core.registry import NoteModelRegistry
+from dx_vault_atlas.shared.pydantic_utils import strip_unknown_fields
+
+# Column kind → SQLite type; lists are stored as JSON plus one row per item
+_SQL_TYPES = {
+    "integer": "INTEGER",
+    "real": "REAL",
+    "text": "TEXT",
+    "datetime": "TEXT",
+    "list": "TEXT",
+}
+
+# Free-text columns that are not worth a B-tree index
+_UNINDEXED = frozenset({"title", "up"})
+
+
+@dataclass(frozen=True)
+class Column:
+    """One indexed frontmatter field.
+
+    Attributes:
+        name: Frontmatter key (the field alias when it has one).
+        kind: ``integer``, ``real``, ``text``, ``datetime`` or ``list``.
+    """
+
+    name: str
+    kind: str
+
+    @property
+    def sql_type(self) -> str:
+        """SQLite column type."""
+        return _SQL_TYPES[self.kind]
+
+    @property
+    def indexed(self) -> bool:
+        """True if the column gets its own index."""
+        return self.kind != "list" and self.name not in _UNINDEXED
+
+    def cell(self, value: Any) -> Any:  # noqa: ANN401
+        """Convert a frontmatter *value* to what is stored, or None."""
+        if value is None:
+            return None
+        if self.kind == "list":
+            items = self.items(value)
+            return json.dumps(items, ensure_ascii=False) if items else None
+        if isinstance(value, (dict, list)):
+            return None
+        if self.kind == "datetime":
+            return value.isoformat() if isinstance(value, date) else str(value)
+        if self.kind in ("integer", "real"):
+            cast = int if self.kind == "integer" else float
+            try:
+                return cast(value)
+            except (TypeError, ValueError):
+                return None
+        return str(value)
+
+    def items(self, value: Any) -> list[str]:  # noqa: ANN401
+        """Values of a list column (a bare string counts as one item)."""
+        if value is None:
+            return []
+        if not isinstance(value, list):
+            value = [value]
+        return [str(item) for item in value if item is not None and str(item)]
+
+
+@dataclass(frozen=True)
+class NoteRecord:
+    """What the index stores for one note.
+
+    Attributes:
+        valid: True if the frontmatter validates against its note model.
+        cells: Stored values, in ``IndexSchema.columns`` order.
+        lists: Items of each list column, for the ``note_values`` table.
+    """
+
+    valid: bool
+    cells: tuple[Any, ...]
+    lists: dict[str, list[str]] = field(default_factory=dict)
+
+
+def _kind(annotation: Any) -> str:  # noqa: ANN401
+    """Column kind for a model field annotation."""
+    if get_origin(annotation) in (Union, UnionType):
+        kinds = {_kind(a) for a in get_args(annotation) if a is not NoneType}
+        return kinds.pop() if len(kinds) == 1 else "text"
+    if get_origin(annotation) is list:
+        return "list"
+    if isinstance(annotation, type):
+        if issubclass(annotation, date):
+            return "datetime"
+        if issubclass(annotation, int):
+            return "integer"
+        if issubclass(annotation, float):
+            return "real"
+    return "text"
+
+
+class IndexSchema:
+    """Columns of the metadata index and the conversion of notes to rows."""
+
+    def __init__(self, model_map: dict[str, type[BaseModel]] | None = None) -> None:
+        """Derive the columns from *model_map* (the registry by default)."""
+        self.model_map = (
+            model_map if model_map is not None else NoteModelRegistry.get_all()
+        )
+        columns: dict[str, Column] = {}
+        for model in self.model_map.values():
+            for name, info in model.model_fields.items():
+                key = info.alias or name
+                # The first model declaring a field decides its kind
+                columns.setdefault(key, Column(key, _kind(info.annotation)))
+        self.columns = tuple(columns.values())
+        self.by_name = columns
+
+    @property
+    def signature(self) -> str:
+        """Digest of the column layout; a change forces a rebuild."""
+        layout = ",".join(f"{c.name}:{c.kind}" for c in self.columns)
+        return hashlib.sha1(layout.encode("utf-8")).hexdigest()[:16]
+
+    def values(self, frontmatter: dict[str, Any]) -> tuple[dict[str, Any], bool]:
+        """Return a note's field values and whether they validate.
+
+        Notes that validate come back as their model dumps them (enums as
+        values, dates as ISO 8601). The others keep their raw values.
+        """
+        note_type = frontmatter.get("type")
+        model = self.model_map.get(note_type) if isinstance(note_type, str) else None
+        if model is None:
+            return frontmatter, False
+        try:
+            note = model.model_validate(strip_unknown_fields(model, frontmatter))
+        except ValidationError:
+            return frontmatter, False
+
+        values = note.model_dump(mode="json", by_alias=True)
+        # Default factories (created=now) would invent values
+        for name, info in model.model_fields.items():
+            key = info.alias or name
+            if info.default_factory is not None and key not in frontmatter:
+                values.pop(key, None)
+        return values, True
+
+    def record(self, frontmatter: dict[str, Any] | None) -> NoteRecord:
+        """Build the index record for a note's *frontmatter*.
+
+        Values come from ``values``; those of invalid notes are converted
+        per column where possible.
+        """
+        if frontmatter is None:
+            return NoteRecord(False, (None,) * len(self.columns))
+
+        values, valid = self.values(frontmatter)
+        cells = tuple(column.cell(values.get(column.name)) for column in self.columns)
+        lists = {
+            column.name: column.items(values.get(column.name))
+            for column in self.columns
+            if column.kind == "list"
+        }
+        return NoteRecord(valid, cells, lists)
@@ -0,0 +1,491 @@
+"""Full-text inverted index with BM25 ranking, for ``dxva search``.
+
+Titles and bodies are tokenized with ``TitleNormalizer.sanitize`` (accents
+stripped, lowercase, split on anything that is not a letter or digit).
+
+Each term's postings are one SQLite blob of varint triples
+``(doc id gap, term frequency, doc length)``, sorted by doc id. Doc ids
+only grow: a new or changed note gets the next id, so its postings are
+appended to the end of each blob without decoding it. Only the postings
+of changed or deleted notes' *old* terms are decoded and rewritten.
+Notes whose file changed but whose indexed text did not (a frontmatter
+edit) only get their fingerprint updated.
+"""
+
+import hashlib
+import math
+import os
+import sqlite3
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from dx_vault_atlas.services.vault_index.postings import decode_varints, put_varint
+from dx_vault_atlas.services.vault_index.store import IndexUpdate
+from dx_vault_atlas.shared.core.io import Fingerprint, file_fingerprint, iter_chunks
+from dx_vault_atlas.shared.logger import logger
+from dx_vault_atlas.shared.utils.title_normalizer import TitleNormalizer
+from dx_vault_atlas.shared.yaml_parser import YamlParseError, YamlParserService
+
+# Bump when the table layout or tokenization changes
+SEARCH_FORMAT = 1
+
+# BM25 parameters (the usual defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Notes tokenized per worker task
+SEARCH_CHUNK_SIZE = 256
+
+# Below this many changed chunks, process start-up costs more than it saves
+_MIN_PARALLEL_CHUNKS = 4
+
+# Longer "words" are usually hashes or base64 noise
+_MAX_TOKEN_LENGTH = 64
+
+# New docs whose postings are appended together (fewer, longer appends)
+_APPEND_BATCH = 4096
+
+# Hits whose path and title are fetched per round trip
+_HIT_BATCH = 512
+
+# ``(doc id, fingerprint, digest)`` of a stored doc
+_StoredDoc = tuple[int, Fingerprint, str]
+
+
+def tokenize(text: str) -> list[str]:
+    """Split *text* into normalized search terms."""
+    return [
+        token
+        for token in TitleNormalizer.sanitize(text).split("_")
+        if token and len(token) <= _MAX_TOKEN_LENGTH
+    ]
+
+
+# -- postings codec -------------------------------------------------------------
+
+
+def encode_postings(entries: Iterable[tuple[int, int, int]], last: int = 0) -> bytes:
+    """Encode ``(doc id, tf, length)`` entries sorted by id.
+
+    Args:
+        entries: Postings to encode, ids strictly increasing.
+        last: Id of the posting these follow (0 for a new list), so the
+            result can be appended to an existing blob.
+    """
+    out = bytearray()
+    for doc_id, tf, length in entries:
+        for value in (doc_id - last, tf, length):
+            if value < 0x80:
+                out.append(value)  # most gaps and frequencies fit one byte
+            else:
+                put_varint(out, value)
+        last = doc_id
+    return bytes(out)
+
+
+def decode_postings(data: bytes) -> list[tuple[int, int, int]]:
+    """Decode a postings blob back to ``(doc id, tf, length)`` entries."""
+    values = decode_varints(data)
+    entries = []
+    doc_id = 0
+    for i in range(0, len(values) - 2, 3):
+        doc_id += values[i]
+        entries.append((doc_id, values[i + 1], values[i + 2]))
+    return entries
+
+
+# -- documents ------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SearchDoc:
+    """Tokenized form of one note.
+
+    Attributes:
+        title: Title shown in results (frontmatter title or filename).
+        digest: Hash of the indexed text, to skip frontmatter-only edits.
+        length: Number of tokens.
+        terms: Term frequencies.
+    """
+
+    title: str
+    digest: str
+    length: int
+    terms: dict[str, int]
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One ranked search result."""
+
+    path: str
+    title: str
+    score: float
+
+
+def _read_doc(path: Path, parser: YamlParserService) -> SearchDoc:
+    """Tokenize the title and body of the note at *path*."""
+    try:
+        content = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        logger.debug(f"Search index: cannot read {path.name}: {e}")
+        content = ""
+    try:
+        parsed = parser.parse(content)
+        title, body = parsed.frontmatter.get("title"), parsed.body
+    except YamlParseError:
+        title, body = None, content
+    title = title if isinstance(title, str) and title.strip() else path.stem
+
+    text = f"{title}\n{body}"
+    tokens = tokenize(text)
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return SearchDoc(title, digest, len(tokens), dict(Counter(tokens)))
+
+
+def _search_chunk(paths: list[Path]) -> list[tuple[Fingerprint | None, SearchDoc]]:
+    """Worker entry point: tokenize one chunk of notes."""
+    parser = YamlParserService()
+    return [(file_fingerprint(path), _read_doc(path, parser)) for path in paths]
+
+
+# -- index ----------------------------------------------------------------------
+
+
+class SearchIndex:
+    """On-disk inverted index over the titles and bodies of one vault."""
+
+    def __init__(self, db_path: Path, vault: Path, workers: int | None = None) -> None:
+        """Open (creating if needed) the index at *db_path*.
+
+        Args:
+            db_path: SQLite database file.
+            vault: Vault root; stored paths are relative to it.
+            workers: Processes for large refreshes; defaults to the CPU count.
+        """
+        self.vault = vault
+        self.workers = workers or os.cpu_count() or 1
+        self._prefix = os.path.join(str(vault), "")  # noqa: PTH118 - str prefix fast path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._ensure_tables()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self) -> "SearchIndex":
+        """Use the index as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the connection on exit."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of indexed notes."""
+        return int(self.conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0])
+
+    def _ensure_tables(self) -> None:
+        """Create the tables, rebuilding them if the format changed."""
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            row = self.conn.execute(
+                "SELECT value FROM meta WHERE key = 'format'"
+            ).fetchone()
+            if row is not None and row[0] == str(SEARCH_FORMAT):
+                return
+            self.conn.execute("DROP TABLE IF EXISTS docs")
+            self.conn.execute("DROP TABLE IF EXISTS postings")
+            self.conn.execute(
+                "CREATE TABLE docs (id INTEGER PRIMARY KEY, path TEXT NOT NULL"
+                " UNIQUE, mtime_ns INTEGER, size INTEGER, digest TEXT, title TEXT,"
+                " length INTEGER, terms TEXT)"
+            )
+            self.conn.execute(
+                "CREATE TABLE postings (term TEXT PRIMARY KEY, df INTEGER,"
+                " last INTEGER, data BLOB) WITHOUT ROWID"
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                [("format", str(SEARCH_FORMAT)), ("next_id", "1")],
+            )
+
+    def _relative(self, path: Path) -> str:
+        """Vault-relative POSIX path of a scanned note."""
+        text = str(path)
+        if text.startswith(self._prefix):
+            return text[len(self._prefix) :].replace(os.sep, "/")
+        return path.relative_to(self.vault).as_posix()
+
+    # -- refresh --------------------------------------------------------------
+
+    def refresh(self, notes: Iterable[Path]) -> IndexUpdate:
+        """Bring the index in line with *notes* (a full vault scan)."""
+        gone, previous, changed = self._diff(notes)
+        update = IndexUpdate(len(changed) - len(previous), len(previous), len(gone))
+        if not update.changed:
+            return update
+
+        with self.conn:
+            removals: dict[str, set[int]] = {}
+            self._drop_docs([entry[0] for entry in gone.values()], removals)
+            self._index_changed(changed, previous, removals)
+            self._remove_postings(removals)
+        return update
+
+    def _diff(
+        self, notes: Iterable[Path]
+    ) -> tuple[dict[str, _StoredDoc], dict[str, tuple[int, str]], list[Path]]:
+        """Compare a scan with the stored docs.
+
+        Returns:
+            ``(gone, previous, changed)``: stored docs missing from the scan,
+            the id and digest of each modified note, and every note to
+            (re)tokenize.
+        """
+        known: dict[str, _StoredDoc] = {
+            path: (doc_id, (mtime, size), digest)
+            for doc_id, path, mtime, size, digest in self.conn.execute(
+                "SELECT id, path, mtime_ns, size, digest FROM docs"
+            )
+        }
+        previous: dict[str, tuple[int, str]] = {}
+        changed: list[Path] = []
+        for path in notes:
+            rel = self._relative(path)
+            entry = known.pop(rel, None)
+            if entry is None:
+                changed.append(path)
+            elif entry[1] != file_fingerprint(path):
+                previous[rel] = (entry[0], entry[2])
+                changed.append(path)
+        return known, previous, changed
+
+    def _index_changed(
+        self,
+        changed: list[Path],
+        previous: dict[str, tuple[int, str]],
+        removals: dict[str, set[int]],
+    ) -> None:
+        """Tokenize *changed* notes and append them under fresh ids.
+
+        A modified note whose content digest is unchanged only gets its
+        fingerprint updated.
+        """
+        lasts = dict(self.conn.execute("SELECT term, last FROM postings"))
+        (next_id,) = self.conn.execute(
+            "SELECT value FROM meta WHERE key = 'next_id'"
+        ).fetchone()
+        next_id = int(next_id)
+
+        fresh: list[tuple[int, str, int | None, int | None, SearchDoc]] = []
+        for chunk in self._docs(changed):
+            for path, fingerprint, doc in chunk:
+                rel = self._relative(path)
+                mtime, size = fingerprint or (None, None)
+                old = previous.get(rel)
+                if old is not None and old[1] == doc.digest:
+                    self.conn.execute(
+                        "UPDATE docs SET mtime_ns = ?, size = ? WHERE id = ?",
+                        (mtime, size, old[0]),
+                    )
+                    continue
+                if old is not None:
+                    self._drop_docs([old[0]], removals)
+                fresh.append((next_id, rel, mtime, size, doc))
+                next_id += 1
+            if len(fresh) >= _APPEND_BATCH:
+                self._append(fresh, lasts)
+                fresh = []
+        self._append(fresh, lasts)
+        self.conn.execute(
+            "UPDATE meta SET value = ? WHERE key = 'next_id'", (str(next_id),)
+        )
+
+    def _docs(
+        self, paths: list[Path]
+    ) -> Iterator[list[tuple[Path, Fingerprint | None, SearchDoc]]]:
+        """Yield tokenized notes chunk by chunk, in parallel if many."""
+        chunks = list(iter_chunks(paths, SEARCH_CHUNK_SIZE))
+        if self.workers <= 1 or len(chunks) < _MIN_PARALLEL_CHUNKS:
+            for chunk in chunks:
+                entries = _search_chunk(chunk)
+                yield [
+                    (path, *entry)
+                    for path, entry in zip(chunk, entries, strict=True)
+                ]
+            return
+
+        workers = min(self.workers, len(chunks))
+        logger.debug(f"Search index: {len(chunks)} chunks on {workers} workers")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_search_chunk, chunks)
+            for chunk, entries in zip(chunks, results, strict=True):
+                yield [
+                    (path, *entry)
+                    for path, entry in zip(chunk, entries, strict=True)
+                ]
+
+    def _drop_docs(self, doc_ids: list[int], removals: dict[str, set[int]]) -> None:
+        """Delete docs, recording which postings must forget them."""
+        for doc_id in doc_ids:
+            (terms,) = self.conn.execute(
+                "SELECT terms FROM docs WHERE id = ?", (doc_id,)
+            ).fetchone()
+            for term in terms.split():
+                removals.setdefault(term, set()).add(doc_id)
+            self.conn.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+
+    def _append(
+        self,
+        docs: list[tuple[int, str, int | None, int | None, SearchDoc]],
+        lasts: dict[str, int],
+    ) -> None:
+        """Insert new docs and append their postings (ids are all new)."""
+        self.conn.executemany(
+            "INSERT INTO docs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (doc_id, rel, mtime, size, doc.digest, doc.title, doc.length,
+                 " ".join(doc.terms))
+                for doc_id, rel, mtime, size, doc in docs
+            ],
+        )
+        postings: dict[str, list[tuple[int, int, int]]] = {}
+        for doc_id, _, _, _, doc in docs:
+            for term, tf in doc.terms.items():
+                postings.setdefault(term, []).append((doc_id, tf, doc.length))
+
+        inserts, updates = [], []
+        for term, entries in postings.items():
+            last = lasts.get(term)
+            blob = encode_postings(entries, last or 0)
+            if last is None:
+                inserts.append((term, len(entries), entries[-1][0], blob))
+            else:
+                updates.append((blob, len(entries), entries[-1][0], term))
+            lasts[term] = entries[-1][0]
+        self.conn.executemany("INSERT INTO postings VALUES (?, ?, ?, ?)", inserts)
+        self.conn.executemany(
+            # || yields TEXT; the cast keeps the bytes and restores BLOB
+            "UPDATE postings SET data = CAST(data || ? AS BLOB), df = df + ?,"
+            " last = ?"
+            " WHERE term = ?",
+            updates,
+        )
+
+    def _remove_postings(self, removals: dict[str, set[int]]) -> None:
+        """Rewrite the postings of *removals* without the dropped docs."""
+        for term, doc_ids in removals.items():
+            row = self.conn.execute(
+                "SELECT data FROM postings WHERE term = ?", (term,)
+            ).fetchone()
+            if row is None:
+                continue
+            entries = [e for e in decode_postings(row[0]) if e[0] not in doc_ids]
+            if entries:
+                self.conn.execute(
+                    "UPDATE postings SET data = ?, df = ?, last = ? WHERE term = ?",
+                    (encode_postings(entries), len(entries), entries[-1][0], term),
+                )
+            else:
+                self.conn.execute("DELETE FROM postings WHERE term = ?", (term,))
+
+    # -- search ---------------------------------------------------------------
+
+    def search(
+        self,
+        text: str,
+        limit: int | None = None,
+        allowed: set[str] | None = None,
+        require_all: bool = False,
+    ) -> list[SearchHit]:
+        """Rank notes against *text* with BM25.
+
+        Args:
+            text: Free-text query.
+            limit: Maximum number of hits.
+            allowed: If given, only these vault-relative paths can match.
+            require_all: Only notes containing every query term match.
+        """
+        terms = list(dict.fromkeys(tokenize(text)))
+        count, total = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(length), 0) FROM docs"
+        ).fetchone()
+        if not terms or not count:
+            return []
+
+        scored = self._score(terms, count, total / count or 1.0, require_all)
+        if scored is None:
+            return []
+        scores, matched = scored
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if require_all:
+            ranked = [item for item in ranked if matched[item[0]] == len(terms)]
+        return self._hits(ranked, limit, allowed)
+
+    def _score(
+        self,
+        terms: list[str],
+        count: int,
+        avg_length: float,
+        require_all: bool,
+    ) -> tuple[dict[int, float], Counter[int]] | None:
+        """BM25 score of every doc holding a query term.
+
+        Returns:
+            ``(scores, matched)``, where *matched* counts the query terms
+            each doc holds; None if *require_all* and a term is unknown.
+        """
+        scores: dict[int, float] = {}
+        matched: Counter[int] = Counter()
+        for term in terms:
+            row = self.conn.execute(
+                "SELECT df, data FROM postings WHERE term = ?", (term,)
+            ).fetchone()
+            if row is None:
+                if require_all:
+                    return None
+                continue
+            df, data = row
+            idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+            for doc_id, tf, length in decode_postings(data):
+                norm = tf * (BM25_K1 + 1) / (
+                    tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+                )
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * norm
+                matched[doc_id] += 1
+        return scores, matched
+
+    def _hits(
+        self,
+        ranked: list[tuple[int, float]],
+        limit: int | None,
+        allowed: set[str] | None,
+    ) -> list[SearchHit]:
+        """Look up paths and titles of *ranked* docs, best first."""
+        hits: list[SearchHit] = []
+        for batch in iter_chunks(ranked, _HIT_BATCH):
+            rows = {
+                doc_id: (path, title)
+                for doc_id, path, title in self.conn.execute(
+                    "SELECT id, path, title FROM docs WHERE id IN"
+                    f" ({', '.join('?' * len(batch))})",
+                    [doc_id for doc_id, _ in batch],
+                )
+            }
+            for doc_id, score in batch:
+                path, title = rows[doc_id]
+                if allowed is not None and path not in allowed:
+                    continue
+                hits.append(SearchHit(path, title, score))
+                if limit is not None and len(hits) >= limit:
+                    return hits
+        return hits
@@ -0,0 +1,83 @@
+"""Aggregate counters behind ``dxva stats``.
+
+The metadata index keeps one ``(dimension, value) -> notes`` counter per
+distinct value of a few model fields (type, status, area, priority,
+schema version, creation month) plus the valid/invalid split against
+the notes' Pydantic models. Refresh
+subtracts the old keys of every changed or removed note and adds the
+new ones, so the counters stay exact without ever re-reading unchanged
+notes and the dashboard is a single read of a few dozen rows.
+
+Schema validity is narrower than what ``dxva doctor`` reports: the doctor
+also flags filename/title mismatches, date problems and values not in
+canonical form, none of which the index checks. A vault can therefore
+show no schema-invalid notes here and still have work for the doctor.
+"""
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+# (dimension, index column) pairs counted for every note
+STAT_DIMENSIONS = (
+    ("type", "type"),
+    ("status", "status"),
+    ("area", "area"),
+    ("priority", "priority"),
+    ("version", "version"),
+    ("month", "created"),
+)
+
+# Dimension splitting notes into schema-valid and schema-invalid ones
+VALIDITY = "validity"
+
+# Value counted for notes without the field
+UNSET = ""
+
+_MONTH_RE = re.compile(r"^\d{4}-\d{2}")
+
+
+def stat_keys(valid: bool, values: Mapping[str, Any]) -> list[tuple[str, str]]:
+    """The ``(dimension, value)`` counters a note contributes to.
+
+    Args:
+        valid: Whether the note validates against its Pydantic model.
+        values: Stored index cells by column; dimensions whose column is
+            missing (not in the schema) are skipped.
+    """
+    keys = [(VALIDITY, "valid" if valid else "invalid")]
+    for dimension, column in STAT_DIMENSIONS:
+        if column not in values:
+            continue
+        value = values[column]
+        text = UNSET if value is None else str(value)
+        if dimension == "month":
+            text = text[:7] if _MONTH_RE.match(text) else UNSET
+        keys.append((dimension, text))
+    return keys
+
+
+@dataclass(frozen=True)
+class VaultStats:
+    """Snapshot of the aggregate counters.
+
+    Attributes:
+        total: Indexed notes.
+        schema_invalid: Notes that do not validate against their
+            Pydantic model (a subset of what ``dxva doctor`` flags).
+        counts: Notes per value, per dimension; most common first,
+            except months, which are chronological.
+    """
+
+    total: int
+    schema_invalid: int
+    counts: dict[str, dict[str, int]]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-data form, for JSON output."""
+        return {
+            "total": self.total,
+            "schema_invalid": self.schema_invalid,
+            **self.counts,
+        }
@@ -0,0 +1,430 @@
+"""Persistent SQLite index of every note's frontmatter.
+
+Table layout:
+
+- ``notes``: one row per note with its vault-relative ``path``, file
+  fingerprint, ``valid`` flag and one column per model field (see
+  ``IndexSchema``); scalar columns are indexed.
+- ``note_values``: one ``(note_id, field, value)`` row per item of a list
+  field (tags, aliases), case-folded and indexed on ``(field, value)``.
+- ``value_postings``: for each distinct list item, the sorted ids of the
+  notes that have it, delta-encoded (see ``postings``); rewritten only for
+  the items of notes that changed.
+- ``stats``: aggregate note counters per ``(dimension, value)`` (see
+  ``stats``), adjusted by the notes each refresh changes.
+- ``meta``: layout signature (a mismatch drops and rebuilds the tables)
+  and a generation counter bumped by every refresh that changes notes,
+  which derived caches compare against.
+
+``refresh`` stats every note and only re-reads those whose fingerprint
+changed, so keeping the index current costs one ``stat`` per note.
+"""
+
+import json
+import os
+import sqlite3
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+from typing import Any
+
+from dx_vault_atlas.services.vault_index.postings import encode_ids
+from dx_vault_atlas.services.vault_index.query import Query, compile_query
+from dx_vault_atlas.services.vault_index.schema import IndexSchema, NoteRecord
+from dx_vault_atlas.services.vault_index.stats import (
+    STAT_DIMENSIONS,
+    VALIDITY,
+    VaultStats,
+    stat_keys,
+)
+from dx_vault_atlas.shared.core.io import Fingerprint, file_fingerprint, iter_chunks
+from dx_vault_atlas.shared.logger import logger
+from dx_vault_atlas.shared.yaml_parser import YamlParseError, YamlParserService
+
+# Bump when the table layout changes (besides model columns)
+STORE_FORMAT = 3
+
+# Notes parsed per worker task
+INDEX_CHUNK_SIZE = 256
+
+# Below this many changed chunks, process start-up costs more than it saves
+_MIN_PARALLEL_CHUNKS = 4
+
+
+@dataclass(frozen=True)
+class IndexUpdate:
+    """What a refresh changed."""
+
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+
+    @property
+    def changed(self) -> bool:
+        """True if any note was added, updated or removed."""
+        return bool(self.added or self.updated or self.removed)
+
+
+def _read_frontmatter(
+    path: Path, parser: YamlParserService
+) -> dict[str, Any] | None:
+    """Parse the frontmatter of *path*, or None if it cannot be read."""
+    try:
+        return parser.parse(path.read_text(encoding="utf-8")).frontmatter
+    except (OSError, UnicodeDecodeError, YamlParseError) as e:
+        logger.debug(f"Metadata index: cannot parse {path.name}: {e}")
+        return None
+
+
+def _index_chunk(
+    paths: list[Path], schema: IndexSchema
+) -> list[tuple[Fingerprint | None, NoteRecord]]:
+    """Worker entry point: build the records of one chunk of notes."""
+    parser = YamlParserService()
+    return [
+        (file_fingerprint(path), schema.record(_read_frontmatter(path, parser)))
+        for path in paths
+    ]
+
+
+class MetadataIndex:
+    """SQLite index over the frontmatter of one vault."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        vault: Path,
+        schema: IndexSchema | None = None,
+        workers: int | None = None,
+    ) -> None:
+        """Open (creating if needed) the index at *db_path*.
+
+        Args:
+            db_path: SQLite database file.
+            vault: Vault root; stored paths are relative to it.
+            schema: Column layout; derived from the registry by default.
+            workers: Processes for large refreshes; defaults to the CPU count.
+        """
+        self.vault = vault
+        self.schema = schema or IndexSchema()
+        self.workers = workers or os.cpu_count() or 1
+        self._prefix = os.path.join(str(vault), "")  # noqa: PTH118 - str prefix fast path
+        # Cell position of each column counted by ``dxva stats``
+        self._stat_columns = {
+            column: self.schema.columns.index(self.schema.by_name[column])
+            for _, column in STAT_DIMENSIONS
+            if column in self.schema.by_name
+        }
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._ensure_tables()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self) -> "MetadataIndex":
+        """Use the index as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the connection on exit."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of indexed notes."""
+        return int(self.conn.execute("SELECT COUNT(*) FROM notes").fetchone()[0])
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every refresh that changes the index."""
+        row = self.conn.execute(
+            "SELECT value FROM meta WHERE key = 'generation'"
+        ).fetchone()
+        return int(row[0]) if row is not None else 0
+
+    # -- tables ---------------------------------------------------------------
+
+    def _ensure_tables(self) -> None:
+        """Create the tables, rebuilding them if the layout changed."""
+        signature = f"{STORE_FORMAT}:{self.schema.signature}"
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            row = self.conn.execute(
+                "SELECT value FROM meta WHERE key = 'layout'"
+            ).fetchone()
+            if row is not None and row[0] == signature:
+                return
+            if row is not None:
+                logger.info("Metadata index layout changed; rebuilding")
+            self.conn.execute("DROP TABLE IF EXISTS stats")
+            self.conn.execute("DROP TABLE IF EXISTS value_postings")
+            self.conn.execute("DROP TABLE IF EXISTS note_values")
+            self.conn.execute("DROP TABLE IF EXISTS notes")
+
+            columns = "".join(
+                f', "{c.name}" {c.sql_type}' for c in self.schema.columns
+            )
+            self.conn.execute(
+                "CREATE TABLE notes (id INTEGER PRIMARY KEY, path TEXT NOT NULL"
+                f" UNIQUE, mtime_ns INTEGER, size INTEGER, valid INTEGER{columns})"
+            )
+            for column in self.schema.columns:
+                if column.indexed:
+                    self.conn.execute(
+                        f'CREATE INDEX "ix_notes_{column.name}"'
+                        f' ON notes ("{column.name}")'
+                    )
+            self.conn.execute("CREATE INDEX ix_notes_valid ON notes (valid)")
+            self.conn.execute(
+                "CREATE TABLE note_values (note_id INTEGER NOT NULL, field TEXT"
+                " NOT NULL, value TEXT NOT NULL)"
+            )
+            self.conn.execute(
+                "CREATE INDEX ix_values_field ON note_values (field, value, note_id)"
+            )
+            self.conn.execute("CREATE INDEX ix_values_note ON note_values (note_id)")
+            self.conn.execute(
+                "CREATE TABLE value_postings (field TEXT NOT NULL, value TEXT NOT"
+                " NULL, df INTEGER NOT NULL, ids BLOB NOT NULL,"
+                " PRIMARY KEY (field, value)) WITHOUT ROWID"
+            )
+            self.conn.execute(
+                "CREATE TABLE stats (dimension TEXT NOT NULL, value TEXT NOT NULL,"
+                " notes INTEGER NOT NULL, PRIMARY KEY (dimension, value))"
+                " WITHOUT ROWID"
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('layout', ?)", (signature,)
+            )
+
+    # -- refresh --------------------------------------------------------------
+
+    def refresh(self, notes: Iterable[Path]) -> IndexUpdate:
+        """Bring the index in line with *notes* (a full vault scan)."""
+        known = {
+            path: (note_id, (mtime, size))
+            for note_id, path, mtime, size in self.conn.execute(
+                "SELECT id, path, mtime_ns, size FROM notes"
+            )
+        }
+        changed: list[Path] = []
+        stale: list[int] = []
+        for path in notes:
+            entry = known.pop(self._relative(path), None)
+            if entry is None:
+                changed.append(path)
+            elif entry[1] != file_fingerprint(path):
+                changed.append(path)
+                stale.append(entry[0])
+        removed = [note_id for note_id, _ in known.values()]
+
+        update = IndexUpdate(len(changed) - len(stale), len(stale), len(removed))
+        if not update.changed:
+            return update
+        with self.conn:
+            # Items the changed notes had before, plus those they have now
+            touched = self._values_of([*stale, *removed])
+            counters = self._stat_keys_of([*stale, *removed])
+            self._delete(removed)
+            for chunk in self._records(changed):
+                touched.update(self._upsert(chunk))
+                counters.update(self._record_stat_keys(chunk))
+            self._rebuild_postings(touched)
+            self._adjust_stats(counters)
+            self.conn.execute(
+                "INSERT INTO meta VALUES ('generation', 1) ON CONFLICT (key)"
+                " DO UPDATE SET value = value + 1"
+            )
+        return update
+
+    def _relative(self, path: Path) -> str:
+        """Vault-relative POSIX path of a scanned note."""
+        text = str(path)
+        if text.startswith(self._prefix):
+            # Scanned paths start with the vault root; skip Path.relative_to
+            return text[len(self._prefix) :].replace(os.sep, "/")
+        return path.relative_to(self.vault).as_posix()
+
+    def _records(
+        self, paths: list[Path]
+    ) -> Iterator[list[tuple[Path, Fingerprint | None, NoteRecord]]]:
+        """Yield the records of *paths* chunk by chunk, in parallel if large."""
+        chunks = list(iter_chunks(paths, INDEX_CHUNK_SIZE))
+        if self.workers <= 1 or len(chunks) < _MIN_PARALLEL_CHUNKS:
+            for chunk in chunks:
+                yield [
+                    (path, *entry)
+                    for path, entry in zip(
+                        chunk, _index_chunk(chunk, self.schema), strict=True
+                    )
+                ]
+            return
+
+        workers = min(self.workers, len(chunks))
+        logger.debug(f"Metadata index: {len(chunks)} chunks on {workers} workers")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_index_chunk, chunks, repeat(self.schema))
+            for chunk, entries in zip(chunks, results, strict=True):
+                yield [
+                    (path, *entry)
+                    for path, entry in zip(chunk, entries, strict=True)
+                ]
+
+    def _delete(self, note_ids: list[int]) -> None:
+        """Remove notes (and their list values) by id."""
+        rows = [(note_id,) for note_id in note_ids]
+        self.conn.executemany("DELETE FROM note_values WHERE note_id = ?", rows)
+        self.conn.executemany("DELETE FROM notes WHERE id = ?", rows)
+
+    def _values_of(self, note_ids: list[int]) -> set[tuple[str, str]]:
+        """``(field, value)`` list items of the given notes."""
+        values: set[tuple[str, str]] = set()
+        for note_id in note_ids:
+            values.update(
+                self.conn.execute(
+                    "SELECT field, value FROM note_values WHERE note_id = ?",
+                    (note_id,),
+                )
+            )
+        return values
+
+    def _rebuild_postings(self, values: set[tuple[str, str]]) -> None:
+        """Rewrite the id postings of the given list items."""
+        for field_name, value in values:
+            ids = [
+                note_id
+                for (note_id,) in self.conn.execute(
+                    "SELECT DISTINCT note_id FROM note_values"
+                    " WHERE field = ? AND value = ? ORDER BY note_id",
+                    (field_name, value),
+                )
+            ]
+            if ids:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO value_postings VALUES (?, ?, ?, ?)",
+                    (field_name, value, len(ids), encode_ids(ids)),
+                )
+            else:
+                self.conn.execute(
+                    "DELETE FROM value_postings WHERE field = ? AND value = ?",
+                    (field_name, value),
+                )
+
+    def _stat_keys_of(self, note_ids: list[int]) -> Counter[tuple[str, str]]:
+        """Counters the given notes contribute to, negated (to subtract)."""
+        columns = "".join(f', "{column}"' for column in self._stat_columns)
+        keys: Counter[tuple[str, str]] = Counter()
+        for note_id in note_ids:
+            row = self.conn.execute(
+                f"SELECT valid{columns} FROM notes WHERE id = ?", (note_id,)
+            ).fetchone()
+            if row is not None:
+                values = dict(zip(self._stat_columns, row[1:], strict=True))
+                keys.subtract(stat_keys(bool(row[0]), values))
+        return keys
+
+    def _record_stat_keys(
+        self, rows: list[tuple[Path, Fingerprint | None, NoteRecord]]
+    ) -> Counter[tuple[str, str]]:
+        """Counters a chunk of freshly parsed notes contributes to."""
+        keys: Counter[tuple[str, str]] = Counter()
+        for _path, _fingerprint, record in rows:
+            values = {
+                column: record.cells[position]
+                for column, position in self._stat_columns.items()
+            }
+            keys.update(stat_keys(record.valid, values))
+        return keys
+
+    def _adjust_stats(self, deltas: Counter[tuple[str, str]]) -> None:
+        """Apply counter deltas, dropping counters that reach zero."""
+        changes = [(*key, delta) for key, delta in deltas.items() if delta]
+        self.conn.executemany(
+            "INSERT INTO stats VALUES (?, ?, ?) ON CONFLICT (dimension, value)"
+            " DO UPDATE SET notes = notes + excluded.notes",
+            changes,
+        )
+        self.conn.execute("DELETE FROM stats WHERE notes <= 0")
+
+    def _upsert(
+        self, rows: list[tuple[Path, Fingerprint | None, NoteRecord]]
+    ) -> set[tuple[str, str]]:
+        """Insert or update a chunk of notes, keeping their ids stable.
+
+        Returns:
+            The ``(field, value)`` list items the notes now have.
+        """
+        names = ["path", "mtime_ns", "size", "valid"]
+        names += [column.name for column in self.schema.columns]
+        quoted = ", ".join(f'"{name}"' for name in names)
+        updates = ", ".join(f'"{name}" = excluded."{name}"' for name in names[1:])
+        sql = (
+            f"INSERT INTO notes ({quoted}) VALUES ({', '.join('?' * len(names))})"
+            f" ON CONFLICT(path) DO UPDATE SET {updates}"
+        )
+
+        notes: list[tuple[Any, ...]] = []
+        values: list[tuple[str, str, str]] = []
+        for path, fingerprint, record in rows:
+            rel = self._relative(path)
+            mtime, size = fingerprint if fingerprint is not None else (None, None)
+            notes.append((rel, mtime, size, int(record.valid), *record.cells))
+            values.extend(
+                (name, item.casefold(), rel)
+                for name, items in record.lists.items()
+                for item in items
+            )
+
+        self.conn.executemany(sql, notes)
+        self.conn.executemany(
+            "DELETE FROM note_values"
+            " WHERE note_id = (SELECT id FROM notes WHERE path = ?)",
+            [(note[0],) for note in notes],
+        )
+        self.conn.executemany(
+            "INSERT INTO note_values (note_id, field, value)"
+            " SELECT id, ?, ? FROM notes WHERE path = ?",
+            values,
+        )
+        return {(name, item) for name, item, _ in values}
+
+    # -- queries --------------------------------------------------------------
+
+    def stats(self) -> VaultStats:
+        """Read the aggregate counters."""
+        counts: dict[str, dict[str, int]] = {
+            dimension: {} for dimension, _ in STAT_DIMENSIONS
+        }
+        for dimension, value, notes in self.conn.execute(
+            "SELECT dimension, value, notes FROM stats"
+            " ORDER BY dimension, notes DESC, value"
+        ):
+            counts.setdefault(dimension, {})[value] = notes
+        validity = counts.pop(VALIDITY, {})
+        counts["month"] = dict(sorted(counts["month"].items()))
+        return VaultStats(
+            total=sum(validity.values()),
+            schema_invalid=validity.get("invalid", 0),
+            counts=counts,
+        )
+
+    def query(self, query: Query) -> list[dict[str, Any]]:
+        """Run *query*; list fields come back as lists."""
+        sql, params = compile_query(query)
+        names = [column.name for column in query.fields]
+        lists = [column.kind == "list" for column in query.fields]
+        return [
+            {
+                name: (json.loads(value) if is_list and value else value)
+                for name, is_list, value in zip(names, lists, row, strict=True)
+            }
+            for row in self.conn.execute(sql, params)
+        ]
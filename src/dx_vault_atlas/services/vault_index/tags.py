@@ -0,0 +1,259 @@
+"""Set-algebra queries over tag and alias postings, for ``dxva tags``.
+
+Expressions combine tags with ``&`` (and), ``|`` (or), ``!`` (not) and
+parentheses; ``!`` binds tightest, then ``&``, then ``|``::
+
+    work & !archived
+    (python | rust) & !"to read"
+
+Tags are matched case-insensitively. Each tag's note ids are read from
+its delta-encoded postings and turned into a bitmap (a Python ``int``),
+so ``&``, ``|`` and ``!`` are single big-integer operations. Only the
+postings named in the expression are loaded.
+"""
+
+import re
+from dataclasses import dataclass
+
+from dx_vault_atlas.services.vault_index.postings import decode_ids
+from dx_vault_atlas.services.vault_index.query import QueryError
+from dx_vault_atlas.services.vault_index.store import MetadataIndex
+from dx_vault_atlas.shared.core.io import iter_chunks
+
+_TOKEN_RE = re.compile(r'\s*(?:([&|!()])|"([^"]*)"|([^\s&|!()"]+))')
+
+# Ids whose path and title are fetched per round trip
+_FETCH_BATCH = 512
+
+
+# -- expressions ----------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Tag:
+    """A single tag."""
+
+    name: str
+
+
+@dataclass(frozen=True)
+class Not:
+    """Notes without *operand*."""
+
+    operand: "TagExpr"
+
+
+@dataclass(frozen=True)
+class And:
+    """Notes in both operands."""
+
+    left: "TagExpr"
+    right: "TagExpr"
+
+
+@dataclass(frozen=True)
+class Or:
+    """Notes in either operand."""
+
+    left: "TagExpr"
+    right: "TagExpr"
+
+
+TagExpr = Tag | Not | And | Or
+
+
+def _tokenize(text: str) -> list[tuple[str, str]]:
+    """Split an expression into ``(kind, text)`` tokens."""
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if match is None or match.end() == pos:
+            if text[pos:].strip():
+                raise QueryError(f"Unexpected {text[pos:].strip()!r} in tag expression")
+            break
+        op, quoted, name = match.groups()
+        if op is not None:
+            tokens.append(("op", op))
+        elif quoted is not None or name is not None:
+            tokens.append(("tag", quoted if quoted is not None else name))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser for tag expressions."""
+
+    def __init__(self, text: str) -> None:
+        """Tokenize *text* for parsing."""
+        self.tokens = _tokenize(text)
+        self.pos = 0
+
+    def _peek(self) -> tuple[str, str] | None:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _accept(self, op: str) -> bool:
+        if self._peek() == ("op", op):
+            self.pos += 1
+            return True
+        return False
+
+    def parse(self) -> TagExpr:
+        """Parse the whole expression."""
+        if not self.tokens:
+            raise QueryError("Empty tag expression")
+        expr = self._or()
+        token = self._peek()
+        if token is not None:
+            raise QueryError(f"Unexpected {token[1]!r} in tag expression")
+        return expr
+
+    def _or(self) -> TagExpr:
+        expr = self._and()
+        while self._accept("|"):
+            expr = Or(expr, self._and())
+        return expr
+
+    def _and(self) -> TagExpr:
+        expr = self._not()
+        while self._accept("&"):
+            expr = And(expr, self._not())
+        return expr
+
+    def _not(self) -> TagExpr:
+        if self._accept("!"):
+            return Not(self._not())
+        return self._atom()
+
+    def _atom(self) -> TagExpr:
+        token = self._peek()
+        if token is None:
+            raise QueryError("Tag expression ends unexpectedly")
+        if self._accept("("):
+            expr = self._or()
+            if not self._accept(")"):
+                raise QueryError("Missing ')' in tag expression")
+            return expr
+        if token[0] != "tag":
+            raise QueryError(f"Unexpected {token[1]!r} in tag expression")
+        self.pos += 1
+        return Tag(token[1].lstrip("#"))
+
+
+def parse_tag_expression(text: str) -> TagExpr:
+    """Parse a tag expression.
+
+    Raises:
+        QueryError: On syntax errors.
+    """
+    return _Parser(text).parse()
+
+
+# -- bitmaps --------------------------------------------------------------------
+
+
+def _bitmap(ids: list[int]) -> int:
+    """Bitmap with the bits of sorted *ids* set."""
+    if not ids:
+        return 0
+    bits = bytearray((ids[-1] >> 3) + 1)
+    for note_id in ids:
+        bits[note_id >> 3] |= 1 << (note_id & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _members(bitmap: int) -> list[int]:
+    """Sorted ids whose bits are set in *bitmap*."""
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    ids: list[int] = []
+    for index, byte in enumerate(data):
+        if byte:
+            base = index << 3
+            ids.extend(base + bit for bit in range(8) if byte >> bit & 1)
+    return ids
+
+
+# -- index ----------------------------------------------------------------------
+
+
+class TagIndex:
+    """Tag and alias queries over a metadata index's postings."""
+
+    def __init__(self, index: MetadataIndex) -> None:
+        """Query the postings of *index* (already refreshed)."""
+        self.conn = index.conn
+        self._universe: int | None = None
+
+    def ids(self, field_name: str, value: str) -> list[int]:
+        """Sorted ids of the notes whose *field_name* contains *value*."""
+        row = self.conn.execute(
+            "SELECT ids FROM value_postings WHERE field = ? AND value = ?",
+            (field_name, value.casefold()),
+        ).fetchone()
+        return decode_ids(row[0]) if row is not None else []
+
+    def _all(self) -> int:
+        """Bitmap of every indexed note (for ``!``)."""
+        if self._universe is None:
+            ids = [note_id for (note_id,) in self.conn.execute(
+                "SELECT id FROM notes ORDER BY id"
+            )]
+            self._universe = _bitmap(ids)
+        return self._universe
+
+    def _evaluate(self, expr: TagExpr) -> int:
+        """Bitmap of the notes matching *expr*."""
+        if isinstance(expr, Tag):
+            return _bitmap(self.ids("tags", expr.name))
+        if isinstance(expr, Not):
+            return self._all() & ~self._evaluate(expr.operand)
+        if isinstance(expr, And):
+            return self._evaluate(expr.left) & self._evaluate(expr.right)
+        return self._evaluate(expr.left) | self._evaluate(expr.right)
+
+    def notes(self, ids: list[int]) -> list[dict[str, str]]:
+        """``path`` and ``title`` of the given notes, sorted by path."""
+        rows: list[dict[str, str]] = []
+        for batch in iter_chunks(ids, _FETCH_BATCH):
+            rows.extend(
+                {"path": path, "title": title}
+                for path, title in self.conn.execute(
+                    "SELECT path, title FROM notes WHERE id IN"
+                    f" ({', '.join('?' * len(batch))})",
+                    batch,
+                )
+            )
+        return sorted(rows, key=lambda row: row["path"])
+
+    def query(self, expr: TagExpr) -> list[dict[str, str]]:
+        """Notes matching a parsed tag expression."""
+        return self.notes(_members(self._evaluate(expr)))
+
+    def resolve_alias(self, alias: str) -> list[dict[str, str]]:
+        """Notes that declare *alias*."""
+        return self.notes(self.ids("aliases", alias))
+
+    def frequencies(
+        self, field_name: str = "tags", limit: int | None = None
+    ) -> list[tuple[str, int]]:
+        """``(value, note count)`` pairs, most frequent first."""
+        sql = (
+            "SELECT value, df FROM value_postings WHERE field = ?"
+            " ORDER BY df DESC, value"
+        )
+        params: list[str | int] = [field_name]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return list(self.conn.execute(sql, params))
+
+    def summary(self, field_name: str = "tags") -> tuple[int, int]:
+        """``(distinct values, notes with at least one)`` for *field_name*."""
+        (distinct,) = self.conn.execute(
+            "SELECT COUNT(*) FROM value_postings WHERE field = ?", (field_name,)
+        ).fetchone()
+        (notes,) = self.conn.execute(
+            "SELECT COUNT(DISTINCT note_id) FROM note_values WHERE field = ?",
+            (field_name,),
+        ).fetchone()
+        return distinct, notes
@@ -0,0 +1,290 @@
+"""Prefix trie over note titles and aliases, for ``up`` link autocomplete.
+
+Every note contributes its names: the frontmatter ``title``, each alias
+and the filename stem, sanitized (see ``TitleNormalizer.sanitize``) and
+de-duplicated. Each name is keyed once per word, by the suffix starting
+at that word, so ``learning`` finds ``Machine Learning``; a filename is
+keyed by its start only, unless the note has no other name.
+
+The trie is laid out as one sorted list of keys: the subtree of a prefix
+is the contiguous slice ``[lo, hi)`` found with two bisections, and a
+node's children are enumerated by jumping from one first character to
+the next. Alongside each key, ``packed`` holds its static rank in the
+high bits and its name id in the low bits, so the best matches of a
+prefix are the smallest integers of a slice, picked without any Python
+key function.
+
+Queries are fuzzy in two ways: every typed word must prefix some word of
+the name (in any order), and when the most selective word has too few
+matches, its one-edit variants that exist in the trie (deletion,
+transposition, substitution, insertion) are tried with a rank penalty.
+"""
+
+import base64
+import heapq
+import json
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+from dx_vault_atlas.services.vault_index.store import MetadataIndex
+from dx_vault_atlas.shared.logger import logger
+from dx_vault_atlas.shared.utils.title_normalizer import TitleNormalizer
+
+# Bump when the on-disk layout changes; older files are rebuilt
+TRIE_FORMAT = 1
+
+# Kinds of name, best first
+TITLE, ALIAS, FILENAME = 0, 1, 2
+
+_ID_BITS = 32
+_ID_MASK = (1 << _ID_BITS) - 1
+_MAX_LENGTH = 0xFFF
+_TYPO_PENALTY = 1 << 60
+
+# Upper bound of every key that starts with a given prefix
+_PREFIX_END = chr(0x10FFFF)
+
+# Candidates ranked per window before falling back to a full sort
+_WINDOW_FACTOR = 8
+
+# Typed words shorter than this are never corrected
+_MIN_FUZZY_LENGTH = 3
+
+
+def name_words(text: str) -> list[str]:
+    """Sanitized words of a title, alias or filename."""
+    return [word for word in TitleNormalizer.sanitize(text).split("_") if word]
+
+
+def _rank(kind: int, word_position: int, length: int) -> int:
+    """Static rank of a key: start-of-name, then kind, then shorter names."""
+    later = 1 if word_position else 0
+    return ((later << 14) | (kind << 12) | min(length, _MAX_LENGTH)) << _ID_BITS
+
+
+class TitleTrie:
+    """Sorted-array trie mapping name prefixes to link targets."""
+
+    def __init__(self) -> None:
+        """Create an empty trie."""
+        self.targets: list[str] = []
+        self.names: list[str] = []
+        self.name_target = array("I")
+        self.keys: list[str] = []
+        self.packed = array("Q")
+
+    def __len__(self) -> int:
+        """Number of link targets."""
+        return len(self.targets)
+
+    # -- building -------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls, notes: Iterable[tuple[str, str | None, list[str]]]
+    ) -> "TitleTrie":
+        """Build the trie from ``(link target, title, aliases)`` triples."""
+        trie = cls()
+        entries: list[tuple[str, int]] = []
+        for target, title, aliases in notes:
+            target_id = len(trie.targets)
+            trie.targets.append(target)
+            named: dict[str, int] = {}
+            for kind, text in (
+                (TITLE, title),
+                *((ALIAS, alias) for alias in aliases),
+                (FILENAME, target),
+            ):
+                words = name_words(text) if text else []
+                if words:
+                    named.setdefault("_".join(words), kind)
+
+            for name, kind in named.items():
+                name_id = len(trie.names)
+                trie.names.append(name)
+                trie.name_target.append(target_id)
+                # A filename beside a title is only matched from its start
+                words = name.split("_")
+                if kind == FILENAME and len(named) > 1:
+                    words = words[:1]
+                start = 0
+                for position, word in enumerate(words):
+                    entries.append(
+                        (name[start:], _rank(kind, position, len(name)) | name_id)
+                    )
+                    start += len(word) + 1
+
+        entries.sort()
+        trie.keys = [key for key, _ in entries]
+        trie.packed = array("Q", [packed for _, packed in entries])
+        return trie
+
+    @classmethod
+    def from_index(cls, index: MetadataIndex) -> "TitleTrie":
+        """Build the trie from the notes of a metadata index."""
+        rows = index.conn.execute(
+            'SELECT path, "title", "aliases" FROM notes ORDER BY path'
+        )
+        return cls.build(
+            (
+                PurePosixPath(path).stem,
+                title,
+                json.loads(aliases) if aliases else [],
+            )
+            for path, title, aliases in rows
+        )
+
+    # -- queries --------------------------------------------------------------
+
+    def _range(self, prefix: str) -> tuple[int, int]:
+        """Slice of the keys that start with *prefix*."""
+        lo = bisect_left(self.keys, prefix)
+        return lo, bisect_left(self.keys, prefix + _PREFIX_END, lo)
+
+    def _children(self, prefix: str) -> Iterator[str]:
+        """Characters that follow *prefix* in some key, in order."""
+        lo, hi = self._range(prefix)
+        depth = len(prefix)
+        while lo < hi:
+            key = self.keys[lo]
+            if len(key) == depth:
+                lo += 1
+                continue
+            char = key[depth]
+            yield char
+            lo = bisect_left(self.keys, prefix + chr(ord(char) + 1), lo, hi)
+
+    def _variants(self, word: str) -> Iterator[str]:
+        """One-edit variants of *word* that prefix some key."""
+        seen = {word}
+        candidates: list[str] = []
+        for i in range(len(word)):
+            candidates.append(word[:i] + word[i + 1 :])
+            if i + 1 < len(word):
+                candidates.append(word[:i] + word[i + 1] + word[i] + word[i + 2 :])
+        for i in range(1, len(word) + 1):
+            for char in self._children(word[: i - 1]):
+                candidates.append(word[: i - 1] + char + word[i:])
+                candidates.append(word[: i - 1] + char + word[i - 1 :])
+        for candidate in candidates:
+            if candidate and candidate not in seen:
+                seen.add(candidate)
+                lo, hi = self._range(candidate)
+                if lo < hi:
+                    yield candidate
+
+    def _ranked(self, lo: int, hi: int, wanted: int) -> Iterator[int]:
+        """Packed values of ``[lo, hi)``, best first.
+
+        The best ``wanted`` are taken with a heap; the rest of the slice is
+        sorted only if the caller keeps consuming.
+        """
+        window = self.packed[lo:hi]
+        if len(window) <= wanted:
+            yield from sorted(window)
+            return
+        best = heapq.nsmallest(wanted, window)
+        yield from best
+        yield from sorted(window)[wanted:]
+
+    def complete(self, text: str, limit: int = 10) -> list[str]:
+        """Return up to *limit* link targets matching *text*, best first."""
+        words = name_words(text)
+        if not words or not self.keys:
+            return []
+        # The longest word is the most selective; the others filter
+        driver = max(words, key=len)
+        rest = list(words)
+        rest.remove(driver)
+
+        scores: dict[int, int] = {}
+        self._collect(driver, 0, rest, limit, scores)
+        if len(scores) < limit and len(driver) >= _MIN_FUZZY_LENGTH:
+            for variant in self._variants(driver):
+                self._collect(variant, _TYPO_PENALTY, rest, limit, scores)
+        best = heapq.nsmallest(limit, scores.items(), key=lambda item: item[1])
+        return [self.targets[target_id] for target_id, _ in best]
+
+    def _collect(
+        self,
+        prefix: str,
+        penalty: int,
+        rest: list[str],
+        limit: int,
+        scores: dict[int, int],
+    ) -> None:
+        """Record the best score of each target matching *prefix* and *rest*."""
+        lo, hi = self._range(prefix)
+        found = 0
+        for packed in self._ranked(lo, hi, limit * _WINDOW_FACTOR):
+            name_id = packed & _ID_MASK
+            if rest:
+                words = self.names[name_id].split("_")
+                if not all(
+                    any(word.startswith(part) for word in words)
+                    for part in rest
+                ):
+                    continue
+            target_id = self.name_target[name_id]
+            score = packed + penalty
+            previous = scores.get(target_id)
+            if previous is None:
+                found += 1
+            if previous is None or score < previous:
+                scores[target_id] = score
+            if found >= limit:
+                return
+
+    # -- persistence ----------------------------------------------------------
+
+    def to_dict(self, generation: int) -> dict[str, Any]:
+        """Serialize to the on-disk JSON layout."""
+        return {
+            "format": TRIE_FORMAT,
+            "generation": generation,
+            "targets": self.targets,
+            "names": "\n".join(self.names),
+            "keys": "\n".join(self.keys),
+            "name_target": base64.b64encode(self.name_target.tobytes()).decode(),
+            "packed": base64.b64encode(self.packed.tobytes()).decode(),
+        }
+
+    def save(self, path: Path, generation: int) -> None:
+        """Write the trie atomically to *path*, tagged with *generation*."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps(self.to_dict(generation), ensure_ascii=False), encoding="utf-8"
+        )
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path, generation: int) -> "TitleTrie | None":
+        """Load the trie at *path*, or None if absent or of another generation."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable title trie {path}: {e}")
+            return None
+        if data.get("format") != TRIE_FORMAT or data.get("generation") != generation:
+            return None
+
+        trie = cls()
+        try:
+            trie.targets = data["targets"]
+            trie.names = data["names"].split("\n") if data["names"] else []
+            trie.keys = data["keys"].split("\n") if data["keys"] else []
+            trie.name_target.frombytes(base64.b64decode(data["name_target"]))
+            trie.packed.frombytes(base64.b64decode(data["packed"]))
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring malformed title trie {path}: {e}")
+            return None
+        if len(trie.keys) != len(trie.packed):
+            logger.warning(f"Ignoring inconsistent title trie {path}")
+            return None
+        return trie
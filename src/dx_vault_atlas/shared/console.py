@@ -1,29 +1,42 @@
-"""Shared console interface for interactive CLI using questionary and Rich."""
+"""Shared console interface for interactive CLI using questionary and Rich.
+
+questionary (and prompt_toolkit under it) is imported by the prompts
+themselves, so commands that only print never load it.
+"""
 
 from enum import Enum
-from typing import TypeVar
+from functools import cache
+from typing import TYPE_CHECKING, TypeVar
 
-import questionary
-from questionary import Choice
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
+from dx_vault_atlas.shared.profiling import stage
+
+if TYPE_CHECKING:
+    import questionary
+
 _E = TypeVar("_E", bound=Enum)
 
 console = Console()
 
-# Style for questionary prompts
-MENU_STYLE = questionary.Style(
-    [
-        ("qmark", "bold cyan"),
-        ("question", ""),
-        ("pointer", "bold cyan"),
-        ("highlighted", "bold"),
-        ("selected", "cyan"),
-        ("answer", "bold cyan"),
-    ]
-)
+
+@cache
+def _menu_style() -> "questionary.Style":
+    """Style for questionary prompts."""
+    import questionary
+
+    return questionary.Style(
+        [
+            ("qmark", "bold cyan"),
+            ("question", ""),
+            ("pointer", "bold cyan"),
+            ("highlighted", "bold"),
+            ("selected", "cyan"),
+            ("answer", "bold cyan"),
+        ]
+    )
 
 
 class UserQuitError(Exception):
@@ -101,13 +114,16 @@ def query(prompt_text: str, default: str = "", allow_empty: bool = False) -> str
         UserQuitError: If user presses Ctrl+Q.
         KeyboardInterrupt: If user presses Ctrl+C.
     """
+    import questionary
+
     while True:
-        result = questionary.text(
-            prompt_text,
-            default=default,
-            qmark="●",
-            style=MENU_STYLE,
-        ).ask()
+        with stage("tui"):
+            result = questionary.text(
+                prompt_text,
+                default=default,
+                qmark="●",
+                style=_menu_style(),
+            ).ask()
 
         if result is None:
             raise KeyboardInterrupt
@@ -143,6 +159,9 @@ def choose_enum[E: Enum](
     Raises:
         UserQuitError: If user presses Q.
     """
+    import questionary
+    from questionary import Choice
+
     members = list(enum_cls)
 
     # Build choices with display names
@@ -162,14 +181,15 @@ def choose_enum[E: Enum](
     if show_quit:
         prompt_label = f"{label} [dim](q to quit)[/dim]"
 
-    result = questionary.select(
-        prompt_label,
-        choices=choices,
-        default=choices[default_index] if choices else None,
-        qmark="●",
-        style=MENU_STYLE,
-        use_shortcuts=False,
-    ).ask()
+    with stage("tui"):
+        result = questionary.select(
+            prompt_label,
+            choices=choices,
+            default=choices[default_index] if choices else None,
+            qmark="●",
+            style=_menu_style(),
+            use_shortcuts=False,
+        ).ask()
 
     if result is None:
         raise KeyboardInterrupt
@@ -182,12 +202,15 @@ def choose_enum[E: Enum](
 
 def confirm(message: str, default: bool = True) -> bool:
     """Ask for confirmation."""
-    result = questionary.confirm(
-        message,
-        default=default,
-        qmark="●",
-        style=MENU_STYLE,
-    ).ask()
+    import questionary
+
+    with stage("tui"):
+        result = questionary.confirm(
+            message,
+            default=default,
+            qmark="●",
+            style=_menu_style(),
+        ).ask()
 
     if result is None:
         raise KeyboardInterrupt
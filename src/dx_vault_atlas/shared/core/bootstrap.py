@@ -7,8 +7,6 @@ from dx_vault_atlas.shared.config import (
     GlobalConfig,
     get_config_manager,
 )
-from dx_vault_atlas.shared.console import console
-from dx_vault_atlas.shared.tui.config_wizard import run_setup_wizard
 
 
 def _exit_app(code: int = 0) -> NoReturn:
@@ -30,6 +28,10 @@ def ensure_config_exists() -> GlobalConfig:
     if manager.exists():
         return manager.load()
 
+    # Only a first run needs the console and the wizard
+    from dx_vault_atlas.shared.console import console
+    from dx_vault_atlas.shared.tui.config_wizard import run_setup_wizard
+
     # If we are here, we need to run setup
     # Note: We are running TUI here, which prints to stdout.
     # This is acceptable for a bootstrap process that initiates interaction.
@@ -0,0 +1,144 @@
+"""Two-phase bulk rename with a rollback journal.
+
+A plan of ``(source, target)`` moves is applied in two phases:
+
+1. every source is moved to a hidden temporary name in its directory;
+2. every temporary name is moved to its final target.
+
+Because all sources are vacated before any target is taken, plans with
+chains and cycles (``a -> b``, ``b -> a``) apply cleanly. The plan and the
+current phase are written to a journal before each phase. If a rename
+fails, everything is rolled back; if the process dies, the journal lets
+``RenameTransaction.recover`` finish or undo the transaction.
+"""
+
+import json
+import os
+import uuid
+from pathlib import Path
+
+from dx_vault_atlas.shared.logger import logger
+
+_PREPARE = "prepare"
+_COMMIT = "commit"
+
+# Suffix of the hidden temporary names used in phase 1
+_TMP_SUFFIX = ".dxva-tmp"
+
+
+class RenameError(Exception):
+    """A bulk rename failed and was rolled back."""
+
+
+class RenameTransaction:
+    """Applies a rename plan atomically as far as the filesystem allows."""
+
+    def __init__(self, plan: list[tuple[Path, Path]], journal: Path) -> None:
+        """Initialise with the plan and the journal location.
+
+        Args:
+            plan: ``(source, target)`` pairs; targets must be free, except
+                for names vacated by other sources in the same plan.
+            journal: Where the rollback journal is written.
+        """
+        self.journal = journal
+        token = uuid.uuid4().hex[:8]
+        self.moves = [
+            (src, src.with_name(f".{src.name}.{token}{_TMP_SUFFIX}"), dst)
+            for src, dst in plan
+        ]
+
+    def apply(self) -> None:
+        """Run both phases, rolling back everything on failure.
+
+        Raises:
+            RenameError: If any rename failed (the vault is restored).
+        """
+        staged = committed = 0
+        try:
+            self._write_journal(_PREPARE)
+            for src, tmp, _dst in self.moves:
+                src.rename(tmp)
+                staged += 1
+
+            self._write_journal(_COMMIT)
+            for _src, tmp, dst in self.moves:
+                if dst.exists():
+                    msg = f"Target appeared during rename: {dst}"
+                    raise FileExistsError(msg)
+                tmp.rename(dst)
+                committed += 1
+        except OSError as e:
+            logger.error(f"Bulk rename failed, rolling back: {e}")
+            self._rollback(staged, committed)
+            self.journal.unlink(missing_ok=True)
+            msg = f"Bulk rename rolled back: {e}"
+            raise RenameError(msg) from e
+
+        self.journal.unlink(missing_ok=True)
+
+    @staticmethod
+    def recover(journal: Path) -> int:
+        """Finish or undo a transaction interrupted by a crash.
+
+        An interrupted first phase is undone (temporary names back to their
+        sources). An interrupted second phase is completed, since every
+        source has already been vacated.
+
+        Returns:
+            Number of files moved out of temporary names.
+        """
+        try:
+            data = json.loads(journal.read_text(encoding="utf-8"))
+            phase = data["phase"]
+            moves = [(Path(s), Path(t), Path(d)) for s, t, d in data["moves"]]
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.error(f"Unreadable rename journal {journal}: {e}")
+            return 0
+
+        moved = 0
+        for src, tmp, dst in moves:
+            if not tmp.exists():
+                continue
+            target = dst if phase == _COMMIT and not dst.exists() else src
+            if target.exists():
+                logger.error(f"Cannot recover {tmp}: {target} exists")
+                continue
+            try:
+                tmp.rename(target)
+                moved += 1
+            except OSError as e:
+                logger.error(f"Cannot recover {tmp}: {e}")
+        journal.unlink(missing_ok=True)
+        logger.info(f"Recovered interrupted bulk rename ({phase}): {moved} files")
+        return moved
+
+    def _rollback(self, staged: int, committed: int) -> None:
+        """Undo the first *committed* final moves, then *staged* temp moves."""
+        for _src, tmp, dst in reversed(self.moves[:committed]):
+            try:
+                dst.rename(tmp)
+            except OSError as e:
+                logger.error(f"Rollback could not move {dst} back: {e}")
+        for src, tmp, _dst in self.moves[:staged]:
+            try:
+                tmp.rename(src)
+            except OSError as e:
+                logger.error(f"Rollback could not restore {src}: {e}")
+
+    def _write_journal(self, phase: str) -> None:
+        """Persist the plan and *phase* before touching any file."""
+        self.journal.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.journal.with_suffix(".tmp")
+        payload = {
+            "phase": phase,
+            "moves": [[str(s), str(t), str(d)] for s, t, d in self.moves],
+        }
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(payload, f)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp.replace(self.journal)
+
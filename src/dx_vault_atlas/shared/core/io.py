@@ -1,13 +1,39 @@
 """Shared I/O and File Repository utilities for reading/writing notes."""
 
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any, Protocol
 
+from dx_vault_atlas.shared.logger import logger
+from dx_vault_atlas.shared.profiling import stage
 from dx_vault_atlas.shared.yaml_parser import (
     ParsedNote,
     YamlParserService,
 )
-from dx_vault_atlas.shared.logger import logger
+
+# ``(st_mtime_ns, st_size)`` — cheap change detection without reading a file
+Fingerprint = tuple[int, int]
+
+
+def file_fingerprint(path: Path) -> Fingerprint | None:
+    """Return the fingerprint of *path*, or None if it cannot be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def iter_chunks[T](items: Iterable[T], size: int) -> Iterable[list[T]]:
+    """Yield successive lists of at most *size* items."""
+    chunk: list[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
 
 class FileRepository(Protocol):
@@ -31,7 +57,8 @@ class LocalFileRepository(FileRepository):
 
     def read_text(self, path: Path) -> str:
         """Read text from a local file using UTF-8 encoding."""
-        return path.read_text(encoding="utf-8")
+        with stage("read"):
+            return path.read_text(encoding="utf-8")
 
     def target_exists(self, path: Path) -> bool:
         """Check if a local file exists."""
@@ -39,7 +66,8 @@ class LocalFileRepository(FileRepository):
 
     def write_text(self, path: Path, content: str) -> None:
         """Write text to a local file using UTF-8 encoding."""
-        path.write_text(content, encoding="utf-8")
+        with stage("write"):
+            path.write_text(content, encoding="utf-8")
 
 
 class NoteIOService:
@@ -86,6 +114,12 @@ class NoteIOService:
         if old_path == new_path:
             return True
         try:
+            # Case-only renames on case-insensitive filesystems hit the same file
+            if new_path.exists() and not new_path.samefile(old_path):
+                logger.error(
+                    f"Refusing to rename {old_path.name}: {new_path.name} exists"
+                )
+                return False
             old_path.rename(new_path)
             return True
         except Exception as e:
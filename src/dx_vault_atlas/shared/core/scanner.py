@@ -1,8 +1,10 @@
 """Shared vault scanner."""
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from pathlib import Path
 
+from dx_vault_atlas.shared.profiling import timed_iter
+
 
 class VaultScanner:
     """Scans the vault for markdown files using a generator."""
@@ -18,11 +20,13 @@ class VaultScanner:
         """
         self.exclude_dirs = exclude_dirs or self.DEFAULT_EXCLUDES
 
-    def scan(self, vault_path: Path) -> Generator[Path, None, None]:
+    def scan(self, vault_path: Path, ordered: bool = False) -> Iterator[Path]:
         """Yield all markdown files in the vault recursively.
 
         Args:
             vault_path: Path to the vault root directory.
+            ordered: Visit directories and files in name order, so the
+                output order is stable across runs and filesystems.
 
         Yields:
             Path objects for each markdown file found.
@@ -30,6 +34,12 @@ class VaultScanner:
         Raises:
             ValueError: If vault_path is not a directory.
         """
+        return timed_iter("scan", self._walk(vault_path, ordered))
+
+    def _walk(
+        self, vault_path: Path, ordered: bool
+    ) -> Generator[Path, None, None]:
+        """Generator behind ``scan``."""
         import os
 
         if not vault_path.is_dir():
@@ -41,6 +51,10 @@ class VaultScanner:
                 d for d in dirs if not d.startswith(".") and d not in self.exclude_dirs
             ]
 
+            if ordered:
+                dirs.sort()
+                files = sorted(files)
+
             root_path = Path(root_str)
             for file in files:
                 if file.endswith(".md") and not file.startswith("."):
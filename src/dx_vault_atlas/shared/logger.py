@@ -3,6 +3,10 @@
 Follows Skill 07: Observability & UX.
 - File-only logging (Zero Print policy for internals).
 - Structured format for easy parsing.
+
+Nothing touches the disk at import: the log directory and file are
+created by the first record written, so commands that never log (or
+only ``--help``) start without any filesystem work.
 """
 
 import logging
@@ -15,10 +19,57 @@ from dx_vault_atlas.shared.paths import APP_NAME
 
 # Constants
 # Skill 01: Pathlib usage mandatory
-LOG_DIR = Path(user_log_dir(APP_NAME, ensure_exists=True))
+LOG_DIR = Path(user_log_dir(APP_NAME))
 LOG_FILE = LOG_DIR / "app.log"
 
 
+class _DeferredFileHandler(logging.Handler):
+    """Rotating log file (5 MB, 3 backups) created by the first record.
+
+    The directory, the file and the ``logging.handlers`` machinery are
+    only set up when something is logged. If the file cannot be created,
+    a warning is written to stderr once and later records are dropped.
+    """
+
+    def __init__(self) -> None:
+        """Initialise without touching the disk."""
+        super().__init__()
+        self.baseFilename = str(LOG_FILE)
+        self._target: logging.Handler | None = None
+        self._failed = False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write *record*, opening the log file first if needed."""
+        if self._target is None:
+            if self._failed:
+                return
+            try:
+                from logging.handlers import RotatingFileHandler
+
+                LOG_DIR.mkdir(parents=True, exist_ok=True)
+                self._target = RotatingFileHandler(
+                    LOG_FILE,
+                    maxBytes=5 * 1024 * 1024,  # 5 MB
+                    backupCount=3,
+                    encoding="utf-8",
+                )
+            except OSError as e:
+                self._failed = True
+                sys.stderr.write(
+                    f"WARNING: Could not create log file {LOG_FILE}: {e}\n"
+                )
+                sys.stderr.write("Logging will be restricted to console output.\n")
+                return
+            self._target.setFormatter(self.formatter)
+        self._target.emit(record)
+
+    def close(self) -> None:
+        """Close the log file, if it was opened."""
+        if self._target is not None:
+            self._target.close()
+        super().close()
+
+
 def setup_logger(name: str = "dxva") -> logging.Logger:
     """Configures the main application logger.
 
@@ -34,44 +85,21 @@ def setup_logger(name: str = "dxva") -> logging.Logger:
 
     logger.setLevel(logging.DEBUG)
 
-    # Fail-safe: Ensure directory exists (Skill 06: Fail Fast if IO fails)
-    try:
-        LOG_DIR.mkdir(parents=True, exist_ok=True)
-    except OSError as e:
-        # Graceful fallback: warning to stderr, limit logging to console (if configured later)
-        sys.stderr.write(f"WARNING: Could not create log directory {LOG_DIR}: {e}\n")
-        sys.stderr.write("Logging will be restricted to console output.\n")
-        # Do not exit; return a logger that might only have console handlers added later
-        # or add a NullHandler to avoid "No handler found" warnings
-        logger.addHandler(logging.NullHandler())
-        return logger
-
-    # Handler: Rotating File Handler (Max 5MB, keep 3 backup files)
-    try:
-        from logging.handlers import RotatingFileHandler
-
-        file_handler = RotatingFileHandler(
-            LOG_FILE,
-            maxBytes=5 * 1024 * 1024,  # 5 MB
-            backupCount=3,
-            encoding="utf-8",
-        )
-        file_handler.setLevel(logging.DEBUG)
-
-        # Format: Structured-like (Pipe separated) for easy parsing
-        formatter = logging.Formatter(
-            fmt=(
-                "%(asctime)s | %(levelname)-8s | %(name)s | "
-                "%(funcName)s:%(lineno)d | %(message)s"
-            ),
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-
-    except OSError as e:
-        sys.stderr.write(f"WARNING: Could not create log file {LOG_FILE}: {e}\n")
-        logger.addHandler(logging.NullHandler())
+    # Handler: Rotating File Handler (Max 5MB, keep 3 backup files),
+    # opened by the first record
+    file_handler = _DeferredFileHandler()
+    file_handler.setLevel(logging.DEBUG)
+
+    # Format: Structured-like (Pipe separated) for easy parsing
+    formatter = logging.Formatter(
+        fmt=(
+            "%(asctime)s | %(levelname)-8s | %(name)s | "
+            "%(funcName)s:%(lineno)d | %(message)s"
+        ),
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    file_handler.setFormatter(formatter)
+    logger.addHandler(file_handler)
 
     return logger
 
@@ -4,8 +4,11 @@ Templates remain in note_creator/templates/ as they are service-specific.
 This module provides a reference to that location.
 """
 
+import hashlib
 from pathlib import Path
 
+from platformdirs import user_data_dir
+
 # Package root: src/dx_vault_atlas/shared/paths.py -> parent.parent = dx_vault_atlas
 PACKAGE_ROOT = Path(__file__).resolve().parent.parent
 
@@ -14,6 +17,20 @@ TEMPLATES_DIR = PACKAGE_ROOT / "services" / "note_creator" / "templates"
 
 APP_NAME = "dx-vault-atlas"
 
+# Persistent state (checkpoints, journals, vault indexes)
+DATA_DIR = Path(user_data_dir(APP_NAME))
+
+
+def vault_data_dir(vault_path: Path) -> Path:
+    """Return the per-vault directory for caches and indexes.
+
+    The directory name is derived from the resolved vault path, so
+    several vaults can be indexed side by side.
+    """
+    resolved = str(Path(vault_path).expanduser().resolve())
+    key = hashlib.sha1(resolved.encode("utf-8")).hexdigest()[:12]
+    return DATA_DIR / "vaults" / key
+
 
 def validate_directory(path_str: str | Path) -> Path:
     """Validate that a path exists and is a directory.
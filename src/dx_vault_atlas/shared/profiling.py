@@ -0,0 +1,231 @@
+"""Pipeline stage timing and cProfile capture, behind ``dxva --profile``.
+
+Services mark their pipeline stages with ``stage("read")`` blocks (or
+``timed_iter`` for generators such as the vault scan). While no run is
+being profiled, ``stage`` hands back a shared no-op context, so the
+markers cost one attribute check.
+
+Stage times are exclusive: a stage nested in another (the parse inside a
+validation, the serialize inside a write) is subtracted from its
+parent, so each second is counted once. Stages run by worker threads
+(e.g. the doctor's prefetcher) are counted too and may overlap the main
+thread, so the stage total can exceed the wall time.
+
+While ``shared.tracing`` records a trace, every stage is also recorded
+there as a span.
+"""
+
+import cProfile
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter_ns
+from types import TracebackType
+
+from dx_vault_atlas.shared.tracing import TRACER
+
+# Display order of the breakdown; unknown stages follow, slowest first
+STAGE_ORDER = (
+    "scan",
+    "read",
+    "parse",
+    "validate",
+    "fix",
+    "migrate",
+    "serialize",
+    "write",
+    "editor",
+    "tui",
+)
+
+_NS_PER_S = 1_000_000_000
+
+_NULL_STAGE = nullcontext()
+
+
+@dataclass(frozen=True)
+class StageTime:
+    """Time spent in one stage.
+
+    Attributes:
+        name: Stage name.
+        calls: Times the stage was entered.
+        total_ns: Exclusive time, in nanoseconds.
+    """
+
+    name: str
+    calls: int
+    total_ns: int
+
+    @property
+    def seconds(self) -> float:
+        """Exclusive time, in seconds."""
+        return self.total_ns / _NS_PER_S
+
+
+class _Stage:
+    """Context of one timed stage entry."""
+
+    __slots__ = ("timer", "name", "start", "children")
+
+    def __init__(self, timer: "StageTimer", name: str) -> None:
+        self.timer = timer
+        self.name = name
+        self.start = 0
+        self.children = 0
+
+    def __enter__(self) -> None:
+        self.timer._stack().append(self)
+        self.start = perf_counter_ns()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        elapsed = perf_counter_ns() - self.start
+        stack = self.timer._stack()
+        stack.pop()
+        if stack:
+            stack[-1].children += elapsed
+        self.timer._record(self.name, elapsed - self.children)
+        if TRACER.enabled:
+            TRACER.add(self.name, "stage", self.start, elapsed)
+
+
+class StageTimer:
+    """Accumulates exclusive wall time per pipeline stage."""
+
+    def __init__(self) -> None:
+        """Initialise a disabled timer."""
+        self.enabled = False
+        self._totals: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started = self._stopped = 0
+
+    def start(self) -> None:
+        """Clear previous measurements and start recording."""
+        with self._lock:
+            self._totals.clear()
+        self._started = perf_counter_ns()
+        self._stopped = 0
+        self.enabled = True
+
+    def stop(self) -> None:
+        """Stop recording; measurements are kept."""
+        self.enabled = False
+        self._stopped = perf_counter_ns()
+
+    @property
+    def wall_ns(self) -> int:
+        """Wall time between ``start`` and ``stop`` (or now)."""
+        if not self._started:
+            return 0
+        return (self._stopped or perf_counter_ns()) - self._started
+
+    def stage(self, name: str) -> AbstractContextManager[None]:
+        """Context timing a *name* stage; a no-op while disabled."""
+        if self.enabled:
+            return _Stage(self, name)
+        if TRACER.enabled:
+            return TRACER.span(name)
+        return _NULL_STAGE
+
+    def timed_iter[T](self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        """Iterate *iterable*, timing each step as a *name* stage.
+
+        Only the time spent producing items is counted, not the time the
+        consumer spends on them.
+        """
+        iterator = iter(iterable)
+        if not (self.enabled or TRACER.enabled):
+            return iterator
+        return self._timed(name, iterator)
+
+    def breakdown(self) -> list[StageTime]:
+        """Recorded stages, in ``STAGE_ORDER`` then slowest first."""
+        with self._lock:
+            times = [StageTime(n, c, t) for n, (c, t) in self._totals.items()]
+        rank = {name: i for i, name in enumerate(STAGE_ORDER)}
+        return sorted(
+            times, key=lambda s: (rank.get(s.name, len(rank)), -s.total_ns)
+        )
+
+    # -- private helpers ----------------------------------------------------
+
+    def _timed[T](self, name: str, iterator: Iterator[T]) -> Iterator[T]:
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def _stack(self) -> list[_Stage]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, name: str, elapsed_ns: int) -> None:
+        with self._lock:
+            entry = self._totals.get(name)
+            if entry is None:
+                self._totals[name] = [1, elapsed_ns]
+            else:
+                entry[0] += 1
+                entry[1] += elapsed_ns
+
+
+# Process-wide timer the services report to
+STAGES = StageTimer()
+
+
+def stage(name: str) -> AbstractContextManager[None]:
+    """Time a block as a *name* stage of the profiled run, if any."""
+    return STAGES.stage(name)
+
+
+def timed_iter[T](name: str, iterable: Iterable[T]) -> Iterator[T]:
+    """Iterate *iterable*, timing its steps as a *name* stage, if profiling."""
+    return STAGES.timed_iter(name, iterable)
+
+
+class ProfileSession:
+    """A ``--profile`` run: cProfile plus the stage timer.
+
+    Example:
+        session = ProfileSession(Path("dxva.prof"))
+        session.start()
+        ...
+        breakdown = session.finish()  # stats written to dxva.prof
+    """
+
+    def __init__(self, output: Path, timer: StageTimer = STAGES) -> None:
+        """Initialise a session writing cProfile stats to *output*."""
+        self.output = output
+        self.timer = timer
+        self._profile = cProfile.Profile()
+
+    def start(self) -> None:
+        """Start profiling this thread and timing stages."""
+        self.timer.start()
+        self._profile.enable()
+
+    def finish(self) -> list[StageTime]:
+        """Stop, write the cProfile stats and return the stage breakdown.
+
+        Raises:
+            OSError: If the stats file cannot be written; the timer is
+                stopped regardless.
+        """
+        self._profile.disable()
+        self.timer.stop()
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        self._profile.dump_stats(self.output)
+        return self.timer.breakdown()
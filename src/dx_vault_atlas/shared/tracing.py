@@ -0,0 +1,202 @@
+"""Per-note span tracing in Chrome trace format, behind ``dxva --trace``.
+
+Spans are recorded as ``(name, category, start, duration, thread, note)``
+tuples in a ring buffer of fixed capacity: recording one costs two clock
+reads and a deque append, memory is bounded however long the run, and
+when the buffer is full the oldest spans make room for new ones. The
+buffer is only formatted when exported, as a JSON trace that
+``chrome://tracing`` and https://ui.perfetto.dev open directly.
+
+``note_span`` marks the work on one note and makes its path the thread's
+current note; every span recorded inside it carries that path in its
+``args``. The pipeline stage markers of ``shared.profiling`` are recorded
+as spans too, so a trace shows read, parse, validate, fix, serialize and
+write per note, plus one span per rule (``rule_span``) and per Pydantic
+validation.
+"""
+
+import os
+import threading
+from collections import deque
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from time import perf_counter_ns, time_ns
+from types import TracebackType
+from typing import Any
+
+# Spans kept by default; about 150 bytes each
+DEFAULT_CAPACITY = 65_536
+
+_NULL_SPAN = nullcontext()
+
+# (name, category, start_ns, duration_ns, thread id, note path)
+_Event = tuple[str, str, int, int, int, Path | None]
+
+
+class _Span:
+    """Context of one recorded span."""
+
+    __slots__ = ("tracer", "name", "cat", "start", "note", "previous")
+
+    def __init__(
+        self, tracer: "Tracer", name: str, cat: str, note: Path | None = None
+    ) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.note = note
+        self.start = 0
+        self.previous: Path | None = None
+
+    def __enter__(self) -> None:
+        if self.note is not None:
+            local = self.tracer._local
+            self.previous = getattr(local, "note", None)
+            local.note = self.note
+        self.start = perf_counter_ns()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        elapsed = perf_counter_ns() - self.start
+        self.tracer.add(self.name, self.cat, self.start, elapsed)
+        if self.note is not None:
+            self.tracer._local.note = self.previous
+
+
+class Tracer:
+    """Records spans into a bounded ring buffer."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Initialise a disabled tracer keeping at most *capacity* spans."""
+        self.enabled = False
+        self._events: deque[_Event] = deque(maxlen=max(1, capacity))
+        self._recorded = 0
+        self._local = threading.local()
+        self._origin_ns = 0
+        self._origin_epoch_ns = 0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of spans kept."""
+        return self._events.maxlen or 0
+
+    @property
+    def dropped(self) -> int:
+        """Spans evicted from the full buffer."""
+        return self._recorded - len(self._events)
+
+    def start(self, capacity: int | None = None) -> None:
+        """Clear the buffer and start recording."""
+        if capacity is not None:
+            self._events = deque(maxlen=max(1, capacity))
+        self._events.clear()
+        self._recorded = 0
+        self._origin_ns = perf_counter_ns()
+        self._origin_epoch_ns = time_ns()
+        self.enabled = True
+
+    def stop(self) -> None:
+        """Stop recording; recorded spans are kept for export."""
+        self.enabled = False
+
+    def span(self, name: str, cat: str = "stage") -> AbstractContextManager[None]:
+        """Context recording a span; a no-op while disabled."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, cat)
+
+    def note_span(self, name: str, path: Path) -> AbstractContextManager[None]:
+        """Span covering the work on the note at *path*."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, "note", path)
+
+    def add(self, name: str, cat: str, start_ns: int, duration_ns: int) -> None:
+        """Record a finished span that started at ``perf_counter_ns`` *start_ns*."""
+        self._events.append(
+            (
+                name,
+                cat,
+                start_ns,
+                duration_ns,
+                threading.get_ident(),
+                getattr(self._local, "note", None),
+            )
+        )
+        self._recorded += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """The buffer as a Chrome trace (JSON object format)."""
+        pid = os.getpid()
+        threads: dict[int, int] = {}
+        events: list[dict[str, Any]] = []
+        for name, cat, start, duration, ident, note in list(self._events):
+            tid = threads.setdefault(ident, len(threads) + 1)
+            event: dict[str, Any] = {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": (start - self._origin_ns) / 1000,
+                "dur": duration / 1000,
+                "pid": pid,
+                "tid": tid,
+            }
+            if note is not None:
+                event["args"] = {"path": str(note)}
+            events.append(event)
+
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, tid in threads.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": names.get(ident, f"thread-{tid}")},
+                }
+            )
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "start_epoch_us": self._origin_epoch_ns // 1000,
+                "capacity": self.capacity,
+                "dropped": self.dropped,
+            },
+        }
+
+    def export(self, path: Path) -> int:
+        """Write the trace to *path*; return the number of spans written."""
+        import json  # only exports need it; keeps ``dxva`` startup lean
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        return len(self._events)
+
+
+# Process-wide tracer the services report to
+TRACER = Tracer()
+
+
+def span(name: str, cat: str = "stage") -> AbstractContextManager[None]:
+    """Record a span of the traced run, if any."""
+    return TRACER.span(name, cat)
+
+
+def note_span(name: str, path: Path) -> AbstractContextManager[None]:
+    """Record the work on one note as a span carrying its path, if tracing."""
+    return TRACER.note_span(name, path)
+
+
+def rule_span(rule: object) -> AbstractContextManager[None]:
+    """Record one validation or fix rule invocation, if tracing."""
+    if not TRACER.enabled:
+        return _NULL_SPAN
+    # Unwrap the --profile-rules wrappers to name the rule itself
+    inner = getattr(rule, "rule", rule)
+    return _Span(TRACER, type(inner).__name__, "rule")
@@ -3,22 +3,70 @@
 Provides reusable components:
 - BaseApp: Base application with bindings and theme
 - WizardApp: Generic wizard driven by config
+- WizardSessionApp: Many wizards in one long-lived app
 - VimOptionList: OptionList with j/k navigation
 - StepDone: Completed wizard step display
 - WizardConfig: Wizard configuration
+
+Exports are resolved on first access, so importing a Textual-free
+submodule (``wizard``, ``common_steps``, ``config_wizard``) does not load
+Textual.
 """
 
-from dx_vault_atlas.shared.tui.app import BaseApp
-from dx_vault_atlas.shared.tui.theme import SHARED_CSS, ThemeManager
-from dx_vault_atlas.shared.tui.wizard import (
-    WizardConfig,
-)
-from dx_vault_atlas.shared.tui.wizard_app import WizardApp, run_wizard
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from dx_vault_atlas.shared.tui.app import BaseApp
+    from dx_vault_atlas.shared.tui.session_app import (
+        WizardSessionApp,
+        WizardSessionDriver,
+        run_wizard_session,
+    )
+    from dx_vault_atlas.shared.tui.theme import SHARED_CSS, ThemeManager
+    from dx_vault_atlas.shared.tui.widgets import (
+        create_enum_options,
+        create_vim_option_list,
+    )
+    from dx_vault_atlas.shared.tui.wizard import WizardConfig
+    from dx_vault_atlas.shared.tui.wizard_app import WizardApp, run_wizard
+
+# Export name -> defining submodule
+_EXPORTS = {
+    "BaseApp": "app",
+    "SHARED_CSS": "theme",
+    "ThemeManager": "theme",
+    "WizardConfig": "wizard",
+    "WizardSessionApp": "session_app",
+    "WizardSessionDriver": "session_app",
+    "run_wizard_session": "session_app",
+    "WizardApp": "wizard_app",
+    "run_wizard": "wizard_app",
+    "create_enum_options": "widgets",
+    "create_vim_option_list": "widgets",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the submodule defining *name* on first access."""
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
+    "SHARED_CSS",
+    "BaseApp",
+    "ThemeManager",
     "WizardApp",
     "WizardConfig",
+    "WizardSessionApp",
+    "WizardSessionDriver",
     "create_enum_options",
     "create_vim_option_list",
     "run_wizard",
+    "run_wizard_session",
 ]
@@ -11,9 +11,11 @@ from textual.widgets import Footer, Static
 from dx_vault_atlas.shared.tui.theme import ThemeManager
 
 
-class BaseApp(App[None]):
+class BaseApp[R](App[R]):
     """Base TUI application with common bindings and styling.
 
+    ``R`` is the result type ``run()`` returns, passed to ``exit()``.
+
     Features:
     - Alternative Screen Buffer (automatic in Textual)
     - Q/Ctrl+Q/Escape to quit
@@ -57,10 +57,20 @@ STATUS_STEP = WizardStep(
     condition=lambda data: has_field(data.get("template"), "status"),
 )
 
+# Suggestions are wired in at runtime (see note_creator.tui.run_tui)
+UP_STEP = WizardStep(
+    key="up",
+    label="Enter parent note",
+    step_type="autocomplete",
+    placeholder="Type to search titles and aliases, Enter to skip...",
+    condition=lambda data: has_field(data.get("template"), "up"),
+)
+
 # Pre-built step sequences
 NOTE_CREATOR_STEPS = [
     TITLE_STEP,
     TEMPLATE_STEP,
     PRIORITY_STEP,
     AREA_STEP,
+    UP_STEP,
 ]
@@ -7,6 +7,7 @@ from textual.binding import Binding
 from textual.containers import Container, Vertical
 from textual.widgets import Footer, Label, Static
 
+from dx_vault_atlas.shared.profiling import stage
 from dx_vault_atlas.shared.tui.theme import ThemeManager
 
 
@@ -55,5 +56,6 @@ class ResultApp(App[str]):
 def run_result_tui(note_path: Path) -> str:
     """Run result TUI and return action ('quit' or 'retry')."""
     app = ResultApp(note_path)
-    result = app.run()
+    with stage("tui"):
+        result = app.run()
     return result if isinstance(result, str) else "quit"
@@ -0,0 +1,150 @@
+"""Long-lived wizard session: many wizards in one running Textual app."""
+
+from typing import Any, Protocol
+
+from textual.app import ComposeResult
+from textual.containers import Container, Horizontal, Vertical
+from textual.widgets import Footer, Static
+
+from dx_vault_atlas.shared.profiling import stage
+from dx_vault_atlas.shared.tui.wizard import WizardConfig
+from dx_vault_atlas.shared.tui.wizard_app import WizardApp
+
+# Queue entries shown in the sidebar
+_QUEUE_PREVIEW = 15
+
+
+class WizardSessionDriver(Protocol):
+    """Supplies wizard configs to a ``WizardSessionApp`` and consumes answers."""
+
+    def next_config(self) -> WizardConfig | None:
+        """Return the next wizard to show, or None when the queue is done."""
+        ...
+
+    def submit(self, data: dict[str, Any]) -> WizardConfig | None:
+        """Apply answers for the current wizard.
+
+        Returns a config to retry the same item, or None to move on.
+        """
+        ...
+
+    def skip(self) -> None:
+        """Skip the current item."""
+        ...
+
+    def pending(self) -> list[str]:
+        """Labels of the items still queued (current one first)."""
+        ...
+
+    def drain_messages(self) -> list[str]:
+        """Return and clear status messages produced since the last call."""
+        ...
+
+
+class WizardSessionApp(WizardApp):
+    """Runs a queue of wizards inside a single Textual app.
+
+    Instead of exiting when a wizard completes, the answers are handed to
+    the driver and the next config is swapped in place: terminal setup,
+    CSS parsing and composition happen once per session, not per item.
+    A sidebar lists the remaining queue.
+
+    Exits with ``{"__quit__": True}`` if the user quits, else ``{}``.
+    """
+
+    DEFAULT_CSS = """
+    #session-body {
+        height: 1fr;
+    }
+    #session-body #wizard {
+        width: 1fr;
+    }
+    #session-queue {
+        width: 36;
+        height: 1fr;
+        padding: 1 1;
+        border-left: solid $primary-background;
+    }
+    """
+
+    def __init__(self, driver: WizardSessionDriver, title: str) -> None:
+        """Initialise the session.
+
+        Args:
+            driver: Source of wizard configs and sink for answers.
+            title: Header shown when no item is loaded.
+        """
+        super().__init__(WizardConfig(title=title, steps=[]))
+        self.driver = driver
+
+    def compose(self) -> ComposeResult:
+        """Compose header, wizard area with queue sidebar, and footer."""
+        with Container(id="header-panel"):
+            yield Static(self.HEADER_TITLE, id="header-title")
+        with Horizontal(id="session-body"):
+            with Vertical(id="wizard"):
+                pass
+            yield Static("", id="session-queue")
+        yield Footer()
+
+    def on_mount(self) -> None:
+        """Load the first item."""
+        self._load(self.driver.next_config())
+
+    # -- session flow -------------------------------------------------------
+
+    def _load(self, config: WizardConfig | None) -> None:
+        """Swap in *config*, or exit when the queue is exhausted."""
+        self._flush_messages()
+        if config is None:
+            self.exit({})
+            return
+
+        self.config = config
+        self.data = {}
+        self.step_index = 0
+        self.query_one("#header-title", Static).update(config.title)
+        self._refresh_queue()
+        self._compute_active_steps()
+        self._show_current_step()
+
+    def _complete(self) -> None:
+        """Hand the answers to the driver and continue with the next item."""
+        retry = self.driver.submit(dict(self.data))
+        self._load(retry if retry is not None else self.driver.next_config())
+
+    def action_skip(self) -> None:
+        """Skip the current item and continue with the next one."""
+        self.driver.skip()
+        self._load(self.driver.next_config())
+
+    # -- helpers ------------------------------------------------------------
+
+    def _refresh_queue(self) -> None:
+        """Render the remaining queue in the sidebar."""
+        pending = self.driver.pending()
+        lines = [f"[bold]Queue[/] [dim]({len(pending)})[/]", ""]
+        for i, label in enumerate(pending[:_QUEUE_PREVIEW]):
+            marker = "[bold cyan]●[/]" if i == 0 else "[dim]○[/]"
+            lines.append(f"{marker} {label}")
+        if len(pending) > _QUEUE_PREVIEW:
+            lines.append(f"[dim]… {len(pending) - _QUEUE_PREVIEW} more[/]")
+        self.query_one("#session-queue", Static).update("\n".join(lines))
+
+    def _flush_messages(self) -> None:
+        """Show driver messages as transient notifications."""
+        for message in self.driver.drain_messages():
+            self.notify(message, timeout=2)
+
+
+def run_wizard_session(
+    driver: WizardSessionDriver, title: str = "DX Vault Atlas"
+) -> dict[str, Any] | None:
+    """Run a wizard session until the driver's queue is exhausted.
+
+    Returns:
+        ``{"__quit__": True}`` if the user quit, ``{}`` otherwise, or None
+        if the app was interrupted.
+    """
+    with stage("tui"):
+        return WizardSessionApp(driver, title).run()
@@ -12,11 +12,13 @@ class WizardStep:
 
     key: str
     label: str
-    step_type: str  # "input" or "select"
+    step_type: str  # "input", "select" or "autocomplete"
     enum_cls: type[Enum] | None = None
     default_value: Any = None
     placeholder: str = ""
     condition: Callable[[dict[str, Any]], bool] | None = None
+    # Autocomplete only: suggestions for the typed text (called per keystroke)
+    suggest: Callable[[str], list[str]] | None = None
 
 
 @dataclass
@@ -5,18 +5,26 @@ from typing import Any
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.widgets import Input, Label, OptionList, Static
+from textual.widgets.option_list import Option
 
+from dx_vault_atlas.shared.profiling import stage
 from dx_vault_atlas.shared.tui.app import BaseApp
-from dx_vault_atlas.shared.tui.widgets import StepDone, create_vim_option_list
+from dx_vault_atlas.shared.tui.widgets import (
+    StepDone,
+    VimOptionList,
+    create_vim_option_list,
+)
 from dx_vault_atlas.shared.tui.wizard import WizardConfig, WizardStep
 
 
-class WizardApp(BaseApp):
+class WizardApp(BaseApp[dict[str, Any]]):
     """Generic wizard TUI driven by configuration."""
 
     BINDINGS = [
         Binding("s", "skip", "Skip", show=True),
         Binding("ctrl+s", "skip", "Skip", show=False),
+        Binding("down", "suggestion_down", "Next suggestion", show=False),
+        Binding("up", "suggestion_up", "Previous suggestion", show=False),
     ]
 
     def __init__(self, config: WizardConfig) -> None:
@@ -31,6 +39,7 @@ class WizardApp(BaseApp):
         self.data: dict[str, Any] = {}
         self.step_index = 0
         self.active_steps: list[WizardStep] = []
+        self.suggestions: list[str] = []
 
     def compose(self) -> ComposeResult:
         """Compose the application."""
@@ -67,7 +76,9 @@ class WizardApp(BaseApp):
 
         # Show current step
         step = self.active_steps[self.step_index]
-        hint = "[dim](j/k)[/]" if step.step_type == "select" else ""
+        hint = {"select": "[dim](j/k)[/]", "autocomplete": "[dim](↑/↓)[/]"}.get(
+            step.step_type, ""
+        )
         self.wizard.mount(
             Label(f"[bold cyan]●[/] {step.label} {hint}", classes="prompt-label")
         )
@@ -80,6 +91,16 @@ class WizardApp(BaseApp):
             )
             self.wizard.mount(input_widget)
             self.call_after_refresh(input_widget.focus)
+        elif step.step_type == "autocomplete":
+            self.suggestions = []
+            input_widget = Input(
+                value=step.default_value or "",
+                placeholder=step.placeholder,
+                id="wizard-input",
+            )
+            self.wizard.mount(input_widget)
+            self.wizard.mount(VimOptionList(id="wizard-suggestions"))
+            self.call_after_refresh(input_widget.focus)
         elif step.step_type == "select":
             # Cast to fix MyPy: create_vim_option_list expects type, not Optional[type]
             # We know it's not None here because of the check,
@@ -116,10 +137,35 @@ class WizardApp(BaseApp):
             return f"{name.title()} ({val})"
         return str(value)
 
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Refresh the suggestions of an autocomplete step."""
+        if self.step_index >= len(self.active_steps):
+            return
+        step = self.active_steps[self.step_index]
+        if step.step_type != "autocomplete" or step.suggest is None:
+            return
+        self.suggestions = step.suggest(event.value) if event.value.strip() else []
+        options = self.query_one("#wizard-suggestions", VimOptionList)
+        options.clear_options()
+        options.add_options(
+            Option(suggestion, id=f"{step.key}-{i}")
+            for i, suggestion in enumerate(self.suggestions)
+        )
+        if self.suggestions:
+            options.highlighted = 0
+
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle input submission."""
-        if event.value.strip():
-            step = self.active_steps[self.step_index]
+        step = self.active_steps[self.step_index]
+        if step.step_type == "autocomplete":
+            # The highlighted suggestion wins; an empty input skips the step
+            options = self.query_one("#wizard-suggestions", VimOptionList)
+            if self.suggestions and options.highlighted is not None:
+                self.data[step.key] = self.suggestions[options.highlighted]
+            elif event.value.strip():
+                self.data[step.key] = event.value.strip()
+            self._advance()
+        elif event.value.strip():
             self.data[step.key] = event.value.strip()
             self._advance()
 
@@ -129,9 +175,28 @@ class WizardApp(BaseApp):
         index = int(parts[-1])
 
         step = self.active_steps[self.step_index]
-        self.data[step.key] = list(step.enum_cls)[index]
+        if step.step_type == "autocomplete":
+            self.data[step.key] = self.suggestions[index]
+        else:
+            self.data[step.key] = list(step.enum_cls)[index]
         self._advance()
 
+    def _move_suggestion(self, offset: int) -> None:
+        """Move the highlighted suggestion of an autocomplete step."""
+        if not self.suggestions:
+            return
+        options = self.query_one("#wizard-suggestions", VimOptionList)
+        current = options.highlighted or 0
+        options.highlighted = (current + offset) % len(self.suggestions)
+
+    def action_suggestion_down(self) -> None:
+        """Highlight the next suggestion."""
+        self._move_suggestion(1)
+
+    def action_suggestion_up(self) -> None:
+        """Highlight the previous suggestion."""
+        self._move_suggestion(-1)
+
     def _advance(self) -> None:
         """Advance to next step."""
         self.step_index += 1
@@ -176,4 +241,5 @@ def run_wizard(config: WizardConfig) -> dict[str, Any] | None:
         Collected data dict or None if cancelled.
     """
     app = WizardApp(config)
-    return app.run()
+    with stage("tui"):
+        return app.run()
@@ -4,9 +4,31 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+# Stems kept in the parse memo; a note is looked up several times in a row,
+# so a small LRU catches nearly every repeat
+STEM_MEMO_SIZE = 4096
+
+
+def strip_tz(dt: datetime) -> datetime:
+    """Return a naive (tz-unaware) copy of *dt*."""
+    if dt.tzinfo is not None:
+        return dt.replace(tzinfo=None)
+    return dt
+
 
 class DateResolver:
-    """Resolves the creation date of a note based on a hierarchy of sources."""
+    """Resolves the creation date of a note based on a hierarchy of sources.
+
+    An instance is meant to live for one run: "now" is captured once at
+    construction and recently seen stems are memoized, so the validator,
+    the fixer and the rename step can share the work for the same note.
+    The memo is a bounded LRU, so memory stays flat on large vaults.
+    """
+
+    def __init__(self, now: datetime | None = None) -> None:
+        """Initialise with a run-scoped reference time (defaults to now)."""
+        self.now = now or datetime.now()
+        self._stems: dict[str, tuple[str | None, datetime | None]] = {}
 
     @staticmethod
     def extract_timestamp_from_stem(stem: str) -> str | None:
@@ -24,8 +46,47 @@ class DateResolver:
         return None
 
     @staticmethod
+    def parse_timestamp(ts: str) -> datetime | None:
+        """Parse a 12- or 14-digit ``YYYYMMDDHHMM[SS]`` string.
+
+        Slices the digits directly instead of going through ``strptime``;
+        returns None for impossible calendar values.
+        """
+        try:
+            return datetime(
+                int(ts[0:4]),
+                int(ts[4:6]),
+                int(ts[6:8]),
+                int(ts[8:10]),
+                int(ts[10:12]),
+                int(ts[12:14]) if len(ts) == 14 else 0,
+            )
+        except ValueError:
+            return None
+
+    def stem_timestamp(self, stem: str) -> str | None:
+        """Memoized ``extract_timestamp_from_stem``."""
+        return self._lookup(stem)[0]
+
+    def parse_stem(self, stem: str) -> datetime | None:
+        """Return the datetime encoded in *stem*, ignoring the future check."""
+        return self._lookup(stem)[1]
+
+    def stem_matches(self, stem: str, created: datetime) -> bool:
+        """Return True if *stem* carries the full timestamp of *created*.
+
+        Equivalent to comparing the 14-digit stem prefix with
+        ``created.strftime("%Y%m%d%H%M%S")``; 12-digit stems never match.
+        """
+        ts, dt = self._lookup(stem)
+        if ts is None or len(ts) != 14 or dt is None:
+            return False
+        return dt == created.replace(microsecond=0, tzinfo=None)
+
     def resolve_created(
-        file_path: Path, frontmatter: dict[str, Any]
+        self,
+        file_path: Path,
+        frontmatter: dict[str, Any],  # noqa: ARG002 - kept for callers
     ) -> datetime | None:
         """Resolve the creation date.
 
@@ -37,21 +98,10 @@ class DateResolver:
         Returns:
             datetime or None if not found/invalid/future.
         """
-        cand = DateResolver.extract_timestamp_from_stem(file_path.stem)
-        if not cand:
-            return None
-
-        now = datetime.now()
-
-        try:
-            fmt = "%Y%m%d%H%M%S" if len(cand) == 14 else "%Y%m%d%H%M"
-            dt = datetime.strptime(cand, fmt)
-            # Future check
-            if dt > now:
-                return None
-            return dt
-        except ValueError:
+        dt = self.parse_stem(file_path.stem)
+        if dt is None or dt > self.now:
             return None
+        return dt
 
     @staticmethod
     def resolve_updated(
@@ -71,3 +121,16 @@ class DateResolver:
         # If we can't use metadata, we can't invent a date.
         # Maybe we return None and let Fixer handle it (e.g. use created).
         return None
+
+    # -- private helpers ----------------------------------------------------
+
+    def _lookup(self, stem: str) -> tuple[str | None, datetime | None]:
+        """Return ``(timestamp, parsed)`` for *stem*, memoized LRU-style."""
+        hit = self._stems.pop(stem, None)
+        if hit is None:
+            ts = self.extract_timestamp_from_stem(stem)
+            hit = (ts, self.parse_timestamp(ts) if ts else None)
+            if len(self._stems) >= STEM_MEMO_SIZE:
+                del self._stems[next(iter(self._stems))]
+        self._stems[stem] = hit
+        return hit
@@ -0,0 +1,127 @@
+"""Precomputed normalization tables for enum-like frontmatter fields."""
+
+from collections.abc import Iterable, Mapping
+from enum import Enum
+from typing import Any
+
+from dx_vault_atlas.core.registry import NoteModelRegistry
+from dx_vault_atlas.shared.models.enums import (
+    NoteArea,
+    NoteStatus,
+    Priority,
+)
+
+
+def normalize_key(text: str) -> str:
+    """Lowercase, strip, and collapse whitespace/dashes."""
+    return text.strip().lower().replace(" ", "_").replace("-", "_")
+
+
+class EnumIndex:
+    """Maps every accepted spelling of one field to its canonical value.
+
+    Keys are stored pre-normalized with ``normalize_key`` so a lookup is a
+    single normalization plus one dict probe, regardless of how many
+    members the enum has.
+    """
+
+    def __init__(self, field: str, choices: Iterable[Any]) -> None:
+        """Initialise the index with the canonical *choices* of *field*."""
+        self.field = field
+        self.choices: tuple[Any, ...] = tuple(choices)
+        self._canonical: frozenset[Any] = frozenset(self.choices)
+        self._table: dict[str, Any] = {}
+        for value in self.choices:
+            self.add(str(value), value)
+
+    def __contains__(self, value: object) -> bool:
+        """Return True if *value* is already canonical."""
+        try:
+            return value in self._canonical
+        except TypeError:  # unhashable frontmatter values, e.g. lists
+            return False
+
+    def add(self, spelling: str, canonical: Any) -> None:  # noqa: ANN401
+        """Register *spelling* as an alias of *canonical*."""
+        self._table.setdefault(normalize_key(spelling), canonical)
+
+    def lookup(self, raw: str) -> Any | None:  # noqa: ANN401
+        """Return the canonical value for *raw*, or None if unknown."""
+        return self._table.get(normalize_key(raw))
+
+    def complete(self, prefix: str) -> list[str]:
+        """Return canonical choices whose spelling starts with *prefix*."""
+        norm = normalize_key(prefix)
+        return [
+            str(c) for c in self.choices if normalize_key(str(c)).startswith(norm)
+        ]
+
+
+class NormalizationIndex:
+    """Normalization tables for every enum field and the note type.
+
+    Built once per run: ``status``, ``area`` and ``priority`` from
+    ``shared/models/enums.py``, ``type`` from the note model registry
+    (plus the legacy ``note`` type and ``.md`` template names), and any
+    user ``value_mappings`` whose target resolves to a canonical value.
+    """
+
+    def __init__(self, indexes: Mapping[str, EnumIndex]) -> None:
+        """Initialise from per-field indexes."""
+        self._indexes = dict(indexes)
+
+    @classmethod
+    def build(
+        cls,
+        value_mappings: Mapping[str, Mapping[str, str]] | None = None,
+    ) -> "NormalizationIndex":
+        """Build the index from the enums, the registry and *value_mappings*."""
+        indexes = {
+            "status": _enum_index("status", NoteStatus),
+            "area": _enum_index("area", NoteArea),
+            "priority": _enum_index("priority", Priority),
+        }
+
+        note_types = [*NoteModelRegistry.get_all(), "note"]
+        type_index = EnumIndex("type", note_types)
+        for note_type in note_types:
+            type_index.add(f"{note_type}.md", note_type)
+        indexes["type"] = type_index
+
+        for field, replacements in (value_mappings or {}).items():
+            index = indexes.get(field)
+            if index is None:
+                continue
+            for old, new in replacements.items():
+                canonical = index.lookup(str(new))
+                if canonical is not None:
+                    index.add(str(old), canonical)
+
+        return cls(indexes)
+
+    def __getitem__(self, field: str) -> EnumIndex:
+        """Return the index for *field*."""
+        return self._indexes[field]
+
+    @property
+    def fields(self) -> list[str]:
+        """Names of the indexed fields."""
+        return list(self._indexes)
+
+    def lookup(self, field: str, raw: str) -> Any | None:  # noqa: ANN401
+        """Return the canonical value of *raw* for *field*, or None."""
+        index = self._indexes.get(field)
+        return index.lookup(raw) if index is not None else None
+
+    def complete(self, field: str, prefix: str = "") -> list[str]:
+        """Return canonical choices of *field* starting with *prefix*."""
+        index = self._indexes.get(field)
+        return index.complete(prefix) if index is not None else []
+
+
+def _enum_index(field: str, enum_cls: type[Enum]) -> EnumIndex:
+    """Index an enum by value and by member name."""
+    index = EnumIndex(field, [m.value for m in enum_cls])
+    for member in enum_cls:
+        index.add(member.name, member.value)
+    return index
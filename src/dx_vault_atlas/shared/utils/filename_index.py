@@ -0,0 +1,212 @@
+"""In-memory index of vault filenames for collision-free renames.
+
+Two keys are kept per note:
+
+- the case-folded full path, which catches clashes on case-insensitive
+  filesystems and sync targets (``Note.md`` vs ``note.md``);
+- the sanitized stem (see ``TitleNormalizer.sanitize``), vault-wide, which
+  catches notes that would end up with the same wiki-link name
+  (``My Note.md`` vs ``my_note.md`` in another folder).
+
+A rename target that clashes on either key gets a deterministic numeric
+suffix (``_2``, ``_3``, ...). Lookups are O(1) dict hits, so renames can be
+planned without touching the filesystem.
+
+``DirectoryProbe`` is the index-free variant for streaming runs: it keeps
+nothing per note and lists the target directory on demand instead.
+"""
+
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from dx_vault_atlas.shared.utils.title_normalizer import TitleNormalizer
+
+# Upper bound on suffixes tried before giving up on a target
+_MAX_SUFFIX = 10_000
+
+
+def path_key(path: Path) -> str:
+    """Case-insensitive key of a full path."""
+    return str(path).casefold()
+
+
+def stem_key(stem: str) -> str:
+    """Vault-wide key of a filename stem."""
+    return TitleNormalizer.sanitize(stem) or stem.casefold()
+
+
+class FilenameIndex:
+    """Tracks which note owns each path and stem key.
+
+    When built from a partial listing (``complete=False``, e.g. while the
+    scan is still streaming or when resuming without a scan), ``resolve``
+    also checks the filesystem for candidates the index has not seen.
+    """
+
+    def __init__(self, paths: Iterable[Path] = (), complete: bool = True) -> None:
+        """Index *paths*.
+
+        Args:
+            paths: Every note in the vault (or those seen so far).
+            complete: Whether *paths* covers the whole vault.
+        """
+        self.complete = complete
+        self._paths: dict[str, Path] = {}
+        self._stems: dict[str, set[Path]] = {}
+        for path in paths:
+            self.add(path)
+
+    def __len__(self) -> int:
+        """Number of indexed notes."""
+        return len(self._paths)
+
+    def __contains__(self, path: object) -> bool:
+        """True if *path* (case-insensitively) is indexed."""
+        return isinstance(path, Path) and path_key(path) in self._paths
+
+    # -- updates --------------------------------------------------------------
+
+    def add(self, path: Path) -> None:
+        """Index *path*."""
+        self._paths[path_key(path)] = path
+        self._stems.setdefault(stem_key(path.stem), set()).add(path)
+
+    def discard(self, path: Path) -> None:
+        """Remove *path* from the index, if present."""
+        if self._paths.get(path_key(path)) == path:
+            del self._paths[path_key(path)]
+        holders = self._stems.get(stem_key(path.stem))
+        if holders is not None:
+            holders.discard(path)
+            if not holders:
+                del self._stems[stem_key(path.stem)]
+
+    def move(self, old: Path, new: Path) -> None:
+        """Record that *old* was renamed to *new*."""
+        self.discard(old)
+        self.add(new)
+
+    def track(self, paths: Iterable[Path]) -> Iterator[Path]:
+        """Index *paths* as they stream by; mark complete when exhausted."""
+        for path in paths:
+            self.add(path)
+            yield path
+        self.complete = True
+
+    def copy(self) -> "FilenameIndex":
+        """Return an independent copy of the index."""
+        clone = FilenameIndex(complete=self.complete)
+        clone._paths = dict(self._paths)
+        clone._stems = {k: set(v) for k, v in self._stems.items()}
+        return clone
+
+    # -- queries --------------------------------------------------------------
+
+    def is_taken(self, candidate: Path, owner: Path | None = None) -> bool:
+        """True if *candidate* clashes with a note other than *owner*."""
+        holder = self._paths.get(path_key(candidate))
+        if holder is not None and holder != owner:
+            return True
+        holders = self._stems.get(stem_key(candidate.stem), ())
+        if any(h != owner for h in holders):
+            return True
+        if not self.complete and holder is None and candidate.exists():
+            return owner is None or not _same_file(candidate, owner)
+        return False
+
+    def resolve(self, target: Path, owner: Path | None = None) -> Path:
+        """Return *target*, or the first free ``<stem>_<n>`` variant of it.
+
+        Args:
+            target: Desired path.
+            owner: Note being renamed; its own entries never clash.
+
+        Raises:
+            FileExistsError: If no free variant is found.
+        """
+        if not self.is_taken(target, owner):
+            return target
+        for n in range(2, _MAX_SUFFIX):
+            candidate = target.with_name(f"{target.stem}_{n}{target.suffix}")
+            if not self.is_taken(candidate, owner):
+                return candidate
+        msg = f"No free filename for {target}"
+        raise FileExistsError(msg)
+
+    def plan(self, moves: Iterable[tuple[Path, Path]]) -> list[tuple[Path, Path]]:
+        """Resolve a batch of renames in one pass, without touching disk.
+
+        All sources are released first, so chains and cycles (``a -> b``,
+        ``b -> a``) keep their desired names; apply such a plan with both
+        phases of ``RenameTransaction``, not one rename at a time. Each move
+        then reserves its final name before the next is resolved, so the
+        plan is collision-free as a whole. Moves whose final path equals
+        the source are dropped. The index itself is not modified.
+
+        Args:
+            moves: ``(source, desired_target)`` pairs, in priority order.
+
+        Returns:
+            ``(source, final_target)`` pairs.
+        """
+        moves = list(moves)
+        planned = self.copy()
+        for source, _target in moves:
+            planned.discard(source)
+
+        plan: list[tuple[Path, Path]] = []
+        for source, target in moves:
+            final = planned.resolve(target, owner=source)
+            planned.add(final)
+            if final != source:
+                plan.append((source, final))
+        return plan
+
+
+class DirectoryProbe(FilenameIndex):
+    """Resolves collisions by listing the target directory on each query.
+
+    Nothing is retained per note, so memory stays flat however large the
+    vault is. Both keys are compared against the target directory only:
+    sanitize-equivalent stems in other folders are not detected.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty probe."""
+        super().__init__(complete=False)
+
+    def add(self, path: Path) -> None:  # noqa: ARG002 - the disk is the index
+        """Do nothing; renames are visible on disk straight away."""
+
+    def copy(self) -> "DirectoryProbe":
+        """Return a new probe (there is no state to copy)."""
+        return DirectoryProbe()
+
+    def is_taken(self, candidate: Path, owner: Path | None = None) -> bool:
+        """True if a file in *candidate*'s directory clashes with it."""
+        wanted_path = path_key(candidate)
+        wanted_stem = stem_key(candidate.stem)
+        suffix = candidate.suffix.casefold()
+        try:
+            entries = list(candidate.parent.iterdir())
+        except OSError:
+            return False
+        for entry in entries:
+            if entry == owner:
+                continue
+            if path_key(entry) == wanted_path:
+                return owner is None or not _same_file(entry, owner)
+            if (
+                entry.suffix.casefold() == suffix
+                and stem_key(entry.stem) == wanted_stem
+            ):
+                return True
+        return False
+
+
+def _same_file(a: Path, b: Path) -> bool:
+    """True if *a* and *b* are the same file on disk."""
+    try:
+        return a.samefile(b)
+    except OSError:
+        return False
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 
 import yaml
 
+from dx_vault_atlas.shared.profiling import stage
 from dx_vault_atlas.shared.utils.title_normalizer import TitleNormalizer
 
 
@@ -78,7 +79,8 @@ class YamlParserService:
         body = match.group(2)
 
         try:
-            raw_frontmatter = yaml.safe_load(yaml_content)
+            with stage("parse"):
+                raw_frontmatter = yaml.safe_load(yaml_content)
             # Handle empty YAML block
             if raw_frontmatter is None:
                 raw_frontmatter = {}
@@ -117,10 +119,11 @@ class YamlParserService:
             normalized_title = TitleNormalizer.normalize_frontmatter_title(raw_title)
             serialization_dict["title"] = DoubleQuotedString(normalized_title)
 
-        yaml_content = yaml.dump(
-            serialization_dict,
-            default_flow_style=False,
-            allow_unicode=True,
-            sort_keys=False,
-        )
+        with stage("serialize"):
+            yaml_content = yaml.dump(
+                serialization_dict,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+            )
         return f"---\n{yaml_content}---\n"
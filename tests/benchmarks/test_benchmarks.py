@@ -0,0 +1,173 @@
+"""Tests for the synthetic vault generator and the benchmark suite."""
+
+from pathlib import Path
+
+import pytest
+
+import dx_vault_atlas.shared.models.note  # noqa: F401
+from dx_vault_atlas.benchmarks.suite import (
+    STAGES,
+    BenchReport,
+    StageResult,
+    comparable,
+    compare,
+    run_suite,
+)
+from dx_vault_atlas.benchmarks.synthetic import (
+    INVALID_KINDS,
+    MANIFEST_NAME,
+    SyntheticVault,
+    VaultSpec,
+    ensure_vault,
+    generate_vault,
+)
+from dx_vault_atlas.core.registry import NoteModelRegistry
+from dx_vault_atlas.services.note_doctor.core.fixer import (
+    NoteFixer,
+    default_fix_rules,
+)
+from dx_vault_atlas.services.note_doctor.validator import NoteDoctorValidator
+from dx_vault_atlas.shared.core.scanner import VaultScanner
+from dx_vault_atlas.shared.yaml_parser import YamlParserService
+
+
+def _contents(root: Path) -> dict[str, str]:
+    return {
+        p.relative_to(root).as_posix(): p.read_text(encoding="utf-8")
+        for p in VaultScanner().scan(root)
+    }
+
+
+def test_same_seed_same_vault(tmp_path: Path) -> None:
+    """A spec always produces the same files; another seed does not."""
+    spec = VaultSpec(notes=60, seed=7, invalid_ratio=0.5)
+    generate_vault(tmp_path / "a", spec)
+    generate_vault(tmp_path / "b", spec)
+    generate_vault(tmp_path / "c", VaultSpec(notes=60, seed=8, invalid_ratio=0.5))
+
+    a = _contents(tmp_path / "a")
+    assert len(a) == 60
+    assert a == _contents(tmp_path / "b")
+    assert a != _contents(tmp_path / "c")
+
+
+def test_shape_follows_spec(tmp_path: Path) -> None:
+    """Types, invalid share and depth follow the spec."""
+    spec = VaultSpec(notes=400, invalid_ratio=0.25, body_size=(50, 80), max_depth=2)
+    vault = generate_vault(tmp_path / "vault", spec)
+
+    assert set(vault.types) == set(NoteModelRegistry.get_all())
+    assert sum(vault.types.values()) == 400
+    assert 60 < vault.invalid_count < 140
+    assert set(vault.invalid) <= set(INVALID_KINDS)
+
+    for rel in _contents(vault.root):
+        assert rel.count("/") <= 2
+
+    flat_spec = VaultSpec(notes=20, invalid_ratio=0, max_depth=0)
+    flat = generate_vault(tmp_path / "flat", flat_spec)
+    assert all("/" not in rel for rel in _contents(flat.root))
+
+
+def test_valid_notes_pass_the_doctor(tmp_path: Path) -> None:
+    """Notes generated valid raise no doctor issues."""
+    vault = generate_vault(tmp_path / "vault", VaultSpec(notes=150, invalid_ratio=0))
+    validator = NoteDoctorValidator(YamlParserService())
+    fixer = NoteFixer(default_fix_rules())
+    for path in VaultScanner().scan(vault.root):
+        result = validator.validate(path)
+        assert result.is_valid, (
+            path.name,
+            result.invalid_fields,
+            result.missing_fields,
+        )
+        assert not fixer.rules_for(result), path.name
+
+
+def test_invalid_notes_are_flagged(tmp_path: Path) -> None:
+    """Every kind of breakage is caught by the doctor."""
+    vault = generate_vault(tmp_path / "vault", VaultSpec(notes=150, invalid_ratio=1))
+    validator = NoteDoctorValidator(YamlParserService())
+    fixer = NoteFixer(default_fix_rules())
+    for path in VaultScanner().scan(vault.root):
+        result = validator.validate(path)
+        flagged = result.error or not result.is_valid or fixer.rules_for(result)
+        assert flagged, path.name
+
+
+def test_manifest_reuse_and_overwrite_guard(tmp_path: Path) -> None:
+    """A matching vault is reused; foreign directories are never replaced."""
+    root = tmp_path / "vault"
+    spec = VaultSpec(notes=10)
+    generate_vault(root, spec)
+    assert SyntheticVault.load(root).spec == spec
+
+    marker = next(root.rglob("*.md"))
+    marker.write_text("touched", encoding="utf-8")
+    ensure_vault(root, spec)
+    assert marker.read_text(encoding="utf-8") == "touched"  # reused
+
+    ensure_vault(root, VaultSpec(notes=12))
+    assert len(_contents(root)) == 12  # regenerated
+
+    other = tmp_path / "notes"
+    other.mkdir()
+    (other / "mine.md").write_text("keep", encoding="utf-8")
+    with pytest.raises(ValueError, match="non-synthetic"):
+        generate_vault(other, spec)
+    assert not (other / MANIFEST_NAME).exists()
+
+
+def test_spec_validation() -> None:
+    """Out-of-range specs are rejected."""
+    with pytest.raises(ValueError, match="invalid_ratio"):
+        VaultSpec(notes=10, invalid_ratio=1.5)
+    with pytest.raises(ValueError, match="body_size"):
+        VaultSpec(notes=10, body_size=(10, 5))
+
+
+def test_suite_runs_every_stage(tmp_path: Path) -> None:
+    """Each stage is timed once per size and reported as it finishes."""
+    seen: list[StageResult] = []
+    report = run_suite(
+        tmp_path,
+        VaultSpec(notes=0, invalid_ratio=0.2),
+        sizes=[30],
+        isolate=False,
+        on_result=seen.append,
+    )
+
+    assert [r.stage for r in report.results] == list(STAGES)
+    assert seen == report.results
+    by_stage = {r.stage: r for r in report.results}
+    assert by_stage["scan"].notes == by_stage["parse"].notes == 30
+    assert 0 < by_stage["migrate"].notes <= 30
+    assert all(r.seconds >= 0 for r in report.results)
+    assert report.meta["spec"]["invalid_ratio"] == 0.2
+
+    with pytest.raises(ValueError, match="Unknown stages"):
+        run_suite(tmp_path, VaultSpec(notes=0), sizes=[30], stages=["lint"])
+
+
+def test_report_round_trip_and_compare(tmp_path: Path) -> None:
+    """Reports survive a save and load; compare pairs matching rows."""
+    meta = {"commit": "abc", "generator": 1, "spec": {"seed": 0}}
+    base = BenchReport(meta, [StageResult(100, "parse", 100, 2.0, 1024)])
+    head = BenchReport(
+        {**meta, "commit": "def"},
+        [
+            StageResult(100, "parse", 100, 1.0, None),
+            StageResult(100, "scan", 100, 1.0, None),
+        ],
+    )
+    path = tmp_path / "base.json"
+    base.save(path)
+    loaded = BenchReport.load(path)
+    assert loaded.results == base.results
+    assert comparable(loaded, head)
+
+    rows = compare(loaded, head)
+    assert len(rows) == 1
+    assert rows[0]["change"] == pytest.approx(1.0)  # twice as fast
+
+    assert not comparable(base, BenchReport({**meta, "spec": {"seed": 1}}, []))
@@ -0,0 +1,122 @@
+"""Startup guards: what importing ``dxva`` and its commands loads.
+
+Import time itself depends on the machine and is checked by the
+``imports`` benchmark command; these tests assert which modules get
+imported, which holds everywhere.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from dx_vault_atlas.benchmarks.importtime import (
+    COMMANDS,
+    IMPORT_BUDGET_MS,
+    TUI_MODULES,
+    parse_importtime,
+    run_commands,
+)
+
+_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        900 |     rich.style
+import time:      1500 |       2400 |   rich.console
+Usage: dxva [OPTIONS] COMMAND [ARGS]...
+import time:        80 |       2480 | dx_vault_atlas.cli
+"""
+
+
+def _loaded_roots(module: str, env: dict[str, str] | None = None) -> set[str]:
+    """Top-level packages loaded by importing *module* in a fresh interpreter."""
+    code = (
+        f"import sys, {module}; "
+        "print(' '.join({name.partition('.')[0] for name in sys.modules}))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(proc.stdout.split())
+
+
+def test_parse_importtime() -> None:
+    """Records keep their nesting depth; interleaved output is skipped."""
+    records = parse_importtime(_SAMPLE)
+
+    assert [r.module for r in records] == [
+        "_io",
+        "rich.style",
+        "rich.console",
+        "dx_vault_atlas.cli",
+    ]
+    assert [r.depth for r in records] == [1, 2, 1, 0]
+    assert records[2].self_us == 1500
+    assert records[2].cumulative_us == 2400
+
+
+def test_thresholds_fit_the_budget() -> None:
+    """No command is allowed more than the overall import budget."""
+    assert all(spec.threshold_ms <= IMPORT_BUDGET_MS for spec in COMMANDS.values())
+
+
+def test_cli_import_loads_no_command_dependencies() -> None:
+    """Importing the CLI leaves Textual, Rich, Pydantic and YAML unloaded."""
+    loaded = _loaded_roots("dx_vault_atlas.cli")
+    assert not loaded & {*TUI_MODULES, "rich", "pydantic", "yaml"}
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "dx_vault_atlas.services.note_doctor.app",
+        "dx_vault_atlas.services.note_migrator.app",
+        "dx_vault_atlas.services.vault_index.app",
+        "dx_vault_atlas.services.link_graph.app",
+    ],
+)
+def test_batch_commands_do_not_load_the_tui(module: str) -> None:
+    """Service apps import the TUI only when a wizard is shown."""
+    assert not _loaded_roots(module) & set(TUI_MODULES)
+
+
+def test_logger_import_does_not_create_the_log_dir(tmp_path: Path) -> None:
+    """The log directory is created on the first record, not on import."""
+    env = {
+        **os.environ,
+        "HOME": str(tmp_path),
+        "XDG_STATE_HOME": str(tmp_path / "state"),
+        "XDG_CACHE_HOME": str(tmp_path / "cache"),
+        "LOCALAPPDATA": str(tmp_path / "local"),
+    }
+    code = (
+        "from dx_vault_atlas.shared.logger import LOG_DIR; "
+        "print(LOG_DIR.is_relative_to(sys.argv[1]), LOG_DIR.exists())"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", f"import sys; {code}", str(tmp_path)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert proc.stdout.split() == ["True", "False"]
+
+
+def test_help_command_imports() -> None:
+    """``dxva --help`` imports nothing forbidden; unknown commands raise."""
+    (report,) = run_commands(["help"])
+
+    assert report.forbidden_imports == []
+    assert "dx_vault_atlas.cli" in report.modules
+    assert report.total_ms > 0
+    assert all(r.module not in report.baseline for r in report.slowest())
+
+    with pytest.raises(ValueError, match="Unknown commands"):
+        run_commands(["lint"])
@@ -0,0 +1,65 @@
+"""Memory budgets of doctor and migrate runs, traced with ``tracemalloc``.
+
+Budgets are per note and leave about 2x headroom over the measured cost,
+so they only trip when a structure starts keeping more per note than it
+used to (e.g. the doctor's queue of notes awaiting the wizard).
+"""
+
+from pathlib import Path
+
+import pytest
+
+from dx_vault_atlas.benchmarks.memory import profile_memory
+from dx_vault_atlas.benchmarks.synthetic import (
+    SyntheticVault,
+    VaultSpec,
+    generate_vault,
+)
+
+KIB = 1024
+
+# Per-note budgets, in bytes: (peak, retained)
+BUDGETS = {
+    "doctor": (10 * KIB, 4 * KIB),
+    "migrate": (2 * KIB, 1 * KIB),
+}
+
+
+@pytest.fixture(scope="module")
+def vault(tmp_path_factory: pytest.TempPathFactory) -> SyntheticVault:
+    """A half-invalid vault shared by the module's tests."""
+    root = tmp_path_factory.mktemp("memory") / "vault"
+    return generate_vault(root, VaultSpec(notes=300, seed=3, invalid_ratio=0.5))
+
+
+@pytest.mark.parametrize("command", sorted(BUDGETS))
+def test_per_note_budget(command: str, vault: SyntheticVault) -> None:
+    """Peak and retained memory per note stay within the budget."""
+    report = profile_memory(command, vault.root)
+    peak_budget, retained_budget = BUDGETS[command]
+
+    assert report.notes == 300
+    assert 0 < report.retained <= report.peak
+    assert report.peak_per_note <= peak_budget, report.to_dict()
+    assert report.retained_per_note <= retained_budget, report.to_dict()
+
+
+def test_breakdown_names_the_retainers(vault: SyntheticVault) -> None:
+    """The largest retaining modules are listed, biggest first."""
+    report = profile_memory("doctor", vault.root, top=5)
+
+    assert 0 < len(report.modules) <= 5
+    sizes = [m.size for m in report.modules]
+    assert sizes == sorted(sizes, reverse=True)
+    assert any(m.module.startswith("dx_vault_atlas.") for m in report.modules)
+    assert sum(sizes) <= report.retained
+
+
+def test_migrate_leaves_the_vault_untouched(vault: SyntheticVault) -> None:
+    """Measuring a migration works on a copy of the vault."""
+    before = {p: p.read_bytes() for p in Path(vault.root).rglob("*.md")}
+    profile_memory("migrate", vault.root)
+    assert {p: p.read_bytes() for p in Path(vault.root).rglob("*.md")} == before
+
+    with pytest.raises(ValueError, match="Unknown command"):
+        profile_memory("lint", vault.root)
@@ -0,0 +1,95 @@
+"""Tests for the wikilink graph behind ``dxva graph``."""
+
+import os
+from pathlib import Path
+
+from dx_vault_atlas.services.link_graph.graph import LinkGraph
+from dx_vault_atlas.services.link_graph.links import extract_links, link_key
+from dx_vault_atlas.shared.core.scanner import VaultScanner
+
+
+def _write(vault: Path, rel: str, content: str) -> Path:
+    path = vault / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _refresh(graph: LinkGraph) -> bool:
+    return graph.refresh(VaultScanner().scan(graph.vault))
+
+
+def _vault(tmp_path: Path) -> Path:
+    vault = tmp_path / "vault"
+    _write(
+        vault, "Hub.md", '---\nup: "[[Index]]"\n---\nSee [[Alpha]] and [[Beta|b]].\n'
+    )
+    _write(vault, "Index.md", "Root note.\n")
+    _write(vault, "notes/Alpha.md", "Back to [[hub#Section]] and [[Missing]].\n")
+    _write(vault, "notes/Beta.md", "![[diagram.png]] [[Alpha^block]] [[Beta]]\n")
+    return vault
+
+
+def test_link_keys() -> None:
+    """Links reduce to lowercase stems; attachments and code are skipped."""
+    assert link_key("Folder/Note.md#Heading|Alias") == "note"
+    assert link_key("image.PNG") is None
+    assert link_key("#heading-only") is None
+    content = "[[A]] [[a|x]]\n```\n[[Code]]\n```\n[[B#h]]"
+    assert extract_links(content) == ("a", "b")
+
+
+def test_backlinks_orphans_and_broken(tmp_path: Path) -> None:
+    """Both adjacencies, orphans and broken links come from one build."""
+    graph = LinkGraph(_vault(tmp_path))
+    assert _refresh(graph)
+
+    alpha = graph.resolve("[[alpha]]")
+    assert alpha is not None
+    assert graph.backlinks(alpha) == ["Hub.md", "notes/Beta.md"]
+    assert graph.resolve("notes/Beta.md") == graph.resolve("Beta")
+    assert graph.resolve("Nope") is None
+    # Self-links do not count; Hub is linked from Alpha
+    assert graph.orphans() == []
+    assert graph.outlinks(graph.resolve("Beta")) == ["notes/Alpha.md"]
+    assert graph.broken_links() == [("notes/Alpha.md", "missing")]
+
+
+def test_refresh_is_incremental(tmp_path: Path) -> None:
+    """Only changed notes are re-read, and edges follow edits and deletes."""
+    vault = _vault(tmp_path)
+    graph = LinkGraph(vault)
+    _refresh(graph)
+    assert not _refresh(graph)
+
+    # Touched but identical content: stored links are reused
+    index = vault / "Index.md"
+    stat = index.stat()
+    os.utime(index, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    graph.links[graph.resolve("Index")] = ("sentinel",)
+    assert _refresh(graph)
+    assert graph.links[graph.resolve("Index")] == ("sentinel",)
+
+    _write(vault, "Hub.md", "Only [[Index]] now.\n")
+    (vault / "notes" / "Beta.md").unlink()
+    assert _refresh(graph)
+    assert graph.resolve("Beta") is None
+    assert graph.backlinks(graph.resolve("Alpha")) == []
+    assert graph.orphans() == ["notes/Alpha.md"]
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    """A saved graph loads back unchanged, and only for its own vault."""
+    vault = _vault(tmp_path)
+    store = tmp_path / "state" / "link_graph.json"
+    graph = LinkGraph(vault)
+    _refresh(graph)
+    graph.save(store)
+
+    loaded = LinkGraph.load(store, vault)
+    assert loaded is not None
+    assert loaded.paths == graph.paths
+    assert loaded.in_targets == graph.in_targets
+    assert loaded.backlinks(loaded.resolve("Alpha")) == ["Hub.md", "notes/Beta.md"]
+    assert not _refresh(loaded)
+    assert LinkGraph.load(store, tmp_path) is None
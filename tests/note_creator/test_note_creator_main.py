@@ -33,6 +33,22 @@ class TestNoteFactory:
         assert note.priority == Priority.MEDIUM.value
         assert note.status == NoteStatus.TO_READ.value
 
+    def test_up_link_from_wizard(self) -> None:
+        """Should wrap the chosen parent in a wikilink, defaulting to blank."""
+        data = {
+            "title": "Child",
+            "template": NoteTemplate.INFO,
+            "priority": Priority.LOW,
+            "up": "Parent",
+        }
+        assert NoteFactory.create_note(data).up == "[[Parent]]"
+
+        data["up"] = "[[Parent]]"
+        assert NoteFactory.create_note(data).up == "[[Parent]]"
+
+        del data["up"]
+        assert NoteFactory.create_note(data).up == "[[ ]]"
+
     def test_create_project_note(self) -> None:
         """Should create ProjectNote for PROJECT template."""
         data = {
@@ -24,3 +24,16 @@ class TestNoteCreatorTUI:
         config: WizardConfig = args[0]
         assert config.title == "DX Vault Atlas · Note Creator"
         assert config.on_complete is None
+
+    @patch("dx_vault_atlas.services.note_creator.tui.run_wizard")
+    def test_run_tui_wires_link_suggestions(self, mock_run_wizard: MagicMock) -> None:
+        """run_tui should hand the suggestion callback to the up step only."""
+
+        def suggest(text: str) -> list[str]:
+            return [text]
+
+        run_tui(suggest)
+
+        config: WizardConfig = mock_run_wizard.call_args[0][0]
+        suggesting = [step.key for step in config.steps if step.suggest is suggest]
+        assert suggesting == ["up"]
@@ -7,6 +7,7 @@ from dx_vault_atlas.shared.tui.common_steps import (
     PRIORITY_STEP,
     TEMPLATE_STEP,
     TITLE_STEP,
+    UP_STEP,
 )
 from dx_vault_atlas.shared.tui.wizard import WizardConfig
 
@@ -51,18 +52,25 @@ class TestWizardStep:
 
         assert AREA_STEP.condition(project_data) is True
 
+    def test_up_step_is_autocomplete(self) -> None:
+        """Up step autocompletes, for every template."""
+        assert UP_STEP.step_type == "autocomplete"
+        assert UP_STEP.suggest is None  # wired in by run_tui
+        for template in NoteTemplate:
+            assert UP_STEP.condition({"template": template}) is True
+
 
 class TestNoteCreatorSteps:
     """Tests for NOTE_CREATOR_STEPS configuration."""
 
-    def test_has_four_steps(self) -> None:
-        """Should have 4 steps total."""
-        assert len(NOTE_CREATOR_STEPS) == 4
+    def test_has_five_steps(self) -> None:
+        """Should have 5 steps total."""
+        assert len(NOTE_CREATOR_STEPS) == 5
 
     def test_steps_in_correct_order(self) -> None:
         """Steps should be in correct order."""
         keys = [step.key for step in NOTE_CREATOR_STEPS]
-        assert keys == ["title", "template", "priority", "area"]
+        assert keys == ["title", "template", "priority", "area", "up"]
 
 
 class TestWizardConfig:
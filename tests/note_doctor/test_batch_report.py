@@ -0,0 +1,67 @@
+"""Tests for batch-mode outcomes and the streaming NDJSON report."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from dx_vault_atlas.services.note_doctor.core.report import (
+    NdjsonReport,
+    NoteOutcome,
+    changed_keys,
+)
+from dx_vault_atlas.services.note_doctor.validator import ValidationResult
+
+
+def test_changed_keys_covers_add_remove_modify() -> None:
+    """Added, removed and modified keys are all reported, sorted."""
+    before = {"a": 1, "b": 2, "c": 3}
+    after = {"a": 1, "b": 20, "d": 4}
+    assert changed_keys(before, after) == ["b", "c", "d"]
+
+
+def test_outcome_record_shape(tmp_path: Path) -> None:
+    """Report lines carry path, outcome, issues, fixes and timings."""
+    result = ValidationResult(
+        tmp_path / "n.md",
+        False,
+        missing_fields=["title"],
+        invalid_fields=["priority"],
+    )
+    outcome = NoteOutcome(
+        tmp_path / "n.md",
+        "invalid",
+        result,
+        applied_fixes=["tags"],
+        timings_ms={"fix": 0.12345},
+    )
+
+    record = outcome.to_record()
+
+    assert record["path"] == str(tmp_path / "n.md")
+    assert record["outcome"] == "invalid"
+    assert record["missing"] == ["title"]
+    assert record["invalid"] == ["priority"]
+    assert record["applied_fixes"] == ["tags"]
+    assert record["timings_ms"] == {"fix": 0.123}
+    assert outcome.needs_attention
+
+
+def test_report_streams_each_line(tmp_path: Path) -> None:
+    """Every record is on disk as soon as it is written."""
+    out = tmp_path / "reports" / "doctor.ndjson"
+
+    with NdjsonReport(out) as report:
+        report.write({"path": "a.md", "outcome": "valid"})
+        assert out.read_text(encoding="utf-8").count("\n") == 1
+        report.write({"path": Path("b.md"), "outcome": "fixed"})
+
+    lines = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert [line["path"] for line in lines] == ["a.md", "b.md"]
+    assert report.count == 2
+
+
+def test_report_requires_context_manager(tmp_path: Path) -> None:
+    """Writing outside the ``with`` block is an error."""
+    with pytest.raises(RuntimeError):
+        NdjsonReport(tmp_path / "x.ndjson").write({})
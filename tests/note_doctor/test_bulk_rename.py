@@ -0,0 +1,85 @@
+"""Tests for the two-phase bulk rename transaction behind ``--rename-all``."""
+
+from pathlib import Path
+
+import pytest
+
+from dx_vault_atlas.shared.core.bulk_rename import RenameError, RenameTransaction
+from dx_vault_atlas.shared.utils.filename_index import FilenameIndex
+
+
+def _files(tmp_path: Path, *names: str) -> list[Path]:
+    paths = []
+    for name in names:
+        path = tmp_path / name
+        path.write_text(name, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _contents(tmp_path: Path) -> dict[str, str]:
+    return {
+        p.name: p.read_text(encoding="utf-8") for p in sorted(tmp_path.glob("*.md"))
+    }
+
+
+def test_apply_swaps_a_cycle(tmp_path: Path) -> None:
+    """Two notes can trade names through the temporary phase."""
+    a, b = _files(tmp_path, "a.md", "b.md")
+    journal = tmp_path / "journal.json"
+
+    plan = FilenameIndex([a, b]).plan([(a, b), (b, a)])
+    RenameTransaction(plan, journal).apply()
+
+    assert plan == [(a, b), (b, a)]
+    assert _contents(tmp_path) == {"a.md": "b.md", "b.md": "a.md"}
+    assert not journal.exists()
+
+
+def test_failure_rolls_everything_back(tmp_path: Path) -> None:
+    """One failed move restores every file and leaves no temp names."""
+    a, b, taken = _files(tmp_path, "a.md", "b.md", "taken.md")
+    plan = [(a, tmp_path / "a2.md"), (b, taken)]
+
+    with pytest.raises(RenameError):
+        RenameTransaction(plan, tmp_path / "journal.json").apply()
+
+    assert _contents(tmp_path) == {
+        "a.md": "a.md",
+        "b.md": "b.md",
+        "taken.md": "taken.md",
+    }
+    assert not list(tmp_path.glob(".*"))
+
+
+def test_recover_undoes_interrupted_prepare(tmp_path: Path) -> None:
+    """A crash while staging is undone back to the original names."""
+    (a,) = _files(tmp_path, "a.md")
+    journal = tmp_path / "journal.json"
+    tx = RenameTransaction([(a, tmp_path / "z.md")], journal)
+    tx._write_journal("prepare")
+    a.rename(tx.moves[0][1])
+
+    assert RenameTransaction.recover(journal) == 1
+    assert _contents(tmp_path) == {"a.md": "a.md"}
+    assert not journal.exists()
+
+
+def test_recover_completes_interrupted_commit(tmp_path: Path) -> None:
+    """A crash while committing is rolled forward to the final names."""
+    a, b = _files(tmp_path, "a.md", "b.md")
+    journal = tmp_path / "journal.json"
+    tx = RenameTransaction([(a, b), (b, a)], journal)
+    for src, tmp, _dst in tx.moves:
+        src.rename(tmp)
+    tx._write_journal("commit")
+    tx.moves[0][1].rename(b)  # first final move done, then "crash"
+
+    assert RenameTransaction.recover(journal) == 1
+    assert _contents(tmp_path) == {"a.md": "b.md", "b.md": "a.md"}
+    assert not journal.exists()
+
+
+def test_recover_without_journal_is_a_no_op(tmp_path: Path) -> None:
+    """No journal means nothing to recover."""
+    assert RenameTransaction.recover(tmp_path / "missing.json") == 0
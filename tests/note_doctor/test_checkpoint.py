@@ -0,0 +1,148 @@
+"""Tests for the interactive doctor checkpoint used by ``--resume``."""
+
+import json
+from pathlib import Path
+
+import dx_vault_atlas.shared.models.note  # noqa: F401
+from dx_vault_atlas.services.note_doctor.app import create_app
+from dx_vault_atlas.services.note_doctor.checkpoint import DoctorCheckpoint
+from dx_vault_atlas.services.note_doctor.session import DoctorSession
+from dx_vault_atlas.services.note_doctor.validator import ValidationResult
+from dx_vault_atlas.shared.config import GlobalConfig
+from dx_vault_atlas.shared.core.io import file_fingerprint
+
+
+def _note(tmp_path: Path, name: str) -> ValidationResult:
+    path = tmp_path / name
+    path.write_text("---\ntitle: x\n---\n", encoding="utf-8")
+    return ValidationResult(path, False, missing_fields=["type"])
+
+
+def test_round_trip_and_progress(tmp_path: Path) -> None:
+    """Renames, applied keys and the position survive a reload."""
+    store = tmp_path / "state" / "checkpoint.json"
+    results = [_note(tmp_path, "a.md"), _note(tmp_path, "b.md")]
+
+    checkpoint = DoctorCheckpoint.start(tmp_path, results, path=store)
+    checkpoint.relocate(tmp_path / "a2.md")
+    checkpoint.advance(["type", "status"])
+
+    loaded = DoctorCheckpoint.load(store)
+    assert loaded is not None
+    assert loaded.position == 1
+    assert loaded.queue[0].path == str(tmp_path / "a2.md")
+    assert loaded.queue[0].applied == ["status", "type"]
+    assert [e.file_path.name for e in loaded.remaining] == ["b.md"]
+    assert loaded.remaining[0].missing == ["type"]
+
+    loaded.advance([])
+    assert loaded.done
+    loaded.clear()
+    assert DoctorCheckpoint.load(store) is None
+    assert not checkpoint.journal.exists()
+
+
+def test_progress_is_journalled_not_rewritten(tmp_path: Path) -> None:
+    """The queue is written once; a torn last journal line is ignored."""
+    store = tmp_path / "c.json"
+    results = [_note(tmp_path, f"{i}.md") for i in range(3)]
+    checkpoint = DoctorCheckpoint.start(tmp_path, results, path=store)
+    queue_file = store.read_bytes()
+
+    checkpoint.advance(["type"])
+    checkpoint.advance([])
+    assert store.read_bytes() == queue_file
+
+    with checkpoint.journal.open("a", encoding="utf-8") as f:
+        f.write('{"at": 2, "adv')
+    loaded = DoctorCheckpoint.load(store)
+    assert loaded is not None
+    assert loaded.position == 2
+    assert loaded.queue[0].applied == ["type"]
+
+
+def test_fingerprint_detects_changes(tmp_path: Path) -> None:
+    """Editing a queued note changes its fingerprint."""
+    result = _note(tmp_path, "a.md")
+    checkpoint = DoctorCheckpoint.start(tmp_path, [result], path=tmp_path / "c.json")
+    entry = checkpoint.queue[0]
+
+    assert entry.is_unchanged(file_fingerprint(result.file_path))
+    result.file_path.write_text("---\ntitle: changed\n---\n", encoding="utf-8")
+    assert not entry.is_unchanged(file_fingerprint(result.file_path))
+
+
+def test_unreadable_or_foreign_format_is_ignored(tmp_path: Path) -> None:
+    """Corrupt files and other format versions load as no checkpoint."""
+    store = tmp_path / "c.json"
+    store.write_text("{not json", encoding="utf-8")
+    assert DoctorCheckpoint.load(store) is None
+
+    store.write_text(json.dumps({"format": 999}), encoding="utf-8")
+    assert DoctorCheckpoint.load(store) is None
+
+
+def test_session_advances_checkpoint_per_handled_note(tmp_path: Path) -> None:
+    """Quitting mid-note leaves the checkpoint on that note."""
+    results = [_note(tmp_path, "a.md"), _note(tmp_path, "b.md")]
+    checkpoint = DoctorCheckpoint.start(tmp_path, results, path=tmp_path / "c.json")
+
+    class _TUI:
+        def prepare(self, result: ValidationResult) -> object:
+            return result
+
+        def config_for(
+            self,
+            prepared: object,  # noqa: ARG002
+            title: str | None = None,
+        ) -> str:
+            return title or ""
+
+    class _App:
+        tui = _TUI()
+
+    session = DoctorSession(
+        _App(),  # type: ignore[arg-type]
+        ["a.md", "b.md"],
+        iter([(r, None) for r in results]),
+        max_attempts=2,
+        checkpoint=checkpoint,
+    )
+    session.next_config()
+    session.skip()
+    session.next_config()
+
+    assert DoctorCheckpoint.load(tmp_path / "c.json").position == 1
+
+
+def test_cli_loop_records_renames_and_applied_keys(tmp_path: Path) -> None:
+    """Debug mode keeps the checkpoint in step like the TUI session."""
+    note = tmp_path / "old.md"
+    note.write_text(
+        "---\ntitle: New Name\ntype: ref\naliases: [New Name]\npriority: 999\n---\n",
+        encoding="utf-8",
+    )
+    doctor = create_app(GlobalConfig(vault_path=tmp_path, vault_inbox=tmp_path))
+    doctor.cli = _QuietCLI({"priority": 3})
+    result = doctor.validator.validate(note)
+    checkpoint = DoctorCheckpoint.start(tmp_path, [result], path=tmp_path / "c.json")
+
+    doctor._process_invalid_results([result], debug_mode=True, checkpoint=checkpoint)
+
+    entry = checkpoint.queue[0]
+    assert entry.path == str(tmp_path / "new_name.md")
+    assert entry.applied == ["priority"]
+    assert checkpoint.done
+
+
+class _QuietCLI:
+    """DoctorCLI stand-in answering every prompt with fixed fixes."""
+
+    def __init__(self, fixes: dict[str, object]) -> None:
+        self.fixes = fixes
+
+    def gather_fixes(self, result: ValidationResult) -> dict[str, object]:  # noqa: ARG002
+        return dict(self.fixes)
+
+    def __getattr__(self, name: str) -> object:
+        return lambda *_args, **_kwargs: None
@@ -0,0 +1,141 @@
+"""Columnar batch validation must agree with per-note validation."""
+
+from pathlib import Path
+
+import pytest
+
+import dx_vault_atlas.shared.models.note  # noqa: F401
+from dx_vault_atlas.services.note_doctor.columnar import (
+    ColumnarValidator,
+    FrontmatterTable,
+)
+from dx_vault_atlas.services.note_doctor.core.profiler import RuleProfiler
+from dx_vault_atlas.services.note_doctor.validator import NoteDoctorValidator
+from dx_vault_atlas.shared.core.io import iter_chunks
+from dx_vault_atlas.shared.yaml_parser import YamlParserService
+
+SCENARIOS_DIR = Path(__file__).parent / "doctor_scenarios"
+
+_TASK = """---
+version: '1.0'
+type: task
+title: {title}
+aliases: [{title}]
+tags: []
+created: 2025-01-01 12:00:00
+updated: 2025-01-01 12:00:00
+priority: {priority}
+status: {status}
+area: {area}
+---
+body
+"""
+
+_VARIANTS = [
+    {"priority": 3, "status": "to_do", "area": "work"},
+    {"priority": 9, "status": "to_do", "area": "work"},
+    {"priority": "High", "status": "to_do", "area": "work"},
+    {"priority": 1, "status": "doing", "area": "work"},
+    {"priority": 1, "status": "to_do", "area": "Work"},
+    {"priority": 1, "status": "to_do", "area": "''"},
+    {"priority": 1, "status": "[to_do]", "area": "work"},
+]
+
+
+@pytest.fixture
+def validator() -> NoteDoctorValidator:
+    """Per-note validator the columnar one wraps."""
+    return NoteDoctorValidator(YamlParserService())
+
+
+def _assert_same(columnar: list, per_note: list) -> None:
+    for got, want in zip(columnar, per_note, strict=True):
+        assert got.file_path == want.file_path
+        assert got.is_valid == want.is_valid, got.file_path.name
+        assert got.missing_fields == want.missing_fields, got.file_path.name
+        assert got.invalid_fields == want.invalid_fields, got.file_path.name
+        assert got.warnings == want.warnings, got.file_path.name
+        assert got.error == want.error, got.file_path.name
+
+
+def test_scenarios_match_per_note(validator: NoteDoctorValidator) -> None:
+    """Every doctor scenario yields the same result in batch mode."""
+    paths = sorted(SCENARIOS_DIR.glob("*.md"))
+    batch = ColumnarValidator(validator).validate_batch(paths)
+    _assert_same(batch, [validator.validate(p) for p in paths])
+
+
+def test_enum_variants_match_per_note(
+    validator: NoteDoctorValidator, tmp_path: Path
+) -> None:
+    """Enum and shape variants are routed exactly like per-note validation."""
+    paths = []
+    for i, variant in enumerate(_VARIANTS):
+        title = f"note {i}"
+        path = tmp_path / f"20250101120000_note_{i}.md"
+        path.write_text(_TASK.format(title=title, **variant), encoding="utf-8")
+        paths.append(path)
+
+    batch = ColumnarValidator(validator).validate_batch(paths)
+    _assert_same(batch, [validator.validate(p) for p in paths])
+    assert batch[0].is_valid
+    assert not any(r.is_valid for r in batch[1:])
+
+
+def test_valid_rows_skip_per_note_validation(
+    validator: NoteDoctorValidator,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Rows passing the column checks never reach the per-note validator."""
+    fm = {
+        "version": "1.0",
+        "type": "ref",
+        "title": "Fast",
+        "aliases": ["Fast"],
+        "tags": [],
+    }
+    calls: list[Path] = []
+    original = validator.validate_content
+    monkeypatch.setattr(
+        validator,
+        "validate_content",
+        lambda p, f, b: calls.append(p) or original(p, f, b),
+    )
+
+    table = FrontmatterTable(
+        [tmp_path / "fast.md", tmp_path / "slow.md"],
+        [fm, {**fm, "title": "Slow", "aliases": "Slow"}],
+        ["", ""],
+    )
+    results = ColumnarValidator(validator).validate_table(table)
+
+    assert results[0].is_valid
+    assert not results[1].is_valid
+    assert calls == [tmp_path / "slow.md"]
+
+
+def test_profiled_rules_keep_the_column_fast_path(
+    validator: NoteDoctorValidator, tmp_path: Path
+) -> None:
+    """Rules wrapped by the profiler are still recognised as column rules."""
+    profiler = RuleProfiler()
+    validator.rules = profiler.wrap_validation_rules(validator.rules)
+    fm = {
+        "version": "1.0",
+        "type": "ref",
+        "title": "Fast",
+        "aliases": ["Fast"],
+        "tags": [],
+    }
+    table = FrontmatterTable([tmp_path / "fast.md"], [fm], [""])
+
+    assert ColumnarValidator(validator).validate_table(table)[0].is_valid
+    calls = {s.name: s.calls for s in profiler.sorted_stats()}
+    assert calls["PriorityRule"] == 0
+    assert calls["VersionRule"] == 0
+
+
+def test_iter_chunks() -> None:
+    """Chunks hold at most *size* items; the last one may be shorter."""
+    assert list(iter_chunks(range(5), 2)) == [[0, 1], [2, 3], [4]]
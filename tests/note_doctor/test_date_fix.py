@@ -0,0 +1,163 @@
+"""Tests for the head-only, parallel ``--fix-date`` engine."""
+
+import random
+import shutil
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from dx_vault_atlas.services.note_doctor.app import create_app
+from dx_vault_atlas.services.note_doctor.core.fixer import DateFixRule
+from dx_vault_atlas.services.note_doctor.core.profiler import RuleProfiler
+from dx_vault_atlas.services.note_doctor.date_fix import (
+    _FULL,
+    DateFixEngine,
+    read_date_head,
+)
+from dx_vault_atlas.shared.config import GlobalConfig
+from dx_vault_atlas.shared.core.io import NoteIOService
+from dx_vault_atlas.shared.tracing import TRACER
+from dx_vault_atlas.shared.utils.date_resolver import DateResolver
+from dx_vault_atlas.shared.yaml_parser import YamlParserService
+
+SCENARIOS = Path(__file__).parent / "doctor_scenarios"
+NOW = datetime(2026, 1, 1, 12, 0, 0)
+
+_STEMS = ["20250101120000_a", "202501011200_b", "c", "20990101120000_future"]
+_CREATED = [
+    None,
+    "2025-01-01 12:00:00",
+    "2025-01-01",
+    "01-02-2024",
+    "2099-01-01 00:00:00",
+    "'2025-01-01T12:00:00'",
+    "",
+]
+_UPDATED = [None, "2024-01-01 00:00:00", "2025-06-01 00:00:00", "garbage"]
+
+
+def _serial_fix(paths: list[Path]) -> list[Path]:
+    """Reference: the original read-everything, one-note-at-a-time loop."""
+    io = NoteIOService(YamlParserService())
+    rule = DateFixRule(DateResolver(NOW))
+    fixed = []
+    for path in paths:
+        parsed = io.read_note(path)
+        if not parsed:
+            continue
+        new_fm = parsed.frontmatter.copy()
+        if rule.apply(path, parsed.frontmatter, new_fm) and io.write_note(
+            path, new_fm, parsed.body
+        ):
+            fixed.append(path)
+    return fixed
+
+
+def _random_vault(root: Path, count: int, seed: int) -> None:
+    rng = random.Random(seed)
+    root.mkdir()
+    for i in range(count):
+        lines = ["---", "title: x"]
+        created, updated = rng.choice(_CREATED), rng.choice(_UPDATED)
+        if created is not None:
+            lines.append(f"created: {created}")
+        if updated is not None:
+            lines.append(f"updated: {updated}")
+        lines.append("---")
+        (root / f"{rng.choice(_STEMS)}_{i}.md").write_text(
+            "\n".join(lines) + "\nbody\n", encoding="utf-8"
+        )
+
+
+def _snapshot(root: Path) -> dict[str, str]:
+    return {p.name: p.read_text(encoding="utf-8") for p in sorted(root.rglob("*.md"))}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_engine_matches_serial_fix(tmp_path: Path, workers: int) -> None:
+    """Head-only, chunked fixing writes exactly what the serial loop does."""
+    expected, actual = tmp_path / "expected", tmp_path / "actual"
+    _random_vault(expected, 300, seed=7)
+    shutil.copytree(SCENARIOS, expected / "scenarios")
+    shutil.copytree(expected, actual)
+
+    serial = _serial_fix(sorted(expected.rglob("*.md")))
+    engine = DateFixEngine(now=NOW, workers=workers, chunk_size=32)
+    fast = list(engine.run(sorted(actual.rglob("*.md"))))
+
+    assert [p.relative_to(actual) for p in fast] == [
+        p.relative_to(expected) for p in serial
+    ]
+    assert _snapshot(actual) == _snapshot(expected)
+
+
+def test_head_decodes_only_simple_frontmatter(tmp_path: Path) -> None:
+    """Plain date lines decode; anything unusual takes the full path."""
+    note = tmp_path / "n.md"
+
+    note.write_text("---\ncreated: 2025-01-01 12:00:00\n---\nbody", encoding="utf-8")
+    assert read_date_head(note) == {"created": datetime(2025, 1, 1, 12, 0, 0)}
+
+    note.write_text("no frontmatter", encoding="utf-8")
+    assert read_date_head(note) is _FULL
+
+    note.write_text("---\ncreated: >\n  2025\n---\n", encoding="utf-8")
+    assert read_date_head(note) is _FULL
+
+
+def test_head_resolves_serializer_anchors(tmp_path: Path) -> None:
+    """Notes written by the doctor share one anchored date object."""
+    note = tmp_path / "n.md"
+    note.write_text(
+        "---\ncreated: &id001 2025-01-01 12:00:00\nupdated: *id001\n---\n",
+        encoding="utf-8",
+    )
+    head = read_date_head(note)
+    assert head == {
+        "created": datetime(2025, 1, 1, 12, 0, 0),
+        "updated": datetime(2025, 1, 1, 12, 0, 0),
+    }
+
+
+def test_given_rule_runs_in_process(tmp_path: Path) -> None:
+    """A profiled rule is used as is and records one call per note."""
+    _random_vault(tmp_path / "vault", 200, seed=3)
+    paths = sorted((tmp_path / "vault").glob("*.md"))
+    profiler = RuleProfiler()
+    rule = profiler.wrap_fix_rule(DateFixRule(DateResolver(NOW)))
+
+    TRACER.start()
+    try:
+        engine = DateFixEngine(now=NOW, workers=4, chunk_size=8, rule=rule)
+        fixed = list(engine.run(paths))
+    finally:
+        TRACER.stop()
+
+    assert engine.workers == 1
+    assert fixed
+    (stats,) = profiler.sorted_stats()
+    assert stats.name == "DateFixRule"
+    assert stats.calls == len(paths)
+    assert stats.hits == len(fixed)
+    names = {e["name"] for e in TRACER.to_dict()["traceEvents"] if e["ph"] == "X"}
+    assert {"doctor.fix_date", "DateFixRule"} <= names
+
+
+def test_profiled_doctor_reports_the_date_rule(tmp_path: Path) -> None:
+    """``--fix-date --profile-rules`` measures the app's wrapped date rule."""
+    vault = tmp_path / "vault"
+    _random_vault(vault, 50, seed=5)
+    settings = GlobalConfig(vault_path=vault, vault_inbox=vault)
+    doctor = create_app(settings, profile_rules=True)
+    doctor.cli = SimpleNamespace(
+        show_note_date_fixed=lambda _name: None,
+        show_date_fix_result=lambda _fixed: None,
+    )
+
+    doctor._run_date_fix_mode(sorted(vault.glob("*.md")))
+
+    assert doctor.profiler is not None
+    by_name = {s.name: s for s in doctor.profiler.sorted_stats()}
+    assert by_name["DateFixRule"].calls >= 50
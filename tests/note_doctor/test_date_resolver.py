@@ -0,0 +1,116 @@
+"""Tests for the memoized, digit-slicing DateResolver."""
+
+import random
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from dx_vault_atlas.services.note_doctor.core.fixer import DateFixRule
+from dx_vault_atlas.shared.utils import date_resolver
+from dx_vault_atlas.shared.utils.date_resolver import DateResolver
+
+
+def _strptime_or_none(ts: str) -> datetime | None:
+    fmt = "%Y%m%d%H%M%S" if len(ts) == 14 else "%Y%m%d%H%M"
+    try:
+        return datetime.strptime(ts, fmt)
+    except ValueError:
+        return None
+
+
+def test_parse_matches_strptime() -> None:
+    """Slicing agrees with ``strptime`` on valid and impossible timestamps."""
+    rng = random.Random(30)
+    samples = ["20250101120000", "202501011200", "20251301000000", "20250230000000",
+               "20250101240000", "20250101126000", "20250101120060", "00000101000000"]
+    for _ in range(2000):
+        parts = [
+            rng.randint(1900, 2100),
+            rng.randint(0, 13),
+            rng.randint(0, 32),
+            rng.randint(0, 25),
+            rng.randint(0, 61),
+            rng.randint(0, 61),
+        ]
+        ts = "".join(f"{p:0{4 if i == 0 else 2}d}" for i, p in enumerate(parts))
+        samples += [ts, ts[:12]]
+
+    for ts in samples:
+        assert DateResolver.parse_timestamp(ts) == _strptime_or_none(ts), ts
+
+
+def test_future_check_uses_run_scoped_now() -> None:
+    """Stems after the captured "now" are rejected."""
+    resolver = DateResolver(now=datetime(2025, 6, 1))
+
+    assert resolver.resolve_created(Path("20250101120000_a.md"), {}) == datetime(
+        2025, 1, 1, 12
+    )
+    assert resolver.resolve_created(Path("20250701120000_a.md"), {}) is None
+    assert resolver.resolve_created(Path("no_timestamp.md"), {}) is None
+
+
+def test_fixer_future_check_uses_run_scoped_now() -> None:
+    """The fixer and its issue check compare against the resolver's "now"."""
+    rule = DateFixRule(DateResolver(now=datetime(2025, 6, 1)))
+    path = Path("no_timestamp.md")
+    past = {"created": datetime(2025, 5, 1, 9), "updated": datetime(2025, 5, 1, 9)}
+    future = {"created": datetime(2025, 7, 1, 9), "updated": datetime(2025, 7, 1, 9)}
+
+    assert rule.issues(path, past) == []
+    assert rule.issues(path, future) == ["created"]
+
+    fixed = dict(future)
+    assert rule.apply(path, future, fixed)
+    assert fixed["created"] is None
+
+
+def test_stems_are_parsed_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Repeated lookups of the same stem hit the memo."""
+    resolver = DateResolver()
+    calls: list[str] = []
+    original = DateResolver.parse_timestamp
+    monkeypatch.setattr(
+        DateResolver,
+        "parse_timestamp",
+        staticmethod(lambda ts: calls.append(ts) or original(ts)),
+    )
+
+    path = Path("20250101120000_note.md")
+    resolver.resolve_created(path, {})
+    resolver.stem_matches(path.stem, datetime(2025, 1, 1, 12))
+    assert resolver.stem_timestamp(path.stem) == "20250101120000"
+    assert calls == ["20250101120000"]
+
+
+def test_stem_memo_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The memo evicts the least recently used stem beyond its size."""
+    monkeypatch.setattr(date_resolver, "STEM_MEMO_SIZE", 2)
+    resolver = DateResolver()
+
+    resolver.stem_timestamp("20250101120000_a")
+    resolver.stem_timestamp("20250101120000_b")
+    resolver.stem_timestamp("20250101120000_a")
+    resolver.stem_timestamp("20250101120000_c")
+
+    assert list(resolver._stems) == ["20250101120000_a", "20250101120000_c"]
+
+
+@pytest.mark.parametrize(
+    ("stem", "created"),
+    [
+        ("20250101120000_a", datetime(2025, 1, 1, 12)),
+        ("20250101120000_a", datetime(2025, 1, 1, 12, 0, 0, 500)),
+        ("20250101120000_a", datetime(2025, 1, 1, 12, tzinfo=UTC)),
+        ("20250101120001_a", datetime(2025, 1, 1, 12)),
+        ("202501011200_a", datetime(2025, 1, 1, 12)),
+        ("a", datetime(2025, 1, 1, 12)),
+    ],
+)
+def test_stem_matches_strftime(stem: str, created: datetime) -> None:
+    """Datetime comparison agrees with the previous string comparison."""
+    expected = DateResolver.extract_timestamp_from_stem(stem) == created.strftime(
+        "%Y%m%d%H%M%S"
+    )
+    assert DateResolver().stem_matches(stem, created) is expected
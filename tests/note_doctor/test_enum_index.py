@@ -0,0 +1,69 @@
+"""Tests for the precomputed enum normalization index."""
+
+from pathlib import Path
+
+import dx_vault_atlas.shared.models.note  # noqa: F401
+from dx_vault_atlas.services.note_doctor.core.fixer import EnumFixRule, NoteFixer
+from dx_vault_atlas.services.note_doctor.validator import NoteDoctorValidator
+from dx_vault_atlas.shared.utils.enum_index import NormalizationIndex
+from dx_vault_atlas.shared.yaml_parser import YamlParserService
+
+
+def test_spelling_variants_resolve_to_canonical() -> None:
+    """Casing, dash/space variants and member names all resolve."""
+    index = NormalizationIndex.build()
+
+    assert index.lookup("status", "In Progress") == "in_progress"
+    assert index.lookup("status", "to-do") == "to_do"
+    assert index.lookup("status", "bogus") is None
+    assert index.lookup("area", " WORK ") == "work"
+    assert index.lookup("priority", "High") == 3
+    assert index.lookup("type", "TASK.md") == "task"
+    assert index.lookup("type", "note") == "note"
+    assert index.lookup("unknown_field", "x") is None
+
+
+def test_value_mappings_extend_the_index() -> None:
+    """User mappings resolve when their target is canonical."""
+    index = NormalizationIndex.build(
+        {
+            "status": {"wip": "In Progress", "nope": "not-a-status"},
+            "unindexed": {"a": "b"},
+        }
+    )
+
+    assert index.lookup("status", "WIP") == "in_progress"
+    assert index.lookup("status", "nope") is None
+
+
+def test_complete_prefix() -> None:
+    """The same tables back prefix completion."""
+    index = NormalizationIndex.build()
+
+    assert index.complete("status", "to") == ["to_do", "to_read"]
+    assert index.complete("area") == ["personal", "work"]
+    assert index.complete("missing", "x") == []
+
+
+def test_fixer_and_validator_share_mappings(tmp_path: Path) -> None:
+    """A mapped status selects the enum rule and is canonicalized, not dropped."""
+    index = NormalizationIndex.build({"status": {"wip": "in_progress"}})
+    validator = NoteDoctorValidator(YamlParserService())
+    fixer = NoteFixer([EnumFixRule(index)])
+    fm = {"type": "task", "title": "T", "status": "wip", "priority": 1}
+
+    result = validator.validate_content(tmp_path / "t.md", fm, "")
+    assert [type(r) for r in fixer.rules_for(result)] == [EnumFixRule]
+
+    changed, fixed, _ = fixer.fix(tmp_path / "t.md", dict(fm), "", result=result)
+    assert changed
+    assert fixed["status"] == "in_progress"
+
+
+def test_canonical_membership() -> None:
+    """Only canonical values are members; unhashable values are not."""
+    index = NormalizationIndex.build()["status"]
+
+    assert "in_progress" in index
+    assert "WIP" not in index
+    assert ["in_progress"] not in index
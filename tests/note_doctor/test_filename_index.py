@@ -0,0 +1,96 @@
+"""Tests for the filename index used to plan collision-free renames."""
+
+from pathlib import Path
+
+from dx_vault_atlas.shared.core.io import NoteIOService
+from dx_vault_atlas.shared.utils.filename_index import DirectoryProbe, FilenameIndex
+from dx_vault_atlas.shared.yaml_parser import YamlParserService
+
+VAULT = Path("/vault")
+
+
+def test_free_target_is_kept() -> None:
+    """A target nobody holds is returned unchanged."""
+    index = FilenameIndex([VAULT / "a.md"])
+    assert index.resolve(VAULT / "b.md", owner=VAULT / "a.md") == VAULT / "b.md"
+
+
+def test_case_and_sanitize_equivalent_names_clash() -> None:
+    """Case-only and sanitize-equivalent names count as taken."""
+    index = FilenameIndex([VAULT / "Note.md", VAULT / "sub" / "My Idea.md"])
+
+    assert index.is_taken(VAULT / "note.md")
+    assert index.is_taken(VAULT / "my_idea.md")
+    assert index.resolve(VAULT / "note.md") == VAULT / "note_2.md"
+
+
+def test_own_entry_never_clashes() -> None:
+    """A case-only rename of a note is not a collision with itself."""
+    index = FilenameIndex([VAULT / "Note.md"])
+    target = VAULT / "note.md"
+    assert index.resolve(target, owner=VAULT / "Note.md") == target
+
+
+def test_suffix_is_deterministic() -> None:
+    """The first free numeric suffix is picked, every time."""
+    index = FilenameIndex([VAULT / "x.md", VAULT / "x_2.md"])
+    assert index.resolve(VAULT / "x.md") == VAULT / "x_3.md"
+    assert index.resolve(VAULT / "x.md") == VAULT / "x_3.md"
+
+
+def test_plan_reserves_targets_in_one_pass() -> None:
+    """Each planned move reserves its target for the next ones."""
+    a, b, c = VAULT / "a.md", VAULT / "b.md", VAULT / "c.md"
+    index = FilenameIndex([a, b, c])
+
+    plan = index.plan([(a, VAULT / "t.md"), (b, VAULT / "T.md"), (c, c)])
+
+    assert plan == [(a, VAULT / "t.md"), (b, VAULT / "T_2.md")]
+    # Planning does not mutate the live index
+    assert a in index
+    assert VAULT / "t.md" not in index
+
+
+def test_move_frees_the_old_name() -> None:
+    """A moved note releases its old name and holds the new one."""
+    index = FilenameIndex([VAULT / "a.md"])
+    index.move(VAULT / "a.md", VAULT / "b.md")
+    assert not index.is_taken(VAULT / "a.md")
+    assert index.is_taken(VAULT / "b.md")
+
+
+def test_incomplete_index_checks_disk(tmp_path: Path) -> None:
+    """Until the scan is done, unseen files on disk still clash."""
+    (tmp_path / "unseen.md").write_text("x", encoding="utf-8")
+    index = FilenameIndex(complete=False)
+
+    assert index.resolve(tmp_path / "unseen.md") == tmp_path / "unseen_2.md"
+    consumed = list(index.track([tmp_path / "unseen.md"]))
+    assert consumed == [tmp_path / "unseen.md"]
+    assert index.complete
+
+
+def test_directory_probe_checks_the_target_directory(tmp_path: Path) -> None:
+    """The probe finds case and sanitize clashes on disk and keeps nothing."""
+    (tmp_path / "My Note.md").write_text("x", encoding="utf-8")
+    (tmp_path / "other.md").write_text("x", encoding="utf-8")
+    probe = DirectoryProbe()
+
+    assert list(probe.track([tmp_path / "other.md"])) == [tmp_path / "other.md"]
+    assert len(probe) == 0
+    assert probe.resolve(tmp_path / "my_note.md") == tmp_path / "my_note_2.md"
+    assert probe.resolve(tmp_path / "OTHER.md") == tmp_path / "OTHER_2.md"
+    assert probe.resolve(tmp_path / "OTHER.md", owner=tmp_path / "other.md") == (
+        tmp_path / "OTHER.md"
+    )
+    assert probe.resolve(tmp_path / "free.md") == tmp_path / "free.md"
+
+
+def test_rename_note_refuses_to_clobber(tmp_path: Path) -> None:
+    """Renaming onto an existing file fails and leaves it intact."""
+    src, dst = tmp_path / "a.md", tmp_path / "b.md"
+    src.write_text("a", encoding="utf-8")
+    dst.write_text("b", encoding="utf-8")
+
+    assert not NoteIOService(YamlParserService()).rename_note(src, dst)
+    assert dst.read_text(encoding="utf-8") == "b"
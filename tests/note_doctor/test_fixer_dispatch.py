@@ -0,0 +1,171 @@
+"""Issue-driven fixer dispatch must match running the full rule chain."""
+
+import copy
+import random
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import dx_vault_atlas.shared.models.note  # noqa: F401
+from dx_vault_atlas.services.note_doctor.core.fixer import (
+    NoteFixer,
+    VersionFixRule,
+    default_fix_rules,
+)
+from dx_vault_atlas.services.note_doctor.validator import NoteDoctorValidator
+from dx_vault_atlas.shared.utils.date_resolver import DateResolver
+from dx_vault_atlas.shared.yaml_parser import YamlParserService
+
+SCENARIOS_DIR = Path(__file__).parent / "doctor_scenarios"
+
+_ABSENT = object()
+
+_POOLS: dict[str, list[Any]] = {
+    "type": ["task", "Task", "project", "ref", "moc", "info", "INFO.md",
+             "note", "bogus", "", None, 5, _ABSENT],
+    "title": ["Note", "Other", "", None, 3, _ABSENT],
+    "aliases": [["Note"], ["Other"], [], "Note", "Other", None, _ABSENT],
+    "tags": [[], ["x"], None, "x", _ABSENT],
+    "status": ["to_do", "To Do", "doing", "", [], ["Doing"], "bogus", 3,
+               None, _ABSENT],
+    "area": ["work", "Work", "", "nowhere", None, _ABSENT],
+    "priority": [1, 3, "High", 9, None, _ABSENT],
+    "version": ["1.0", 1.0, "0.9", "1.0.0", _ABSENT],
+    "created": [
+        datetime(2025, 1, 1, 12),
+        datetime(2025, 1, 1, 12, tzinfo=UTC),
+        datetime(2099, 1, 1),
+        date(2025, 1, 1),
+        "2025-01-01 12:00:00",
+        "01-02-2025",
+        "01/02/2025 10:00:00",
+        None,
+        _ABSENT,
+    ],
+    "updated": [datetime(2024, 1, 1), datetime(2025, 6, 1), "x", None, _ABSENT],
+    "up": ["[[MOC]]", None, _ABSENT],
+    "foo": [1, _ABSENT],
+}
+
+_STEMS = [
+    "20250101120000_note",
+    "202501011200_note",
+    "20991231235959_note",
+    "20251301000000_note",
+    "note",
+]
+
+
+def _full_fixer() -> NoteFixer:
+    return NoteFixer(default_fix_rules(date_resolver=DateResolver()))
+
+
+def _random_frontmatter(rng: random.Random) -> dict[str, Any]:
+    fm = {}
+    for key, pool in _POOLS.items():
+        value = rng.choice(pool)
+        if value is not _ABSENT:
+            fm[key] = copy.deepcopy(value)
+    return fm
+
+
+@pytest.fixture
+def validator() -> NoteDoctorValidator:
+    """Validator reporting the field codes the fixer dispatches on."""
+    return NoteDoctorValidator(YamlParserService())
+
+
+def _assert_dispatch_matches(
+    fixer: NoteFixer,
+    validator: NoteDoctorValidator,
+    path: Path,
+    fm: dict[str, Any],
+) -> None:
+    result = validator.validate_content(path, fm, "")
+    expected = fixer.fix(path, copy.deepcopy(fm), "")
+    got = fixer.fix(path, copy.deepcopy(fm), "", result=result)
+    assert got == expected, (path.name, fm)
+
+
+def test_scenarios_match_full_chain(validator: NoteDoctorValidator) -> None:
+    """Dispatching on issue codes changes exactly what the full chain does."""
+    fixer = _full_fixer()
+    for path in sorted(SCENARIOS_DIR.glob("*.md")):
+        parsed = validator.read_note(path)
+        if isinstance(parsed, tuple):
+            _assert_dispatch_matches(fixer, validator, path, parsed[0])
+
+
+def test_random_frontmatter_matches_full_chain(
+    validator: NoteDoctorValidator, tmp_path: Path
+) -> None:
+    """Randomised frontmatter combinations agree with the full chain."""
+    rng = random.Random(28)
+    fixer = _full_fixer()
+    for _ in range(3000):
+        path = tmp_path / f"{rng.choice(_STEMS)}.md"
+        _assert_dispatch_matches(fixer, validator, path, _random_frontmatter(rng))
+
+
+def test_clean_note_runs_no_rules(
+    validator: NoteDoctorValidator, tmp_path: Path
+) -> None:
+    """A valid, canonical note is skipped by every rule."""
+    created = datetime(2025, 1, 1, 12)
+    fm = {
+        "version": "1.0",
+        "type": "ref",
+        "title": "Clean",
+        "aliases": ["Clean"],
+        "tags": [],
+        "created": created,
+        "updated": created,
+        "up": "[[Index]]",
+    }
+    path = tmp_path / "20250101120000_clean.md"
+    result = validator.validate_content(path, fm, "")
+
+    assert result.is_valid
+    assert not result.missing_fields
+    assert not result.invalid_fields
+    assert _full_fixer().rules_for(result) == []
+
+
+def test_rules_without_handles_always_run(
+    validator: NoteDoctorValidator, tmp_path: Path
+) -> None:
+    """Rules whose ``handles`` is None are never skipped."""
+
+    class MarkerRule:
+        handles = None
+
+        def issues(
+            self,
+            file_path: Path,  # noqa: ARG002
+            frontmatter: dict[str, Any],  # noqa: ARG002
+        ) -> list[str]:
+            return []
+
+        def apply(
+            self,
+            file_path: Path,  # noqa: ARG002
+            original: dict[str, Any],  # noqa: ARG002
+            updated: dict[str, Any],
+        ) -> bool:
+            updated["marker"] = True
+            return True
+
+    fixer = NoteFixer([VersionFixRule(), MarkerRule()])
+    result = validator.validate_content(
+        tmp_path / "a.md", {"type": "ref", "version": "1.0"}, ""
+    )
+
+    assert [type(r) for r in fixer.rules_for(result)] == [MarkerRule]
+
+
+def test_dispatched_rules_report_their_issues() -> None:
+    """Every rule that declares ``handles`` also reports its triggers."""
+    for rule in default_fix_rules():
+        assert callable(getattr(rule, "issues", None)), type(rule).__name__
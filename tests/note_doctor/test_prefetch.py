@@ -0,0 +1,64 @@
+"""Tests for the interactive-phase prefetch worker."""
+
+import threading
+from pathlib import Path
+
+from dx_vault_atlas.services.note_doctor.prefetch import PrefetchedNote, Prefetcher
+from dx_vault_atlas.shared.core.io import file_fingerprint
+
+
+def test_iterate_preserves_order_and_runs_off_thread() -> None:
+    """Items come back in input order, loaded by the prefetch worker."""
+    threads: set[str] = set()
+
+    def load(n: int) -> int:
+        threads.add(threading.current_thread().name)
+        return n * 10
+
+    pairs = list(Prefetcher(load, depth=2).iterate(range(5)))
+
+    assert pairs == [(0, 0), (1, 10), (2, 20), (3, 30), (4, 40)]
+    assert threads
+    assert all(t.startswith("doctor-prefetch") for t in threads)
+
+
+def test_loads_ahead_while_current_item_is_in_use() -> None:
+    """The next items are loaded before the consumer asks for them."""
+    loaded: list[int] = []
+    ahead = threading.Event()
+
+    def load(n: int) -> int:
+        loaded.append(n)
+        if n == 2:
+            ahead.set()
+        return n
+
+    items = Prefetcher(load, depth=2).iterate(range(10))
+    first, _ = next(items)
+
+    assert first == 0
+    assert ahead.wait(timeout=5)
+    assert loaded[:3] == [0, 1, 2]
+    items.close()
+
+
+def test_failed_load_yields_none() -> None:
+    """A load that raises yields None so the caller can go cold."""
+    def load(n: int) -> int:
+        if n == 1:
+            raise OSError("boom")
+        return n
+
+    assert list(Prefetcher(load).iterate([0, 1, 2])) == [(0, 0), (1, None), (2, 2)]
+
+
+def test_stale_file_is_detected(tmp_path: Path) -> None:
+    """A note edited after it was read ahead is stale."""
+    note = tmp_path / "n.md"
+    note.write_text("a", encoding="utf-8")
+    prefetched = PrefetchedNote(note, file_fingerprint(note))
+
+    assert prefetched.is_fresh()
+
+    note.write_text("changed", encoding="utf-8")
+    assert not prefetched.is_fresh()
@@ -0,0 +1,104 @@
+"""Tests for the stage timer and the ``--profile`` session."""
+
+import pstats
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from dx_vault_atlas.benchmarks.synthetic import VaultSpec, generate_vault
+from dx_vault_atlas.services.note_migrator.app import create_app
+from dx_vault_atlas.shared.profiling import (
+    STAGES,
+    ProfileSession,
+    StageTimer,
+    stage,
+)
+
+
+@pytest.fixture
+def timer() -> StageTimer:
+    """A started stage timer of its own."""
+    timer = StageTimer()
+    timer.start()
+    return timer
+
+
+def _times(timer: StageTimer) -> dict[str, tuple[int, float]]:
+    return {s.name: (s.calls, s.seconds) for s in timer.breakdown()}
+
+
+def test_disabled_timer_records_nothing() -> None:
+    """An unstarted timer passes items through and records no stage."""
+    timer = StageTimer()
+    with timer.stage("read"):
+        pass
+    assert list(timer.timed_iter("scan", [1, 2])) == [1, 2]
+    assert timer.breakdown() == []
+
+
+def test_nested_stages_are_exclusive(timer: StageTimer) -> None:
+    """An inner stage's time is not counted again in the outer one."""
+    with timer.stage("validate"):
+        time.sleep(0.02)
+        with timer.stage("parse"):
+            time.sleep(0.05)
+    timer.stop()
+
+    times = _times(timer)
+    assert times["parse"][0] == times["validate"][0] == 1
+    assert times["parse"][1] >= 0.05
+    assert 0.02 <= times["validate"][1] < 0.05
+    assert timer.wall_ns >= 70_000_000
+
+
+def test_timed_iter_counts_only_production(timer: StageTimer) -> None:
+    """Only the time spent producing items is charged to the stage."""
+    def slow() -> object:
+        for i in range(3):
+            time.sleep(0.01)
+            yield i
+
+    for _ in timer.timed_iter("scan", slow()):
+        time.sleep(0.03)  # consumer time is not scan time
+    calls, seconds = _times(timer)["scan"]
+    assert calls == 4  # three items and the final StopIteration
+    assert 0.03 <= seconds < 0.09
+
+
+def test_breakdown_order(timer: StageTimer) -> None:
+    """Known stages come in pipeline order, then the others."""
+    for name in ("write", "custom", "scan", "parse"):
+        with timer.stage(name):
+            pass
+    assert [s.name for s in timer.breakdown()] == ["scan", "parse", "write", "custom"]
+
+
+def test_session_profiles_a_migration(tmp_path: Path) -> None:
+    """A profiled migration writes stats and breaks down its stages."""
+    vault = generate_vault(tmp_path / "vault", VaultSpec(notes=40, invalid_ratio=0.5))
+    settings = SimpleNamespace(vault_path=vault.root)
+    app = create_app(settings)
+    app.ui = SimpleNamespace(
+        show_header=lambda _title: None,
+        confirm=lambda _message: True,
+        display_message=lambda _msg: None,
+        print_summary=lambda _data: None,
+    )
+
+    output = tmp_path / "profile" / "run.pstats"
+    session = ProfileSession(output)
+    session.start()
+    app.run()
+    breakdown = session.finish()
+
+    assert not STAGES.enabled
+    stages = {s.name for s in breakdown}
+    assert {"scan", "read", "parse", "migrate", "serialize", "write"} <= stages
+    # The stats file is a regular cProfile dump
+    assert pstats.Stats(str(output)).total_calls > 0
+
+    with stage("read"):
+        pass
+    assert {s.name for s in STAGES.breakdown()} == stages  # stopped
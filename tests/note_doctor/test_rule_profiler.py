@@ -0,0 +1,65 @@
+"""Tests for the per-rule profiler used by ``dxva doctor --profile-rules``."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from dx_vault_atlas.services.note_doctor.core import profiler as profiler_module
+from dx_vault_atlas.services.note_doctor.core.fixer import (
+    DefaultsFixRule,
+    EnumFixRule,
+    NoteFixer,
+)
+from dx_vault_atlas.services.note_doctor.core.profiler import RuleProfiler, RuleStats
+from dx_vault_atlas.services.note_doctor.validator import NoteDoctorValidator
+from dx_vault_atlas.shared.yaml_parser import YamlParserService
+
+
+def test_validation_rules_record_calls_and_hits(tmp_path: Path) -> None:
+    """Each wrapped validation rule counts calls and raised issues."""
+    profiler = RuleProfiler()
+    validator = NoteDoctorValidator(YamlParserService())
+    validator.rules = profiler.wrap_validation_rules(validator.rules)
+
+    bad = {"title": "Bad", "aliases": ["Bad"], "type": "ref", "priority": 999}
+    good = {"title": "Good", "aliases": ["Good"], "type": "ref"}
+    validator.validate_content(tmp_path / "bad.md", bad, "")
+    validator.validate_content(tmp_path / "good.md", good, "")
+
+    by_name = {s.name: s for s in profiler.sorted_stats()}
+    assert by_name["PriorityRule"].calls == 2
+    assert by_name["PriorityRule"].hits == 1
+    assert by_name["AreaRule"].hits == 0
+
+
+def test_fix_rules_record_changes_and_export(tmp_path: Path) -> None:
+    """Wrapped fix rules report hits and the profile exports as JSON."""
+    profiler = RuleProfiler()
+    fixer = NoteFixer(profiler.wrap_fix_rules([EnumFixRule(), DefaultsFixRule()]))
+
+    fixer.fix(tmp_path / "a.md", {"title": "A", "type": "ref", "tags": None}, "")
+
+    by_name = {s.name: s for s in profiler.sorted_stats()}
+    assert by_name["EnumFixRule"].hits == 1
+    assert by_name["DefaultsFixRule"].calls == 1
+    assert by_name["EnumFixRule"].percentile_ms(99) >= 0
+
+    out = tmp_path / "profile.json"
+    profiler.export_json(out)
+    data = json.loads(out.read_text(encoding="utf-8"))
+    assert {r["rule"] for r in data["rules"]} == {"EnumFixRule", "DefaultsFixRule"}
+    assert {"calls", "hits", "total_ms", "p50_ms", "p99_ms"} <= set(data["rules"][0])
+
+
+def test_latency_samples_are_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Percentiles come from a fixed-size reservoir, not every call."""
+    monkeypatch.setattr(profiler_module, "RESERVOIR_SIZE", 100)
+    stats = RuleStats(name="Rule", kind="fix")
+
+    for elapsed in range(10_000):
+        stats.record(elapsed, hit=False)
+
+    assert stats.calls == 10_000
+    assert len(stats._samples) == 100
+    assert 2_000 < stats.percentile_ms(50) * 1_000_000 < 8_000
@@ -0,0 +1,109 @@
+"""Tests for the driver behind the single-app interactive doctor session."""
+
+from pathlib import Path
+from typing import Any
+
+from dx_vault_atlas.services.note_doctor.session import DoctorSession
+from dx_vault_atlas.services.note_doctor.validator import ValidationResult
+
+
+class _Prepared:
+    def __init__(self, result: ValidationResult, steps: list[str]) -> None:
+        self.result = result
+        self.steps = steps
+
+
+class _FakeTUI:
+    def prepare(self, result: ValidationResult) -> _Prepared:
+        return _Prepared(result, list(result.missing_fields))
+
+    def config_for(self, prepared: _Prepared, title: str | None = None) -> Any:  # noqa: ANN401
+        return (title, prepared.steps) if prepared.steps else None
+
+    def finalize(
+        self,
+        prepared: _Prepared,  # noqa: ARG002
+        answers: dict[str, Any],
+    ) -> dict[str, Any]:
+        return dict(answers)
+
+
+class _FakeApp:
+    """Applies fixes by re-validating against a scripted sequence."""
+
+    def __init__(self, after_fix: list[ValidationResult]) -> None:
+        self.tui = _FakeTUI()
+        self.after_fix = after_fix
+        self.applied: list[tuple[Path, dict[str, Any]]] = []
+
+    def _rename(
+        self,
+        result: ValidationResult,  # noqa: ARG002
+        renamed: Any = None,  # noqa: ANN401, ARG002
+    ) -> None:
+        return None
+
+    def _apply_wizard_fixes(
+        self,
+        file_path: Path,
+        frontmatter: dict[str, Any],  # noqa: ARG002
+        fixes: dict[str, Any],
+        body: str,  # noqa: ARG002
+    ) -> ValidationResult:
+        self.applied.append((file_path, fixes))
+        return self.after_fix.pop(0)
+
+
+def _invalid(name: str) -> ValidationResult:
+    return ValidationResult(Path(name), False, missing_fields=["title"])
+
+
+def _session(
+    results: list[ValidationResult], after_fix: list[ValidationResult]
+) -> tuple[DoctorSession, _FakeApp]:
+    app = _FakeApp(after_fix)
+    notes = iter([(r, None) for r in results])
+    names = [r.file_path.name for r in results]
+    return DoctorSession(app, names, notes, max_attempts=2), app  # type: ignore[arg-type]
+
+
+def test_walks_queue_and_moves_on_after_fix() -> None:
+    """A fixed note leaves the queue and the next one is shown."""
+    a, b = _invalid("a.md"), _invalid("b.md")
+    session, app = _session([a, b], [ValidationResult(Path("a.md"), True)])
+
+    title, _ = session.next_config()
+    assert title == "[1/2] Fixing Note: a.md"
+    assert session.pending() == ["a.md", "b.md"]
+
+    assert session.submit({"title": "A"}) is None
+    title, _ = session.next_config()
+    assert title == "[2/2] Fixing Note: b.md"
+    assert session.pending() == ["b.md"]
+
+    session.skip()
+    assert session.next_config() is None
+    assert app.applied == [(Path("a.md"), {"title": "A"})]
+    assert session.drain_messages() == session.log
+    assert session.drain_messages() == []
+
+
+def test_retries_until_max_attempts() -> None:
+    """A note that stays invalid is retried, then given up on."""
+    a = _invalid("a.md")
+    session, app = _session([a], [_invalid("a.md"), _invalid("a.md")])
+
+    session.next_config()
+    assert session.submit({"title": "x"}) is not None
+    assert session.submit({"title": "y"}) is None
+    assert len(app.applied) == 2
+    assert "2 attempts" in session.log[-1]
+
+
+def test_empty_answers_skip_without_writing() -> None:
+    """Submitting no answers skips the note and writes nothing."""
+    session, app = _session([_invalid("a.md")], [])
+
+    session.next_config()
+    assert session.submit({}) is None
+    assert app.applied == []
@@ -0,0 +1,114 @@
+"""Tests for the span tracer and the ``--trace`` instrumentation."""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from dx_vault_atlas.benchmarks.synthetic import VaultSpec, generate_vault
+from dx_vault_atlas.services.note_doctor.app import create_app as create_doctor
+from dx_vault_atlas.services.note_migrator.app import create_app as create_migrator
+from dx_vault_atlas.shared.config import GlobalConfig
+from dx_vault_atlas.shared.core.scanner import VaultScanner
+from dx_vault_atlas.shared.profiling import stage
+from dx_vault_atlas.shared.tracing import TRACER, Tracer, note_span, span
+
+
+@pytest.fixture
+def tracer() -> Iterator[Tracer]:
+    """The process-wide tracer, started for the test."""
+    TRACER.start()
+    yield TRACER
+    TRACER.stop()
+
+
+def _spans(tracer: Tracer) -> list[dict]:
+    return [e for e in tracer.to_dict()["traceEvents"] if e["ph"] == "X"]
+
+
+def test_disabled_tracer_records_nothing() -> None:
+    """Spans of a tracer that was never started are not kept."""
+    tracer = Tracer()
+    with tracer.span("read"), tracer.note_span("note", Path("a.md")):
+        pass
+    assert tracer.to_dict()["traceEvents"] == []
+
+
+def test_ring_buffer_keeps_newest(tmp_path: Path) -> None:
+    """Beyond capacity the oldest spans are dropped and counted."""
+    tracer = Tracer(capacity=3)
+    tracer.start()
+    for i in range(5):
+        with tracer.span(f"s{i}"):
+            pass
+    tracer.stop()
+
+    assert [e["name"] for e in _spans(tracer)] == ["s2", "s3", "s4"]
+    assert tracer.dropped == 2
+
+    out = tmp_path / "trace" / "run.json"
+    assert tracer.export(out) == 3
+    data = json.loads(out.read_text(encoding="utf-8"))
+    assert data["otherData"]["dropped"] == 2
+    events = data["traceEvents"]
+    assert any(e["ph"] == "M" and e["name"] == "thread_name" for e in events)
+
+
+def test_spans_inherit_the_current_note(tracer: Tracer) -> None:
+    """Spans opened inside a note span are tagged with its path."""
+    note = Path("vault/a.md")
+    with span("scan"):
+        pass
+    with note_span("doctor.classify_note", note), stage("read"):
+        pass
+    with stage("write"):
+        pass
+
+    by_name = {e["name"]: e for e in _spans(tracer)}
+    assert "args" not in by_name["scan"]
+    assert "args" not in by_name["write"]
+    assert by_name["read"]["args"] == {"path": str(note)}
+    assert by_name["doctor.classify_note"]["cat"] == "note"
+    parent, child = by_name["doctor.classify_note"], by_name["read"]
+    assert parent["ts"] <= child["ts"]
+    assert child["ts"] + child["dur"] <= parent["ts"] + parent["dur"]
+
+
+def test_doctor_spans_cover_rules_and_pydantic(tmp_path: Path, tracer: Tracer) -> None:
+    """Classifying notes records note, stage, rule and validation spans."""
+    vault = generate_vault(tmp_path / "vault", VaultSpec(notes=30, invalid_ratio=0.5))
+    doctor = create_doctor(GlobalConfig(vault_path=vault.root, vault_inbox=vault.root))
+    paths = list(VaultScanner().scan(vault.root, ordered=True))
+    for path in paths:
+        doctor._classify_note(path, debug_mode=False)
+
+    events = _spans(tracer)
+    notes = [e for e in events if e["name"] == "doctor.classify_note"]
+    assert {e["args"]["path"] for e in notes} == {str(p) for p in paths}
+    cats = {e["cat"] for e in events}
+    assert {"note", "stage", "rule", "pydantic"} <= cats
+    assert {"read", "parse", "validate"} <= {e["name"] for e in events}
+    # Every rule and validation span is attributed to its note
+    assert all("args" in e for e in events if e["cat"] in ("rule", "pydantic"))
+
+
+def test_migrator_spans_carry_note_paths(tmp_path: Path, tracer: Tracer) -> None:
+    """Each migrated note gets a span and its stages carry its path."""
+    vault = generate_vault(tmp_path / "vault", VaultSpec(notes=20, invalid_ratio=0.5))
+    app = create_migrator(SimpleNamespace(vault_path=vault.root))
+    app.ui = SimpleNamespace(
+        show_header=lambda _title: None,
+        confirm=lambda _message: True,
+        display_message=lambda _msg: None,
+        print_summary=lambda _data: None,
+    )
+    app.run()
+
+    events = _spans(tracer)
+    notes = {e["args"]["path"] for e in events if e["name"] == "migrator.migrate_note"}
+    assert len(notes) == 20
+    migrate = [e for e in events if e["name"] == "migrate"]
+    assert migrate
+    assert all(e["args"]["path"] in notes for e in migrate)
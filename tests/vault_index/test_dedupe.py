@@ -0,0 +1,73 @@
+"""Tests for MinHash/LSH near-duplicate detection behind ``dxva dedupe``."""
+
+import random
+from pathlib import Path
+
+from dx_vault_atlas.services.vault_index.dedupe import (
+    MinHashIndex,
+    cluster,
+    jaccard,
+    shingles,
+    signature,
+)
+from dx_vault_atlas.shared.core.scanner import VaultScanner
+
+_WORDS = [f"palabra{i}" for i in range(400)]
+
+
+def _text(seed: int, length: int = 200) -> list[str]:
+    rng = random.Random(seed)
+    return [rng.choice(_WORDS) for _ in range(length)]
+
+
+def _write(root: Path, name: str, title: str, words: list[str]) -> None:
+    path = root / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\ntitle: {title}\n---\n{' '.join(words)}\n", encoding="utf-8")
+
+
+def test_signature_agreement_tracks_jaccard() -> None:
+    """Matching signature bins estimate the Jaccard similarity."""
+    base = _text(1)
+    near = base[:190] + _text(2, 10)
+    a, b, c = shingles("T", " ".join(base)), shingles("T", " ".join(near)), shingles(
+        "U", " ".join(_text(3))
+    )
+    agree = sum(x == y for x, y in zip(signature(a), signature(b), strict=True)) / 128
+    assert abs(agree - jaccard(a, b)) < 0.2
+    assert sum(x == y for x, y in zip(signature(a), signature(c), strict=True)) < 10
+    assert shingles("Título", "") == shingles("titulo", "")
+
+
+def test_cluster_groups_connected_pairs() -> None:
+    """Pairs sharing a note merge; a cluster reports its weakest link."""
+    clusters = cluster([("a", "b", 0.9), ("b", "c", 0.85), ("x", "y", 1.0)])
+    assert [(c.paths, c.similarity) for c in clusters] == [
+        (("a", "b", "c"), 0.85),
+        (("x", "y"), 1.0),
+    ]
+
+
+def test_finds_near_duplicates_and_reuses_signatures(tmp_path: Path) -> None:
+    """Near copies cluster together and unchanged notes are not re-signed."""
+    inbox = tmp_path / "inbox"
+    base = _text(10)
+    _write(inbox, "orig.md", "Meeting notes", base)
+    _write(inbox, "copy.md", "Meeting notes", base[:195] + _text(11, 5))
+    _write(inbox, "sub/copy2.md", "Meeting Notes!", base)
+    _write(inbox, "other.md", "Other", _text(12))
+    _write(inbox, "empty.md", "", [])
+    store = tmp_path / "minhash.sqlite3"
+    scan = VaultScanner().scan
+
+    with MinHashIndex(store, inbox) as index:
+        assert index.refresh(scan(inbox)).added == 5
+        clusters = index.clusters(0.8)
+    assert [c.paths for c in clusters] == [("copy.md", "orig.md", "sub/copy2.md")]
+    assert clusters[0].similarity >= 0.8
+
+    (inbox / "copy.md").unlink()
+    with MinHashIndex(store, inbox) as index:
+        update = index.refresh(scan(inbox))
+        assert (update.added, update.updated, update.removed) == (0, 0, 1)
+        assert [c.paths for c in index.clusters(0.8)] == [("orig.md", "sub/copy2.md")]
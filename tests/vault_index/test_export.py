@@ -0,0 +1,111 @@
+"""Tests for the streaming frontmatter export behind ``dxva export``."""
+
+import csv
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from dx_vault_atlas.services.vault_index.export import (
+    VaultExporter,
+    write_csv,
+    write_jsonl,
+)
+from dx_vault_atlas.shared.core.scanner import VaultScanner
+
+_TASK = """---
+title: {title}
+type: task
+status: to_do
+area: work
+priority: 3
+tags: [work]
+created: 2024-01-0{day} 10:00:00
+updated: 2024-01-0{day} 10:00:00
+---
+Body.
+"""
+
+
+def _write(vault: Path, name: str, content: str) -> Path:
+    path = vault / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def vault(tmp_path: Path) -> Path:
+    """Three valid tasks, one that fails validation and one unparseable note."""
+    vault = tmp_path / "vault"
+    _write(vault, "b.md", _TASK.format(title="B", day=2))
+    _write(vault, "a.md", _TASK.format(title="A", day=1))
+    _write(vault, "z/c.md", _TASK.format(title="C", day=3))
+    _write(
+        vault,
+        "m/bad.md",
+        "---\ntitle: Bad\ntype: task\nowner: me\ndue: 2024-02-01\n---\n",
+    )
+    _write(vault, "m/broken.md", "---\ntitle: [unclosed\n---\n")
+    return vault
+
+
+def test_ordered_scan_is_sorted(vault: Path) -> None:
+    """An ordered scan yields paths sorted by their vault-relative form."""
+    scanned = VaultScanner().scan(vault, ordered=True)
+    paths = [p.relative_to(vault).as_posix() for p in scanned]
+    assert paths == ["a.md", "b.md", "m/bad.md", "m/broken.md", "z/c.md"]
+
+
+def test_records(vault: Path) -> None:
+    """Records carry dumped fields, validity, extras and parse errors."""
+    records = list(VaultExporter(vault).records())
+    assert [r["path"] for r in records] == [
+        "a.md",
+        "b.md",
+        "m/bad.md",
+        "m/broken.md",
+        "z/c.md",
+    ]
+    a = records[0]
+    assert a["valid"] is True
+    assert a["type"] == "task"
+    assert a["priority"] == 3
+    # Same date format as model_dump(mode="json")
+    assert a["created"] == "2024-01-01T10:00:00"
+
+    bad = records[2]
+    assert bad["valid"] is False
+    assert bad["owner"] == "me"
+    assert bad["due"] == "2024-02-01"
+    assert "error" in records[3]
+
+
+def test_parallel_matches_serial(vault: Path) -> None:
+    """Worker processes produce the same records in the same order."""
+    serial = list(VaultExporter(vault).records())
+    parallel = list(VaultExporter(vault, workers=2, chunk_size=1).records())
+    assert parallel == serial
+
+
+def test_write_jsonl(vault: Path) -> None:
+    """One JSON object per line, in record order."""
+    out = io.StringIO()
+    assert write_jsonl(VaultExporter(vault).records(), out) == 5
+    lines = out.getvalue().splitlines()
+    assert json.loads(lines[1])["title"] == "B"
+
+
+def test_write_csv(vault: Path) -> None:
+    """Columns are stable; lists and extras are JSON-encoded cells."""
+    exporter = VaultExporter(vault)
+    out = io.StringIO()
+    assert write_csv(exporter.records(), out, exporter.columns) == 5
+
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert list(rows[0]) == exporter.columns
+    assert rows[0]["valid"] == "true"
+    assert json.loads(rows[0]["tags"]) == ["work"]
+    assert json.loads(rows[2]["extra"]) == {"owner": "me", "due": "2024-02-01"}
+    assert rows[3]["error"]
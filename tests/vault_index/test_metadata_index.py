@@ -0,0 +1,134 @@
+"""Tests for the SQLite metadata index behind ``dxva query``."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from dx_vault_atlas.services.vault_index.query import QueryError, parse_query
+from dx_vault_atlas.services.vault_index.schema import IndexSchema
+from dx_vault_atlas.services.vault_index.store import MetadataIndex
+from dx_vault_atlas.shared.core.scanner import VaultScanner
+
+_TASK = """---
+title: {title}
+type: task
+status: {status}
+area: work
+priority: {priority}
+tags: [{tags}]
+created: 2024-0{month}-01 10:00:00
+updated: 2024-0{month}-01 10:00:00
+---
+Body.
+"""
+
+
+def _task(title: str, status: str, priority: int, tags: str, month: int) -> str:
+    return _TASK.format(
+        title=title, status=status, priority=priority, tags=tags, month=month
+    )
+
+
+def _write(vault: Path, name: str, content: str) -> Path:
+    path = vault / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def vault(tmp_path: Path) -> Path:
+    """Three tasks, one note with a bad priority and one without frontmatter."""
+    vault = tmp_path / "vault"
+    _write(vault, "a.md", _task("A", "in_progress", 4, "work, Deep", 1))
+    _write(vault, "b.md", _task("B", "in_progress", 2, "work", 2))
+    _write(vault, "sub/c.md", _task("C", "to_do", 5, "", 3))
+    _write(vault, "bad.md", "---\ntitle: Bad\ntype: task\npriority: high\n---\n")
+    _write(vault, "plain.md", "No frontmatter.\n")
+    return vault
+
+
+def _index(tmp_path: Path, vault: Path) -> MetadataIndex:
+    index = MetadataIndex(tmp_path / "index.sqlite3", vault, workers=1)
+    index.refresh(VaultScanner().scan(vault))
+    return index
+
+
+def _paths(index: MetadataIndex, *conditions: str, sort: str = "path") -> list[str]:
+    query = parse_query(list(conditions), index.schema, fields="path", sort=sort)
+    return [row["path"] for row in index.query(query)]
+
+
+def test_columns_follow_the_models() -> None:
+    """Columns and their kinds are derived from every note model."""
+    columns = IndexSchema().by_name
+    assert columns["type"].kind == "text"
+    assert columns["priority"].kind == "integer"
+    assert columns["created"].kind == "datetime"
+    assert columns["tags"].kind == "list"
+    assert "start_date" in columns
+    assert "level" in columns
+
+
+def test_filters_sort_and_projection(tmp_path: Path, vault: Path) -> None:
+    """Conditions combine, sort keys apply and fields are projected."""
+    index = _index(tmp_path, vault)
+    assert len(index) == 5
+
+    assert _paths(index, "status=in_progress", "priority>=3") == ["a.md"]
+    assert _paths(index, "type=task", "valid=1", sort="-priority") == [
+        "sub/c.md",
+        "a.md",
+        "b.md",
+    ]
+    assert _paths(index, "tags=deep") == ["a.md"]
+    assert _paths(index, "tags=") == ["bad.md", "plain.md", "sub/c.md"]
+    assert _paths(index, "tags!=deep", "type=task") == ["b.md", "bad.md", "sub/c.md"]
+    assert _paths(index, "status=to_do,in_progress", "created<2024-03") == [
+        "a.md",
+        "b.md",
+    ]
+    assert _paths(index, "valid=0") == ["bad.md", "plain.md"]
+    assert _paths(index, "path~sub/") == ["sub/c.md"]
+
+    query = parse_query(["title=A"], index.schema, fields="title,priority,tags,created")
+    assert index.query(query) == [
+        {
+            "title": "A",
+            "priority": 4,
+            "tags": ["work", "Deep"],
+            "created": "2024-01-01T10:00:00",
+        }
+    ]
+
+
+def test_refresh_is_incremental(tmp_path: Path, vault: Path) -> None:
+    """A refresh only touches added, changed and removed notes."""
+    index = _index(tmp_path, vault)
+    scan = VaultScanner().scan
+    assert not index.refresh(scan(vault)).changed
+
+    b = vault / "b.md"
+    b.write_text(b.read_text().replace("priority: 2", "priority: 3"))
+    stat = b.stat()
+    os.utime(b, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    (vault / "plain.md").unlink()
+    _write(vault, "d.md", _task("D", "to_do", 1, "x", 4))
+
+    update = index.refresh(scan(vault))
+    assert (update.added, update.updated, update.removed) == (1, 1, 1)
+    assert _paths(index, "priority=3") == ["b.md"]
+    assert _paths(index, "tags=x") == ["d.md"]
+    assert len(index) == 5
+
+
+def test_query_errors() -> None:
+    """Unknown fields, bad values and unparsable conditions are rejected."""
+    schema = IndexSchema()
+    with pytest.raises(QueryError, match="Unknown field"):
+        parse_query(["colour=red"], schema)
+    with pytest.raises(QueryError, match="expects a number"):
+        parse_query(["priority>=high"], schema)
+    with pytest.raises(QueryError, match="Cannot parse"):
+        parse_query(["priority"], schema)
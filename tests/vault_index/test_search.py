@@ -0,0 +1,97 @@
+"""Tests for the BM25 full-text index behind ``dxva search``."""
+
+import os
+from pathlib import Path
+from typing import Any
+
+from dx_vault_atlas.services.vault_index.search import (
+    SearchIndex,
+    decode_postings,
+    encode_postings,
+    tokenize,
+)
+from dx_vault_atlas.services.vault_index.store import IndexUpdate
+from dx_vault_atlas.shared.core.scanner import VaultScanner
+
+
+def _write(vault: Path, name: str, title: str, body: str) -> Path:
+    path = vault / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"---\ntitle: {title}\ntype: ref\n---\n{body}\n", encoding="utf-8"
+    )
+    return path
+
+
+def _bump(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def _refresh(index: SearchIndex) -> IndexUpdate:
+    return index.refresh(VaultScanner().scan(index.vault))
+
+
+def _paths(index: SearchIndex, text: str, **kwargs: Any) -> list[str]:  # noqa: ANN401
+    return [hit.path for hit in index.search(text, **kwargs)]
+
+
+def _vault(tmp_path: Path) -> Path:
+    vault = tmp_path / "vault"
+    _write(
+        vault, "a.md", "Reunión de presupuesto", "Presupuesto anual, presupuesto final."
+    )
+    _write(vault, "b.md", "Notas", "Una reunion corta sobre el presupuesto.")
+    _write(vault, "sub/c.md", "Recetas", "Pan, harina y agua.")
+    return vault
+
+
+def test_tokenize_and_postings_codec() -> None:
+    """Terms are folded; postings round-trip, also when appended."""
+    assert tokenize("Reunión: ¡Presupuesto_2024!") == ["reunion", "presupuesto", "2024"]
+    entries = [(1, 3, 10), (2, 1, 200), (300, 5, 7)]
+    assert decode_postings(encode_postings(entries)) == entries
+    head = encode_postings(entries[:2])
+    tail = encode_postings(entries[2:], last=2)
+    assert decode_postings(head + tail) == entries
+
+
+def test_ranking_and_filters(tmp_path: Path) -> None:
+    """BM25 ranks, and require_all, allowed and limit filter the hits."""
+    index = SearchIndex(tmp_path / "search.sqlite3", _vault(tmp_path), workers=1)
+    assert _refresh(index).added == 3
+
+    assert _paths(index, "presupuesto") == ["a.md", "b.md"]
+    assert set(_paths(index, "REUNION harina")) == {"a.md", "b.md", "sub/c.md"}
+    assert _paths(index, "reunion harina", require_all=True) == []
+    assert _paths(index, "presupuesto", allowed={"b.md"}) == ["b.md"]
+    assert _paths(index, "presupuesto", limit=1) == ["a.md"]
+    assert _paths(index, "inexistente") == []
+    hit = index.search("recetas")[0]
+    assert (hit.path, hit.title) == ("sub/c.md", "Recetas")
+
+
+def test_refresh_is_incremental(tmp_path: Path) -> None:
+    """Only added, changed and removed notes touch the postings."""
+    vault = _vault(tmp_path)
+    index = SearchIndex(tmp_path / "search.sqlite3", vault, workers=1)
+    _refresh(index)
+    assert not _refresh(index).changed
+
+    # Frontmatter-only edits keep the postings
+    a = vault / "a.md"
+    a.write_text(a.read_text().replace("type: ref", "type: info"))
+    _bump(a)
+    assert _refresh(index).updated == 1
+    assert _paths(index, "presupuesto") == ["a.md", "b.md"]
+
+    _write(vault, "b.md", "Notas", "Ahora hablamos de harina.")
+    _bump(vault / "b.md")
+    (vault / "sub" / "c.md").unlink()
+    _write(vault, "d.md", "Otra", "Más presupuesto.")
+    update = _refresh(index)
+    assert (update.added, update.updated, update.removed) == (1, 1, 1)
+    assert _paths(index, "presupuesto") == ["a.md", "d.md"]
+    assert _paths(index, "harina") == ["b.md"]
+    assert _paths(index, "recetas") == []
+    assert len(index) == 3
@@ -0,0 +1,131 @@
+"""Tests for the incremental aggregate counters behind ``dxva stats``."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from dx_vault_atlas.services.vault_index.stats import (
+    STAT_DIMENSIONS,
+    UNSET,
+    VaultStats,
+    stat_keys,
+)
+from dx_vault_atlas.services.vault_index.store import MetadataIndex
+from dx_vault_atlas.shared.core.scanner import VaultScanner
+
+_TASK = """---
+title: {title}
+type: task
+status: {status}
+area: work
+priority: {priority}
+created: 2024-0{month}-01 10:00:00
+updated: 2024-0{month}-01 10:00:00
+---
+Body.
+"""
+
+
+def _write(vault: Path, name: str, content: str) -> Path:
+    path = vault / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _task(title: str, status: str = "to_do", priority: int = 3, month: int = 1) -> str:
+    return _TASK.format(title=title, status=status, priority=priority, month=month)
+
+
+@pytest.fixture
+def vault(tmp_path: Path) -> Path:
+    """Three tasks, one note with a bad priority and one without frontmatter."""
+    vault = tmp_path / "vault"
+    _write(vault, "a.md", _task("A", "in_progress", 4, month=1))
+    _write(vault, "b.md", _task("B", "in_progress", 2, month=2))
+    _write(vault, "c.md", _task("C", month=2))
+    _write(vault, "bad.md", "---\ntitle: Bad\ntype: task\npriority: high\n---\n")
+    _write(vault, "plain.md", "No frontmatter.\n")
+    return vault
+
+
+def _recount(index: MetadataIndex) -> VaultStats:
+    """The counters recomputed from scratch, to compare against."""
+    columns = "".join(f', "{column}"' for _, column in STAT_DIMENSIONS)
+    counts: dict[str, dict[str, int]] = {d: {} for d, _ in STAT_DIMENSIONS}
+    total = invalid = 0
+    for valid, *cells in index.conn.execute(f"SELECT valid{columns} FROM notes"):
+        values = dict(
+            zip([column for _, column in STAT_DIMENSIONS], cells, strict=True)
+        )
+        for dimension, value in stat_keys(bool(valid), values)[1:]:
+            counts[dimension][value] = counts[dimension].get(value, 0) + 1
+        total += 1
+        invalid += not valid
+    return VaultStats(total, invalid, counts)
+
+
+def _same(stats: VaultStats, expected: VaultStats) -> bool:
+    return (
+        stats.total == expected.total
+        and stats.schema_invalid == expected.schema_invalid
+        and {d: dict(c) for d, c in stats.counts.items()} == expected.counts
+    )
+
+
+def test_stat_keys() -> None:
+    """A note counts once per dimension; missing values are UNSET."""
+    keys = stat_keys(
+        True, {"type": "task", "priority": 3, "created": "2024-05-02T10:00:00"}
+    )
+    assert keys == [
+        ("validity", "valid"),
+        ("type", "task"),
+        ("priority", "3"),
+        ("month", "2024-05"),
+    ]
+    assert ("month", UNSET) in stat_keys(False, {"created": "someday"})
+    assert ("status", UNSET) in stat_keys(False, {"status": None})
+
+
+def test_counts_after_build(tmp_path: Path, vault: Path) -> None:
+    """A fresh build counts every note under each dimension."""
+    with MetadataIndex(tmp_path / "index.sqlite3", vault, workers=1) as index:
+        index.refresh(VaultScanner().scan(vault))
+        stats = index.stats()
+
+    assert stats.total == 5
+    assert stats.schema_invalid == 2
+    assert stats.counts["type"] == {"task": 4, UNSET: 1}
+    assert stats.counts["status"] == {"in_progress": 2, UNSET: 2, "to_do": 1}
+    assert stats.counts["priority"]["4"] == 1
+    assert list(stats.counts["month"]) == [UNSET, "2024-01", "2024-02"]
+    assert stats.to_dict()["total"] == 5
+
+
+def test_counters_follow_edits_and_deletes(tmp_path: Path, vault: Path) -> None:
+    """Incremental refreshes keep the counters equal to a full recount."""
+    index = MetadataIndex(tmp_path / "index.sqlite3", vault, workers=1)
+    index.refresh(VaultScanner().scan(vault))
+
+    edited = vault / "a.md"
+    edited.write_text(_task("A", "completed", 5, month=3), encoding="utf-8")
+    os.utime(edited, ns=(1, 1))
+    _write(vault, "bad.md", _task("Fixed", month=3))
+    (vault / "plain.md").unlink()
+    _write(vault, "new.md", _task("New", "in_progress", month=1))
+    index.refresh(VaultScanner().scan(vault))
+
+    stats = index.stats()
+    assert _same(stats, _recount(index))
+    assert stats.total == 5
+    assert stats.schema_invalid == 0
+    assert stats.counts["status"] == {"in_progress": 2, "to_do": 2, "completed": 1}
+    assert stats.counts["month"] == {"2024-01": 1, "2024-02": 2, "2024-03": 2}
+    # Counters that drop to zero are removed
+    assert UNSET not in stats.counts["type"]
+
+    index.refresh(VaultScanner().scan(vault))
+    assert _same(index.stats(), _recount(index))
+    index.close()
@@ -0,0 +1,101 @@
+"""Tests for the tag/alias postings behind ``dxva tags``."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from dx_vault_atlas.services.vault_index.postings import decode_ids, encode_ids
+from dx_vault_atlas.services.vault_index.query import QueryError
+from dx_vault_atlas.services.vault_index.store import MetadataIndex
+from dx_vault_atlas.services.vault_index.tags import (
+    And,
+    Not,
+    Or,
+    Tag,
+    TagIndex,
+    parse_tag_expression,
+)
+from dx_vault_atlas.shared.core.scanner import VaultScanner
+
+
+def _write(vault: Path, name: str, tags: str, aliases: str = "") -> Path:
+    path = vault / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"---\ntitle: {path.stem}\ntype: ref\n"
+        f"tags: [{tags}]\naliases: [{aliases}]\n---\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> MetadataIndex:
+    """Metadata index over four notes with overlapping tags and aliases."""
+    vault = tmp_path / "vault"
+    _write(vault, "a.md", "work, Python", "Alpha")
+    _write(vault, "b.md", "work, archived")
+    _write(vault, "c.md", "python, \"to read\"", "alpha, Gamma")
+    _write(vault, "d.md", "")
+    index = MetadataIndex(tmp_path / "index.sqlite3", vault, workers=1)
+    index.refresh(VaultScanner().scan(vault))
+    return index
+
+
+def _paths(tags: TagIndex, expression: str) -> list[str]:
+    return [row["path"] for row in tags.query(parse_tag_expression(expression))]
+
+
+def test_id_codec() -> None:
+    """Sorted id lists round-trip through the varint delta encoding."""
+    ids = [1, 2, 3, 130, 20000]
+    assert decode_ids(encode_ids(ids)) == ids
+    assert decode_ids(b"") == []
+
+
+def test_parse_precedence() -> None:
+    """``!`` binds tighter than ``&``, which binds tighter than ``|``."""
+    assert parse_tag_expression("a | b & !c") == Or(
+        Tag("a"), And(Tag("b"), Not(Tag("c")))
+    )
+    assert parse_tag_expression('(#a | "b c") & d') == And(
+        Or(Tag("a"), Tag("b c")), Tag("d")
+    )
+    for bad in ("", "a &", "(a | b", "a b", "a )"):
+        with pytest.raises(QueryError):
+            parse_tag_expression(bad)
+
+
+def test_set_algebra(index: MetadataIndex) -> None:
+    """Expressions evaluate case-insensitively over the postings."""
+    tags = TagIndex(index)
+    assert _paths(tags, "work & !archived") == ["a.md"]
+    assert _paths(tags, "PYTHON | archived") == ["a.md", "b.md", "c.md"]
+    assert _paths(tags, '!work & !"to read"') == ["d.md"]
+    assert _paths(tags, "nonexistent") == []
+
+
+def test_stats_and_aliases(index: MetadataIndex) -> None:
+    """Tag frequencies, totals and alias lookups come from the postings."""
+    tags = TagIndex(index)
+    assert tags.frequencies(limit=2) == [("python", 2), ("work", 2)]
+    assert tags.summary() == (4, 3)
+    assert [row["path"] for row in tags.resolve_alias("ALPHA")] == ["a.md", "c.md"]
+    assert tags.resolve_alias("missing") == []
+
+
+def test_postings_follow_refresh(index: MetadataIndex) -> None:
+    """Edited and deleted notes drop out of the postings."""
+    vault = index.vault
+    b = _write(vault, "b.md", "python")
+    stat = b.stat()
+    os.utime(b, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    (vault / "a.md").unlink()
+    index.refresh(VaultScanner().scan(vault))
+
+    tags = TagIndex(index)
+    assert _paths(tags, "python") == ["b.md", "c.md"]
+    assert _paths(tags, "work | archived") == []
+    assert ("work", 1) not in tags.frequencies()
+    assert [row["path"] for row in tags.resolve_alias("alpha")] == ["c.md"]
@@ -0,0 +1,127 @@
+"""Tests for the title/alias trie behind ``up`` link autocomplete."""
+
+from pathlib import Path
+
+import pytest
+
+from dx_vault_atlas.services.note_creator.services.link_suggester import (
+    LinkSuggester,
+)
+from dx_vault_atlas.services.vault_index.store import MetadataIndex
+from dx_vault_atlas.services.vault_index.titles import TitleTrie, name_words
+from dx_vault_atlas.shared.core.scanner import VaultScanner
+
+
+def _write(vault: Path, name: str, title: str, aliases: str = "") -> Path:
+    path = vault / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"---\ntitle: {title}\ntype: ref\naliases: [{aliases}]\n---\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def trie() -> TitleTrie:
+    """Trie over five notes with titles, aliases and a dated filename."""
+    return TitleTrie.build(
+        [
+            ("machine_learning", "Machine Learning", ["ML"]),
+            ("deep_learning", "Deep Learning", []),
+            ("math", "Math", ["Mathematics"]),
+            ("20240101_meeting", "Meeting notes", []),
+            ("cafe", "Café", []),
+        ]
+    )
+
+
+def test_name_words() -> None:
+    """Names fold to lowercase ASCII words without punctuation."""
+    assert name_words('"Café au Lait!"') == ["cafe", "au", "lait"]
+    assert name_words("---") == []
+
+
+def test_prefix_ranks_title_starts_first(trie: TitleTrie) -> None:
+    """Matches on the first title word rank above later ones."""
+    assert trie.complete("ma") == ["math", "machine_learning"]
+    assert trie.complete("MACH") == ["machine_learning", "math"]  # then typos
+    assert trie.complete("") == []
+
+
+def test_matches_any_word_and_aliases(trie: TitleTrie) -> None:
+    """Any title word and any alias can match the prefix."""
+    # Later-word matches rank by length
+    assert trie.complete("lear") == ["deep_learning", "machine_learning"]
+    assert trie.complete("learning deep") == ["deep_learning"]
+    assert trie.complete("mathem") == ["math"]
+    assert trie.complete("ml") == ["machine_learning"]
+    assert trie.complete("cafe") == trie.complete("Café") == ["cafe"]
+
+
+def test_filename_matched_from_start_only(trie: TitleTrie) -> None:
+    """Filenames are matched as one word, from their start."""
+    assert trie.complete("20240101") == ["20240101_meeting"]
+    assert "20240101_meeting" in trie.complete("meet")
+
+
+def test_typos_are_tolerated(trie: TitleTrie) -> None:
+    """One edit away still matches, ranked after exact prefixes."""
+    assert trie.complete("machnie")[0] == "machine_learning"  # transposition
+    assert trie.complete("macine")[0] == "machine_learning"  # deletion
+    assert trie.complete("maxhine")[0] == "machine_learning"  # substitution
+    assert trie.complete("deeep") == ["deep_learning"]  # insertion
+    assert trie.complete("zzzz") == []
+
+
+def test_limit(trie: TitleTrie) -> None:
+    """No more than *limit* names are returned."""
+    assert len(trie.complete("m", limit=2)) == 2
+
+
+def test_save_and_load_by_generation(trie: TitleTrie, tmp_path: Path) -> None:
+    """A saved trie only loads for the index generation it was built from."""
+    path = tmp_path / "titles.json"
+    trie.save(path, generation=3)
+
+    loaded = TitleTrie.load(path, generation=3)
+    assert loaded is not None
+    assert loaded.complete("lear") == trie.complete("lear")
+    assert TitleTrie.load(path, generation=4) is None
+    assert TitleTrie.load(tmp_path / "missing.json", generation=3) is None
+
+
+def test_from_index_and_generation(tmp_path: Path) -> None:
+    """The trie is built from the index, whose generation tracks changes."""
+    vault = tmp_path / "vault"
+    _write(vault, "projects/atlas.md", "Vault Atlas", "dxva")
+    _write(vault, "inbox.md", "Inbox")
+    index = MetadataIndex(tmp_path / "index.sqlite3", vault, workers=1)
+    assert index.generation == 0
+
+    index.refresh(VaultScanner().scan(vault))
+    assert index.generation == 1
+    index.refresh(VaultScanner().scan(vault))
+    assert index.generation == 1  # nothing changed
+
+    trie = TitleTrie.from_index(index)
+    assert trie.complete("atl") == ["atlas"]
+    assert trie.complete("dxva") == ["atlas"]
+    index.close()
+
+
+def test_link_suggester(tmp_path: Path) -> None:
+    """Suggestions start once loaded and follow vault changes on reload."""
+    vault = tmp_path / "vault"
+    _write(vault, "atlas.md", "Vault Atlas")
+    suggester = LinkSuggester(vault, data_dir=tmp_path / "data")
+    assert suggester.suggest("atl") == []  # not loaded yet
+
+    suggester.load()
+    assert suggester.ready
+    assert suggester.suggest("vau") == ["atlas"]
+    assert (tmp_path / "data" / "titles.json").exists()
+
+    _write(vault, "axis.md", "Axis")
+    suggester.load()
+    assert suggester.suggest("a") == ["axis", "atlas"]